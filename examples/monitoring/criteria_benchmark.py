@@ -0,0 +1,49 @@
+"""
+성공 기준 평가 마이크로 벤치마크
+
+응답마다 기준 문자열을 파싱하는 방식과, 한 번 컴파일한 SuccessCriteria 를 재사용하는 방식의
+응답 1건당 평가 비용을 비교합니다.
+
+    python examples/monitoring/criteria_benchmark.py
+"""
+
+import timeit
+
+from pawnstack.http.client import HttpResponse
+from pawnstack.http.criteria import compile_criteria
+
+CRITERIA_SETS = {
+    "status only": ["status_code==200"],
+    "status + time": ["status_code==200", "response_time<0.5"],
+    "json path": ["status_code==200", "result.sync_info.latest_block_height>0", "result.peers[0].ok==true"],
+    "grouped": ["(status_code in [200, 204] or status_code==304) and response_time<0.5 and result.ok==true"],
+}
+
+BODY = (
+    b'{"ok": true, "result": {"sync_info": {"latest_block_height": "1234567"}, '
+    b'"peers": [{"ok": true}, {"ok": false}]}}'
+)
+
+
+def bench(label: str, criteria, number: int = 20000):
+    """기준 세트 하나에 대해 파싱+평가 / 컴파일된 평가 비용 측정"""
+    compiled = compile_criteria(criteria)
+
+    def parse_every_time():
+        response = HttpResponse(status_code=200, headers={}, content=BODY)
+        return compile_criteria(criteria).evaluate(response, 0.12)
+
+    def compiled_once():
+        response = HttpResponse(status_code=200, headers={}, content=BODY)
+        return compiled.evaluate(response, 0.12)
+
+    parse_us = timeit.timeit(parse_every_time, number=number) / number * 1e6
+    compiled_us = timeit.timeit(compiled_once, number=number) / number * 1e6
+    print(f"{label:<16} parse+eval: {parse_us:8.2f} µs   compiled eval: {compiled_us:8.2f} µs   "
+          f"speedup: {parse_us / compiled_us:5.1f}x")
+
+
+if __name__ == "__main__":
+    print("=== 성공 기준 평가 비용 (응답 1건당) ===")
+    for name, criteria in CRITERIA_SETS.items():
+        bench(name, criteria)
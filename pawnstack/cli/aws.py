@@ -14,6 +14,11 @@ from typing import Dict, Any, List, Optional
 from argparse import ArgumentParser
 
 from pawnstack.cli.base import CloudBaseCLI, register_cli_command
+from pawnstack.cloud.metadata import DEFAULT_CACHE_PATH, SUMMARY_PATHS, InstanceMetadata
+from pawnstack.cloud.route53 import (
+    Backoff, apply_changes, backup_zones, batch_changes, diff_record_sets, find_hosted_zone,
+    list_hosted_zones, list_record_sets, normalize_name, rebase_records,
+)
 from pawnstack.config.global_config import pawn
 
 
@@ -25,20 +30,26 @@ from pawnstack.config.global_config import pawn
   1. AWS 메타데이터 조회:
      pawns aws metadata --output-format json
 
-  2. AWS 계정 정보 조회:
+  2. 전체 메타데이터 트리 수집 (캐시 무시):
+     pawns aws metadata --crawl --refresh
+
+  3. AWS 계정 정보 조회:
      pawns aws info --profile production
 
-  3. Route53 호스팅 영역 목록:
+  4. Route53 호스팅 영역 목록:
      pawns aws route53 ls --profile production
 
-  4. Route53 호스팅 영역 백업:
+  5. Route53 호스팅 영역 백업:
      pawns aws route53 backup /hostedzone/Z123456789 backup.json
 
-  5. Route53 호스팅 영역 복원:
+  6. Route53 호스팅 영역 복원:
      pawns aws route53 restore backup.json example.com
 
-  6. 모든 Route53 호스팅 영역 백업:
-     pawns aws route53 backup all
+  7. 모든 Route53 호스팅 영역 백업 (16 개 영역 동시 조회):
+     pawns aws route53 backup all --concurrency 16
+
+  8. 기존 영역을 백업과 같게 맞추기 (변경분만 적용, 백업에 없는 레코드 삭제):
+     pawns aws route53 restore backup.json example.com --delete --dry-run
 """
 )
 class AWSCLI(CloudBaseCLI):
@@ -48,6 +59,7 @@ class AWSCLI(CloudBaseCLI):
         super().__init__(args)
         self.metadata_ip = "169.254.169.254"
         self.metadata_timeout = 2
+        self._backoff = None
 
     def get_arguments(self, parser: ArgumentParser):
         """AWS CLI 인수 정의"""
@@ -74,6 +86,22 @@ class AWSCLI(CloudBaseCLI):
             default=2,
             help='메타데이터 요청 타임아웃 (초, default: 2)'
         )
+        metadata_parser.add_argument(
+            '--crawl',
+            action='store_true',
+            help='전체 메타데이터 트리를 동시에 수집'
+        )
+        metadata_parser.add_argument(
+            '--cache-ttl',
+            type=float,
+            default=300,
+            help=f'디스크 캐시 유효 시간 (초, 0 이면 캐시 안 함, 캐시: {DEFAULT_CACHE_PATH}, default: 300)'
+        )
+        metadata_parser.add_argument(
+            '--refresh',
+            action='store_true',
+            help='캐시를 무시하고 새로 조회'
+        )
         metadata_parser.add_argument(
             '--output-file', '-o',
             type=str,
@@ -111,6 +139,12 @@ class AWSCLI(CloudBaseCLI):
             action='store_true',
             help='레코드 세트 정보 포함'
         )
+        ls_parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=8,
+            help='레코드를 동시에 조회할 영역 수 (default: 8)'
+        )
 
         # route53 backup
         backup_parser = route53_subparsers.add_parser(
@@ -124,7 +158,13 @@ class AWSCLI(CloudBaseCLI):
         backup_parser.add_argument(
             'backup_file',
             nargs='?',
-            help='백업 파일 경로 (JSON 형식)'
+            help='백업 파일 경로 (JSON 형식, "all" 이면 백업 디렉토리)'
+        )
+        backup_parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=8,
+            help='레코드를 동시에 조회할 영역 수 (default: 8)'
         )
 
         # route53 restore
@@ -145,6 +185,16 @@ class AWSCLI(CloudBaseCLI):
             action='store_true',
             help='실제 실행하지 않고 계획만 표시'
         )
+        restore_parser.add_argument(
+            '--zone-id',
+            type=str,
+            help='복원할 기존 호스팅 영역 ID (같은 이름의 영역이 여러 개일 때)'
+        )
+        restore_parser.add_argument(
+            '--delete',
+            action='store_true',
+            help='백업에 없는 레코드를 대상 영역에서 삭제'
+        )
 
     async def run_async(self) -> int:
         """AWS CLI 비동기 실행"""
@@ -274,101 +324,54 @@ class AWSCLI(CloudBaseCLI):
             return 1
 
     async def _get_ec2_metadata(self) -> Optional[Dict[str, Any]]:
-        """EC2 메타데이터 조회"""
+        """EC2 메타데이터 조회 (IMDSv2, 동시 조회, 디스크 캐시)"""
         try:
-            import aiohttp
-
-            metadata_ip = getattr(self.args, 'metadata_ip', self.metadata_ip)
-            timeout = getattr(self.args, 'metadata_timeout', self.metadata_timeout)
-
-            base_url = f"http://{metadata_ip}/latest/meta-data/"
-
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
-                metadata = {}
-
-                # 기본 메타데이터 항목들
-                metadata_items = [
-                    'instance-id',
-                    'instance-type',
-                    'local-hostname',
-                    'local-ipv4',
-                    'public-hostname',
-                    'public-ipv4',
-                    'ami-id',
-                    'security-groups',
-                    'placement/availability-zone',
-                    'placement/region'
-                ]
-
-                for item in metadata_items:
-                    try:
-                        async with session.get(f"{base_url}{item}") as response:
-                            if response.status == 200:
-                                value = await response.text()
-                                # 중첩된 키 처리
-                                if '/' in item:
-                                    keys = item.split('/')
-                                    current = metadata
-                                    for key in keys[:-1]:
-                                        if key not in current:
-                                            current[key] = {}
-                                        current = current[key]
-                                    current[keys[-1]] = value
-                                else:
-                                    metadata[item] = value
-                    except Exception:
-                        # 개별 항목 실패는 무시
-                        pass
-
-                # IAM 역할 정보 (있는 경우)
-                try:
-                    async with session.get(f"{base_url}iam/security-credentials/") as response:
-                        if response.status == 200:
-                            role_name = await response.text()
-                            if role_name:
-                                async with session.get(f"{base_url}iam/security-credentials/{role_name}") as role_response:
-                                    if role_response.status == 200:
-                                        role_data = await role_response.json()
-                                        metadata['iam'] = {
-                                            'role_name': role_name,
-                                            'credentials': {
-                                                'access_key_id': role_data.get('AccessKeyId', ''),
-                                                'expiration': role_data.get('Expiration', ''),
-                                                'type': role_data.get('Type', '')
-                                            }
-                                        }
-                except Exception:
-                    pass
-
-                return metadata if metadata else None
-
-        except ImportError:
-            self.log_error("aiohttp 패키지가 필요합니다: pip install aiohttp")
-            return None
+            cache_ttl = getattr(self.args, 'cache_ttl', 300)
+            imds = InstanceMetadata(
+                host=getattr(self.args, 'metadata_ip', self.metadata_ip),
+                timeout=getattr(self.args, 'metadata_timeout', self.metadata_timeout),
+                cache_path=DEFAULT_CACHE_PATH if cache_ttl > 0 else None,
+                cache_ttl=cache_ttl,
+                refresh=getattr(self.args, 'refresh', False),
+            )
+            async with imds:
+                if getattr(self.args, 'crawl', False):
+                    metadata = await imds.crawl()
+                else:
+                    metadata = await imds.collect(SUMMARY_PATHS)
+
+            if imds.stats['cache_hits']:
+                self.log_debug(f"메타데이터 캐시 사용: {DEFAULT_CACHE_PATH}")
+            else:
+                self.log_debug(f"메타데이터 요청 {imds.stats['requests']} 회")
+            return metadata if metadata else None
+
         except Exception as e:
             self.log_debug(f"메타데이터 조회 실패: {e}")
             return None
 
+    def _route53_backoff(self):
+        """모든 Route53 호출이 공유하는 스로틀링 백오프"""
+        if self._backoff is None:
+            self._backoff = Backoff()
+        return self._backoff
+
     async def _route53_list(self) -> int:
         """Route53 호스팅 영역 목록 조회"""
         try:
             route53_client = await self.get_aws_client('route53')
 
             async with route53_client as route53:
-                # 호스팅 영역 목록 조회
-                response = await route53.list_hosted_zones()
-                zones = response.get('HostedZones', [])
+                backoff = self._route53_backoff()
+                zones = await list_hosted_zones(route53, backoff)
 
                 if not zones:
                     self.log_info("호스팅 영역이 없습니다")
                     return 0
 
-                # 레코드 정보 포함 여부
-                include_records = getattr(self.args, 'include_records', False)
-
-                zone_data = []
+                zone_data = {}
                 for zone in zones:
-                    zone_info = {
+                    zone_data[zone['Id']] = {
                         'name': zone['Name'],
                         'id': zone['Id'],
                         'comment': zone.get('Config', {}).get('Comment', ''),
@@ -376,28 +379,23 @@ class AWSCLI(CloudBaseCLI):
                         'record_count': zone.get('ResourceRecordSetCount', 0)
                     }
 
-                    if include_records:
-                        try:
-                            records_response = await route53.list_resource_record_sets(
-                                HostedZoneId=zone['Id']
-                            )
-                            records = records_response.get('ResourceRecordSets', [])
-
-                            # 레코드 타입별 개수 계산
-                            record_types = {}
-                            for record in records:
-                                record_type = record['Type']
-                                record_types[record_type] = record_types.get(record_type, 0) + 1
-
-                            zone_info['record_types'] = record_types
-
-                        except Exception as e:
-                            self.log_warning(f"영역 {zone['Name']} 레코드 조회 실패: {e}")
-
-                    zone_data.append(zone_info)
+                # 레코드 정보 포함 여부
+                if getattr(self.args, 'include_records', False):
+                    concurrency = getattr(self.args, 'concurrency', 8)
+                    async for result in backup_zones(route53, zones, concurrency, backoff):
+                        if not result.ok:
+                            self.log_warning(f"영역 {result.zone['Name']} 레코드 조회 실패: {result.error}")
+                            continue
+
+                        # 레코드 타입별 개수 계산
+                        record_types = {}
+                        for record in result.records:
+                            record_type = record['Type']
+                            record_types[record_type] = record_types.get(record_type, 0) + 1
+                        zone_data[result.zone['Id']]['record_types'] = record_types
 
                 # 출력
-                formatted_output = self.format_output(zone_data)
+                formatted_output = self.format_output(list(zone_data.values()))
                 pawn.console.print(formatted_output)
 
                 return 0
@@ -415,7 +413,7 @@ class AWSCLI(CloudBaseCLI):
             route53_client = await self.get_aws_client('route53')
 
             if zone_id.lower() == 'all':
-                return await self._backup_all_zones(route53_client)
+                return await self._backup_all_zones(route53_client, backup_file)
             else:
                 return await self._backup_single_zone(route53_client, zone_id, backup_file)
 
@@ -427,13 +425,14 @@ class AWSCLI(CloudBaseCLI):
         """단일 호스팅 영역 백업"""
         try:
             async with route53_client as route53:
+                backoff = self._route53_backoff()
+
                 # 호스팅 영역 정보 조회
-                zone_response = await route53.get_hosted_zone(Id=zone_id)
+                zone_response = await backoff.call(route53.get_hosted_zone, Id=zone_id)
                 zone = zone_response['HostedZone']
 
-                # 레코드 세트 조회
-                records_response = await route53.list_resource_record_sets(HostedZoneId=zone_id)
-                records = records_response['ResourceRecordSets']
+                # 레코드 세트 조회 (모든 페이지)
+                records = await list_record_sets(route53, zone_id, backoff)
 
                 # 백업 데이터 구성
                 backup_data = {
@@ -460,55 +459,64 @@ class AWSCLI(CloudBaseCLI):
             self.log_error(f"호스팅 영역 백업 실패: {e}")
             return 1
 
-    async def _backup_all_zones(self, route53_client) -> int:
-        """모든 호스팅 영역 백업"""
+    async def _backup_all_zones(self, route53_client, backup_dir: Optional[str] = None) -> int:
+        """모든 호스팅 영역 백업 (영역별 레코드를 동시에 조회)"""
         try:
             async with route53_client as route53:
+                backoff = self._route53_backoff()
+
                 # 모든 호스팅 영역 조회
-                response = await route53.list_hosted_zones()
-                zones = response.get('HostedZones', [])
+                zones = await list_hosted_zones(route53, backoff)
 
                 if not zones:
                     self.log_info("백업할 호스팅 영역이 없습니다")
                     return 0
 
                 # 백업 디렉토리 생성
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                backup_dir = Path(f"route53_backup_{timestamp}")
-                backup_dir.mkdir(exist_ok=True)
-
-                success_count = 0
-                total_records = 0
+                if not backup_dir:
+                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                    backup_dir = f"route53_backup_{timestamp}"
+                backup_dir = Path(backup_dir)
+                backup_dir.mkdir(parents=True, exist_ok=True)
 
+                # 같은 이름의 공개/비공개 영역은 파일명에 영역 ID 를 붙여 구분
+                name_counts = {}
                 for zone in zones:
-                    try:
-                        zone_id = zone['Id']
-                        zone_name = zone['Name'].rstrip('.')
+                    zone_name = zone['Name'].rstrip('.')
+                    name_counts[zone_name] = name_counts.get(zone_name, 0) + 1
 
-                        # 레코드 세트 조회
-                        records_response = await route53.list_resource_record_sets(HostedZoneId=zone_id)
-                        records = records_response['ResourceRecordSets']
+                success_count = 0
+                total_records = 0
+                concurrency = getattr(self.args, 'concurrency', 8)
 
-                        # 백업 데이터 구성
-                        backup_data = {
-                            'backup_timestamp': datetime.now().isoformat(),
-                            'hosted_zone': zone,
-                            'resource_record_sets': records
-                        }
+                async for result in backup_zones(route53, zones, concurrency, backoff):
+                    zone = result.zone
+                    zone_name = zone['Name'].rstrip('.')
+                    if not result.ok:
+                        self.log_error(f"✗ {zone_name or 'Unknown'} 백업 실패: {result.error}")
+                        continue
 
-                        # 파일 저장
-                        backup_file = backup_dir / f"{zone_name}.json"
-                        await self._write_output_file(str(backup_file), backup_data)
+                    # 백업 데이터 구성
+                    backup_data = {
+                        'backup_timestamp': datetime.now().isoformat(),
+                        'hosted_zone': zone,
+                        'resource_record_sets': result.records
+                    }
 
-                        success_count += 1
-                        total_records += len(records)
+                    # 파일 저장
+                    file_name = zone_name
+                    if name_counts[zone_name] > 1:
+                        file_name = f"{zone_name}_{zone['Id'].rsplit('/', 1)[-1]}"
+                    await self._write_output_file(str(backup_dir / f"{file_name}.json"), backup_data)
 
-                        self.log_info(f"✓ {zone_name} ({len(records)} 레코드)")
+                    success_count += 1
+                    total_records += len(result.records)
 
-                    except Exception as e:
-                        self.log_error(f"✗ {zone.get('Name', 'Unknown')} 백업 실패: {e}")
+                    self.log_info(f"✓ {zone_name} ({len(result.records)} 레코드)")
 
                 self.log_success(f"전체 백업 완료: {success_count}/{len(zones)} 영역, {total_records} 레코드")
+                if backoff.throttled:
+                    self.log_info(f"스로틀링 재시도: {backoff.throttled} 회")
                 self.log_info(f"백업 위치: {backup_dir.absolute()}")
 
                 return 0 if success_count > 0 else 1
@@ -532,10 +540,15 @@ class AWSCLI(CloudBaseCLI):
             route53_client = await self.get_aws_client('route53')
 
             async with route53_client as route53:
+                target_zone = await self._find_restore_target(route53, backup_data, new_zone_name)
+                if target_zone is False:
+                    return 1
+                changes = await self._plan_restore(route53, backup_data, new_zone_name, target_zone)
+
                 if dry_run:
-                    return await self._preview_restore(backup_data, new_zone_name)
+                    return await self._preview_restore(backup_data, new_zone_name, target_zone, changes)
                 else:
-                    return await self._execute_restore(route53, backup_data, new_zone_name)
+                    return await self._execute_restore(route53, backup_data, new_zone_name, target_zone, changes)
 
         except Exception as e:
             self.log_error(f"Route53 복원 실패: {e}")
@@ -568,7 +581,60 @@ class AWSCLI(CloudBaseCLI):
             self.log_error(f"백업 파일 로드 실패: {e}")
             return None
 
-    async def _preview_restore(self, backup_data: Dict[str, Any], new_zone_name: str) -> int:
+    async def _find_restore_target(self, route53, backup_data: Dict[str, Any], new_zone_name: str):
+        """
+        복원할 기존 호스팅 영역 조회
+
+        Returns:
+            기존 영역, 없으면 None (새로 생성), 대상을 정할 수 없으면 False
+        """
+        backoff = self._route53_backoff()
+        zone_id = getattr(self.args, 'zone_id', None)
+        if zone_id:
+            zone = (await backoff.call(route53.get_hosted_zone, Id=zone_id))['HostedZone']
+            if normalize_name(zone['Name']) != normalize_name(new_zone_name):
+                self.log_error(f"영역 {zone_id} 의 이름 ({zone['Name']}) 이 {new_zone_name} 과 다릅니다")
+                return False
+            return zone
+
+        private = backup_data['hosted_zone'].get('Config', {}).get('PrivateZone', False)
+        matches = await find_hosted_zone(route53, new_zone_name, private, backoff)
+        if len(matches) > 1:
+            ids = ', '.join(zone['Id'] for zone in matches)
+            self.log_error(f"이름이 {new_zone_name} 인 영역이 여러 개입니다 ({ids}). --zone-id 로 지정하세요")
+            return False
+        return matches[0] if matches else None
+
+    async def _plan_restore(
+        self,
+        route53,
+        backup_data: Dict[str, Any],
+        new_zone_name: str,
+        target_zone: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """백업 레코드를 새 영역 (이름, 영역 내부 alias 의 영역 ID) 으로 옮기고 현재 영역과의 차이 (변경 목록) 계산"""
+        desired = rebase_records(
+            backup_data['resource_record_sets'], backup_data['hosted_zone']['Name'], new_zone_name,
+            backup_data['hosted_zone'].get('Id'), target_zone['Id'] if target_zone is not None else None
+        )
+        live = []
+        if target_zone is not None:
+            live = await list_record_sets(route53, target_zone['Id'], self._route53_backoff())
+        return diff_record_sets(live, desired, new_zone_name, delete=getattr(self.args, 'delete', False))
+
+    def _summarize_changes(self, changes: List[Dict[str, Any]]) -> Dict[str, int]:
+        summary = {}
+        for change in changes:
+            summary[change['Action']] = summary.get(change['Action'], 0) + 1
+        return summary
+
+    async def _preview_restore(
+        self,
+        backup_data: Dict[str, Any],
+        new_zone_name: str,
+        target_zone: Optional[Dict[str, Any]],
+        changes: List[Dict[str, Any]]
+    ) -> int:
         """복원 미리보기"""
         try:
             hosted_zone = backup_data['hosted_zone']
@@ -576,29 +642,29 @@ class AWSCLI(CloudBaseCLI):
 
             pawn.console.log(f"[bold]복원 계획 미리보기[/bold]")
             pawn.console.log(f"원본 영역: {hosted_zone['Name']}")
-            pawn.console.log(f"새 영역: {new_zone_name}")
-            pawn.console.log(f"총 레코드 수: {len(records)}")
+            if target_zone is not None:
+                pawn.console.log(f"대상 영역: {new_zone_name} (기존 영역 {target_zone['Id']})")
+            else:
+                pawn.console.log(f"대상 영역: {new_zone_name} (새로 생성)")
+            pawn.console.log(f"백업 레코드 수: {len(records)}")
             pawn.console.log("")
 
-            # 레코드 타입별 통계
+            # 레코드 타입별 변경 통계
             record_types = {}
-            skipped_records = []
-
-            for record in records:
-                record_type = record['Type']
-                record_types[record_type] = record_types.get(record_type, 0) + 1
+            for change in changes:
+                record_type = change['ResourceRecordSet']['Type']
+                record_types.setdefault(record_type, {})
+                record_types[record_type][change['Action']] = record_types[record_type].get(change['Action'], 0) + 1
 
-                # SOA, NS 레코드는 건너뜀
-                if record_type in ['SOA', 'NS']:
-                    skipped_records.append(record)
-
-            pawn.console.log("레코드 타입별 통계:")
-            for record_type, count in sorted(record_types.items()):
-                status = "(건너뜀)" if record_type in ['SOA', 'NS'] else ""
-                pawn.console.log(f"  {record_type}: {count} {status}")
+            pawn.console.log("레코드 타입별 변경:")
+            for record_type, actions in sorted(record_types.items()):
+                detail = ", ".join(f"{action} {count}" for action, count in sorted(actions.items()))
+                pawn.console.log(f"  {record_type}: {detail}")
 
             pawn.console.log("")
-            pawn.console.log(f"실제 복원될 레코드: {len(records) - len(skipped_records)}")
+            summary = self._summarize_changes(changes)
+            detail = ", ".join(f"{action} {count}" for action, count in sorted(summary.items())) or "없음"
+            pawn.console.log(f"적용될 변경: {len(changes)} ({detail}), {len(batch_changes(changes))} 배치")
             pawn.console.log("실제 복원을 수행하려면 --dry-run 옵션을 제거하세요.")
 
             return 0
@@ -607,60 +673,68 @@ class AWSCLI(CloudBaseCLI):
             self.log_error(f"복원 미리보기 실패: {e}")
             return 1
 
-    async def _execute_restore(self, route53, backup_data: Dict[str, Any], new_zone_name: str) -> int:
-        """복원 실행"""
+    async def _execute_restore(
+        self,
+        route53,
+        backup_data: Dict[str, Any],
+        new_zone_name: str,
+        target_zone: Optional[Dict[str, Any]],
+        changes: List[Dict[str, Any]]
+    ) -> int:
+        """복원 실행 (변경분만 최대 크기 배치로 적용)"""
         try:
             hosted_zone = backup_data['hosted_zone']
-            records = backup_data['resource_record_sets']
-
-            # 새 호스팅 영역 생성
-            caller_reference = f"{new_zone_name}-{datetime.now().isoformat()}"
-
-            create_response = await route53.create_hosted_zone(
-                Name=new_zone_name,
-                CallerReference=caller_reference,
-                HostedZoneConfig={
-                    'Comment': hosted_zone.get('Config', {}).get('Comment', f'Restored from {hosted_zone["Name"]}'),
-                    'PrivateZone': hosted_zone.get('Config', {}).get('PrivateZone', False)
-                }
-            )
-
-            new_zone = create_response['HostedZone']
-            new_zone_id = new_zone['Id']
-
-            self.log_success(f"새 호스팅 영역 생성 완료: {new_zone_id}")
+            backoff = self._route53_backoff()
+
+            if target_zone is None:
+                # 새 호스팅 영역 생성
+                caller_reference = f"{new_zone_name}-{datetime.now().isoformat()}"
+
+                create_response = await backoff.call(
+                    route53.create_hosted_zone,
+                    Name=new_zone_name,
+                    CallerReference=caller_reference,
+                    HostedZoneConfig={
+                        'Comment': hosted_zone.get('Config', {}).get('Comment', f'Restored from {hosted_zone["Name"]}'),
+                        'PrivateZone': hosted_zone.get('Config', {}).get('PrivateZone', False)
+                    }
+                )
+                target_zone = create_response['HostedZone']
+                self.log_success(f"새 호스팅 영역 생성 완료: {target_zone['Id']}")
+                # 영역 내부 alias 가 새 영역 ID 를 가리키도록 다시 계산
+                changes = await self._plan_restore(route53, backup_data, new_zone_name, target_zone)
+
+            zone_id = target_zone['Id']
+            if not changes:
+                self.log_success("변경할 레코드가 없습니다 (이미 백업과 같음)")
+                return 0
 
             # 레코드 복원
-            restored_count = 0
-            skipped_count = 0
-
-            for record in records:
-                try:
-                    # SOA, NS 레코드는 건너뜀 (자동 생성됨)
-                    if record['Type'] in ['SOA', 'NS']:
-                        skipped_count += 1
-                        continue
-
-                    # 레코드 생성
-                    await route53.change_resource_record_sets(
-                        HostedZoneId=new_zone_id,
-                        ChangeBatch={
-                            'Changes': [{
-                                'Action': 'CREATE',
-                                'ResourceRecordSet': record
-                            }]
-                        }
-                    )
-
-                    restored_count += 1
-
-                except Exception as e:
-                    self.log_warning(f"레코드 복원 실패 ({record.get('Name', 'Unknown')} {record.get('Type', 'Unknown')}): {e}")
-
-            self.log_success(f"복원 완료: {restored_count} 레코드 생성, {skipped_count} 레코드 건너뜀")
-            self.log_info(f"새 호스팅 영역 ID: {new_zone_id}")
-
-            return 0
+            applied = {}
+            failed_count = 0
+            batch_count = 0
+            comment = f"pawns restore from {hosted_zone['Name']}"
+
+            async for batch, error in apply_changes(route53, zone_id, changes, comment=comment, backoff=backoff):
+                batch_count += 1
+                if error:
+                    failed_count += len(batch)
+                    if len(batch) == 1:
+                        record = batch[0]['ResourceRecordSet']
+                        self.log_warning(f"레코드 복원 실패 ({record.get('Name', 'Unknown')} {record.get('Type', 'Unknown')}): {error}")
+                    else:
+                        self.log_warning(f"배치 복원 실패 ({len(batch)} 변경): {error}")
+                    continue
+                for action, count in self._summarize_changes(batch).items():
+                    applied[action] = applied.get(action, 0) + count
+
+            detail = ", ".join(f"{action} {count}" for action, count in sorted(applied.items())) or "없음"
+            self.log_success(f"복원 완료: {sum(applied.values())} 변경 적용 ({detail}), {batch_count} 요청, {failed_count} 실패")
+            if backoff.throttled:
+                self.log_info(f"스로틀링 재시도: {backoff.throttled} 회")
+            self.log_info(f"호스팅 영역 ID: {zone_id}")
+
+            return 0 if failed_count == 0 else 1
 
         except Exception as e:
             self.log_error(f"복원 실행 실패: {e}")
@@ -20,7 +20,10 @@ from pawnstack.cli.banner import generate_banner
 from pawnstack.utils.file import write_json, read_file
 from pawnstack.typing.validators import is_valid_url, is_json
 from pawnstack.http.client import HttpClient
-from pawnstack.monitoring import HTTPMonitor, HTTPMonitorConfig, quick_benchmark
+from pawnstack.http.criteria import SuccessCriteria, compile_criteria, resolve_json_path
+from pawnstack.monitoring import HTTPMonitor, HTTPMonitorConfig, FixedRateScheduler, quick_benchmark
+from pawnstack.monitoring.performance import parse_load_stages
+from pawnstack.monitoring.stats import RollingStats
 
 # 모듈 메타데이터
 __description__ = 'This is a tool to measure RTT on HTTP/S requests.'
@@ -71,6 +74,10 @@ __epilog__ = (
 )
 
 
+# 기준이 없을 때 pawns http 의 판정 (HTTPMonitor 는 2xx)
+DEFAULT_SUCCESS_CRITERIA = ["status_code==200"]
+
+
 @dataclass
 class HTTPTask:
     """HTTP 작업 설정"""
@@ -82,6 +89,13 @@ class HTTPTask:
     success_criteria: List[str] = field(default_factory=lambda: ["status_code==200"])
     logical_operator: str = "and"
     section_name: str = "default"
+    max_body_size: Optional[int] = None
+    discard_unused_body: bool = False  # 기준이 본문을 보지 않으면 본문을 버리고 크기만 기록
+    criteria: SuccessCriteria = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """성공 기준은 한 번만 컴파일 (비어 있으면 status_code==200)"""
+        self.criteria = compile_criteria(self.success_criteria or DEFAULT_SUCCESS_CRITERIA, self.logical_operator)
 
 
 # HTTPMonitor 클래스 제거됨 - 기능이 HTTPCLI로 통합됨
@@ -92,7 +106,7 @@ class HTTPCLI(HTTPBaseCLI):
 
     def __init__(self, args=None):
         super().__init__(args)
-        self.response_times = []
+        self.response_stats = RollingStats()  # 전체 요청 응답시간 (고정 메모리)
         self.total_count = 0
         self.fail_count = 0
         self.error_count = 0
@@ -101,7 +115,9 @@ class HTTPCLI(HTTPBaseCLI):
         self.max_response_time = 0
         self.min_response_time = float('inf')
         self.avg_response_time = 0
-        self.successful_response_times = []  # 성공한 요청들의 응답시간
+        self.success_stats = RollingStats()  # 성공한 요청들의 응답시간 (고정 메모리)
+        self.http_client = HttpClient()  # 모든 체크가 공유하는 커넥션 풀
+        self._reported_missed: Dict[str, int] = {}  # 작업별로 알림한 누락 틱 수
 
     def get_arguments(self, parser: ArgumentParser):
         """인수 정의 (레거시 호환)"""
@@ -121,8 +137,11 @@ class HTTPCLI(HTTPBaseCLI):
 
         parser.add_argument('--data', type=str, help='Data to send with the request (JSON format for POST/PUT requests).')
         parser.add_argument('--headers', type=str, help='HTTP headers in JSON format (e.g., \'{"Content-Type": "application/json"}\').')
+        parser.add_argument('--max-body-size', type=int, help='Maximum response body bytes to keep (0 discards the body, only size is recorded). Default keeps the whole body.', default=None)
+        parser.add_argument('--discard-unused-body', action='store_true', help='Discard the response body (keeping only its size) when no success criterion or --blockheight-key reads it.')
 
-        parser.add_argument('-w', '--workers', type=int, help='Number of worker threads for concurrent requests. Default is 10.', default=10)
+        parser.add_argument('-w', '--workers', type=int, help='Maximum number of concurrent checks. Default is 10.', default=10)
+        parser.add_argument('--jitter', type=float, help='Spread each URL\'s start over this fraction of the interval to avoid bursts (0-1). Default is 0.1.', default=0.1)
         parser.add_argument('--stack-limit', type=int, help='Maximum number of items to keep in response time stack. Default is 5.', default=5)
 
         parser.add_argument('--dry-run', action='store_true', help='Perform a dry run without making actual HTTP requests.')
@@ -137,6 +156,10 @@ class HTTPCLI(HTTPBaseCLI):
         parser.add_argument('--benchmark', action='store_true', help='Run performance benchmark instead of monitoring.')
         parser.add_argument('--benchmark-requests', type=int, help='Number of requests for benchmark. Default is 100.', default=100)
         parser.add_argument('--benchmark-concurrency', type=int, help='Concurrent requests for benchmark. Default is 10.', default=10)
+        parser.add_argument('--benchmark-rate', type=float, help='Target requests per second (open-loop). Latency is measured from the scheduled send time.', default=None)
+        parser.add_argument('--benchmark-duration', type=float, help='Benchmark duration in seconds (instead of --benchmark-requests).', default=None)
+        parser.add_argument('--benchmark-stages', type=str, help='Ramp stages as "duration:target,..." (e.g., "30:100,60:500"). Target is RPS with --benchmark-rate, otherwise concurrency.', default=None)
+        parser.add_argument('--processes', type=int, help='Number of load generator processes for benchmark mode (each with its own event loop and connection pool). Default is 1.', default=1)
 
     def setup_config(self):
         """설정 초기화 (레거시 호환)"""
@@ -243,16 +266,22 @@ class HTTPCLI(HTTPBaseCLI):
                 self.log_error(f"Invalid URL: {self.args.url}")
                 return []
 
-            task = HTTPTask(
-                url=self.args.url,
-                method=getattr(self.args, 'method', 'GET'),
-                headers=self.parse_headers(),
-                data=self.parse_data(),
-                timeout=getattr(self.args, 'timeout', 10.0),
-                success_criteria=getattr(self.args, 'success', None) or ["status_code==200"],
-                logical_operator=getattr(self.args, 'logical_operator', 'and'),
-                section_name="command_line"
-            )
+            try:
+                task = HTTPTask(
+                    url=self.args.url,
+                    method=getattr(self.args, 'method', 'GET'),
+                    headers=self.parse_headers(),
+                    data=self.parse_data(),
+                    timeout=getattr(self.args, 'timeout', 10.0),
+                    success_criteria=getattr(self.args, 'success', None) or ["status_code==200"],
+                    logical_operator=getattr(self.args, 'logical_operator', 'and'),
+                    section_name="command_line",
+                    max_body_size=getattr(self.args, 'max_body_size', None),
+                    discard_unused_body=getattr(self.args, 'discard_unused_body', False)
+                )
+            except ValueError as e:
+                self.log_error(f"Invalid success criteria: {e}")
+                return []
             tasks.append(task)
 
         # 설정 파일에서 추가 작업 로드
@@ -298,16 +327,24 @@ class HTTPCLI(HTTPBaseCLI):
                             except:
                                 success_criteria = [section.get('success')]
 
-                        task = HTTPTask(
-                            url=url,
-                            method=section.get('method', 'GET').upper(),
-                            headers=headers,
-                            data=data,
-                            timeout=float(section.get('timeout', 10.0)),
-                            success_criteria=success_criteria,
-                            logical_operator=section.get('logical_operator', 'and'),
-                            section_name=section_name
-                        )
+                        try:
+                            task = HTTPTask(
+                                url=url,
+                                method=section.get('method', 'GET').upper(),
+                                headers=headers,
+                                data=data,
+                                timeout=float(section.get('timeout', 10.0)),
+                                success_criteria=success_criteria,
+                                logical_operator=section.get('logical_operator', 'and'),
+                                section_name=section_name,
+                                max_body_size=section.getint('max_body_size', getattr(self.args, 'max_body_size', None)),
+                                discard_unused_body=section.getboolean(
+                                    'discard_unused_body', getattr(self.args, 'discard_unused_body', False)
+                                )
+                            )
+                        except ValueError as e:
+                            self.log_warning(f"Skipping section [{section_name}]: invalid success criteria: {e}")
+                            continue
                         tasks.append(task)
 
             except Exception as e:
@@ -315,95 +352,30 @@ class HTTPCLI(HTTPBaseCLI):
 
         return tasks
 
-    def check_success_criteria(self, response, response_time: float, criteria: List[str], operator: str = "and") -> bool:
-        """성공 기준 검사"""
-        if not criteria or criteria == [None]:
-            return response.status_code == 200
+    def check_success_criteria(self, response, response_time: float, criteria, operator: str = "and") -> bool:
+        """
+        성공 기준 검사
 
-        results = []
+        criteria 는 컴파일된 SuccessCriteria 또는 기준 문자열 목록 (목록이면 매번 컴파일됨)
+        """
+        if not isinstance(criteria, SuccessCriteria):
+            criteria = compile_criteria([c for c in criteria or [] if c] or DEFAULT_SUCCESS_CRITERIA, operator)
 
         # 디버그 모드에서 상세 정보 출력
         if getattr(self.args, 'verbose_level', 1) >= 3:
-            pawn.console.log(f"[dim]Checking criteria: {criteria}, operator: {operator}[/dim]")
-
-        for criterion in criteria:
-            if "==" in criterion:
-                key, expected = criterion.split("==", 1)
-                key = key.strip()
-                expected = expected.strip()
-
-                if key == "status_code":
-                    result = response.status_code == int(expected)
-                    results.append(result)
-                    if getattr(self.args, 'verbose_level', 1) >= 3:
-                        pawn.console.log(f"[dim]  status_code: {response.status_code} == {expected} => {result}[/dim]")
-                elif key == "response_time":
-                    result = response_time == float(expected)
-                    results.append(result)
-                    if getattr(self.args, 'verbose_level', 1) >= 3:
-                        pawn.console.log(f"[dim]  response_time: {response_time:.3f} == {expected} => {result}[/dim]")
-                else:
-                    # 응답 데이터에서 키 검색
-                    try:
-                        if hasattr(response, 'json') and response.content:
-                            data = response.json()
-                            actual = self.get_nested_value(data, key)
-                            results.append(str(actual) == expected)
-                        else:
-                            results.append(False)
-                    except:
-                        results.append(False)
-
-            elif "<" in criterion:
-                key, threshold = criterion.split("<", 1)
-                key = key.strip()
-                threshold = float(threshold.strip())
-
-                if key == "response_time":
-                    result = response_time < threshold
-                    results.append(result)
-                    if getattr(self.args, 'verbose_level', 1) >= 3:
-                        pawn.console.log(f"[dim]  response_time: {response_time:.3f} < {threshold} => {result}[/dim]")
-                else:
-                    results.append(False)
-
-            elif ">" in criterion:
-                key, threshold = criterion.split(">", 1)
-                key = key.strip()
-                threshold = float(threshold.strip())
-
-                if key == "response_time":
-                    result = response_time > threshold
-                    results.append(result)
-                    if getattr(self.args, 'verbose_level', 1) >= 3:
-                        pawn.console.log(f"[dim]  response_time: {response_time:.3f} > {threshold} => {result}[/dim]")
-                else:
-                    results.append(False)
-
-        # 결과가 비어있으면 status_code 200 검사
-        if not results:
-            return response.status_code == 200
-
-        # 논리 연산자 적용
-        final_result = all(results) if operator.lower() == "and" else any(results)
+            pawn.console.log(f"[dim]Checking criteria: {list(criteria.criteria)}, operator: {criteria.operator}[/dim]")
+            details = criteria.explain(response, response_time)
+            for source, actual, result in details:
+                pawn.console.log(f"[dim]  {source}: actual={actual!r} => {result}[/dim]")
+            final_result = criteria.evaluate(response, response_time)
+            pawn.console.log(f"[dim]  Final: {[r for _, _, r in details]} with {criteria.operator} => {final_result}[/dim]")
+            return final_result
 
-        if getattr(self.args, 'verbose_level', 1) >= 3:
-            pawn.console.log(f"[dim]  Final: {results} with {operator} => {final_result}[/dim]")
-
-        return final_result
+        return criteria.evaluate(response, response_time)
 
     def get_nested_value(self, data: Dict[str, Any], key_path: str) -> Any:
-        """중첩된 딕셔너리에서 값 추출"""
-        keys = key_path.split(".")
-        current = data
-
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return None
-
-        return current
+        """중첩된 딕셔너리에서 값 추출 (리스트 인덱스 지원)"""
+        return resolve_json_path(data, key_path)
 
     async def run_monitoring(self, tasks: List[HTTPTask]):
         """모니터링 실행"""
@@ -418,25 +390,49 @@ class HTTPCLI(HTTPBaseCLI):
                 pawn.console.log(f"[DRY RUN] Would check: {task.method} {task.url}")
             return
 
-        try:
-            while True:
-                for task in tasks:
-                    result = await self.check_url(task)
-
-                    # 결과 출력
-                    if not getattr(self.args, 'quiet', 0):
-                        self.display_result(result)
+        scheduler = FixedRateScheduler(
+            interval=interval,
+            max_concurrency=getattr(self.args, 'workers', 10),
+            jitter=getattr(self.args, 'jitter', 0.1),
+            on_error=lambda key, e: self.log_error(f"Check failed for {key}: {e}"),
+        )
+        for index, task in enumerate(tasks):
+            key = f"{task.section_name}#{index}"
+            scheduler.add(key, lambda task=task, key=key: self._run_scheduled_check(scheduler, key, task))
 
-                    # 실패 시 슬랙 알림
-                    if not result.get('success') and hasattr(self.args, 'slack_url') and self.args.slack_url:
-                        await self.send_slack_notification(result)
+        try:
+            # URL 별 고정 주기 타이머로 동시 실행 (느린 URL 이 다른 URL 을 지연시키지 않음)
+            await scheduler.run()
+        except KeyboardInterrupt:
+            self.log_info("HTTP monitoring stopped by user")
+        finally:
+            total = scheduler.total_stats()
+            if total.scheduled:
+                self.log_info(
+                    f"Schedule summary: ticks={total.scheduled}, checks={total.completed}, "
+                    f"missed={total.missed}, avg_lag={total.avg_lag * 1000:.1f}ms, max_lag={total.max_lag * 1000:.1f}ms"
+                )
 
-                # 통계 출력은 개별 결과 출력에 포함됨 (레거시 형식)
+    async def _run_scheduled_check(self, scheduler: FixedRateScheduler, key: str, task: HTTPTask):
+        """스케줄러가 호출하는 단일 체크"""
+        result = await self.check_url(task)
 
-                await asyncio.sleep(interval)
+        # 결과 출력
+        if not getattr(self.args, 'quiet', 0):
+            self.display_result(result)
+
+        # 이전 체크가 주기보다 오래 걸려 건너뛴 틱 알림
+        missed = scheduler.stats[key].missed
+        if missed > self._reported_missed.get(key, 0):
+            self.log_warning(
+                f"url='{task.url}' skipped {missed - self._reported_missed.get(key, 0)} tick(s); "
+                f"check takes longer than the {scheduler.interval}s interval"
+            )
+            self._reported_missed[key] = missed
 
-        except KeyboardInterrupt:
-            self.log_info("HTTP monitoring stopped by user")
+        # 실패 시 슬랙 알림
+        if not result.get('success') and hasattr(self.args, 'slack_url') and self.args.slack_url:
+            await self.send_slack_notification(result)
 
     def display_result(self, result: Dict[str, Any]):
         """결과 출력 - 레거시 형식"""
@@ -447,7 +443,7 @@ class HTTPCLI(HTTPBaseCLI):
         stats_str = f"<CER:{self.consecutive_errors}/ER:{self.error_count}/SQ:{self.sequence}>"
 
         # 응답 시간 통계 (밀리초)
-        if self.successful_response_times:
+        if self.success_stats.count:
             avg_ms = int(self.avg_response_time * 1000)
             max_ms = int(self.max_response_time * 1000)
             min_ms = int(self.min_response_time * 1000) if self.min_response_time != float('inf') else 0
@@ -522,7 +518,10 @@ class HTTPCLI(HTTPBaseCLI):
             self.log_error("No valid URLs to monitor")
             return 1
 
-        await self.run_monitoring(tasks)
+        try:
+            await self.run_monitoring(tasks)
+        finally:
+            await self.http_client.aclose()
         return 0
 
     async def run_benchmark_mode(self) -> int:
@@ -535,9 +534,26 @@ class HTTPCLI(HTTPBaseCLI):
         method = getattr(self.args, 'method', 'GET')
         requests = getattr(self.args, 'benchmark_requests', 100)
         concurrency = getattr(self.args, 'benchmark_concurrency', 10)
+        rate = getattr(self.args, 'benchmark_rate', None)
+        duration = getattr(self.args, 'benchmark_duration', None)
+        stages_spec = getattr(self.args, 'benchmark_stages', None)
+        processes = getattr(self.args, 'processes', 1) or 1
+
+        stages = None
+        if stages_spec:
+            try:
+                stages = parse_load_stages(stages_spec)
+            except ValueError as e:
+                self.log_error(str(e))
+                return 1
 
         self.log_info(f"벤치마크 모드 시작: {url}")
-        self.log_info(f"요청 수: {requests}, 동시 요청: {concurrency}")
+        if rate or stages:
+            self.log_info(f"목표 RPS: {rate}, 실행 시간: {duration}, 단계: {stages_spec}")
+        else:
+            self.log_info(f"요청 수: {requests}, 동시 요청: {concurrency}")
+        if processes > 1:
+            self.log_info(f"부하 생성 프로세스: {processes}")
 
         try:
             result = await quick_benchmark(
@@ -545,6 +561,11 @@ class HTTPCLI(HTTPBaseCLI):
                 name=f"CLI Benchmark: {url}",
                 requests=requests,
                 concurrency=concurrency,
+                duration=duration,
+                rate=rate,
+                stages=stages,
+                mode="rate" if rate else None,
+                processes=processes,
                 method=method,
                 headers=self.parse_headers(),
                 data=self.parse_data(),
@@ -561,6 +582,8 @@ class HTTPCLI(HTTPBaseCLI):
             if result.percentiles:
                 pawn.console.log(f"95th 백분위수: {result.percentiles.get(95, 0):.3f}초")
                 pawn.console.log(f"99th 백분위수: {result.percentiles.get(99, 0):.3f}초")
+            if result.corrected_percentiles:
+                pawn.console.log(f"99th 백분위수 (보정): {result.corrected_percentiles.get(99, 0):.3f}초")
 
             return 0
 
@@ -589,7 +612,8 @@ class HTTPCLI(HTTPBaseCLI):
                 success_criteria=task.success_criteria,
                 logical_operator=task.logical_operator,
                 name=task.section_name,
-                verify_ssl=not getattr(self.args, 'ignore_ssl', False)
+                verify_ssl=not getattr(self.args, 'ignore_ssl', False),
+                max_body_size=task.max_body_size
             )
             monitor_configs.append(config)
 
@@ -623,26 +647,30 @@ class HTTPCLI(HTTPBaseCLI):
         self.sequence += 1  # 시퀀스 증가
 
         try:
-            from pawnstack.http.client import HttpClient
-            client = HttpClient()
-
-            # HTTP 요청 실행
-            response = await client.request(
+            # discard_unused_body 이고 본문을 참조하는 기준/블록 높이 키가 없으면 본문은 버리고 크기만 기록
+            max_body_size = task.max_body_size
+            if (max_body_size is None and task.discard_unused_body and not task.criteria.needs_body
+                    and not getattr(self.args, 'blockheight_key', None)):
+                max_body_size = 0
+
+            # HTTP 요청 실행 (공유 커넥션 풀 사용)
+            response = await self.http_client.request(
                 method=task.method,
                 url=task.url,
                 headers=task.headers,
                 json=task.data if isinstance(task.data, dict) else None,
                 data=task.data if isinstance(task.data, str) else None,
                 timeout=task.timeout,
-                verify_ssl=not getattr(self.args, 'ignore_ssl', False)
+                verify_ssl=not getattr(self.args, 'ignore_ssl', False),
+                max_body_size=max_body_size
             )
 
             response_time = time.time() - start_time
-            self.response_times.append(response_time)
+            self.response_stats.add(response_time)
             self.total_count += 1
 
             # 성공 기준 검사
-            success = self.check_success_criteria(response, response_time, task.success_criteria, task.logical_operator)
+            success = self.check_success_criteria(response, response_time, task.criteria)
 
             # 디버그 정보 출력
             if getattr(self.args, 'verbose_level', 1) >= 2:
@@ -655,17 +683,11 @@ class HTTPCLI(HTTPBaseCLI):
                 # 성공 시 연속 에러 카운트 리셋
                 self.consecutive_errors = 0
 
-                # 성공한 요청의 응답 시간 통계 업데이트
-                self.successful_response_times.append(response_time)
-
-                # 최소/최대/평균 응답 시간 업데이트
-                if response_time < self.min_response_time:
-                    self.min_response_time = response_time
-                if response_time > self.max_response_time:
-                    self.max_response_time = response_time
-
-                # 평균 계산
-                self.avg_response_time = sum(self.successful_response_times) / len(self.successful_response_times)
+                # 성공한 요청의 응답 시간 통계 업데이트 (O(1))
+                self.success_stats.add(response_time)
+                self.min_response_time = self.success_stats.min
+                self.max_response_time = self.success_stats.max
+                self.avg_response_time = self.success_stats.mean
 
             result = {
                 "url": task.url,
@@ -675,7 +697,7 @@ class HTTPCLI(HTTPBaseCLI):
                 "success": success,
                 "timestamp": time.time(),
                 "section": task.section_name,
-                "content_length": len(response.content) if response.content else 0,
+                "content_length": response.size,
                 "headers": dict(response.headers) if hasattr(response, 'headers') else {}
             }
 
@@ -708,7 +730,7 @@ class HTTPCLI(HTTPBaseCLI):
 
     def get_statistics(self) -> Dict[str, Any]:
         """통계 정보 반환"""
-        if not self.response_times:
+        if not self.response_stats.count:
             return {}
 
         return {
@@ -716,9 +738,13 @@ class HTTPCLI(HTTPBaseCLI):
             "failed_requests": self.fail_count,
             "error_requests": self.error_count,
             "success_rate": ((self.total_count - self.fail_count) / self.total_count * 100) if self.total_count > 0 else 0,
-            "avg_response_time": sum(self.response_times) / len(self.response_times),
-            "min_response_time": min(self.response_times),
-            "max_response_time": max(self.response_times),
+            "avg_response_time": self.response_stats.mean,
+            "min_response_time": self.response_stats.min,
+            "max_response_time": self.response_stats.max,
+            "ewma_response_time": self.response_stats.ewma,
+            "p50_response_time": self.response_stats.quantile(0.5),
+            "p95_response_time": self.response_stats.quantile(0.95),
+            "p99_response_time": self.response_stats.quantile(0.99),
         }
 
 
@@ -4,6 +4,7 @@ PawnStack 정보 명령어 (레거시 호환)
 시스템 리소스, 네트워크, 디스크 사용량 등 상세 정보 출력
 """
 
+import asyncio
 import os
 import sys
 from argparse import ArgumentParser
@@ -13,6 +14,7 @@ from pawnstack import __version__
 from pawnstack.config.global_config import pawn
 from pawnstack.cli.base import BaseCLI
 from pawnstack.cli.banner import generate_banner
+from pawnstack.cloud.metadata import DEFAULT_CACHE_PATH, SUMMARY_PATHS, InstanceMetadata
 from pawnstack.resource import (
     get_hostname,
     get_platform_info,
@@ -53,6 +55,9 @@ __epilog__ = (
     "     - Writes the collected resource information to 'output.json'.\n\n"
     "    `pawns info -q --output-file output.json`\n\n"
 
+    "  5. Include EC2 instance metadata (IMDSv2, cached on disk for 5 minutes):\n"
+    "     `pawns info --aws-metadata`\n\n"
+
     "For more detailed command usage and options, refer to the help documentation by running 'pawns info --help'."
 )
 
@@ -76,6 +81,9 @@ class InfoCLI(BaseCLI):
             help='Write the output to a file. Default file is "resource_info.json". If a filename is provided, it will be used instead.',
             default=None
         )
+        parser.add_argument('--aws-metadata', action='store_true', help='Include EC2 instance metadata (IMDSv2)')
+        parser.add_argument('--metadata-cache-ttl', type=float, default=300,
+                            help=f'EC2 metadata disk cache TTL in seconds, 0 to disable ({DEFAULT_CACHE_PATH}, default: %(default)s)')
     
     def setup_config(self):
         """설정 초기화 (레거시 호환)"""
@@ -154,6 +162,10 @@ class InfoCLI(BaseCLI):
         # 디스크 정보 수집 및 출력
         self.collect_and_display_disk_info(result)
         
+        # EC2 인스턴스 메타데이터
+        if getattr(self.args, 'aws_metadata', False):
+            self.collect_and_display_aws_info(result)
+        
         # 파일 출력
         write_file = getattr(self.args, 'write_file', None)
         if write_file:
@@ -276,6 +288,33 @@ class InfoCLI(BaseCLI):
         
         self.print_unless_quiet_mode(disk_tree)
     
+    def collect_and_display_aws_info(self, result: dict):
+        """EC2 인스턴스 메타데이터 수집 및 출력 (같은 부팅 안에서는 디스크 캐시 사용)"""
+        cache_ttl = getattr(self.args, 'metadata_cache_ttl', 300)
+
+        async def collect():
+            async with InstanceMetadata(
+                cache_path=DEFAULT_CACHE_PATH if cache_ttl > 0 else None, cache_ttl=cache_ttl
+            ) as imds:
+                return await imds.collect(SUMMARY_PATHS)
+
+        metadata = asyncio.run(collect())
+        result['aws'] = metadata
+
+        aws_tree = Tree("[bold]☁️  AWS Instance[/bold]")
+        if not metadata:
+            aws_tree.add("[dim]Instance metadata not available[/dim]")
+        for key, value in metadata.items():
+            if isinstance(value, dict):
+                sub_tree = aws_tree.add(f"{key.title()}")
+                for sub_key, sub_value in value.items():
+                    sub_tree.add(f"{sub_key.title()}: {sub_value}")
+            else:
+                aws_tree.add(f"{key.title()}: {value}")
+
+        self.print_unless_quiet_mode("")
+        self.print_unless_quiet_mode(aws_tree)
+
     def collect_info(self) -> dict:
         """정보 수집 (테스트용)"""
         result = {
@@ -6,7 +6,6 @@ Mon CLI - 통합 모니터링 도구
 """
 
 import asyncio
-import json
 import time
 import os
 import re
@@ -17,6 +16,7 @@ from pathlib import Path
 
 from pawnstack.cli.base import MonitoringBaseCLI, AsyncBaseCLI, register_cli_command
 from pawnstack.config.global_config import pawn
+from pawnstack.output.jsonl import JsonlSink
 from pawnstack.resource import system, network, disk
 
 import psutil
@@ -90,7 +90,7 @@ class MonCLI(AsyncBaseCLI):
     
     def __init__(self, args=None):
         super().__init__(args)
-        self.monitoring_data = []
+        self.metrics_sink: Optional[JsonlSink] = None
         self.alert_history = []
         self.last_alert_time = {}
         self.ssh_patterns = {}
@@ -181,7 +181,21 @@ class MonCLI(AsyncBaseCLI):
         parser.add_argument(
             '--output-file',
             type=str,
-            help='모니터링 데이터 출력 파일'
+            help='모니터링 데이터 출력 파일 (JSON Lines, .gz/.zst 확장자면 압축)'
+        )
+
+        parser.add_argument(
+            '--output-max-mb',
+            type=float,
+            default=100,
+            help='출력 파일 로테이션 크기 (MB, 0 이면 로테이션 안 함)'
+        )
+
+        parser.add_argument(
+            '--output-backups',
+            type=int,
+            default=None,
+            help='보관할 로테이션 파일 수 (기본: 모두 보관)'
         )
         
         # 알림 옵션
@@ -415,6 +429,8 @@ class MonCLI(AsyncBaseCLI):
                 
         except KeyboardInterrupt:
             pass
+        finally:
+            self.close_metrics_sink()
         
         return 0
     
@@ -801,22 +817,35 @@ class MonCLI(AsyncBaseCLI):
         pass
     
     async def save_metrics(self, metrics: Dict[str, Any]):
-        """메트릭 저장"""
+        """메트릭 저장 (JSON Lines 로 이어 쓰기, 일정 주기로 묶어서 fsync)"""
         output_file = getattr(self.args, 'output_file', None)
         if not output_file:
             return
         
         try:
-            self.monitoring_data.append(metrics)
-            
-            with open(output_file, 'w') as f:
-                json.dump(self.monitoring_data, f, indent=2, ensure_ascii=False)
+            if self.metrics_sink is None:
+                max_mb = getattr(self.args, 'output_max_mb', 100)
+                self.metrics_sink = JsonlSink(
+                    output_file,
+                    flush_interval=10.0,
+                    max_bytes=int(max_mb * 1024 * 1024) if max_mb else None,
+                    backup_count=getattr(self.args, 'output_backups', None)
+                )
             
+            self.metrics_sink.write(metrics)
             self.log_debug(f"메트릭 저장: {output_file}")
         
         except Exception as e:
             self.log_error(f"메트릭 저장 오류: {e}")
-
+    
+    def close_metrics_sink(self):
+        """버퍼에 남은 메트릭 기록 후 파일 닫기"""
+        if self.metrics_sink is not None:
+            try:
+                self.metrics_sink.close()
+            except Exception as e:
+                self.log_error(f"메트릭 저장 오류: {e}")
+            self.metrics_sink = None
 
 def main():
     """CLI 진입점"""
@@ -9,14 +9,15 @@ import socket
 import ipaddress
 import time
 from dataclasses import dataclass
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Iterable
 from argparse import ArgumentParser
-import concurrent.futures
 
 from pawnstack import __version__
 from pawnstack.config.global_config import pawn
 from pawnstack.cli.base import BaseCLI
 from pawnstack.cli.banner import generate_banner
+from pawnstack.output.jsonl import JsonlSink
+from pawnstack.resource.portscan import PortScanner, count_hosts, iter_hosts, parse_ports
 
 # 모듈 메타데이터
 __description__ = 'Network connectivity testing and scanning tool'
@@ -27,6 +28,8 @@ __epilog__ = (
     "  1. Network check:\n\tpawns net check --verbose\n\n"
     "  2. Wait for port:\n\tpawns net wait --host 192.168.1.1 --port 80\n\n"
     "  3. Port scan:\n\tpawns net scan --host-range 192.168.1.1-192.168.1.10 --port-range 20-80\n\n"
+    "  4. Subnet sweep (ping pre-filter, JSONL output):\n"
+    "\tpawns net scan --host-range 10.0.0.0/16 --port-range 22,80,443 --ping --workers 2000 --output scan.jsonl\n\n"
     "For more details, use the -h or --help flag."
 )
 
@@ -42,6 +45,14 @@ class NetConfig:
     host_range: str = ""
     port_range: str = ""
     view_type: str = "all"
+    min_timeout: float = 0.05
+    ping: bool = False
+    ping_ports: str = "22,80,443"
+    output: str = ""
+
+
+# 스캔 진행률 로그 간격 (초)
+PROGRESS_INTERVAL = 5.0
 
 
 class NetCLI(BaseCLI):
@@ -58,13 +69,22 @@ class NetCLI(BaseCLI):
         parser.add_argument('--host', type=str, help='Target host (default: 8.8.8.8)', default='8.8.8.8')
         parser.add_argument('--port', type=int, help='Target port (default: 80)', default=80)
         parser.add_argument('--timeout', type=float, help='Connection timeout in seconds (default: 5)', default=5.0)
-        parser.add_argument('--workers', type=int, help='Number of concurrent workers (default: 50)', default=50)
+        parser.add_argument('--workers', type=int, help='Maximum in-flight connections while scanning (default: 50)', default=50)
         
         # 스캔 관련 옵션
-        parser.add_argument('--host-range', type=str, help='Host range (e.g., 192.168.1.1-192.168.1.255)')
-        parser.add_argument('--port-range', type=str, help='Port range (e.g., 20-80)')
+        parser.add_argument('--host-range', type=str,
+                          help='Hosts to scan: IP, range or CIDR, comma separated (e.g., 192.168.1.1-192.168.1.255, 10.0.0.0/16)')
+        parser.add_argument('--port-range', type=str, help='Ports to scan (e.g., 20-80, 22,80,443)')
         parser.add_argument('--view-type', type=str, choices=['all', 'open', 'closed'], 
-                          help='View type for scan results (default: all)', default='all')
+                          help='View type for scan results; "all" logs open ports and counts the rest (default: all)', default='all')
+        parser.add_argument('--min-timeout', type=float, default=0.05,
+                          help='Lower bound of the RTT-adaptive scan timeout in seconds (default: 0.05)')
+        parser.add_argument('--ping', action='store_true',
+                          help='Skip hosts that do not answer on --ping-ports before scanning')
+        parser.add_argument('--ping-ports', type=str, default='22,80,443',
+                          help='Ports used to detect live hosts (default: 22,80,443)')
+        parser.add_argument('--output', '-o', type=str,
+                          help='Stream every scan result to a JSON Lines file (.gz/.zst compressed by extension)')
         
         parser.add_argument('--log-level', type=str, choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
                           help='Logging level (default: INFO)', default="INFO")
@@ -110,7 +130,11 @@ class NetCLI(BaseCLI):
             workers=getattr(self.args, 'workers', 50),
             host_range=getattr(self.args, 'host_range', ''),
             port_range=getattr(self.args, 'port_range', ''),
-            view_type=getattr(self.args, 'view_type', 'all')
+            view_type=getattr(self.args, 'view_type', 'all'),
+            min_timeout=getattr(self.args, 'min_timeout', 0.05),
+            ping=getattr(self.args, 'ping', False),
+            ping_ports=getattr(self.args, 'ping_ports', '22,80,443'),
+            output=getattr(self.args, 'output', None) or ''
         )
     
     def validate_ip(self, ip: str) -> bool:
@@ -121,39 +145,22 @@ class NetCLI(BaseCLI):
         except ValueError:
             return False
     
+    @staticmethod
+    def host_sort_key(host: str) -> Tuple:
+        """IP 는 주소 순, 호스트 이름은 그 뒤에 이름 순"""
+        try:
+            address = ipaddress.ip_address(host)
+            return (0, address.version, int(address), "")
+        except ValueError:
+            return (1, 0, 0, host)
+    
     def parse_host_range(self, host_range: str) -> List[str]:
-        """호스트 범위 파싱"""
+        """호스트 범위 파싱 (스캔은 목록을 만들지 않는 ``iter_hosts`` 사용)"""
         if not host_range:
             return []
         
-        if '-' not in host_range:
-            if self.validate_ip(host_range):
-                return [host_range]
-            else:
-                self.log_error(f"Invalid IP address: {host_range}")
-                return []
-        
         try:
-            start_ip, end_ip = host_range.split('-')
-            start = ipaddress.ip_address(start_ip)
-            end = ipaddress.ip_address(end_ip)
-            
-            if start > end:
-                self.log_error("Start IP must be less than or equal to end IP")
-                return []
-            
-            # IP 범위 생성
-            hosts = []
-            current = start
-            while current <= end:
-                hosts.append(str(current))
-                current += 1
-                if len(hosts) > 1000:  # 안전장치
-                    self.log_warning("Host range too large, limiting to 1000 hosts")
-                    break
-            
-            return hosts
-            
+            return list(iter_hosts(host_range))
         except ValueError as e:
             self.log_error(f"Invalid host range: {e}")
             return []
@@ -163,32 +170,10 @@ class NetCLI(BaseCLI):
         if not port_range:
             return []
         
-        if '-' not in port_range:
-            try:
-                port = int(port_range)
-                if 0 <= port <= 65535:
-                    return [port]
-                else:
-                    self.log_error(f"Port must be between 0-65535: {port}")
-                    return []
-            except ValueError:
-                self.log_error(f"Invalid port: {port_range}")
-                return []
-        
         try:
-            start_port, end_port = map(int, port_range.split('-'))
-            if not (0 <= start_port <= 65535 and 0 <= end_port <= 65535):
-                self.log_error("Ports must be between 0-65535")
-                return []
-            
-            if start_port > end_port:
-                self.log_error("Start port must be less than or equal to end port")
-                return []
-            
-            return list(range(start_port, end_port + 1))
-            
-        except ValueError:
-            self.log_error(f"Invalid port range: {port_range}")
+            return parse_ports(port_range)
+        except ValueError as e:
+            self.log_error(f"Invalid port range: {port_range} ({e})")
             return []
     
     def check_port(self, host: str, port: int, timeout: float) -> Dict[str, Any]:
@@ -269,10 +254,18 @@ class NetCLI(BaseCLI):
     
     def port_scan(self, config: NetConfig):
         """포트 스캔"""
-        hosts = self.parse_host_range(config.host_range) if config.host_range else [config.host]
+        if config.host_range:
+            try:
+                host_count = count_hosts(config.host_range)
+                hosts: Iterable[str] = iter_hosts(config.host_range)
+            except ValueError as e:
+                self.log_error(f"Invalid host range: {e}")
+                return
+        else:
+            host_count, hosts = 1, [config.host]
         ports = self.parse_port_range(config.port_range) if config.port_range else [config.port]
         
-        if not hosts:
+        if not host_count:
             self.log_error("No valid hosts to scan")
             return
         
@@ -280,57 +273,71 @@ class NetCLI(BaseCLI):
             self.log_error("No valid ports to scan")
             return
         
-        total_scans = len(hosts) * len(ports)
-        pawn.console.log(f"🔍 Starting port scan: {len(hosts)} hosts × {len(ports)} ports = {total_scans} scans")
-        pawn.console.log(f"⚙️  Using {config.workers} workers, timeout: {config.timeout}s")
+        asyncio.run(self.async_port_scan(config, hosts, host_count, ports))
+    
+    async def async_port_scan(self, config: NetConfig, hosts: Iterable[str], host_count: int, ports: List[int]):
+        """비동기 포트 스캔 (결과를 끝나는 순서대로 처리)"""
+        scanner = PortScanner(
+            concurrency=config.workers,
+            timeout=config.timeout,
+            min_timeout=config.min_timeout,
+            ping=config.ping,
+            ping_ports=self.parse_port_range(config.ping_ports) or [config.port]
+        )
+        total_scans = host_count * len(ports)
+        pawn.console.log(f"🔍 Starting port scan: {host_count} hosts × {len(ports)} ports = {total_scans} scans")
+        pawn.console.log(f"⚙️  Using {scanner.concurrency} in-flight connections, timeout: {config.timeout}s "
+                         f"(adaptive, min {config.min_timeout}s){', ping pre-filter' if config.ping else ''}")
         
+        sink = JsonlSink(config.output, batch_size=1000, fsync=False) if config.output else None
         open_ports = []
-        closed_ports = []
-        
-        # 스캔 작업 생성
-        scan_tasks = []
-        for host in hosts:
-            for port in ports:
-                scan_tasks.append((host, port))
+        started = last_report = time.monotonic()
+        stats = scanner.stats
         
-        # 병렬 스캔 실행
-        with concurrent.futures.ThreadPoolExecutor(max_workers=config.workers) as executor:
-            future_to_task = {
-                executor.submit(self.check_port, host, port, config.timeout): (host, port)
-                for host, port in scan_tasks
-            }
-            
-            completed = 0
-            for future in concurrent.futures.as_completed(future_to_task):
-                result = future.result()
-                completed += 1
+        try:
+            async for result in scanner.scan(hosts, ports):
+                if sink is not None:
+                    sink.write(result.to_dict())
                 
-                if result["open"]:
+                if result.open:
                     open_ports.append(result)
                     if config.view_type in ['all', 'open']:
-                        pawn.console.log(f"[green]✅ {result['host']}:{result['port']} OPEN "
-                                       f"({result['response_time']:.3f}s)[/green]")
-                else:
-                    closed_ports.append(result)
-                    if config.view_type in ['all', 'closed']:
-                        error_msg = f" - {result['error']}" if result['error'] else ""
-                        pawn.console.log(f"[red]❌ {result['host']}:{result['port']} CLOSED{error_msg}[/red]")
+                        pawn.console.log(f"[green]✅ {result.host}:{result.port} OPEN ({result.rtt:.3f}s)[/green]")
+                elif config.view_type == 'closed':
+                    error_msg = f" - {result.error}" if result.error else ""
+                    pawn.console.log(f"[red]❌ {result.host}:{result.port} {result.state.upper()}{error_msg}[/red]")
                 
-                # 진행률 표시
-                if completed % 50 == 0 or completed == total_scans:
-                    progress = (completed / total_scans) * 100
-                    pawn.console.log(f"📊 Progress: {completed}/{total_scans} ({progress:.1f}%)")
+                # 진행률 표시 (일정 시간 간격)
+                now = time.monotonic()
+                if now - last_report >= PROGRESS_INTERVAL:
+                    last_report = now
+                    if config.ping:
+                        progress = f"hosts {stats.hosts_checked}/{host_count} (alive {stats.hosts_alive}), probes {stats.probed}"
+                    else:
+                        progress = f"{stats.probed}/{total_scans} ({stats.probed / total_scans * 100:.1f}%)"
+                    pawn.console.log(f"📊 Progress: {progress}, {stats.probed / (now - started):.0f} probes/s, "
+                                     f"timeout {scanner.current_timeout:.3f}s")
+        finally:
+            if sink is not None:
+                sink.close()
         
         # 결과 요약
-        pawn.console.log(f"\n📊 Scan Results:")
-        pawn.console.log(f"  Total scanned: {total_scans}")
-        pawn.console.log(f"  Open ports: {len(open_ports)}")
-        pawn.console.log(f"  Closed ports: {len(closed_ports)}")
+        pawn.console.log(f"\n📊 Scan Results ({time.monotonic() - started:.1f}s):")
+        if config.ping:
+            pawn.console.log(f"  Alive hosts: {stats.hosts_alive}/{stats.hosts_checked}")
+        pawn.console.log(f"  Total scanned: {stats.probed}")
+        pawn.console.log(f"  Open ports: {stats.open}")
+        pawn.console.log(f"  Closed ports: {stats.closed}")
+        pawn.console.log(f"  Filtered (timeout): {stats.filtered}")
+        if stats.errors:
+            pawn.console.log(f"  Errors: {stats.errors}")
+        if sink is not None:
+            pawn.console.log(f"  Results saved to: {config.output}")
         
         if open_ports:
             pawn.console.log(f"\n🔓 Open Ports:")
-            for result in open_ports:
-                pawn.console.log(f"  {result['host']}:{result['port']} ({result['response_time']:.3f}s)")
+            for result in sorted(open_ports, key=lambda r: (self.host_sort_key(r.host), r.port)):
+                pawn.console.log(f"  {result.host}:{result.port} ({result.rtt:.3f}s)")
     
     def run(self) -> int:
         """Net CLI 실행"""
@@ -19,6 +19,7 @@ from email import encoders
 
 from pawnstack.cli.base import AsyncBaseCLI, register_cli_command
 from pawnstack.config.global_config import pawn
+from pawnstack.output.jsonl import JsonlSink, detect_compression
 
 
 @register_cli_command(
@@ -229,7 +230,7 @@ class NotiCLI(AsyncBaseCLI):
         parser.add_argument(
             '--save-history',
             type=str,
-            help='알림 히스토리 저장 파일 경로'
+            help='알림 히스토리 저장 파일 경로 (JSON Lines 로 이어 쓰기, .gz/.zst 확장자면 압축)'
         )
         
         # 설정 파일
@@ -688,6 +689,26 @@ class NotiCLI(AsyncBaseCLI):
         
         return False
     
+    def _migrate_legacy_history(self, history_path: Path):
+        """이전 버전의 JSON 배열 히스토리 파일을 JSON Lines 로 한 번 변환"""
+        if detect_compression(history_path) or not history_path.is_file():
+            return
+        
+        with open(history_path, 'r', encoding='utf-8') as f:
+            head = f.read(64).lstrip()
+        if not head.startswith('['):
+            return
+        
+        with open(history_path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        
+        tmp_path = history_path.with_name(history_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+        tmp_path.replace(history_path)
+        self.log_debug(f"알림 히스토리를 JSON Lines 로 변환: {history_path}")
+    
     def save_notification_history(self, message: str, subject: Optional[str], results: Dict[str, bool]):
         """알림 히스토리 저장"""
         if not hasattr(self.args, 'save_history') or not self.args.save_history:
@@ -706,12 +727,12 @@ class NotiCLI(AsyncBaseCLI):
             
             self.notification_history.append(history_entry)
             
-            # 파일에 저장
+            # 파일에 한 줄 추가 (기존 기록은 다시 쓰지 않음)
             history_path = Path(self.args.save_history)
-            history_path.parent.mkdir(parents=True, exist_ok=True)
+            self._migrate_legacy_history(history_path)
             
-            with open(history_path, 'w', encoding='utf-8') as f:
-                json.dump(self.notification_history, f, indent=2, ensure_ascii=False)
+            with JsonlSink(history_path, batch_size=1) as sink:
+                sink.write(history_entry)
             
             self.log_debug(f"알림 히스토리 저장: {self.args.save_history}")
             
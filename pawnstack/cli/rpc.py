@@ -15,6 +15,8 @@ from pawnstack.config.global_config import pawn
 from pawnstack.cli.base import AsyncBaseCLI
 from pawnstack.cli.banner import generate_banner
 from pawnstack.http.client import HttpClient
+from pawnstack.http.jsonrpc import JsonRpcBatcher, iter_batch_file
+from pawnstack.output.jsonl import JsonlSink
 
 # 모듈 메타데이터
 __description__ = 'JSON-RPC client and testing tool'
@@ -25,6 +27,8 @@ __epilog__ = (
     "  1. Simple RPC call:\n\tpawns rpc --url http://localhost:8080/rpc --method getInfo\n\n"
     "  2. RPC with parameters:\n\tpawns rpc --url http://localhost:8080/rpc --method transfer --params '{\"to\": \"hx123\", \"value\": \"1000\"}'\n\n"
     "  3. Batch RPC calls:\n\tpawns rpc --url http://localhost:8080/rpc --batch-file requests.json\n\n"
+    "  4. Replay a large JSON Lines file, 200 calls per batch, 8 batches in flight:\n"
+    "\tpawns rpc --url http://localhost:9000/api/v3 --batch-file calls.jsonl --batch-size 200 --concurrency 8 --output results.jsonl\n\n"
     "For more details, use the -h or --help flag."
 )
 
@@ -38,6 +42,13 @@ class RPCConfig:
     timeout: float = 30.0
     batch_file: str = ""
     id: int = 1
+    batch_size: int = 100
+    concurrency: int = 4
+    output: str = ""
+
+
+# 결과를 파일로 저장하지 않을 때 콘솔에 자세히 표시할 최대 결과 수
+MAX_DISPLAY_RESULTS = 1000
 
 
 class RPCCLI(AsyncBaseCLI):
@@ -53,7 +64,10 @@ class RPCCLI(AsyncBaseCLI):
         parser.add_argument('--method', type=str, help='RPC method name')
         parser.add_argument('--params', type=str, help='RPC parameters in JSON format')
         parser.add_argument('--timeout', type=float, help='Request timeout (default: 30)', default=30.0)
-        parser.add_argument('--batch-file', type=str, help='JSON file with batch RPC requests')
+        parser.add_argument('--batch-file', type=str, help='JSON array or JSON Lines file with batch RPC requests')
+        parser.add_argument('--batch-size', type=int, help='Requests per JSON-RPC batch array, 1 disables batching (default: 100)', default=100)
+        parser.add_argument('--concurrency', type=int, help='Batches in flight at once (default: 4)', default=4)
+        parser.add_argument('--output', '-o', type=str, help='Stream batch results to a JSON Lines file')
         parser.add_argument('--id', type=int, help='RPC request ID (default: 1)', default=1)
         
         parser.add_argument('--log-level', type=str, choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
@@ -106,7 +120,10 @@ class RPCCLI(AsyncBaseCLI):
             params=params,
             timeout=getattr(self.args, 'timeout', 30.0),
             batch_file=getattr(self.args, 'batch_file', ''),
-            id=getattr(self.args, 'id', 1)
+            id=getattr(self.args, 'id', 1),
+            batch_size=getattr(self.args, 'batch_size', 100),
+            concurrency=getattr(self.args, 'concurrency', 4),
+            output=getattr(self.args, 'output', None) or ''
         )
     
     async def send_rpc_request(self, config: RPCConfig) -> Dict[str, Any]:
@@ -148,66 +165,48 @@ class RPCCLI(AsyncBaseCLI):
                 "status_code": 0
             }
     
+    def create_batcher(self, config: RPCConfig) -> JsonRpcBatcher:
+        """배치 전송기 (CLI 의 HTTP 커넥션 풀 공유)"""
+        return JsonRpcBatcher(
+            self.http_client,
+            config.url,
+            batch_size=config.batch_size,
+            concurrency=config.concurrency,
+            timeout=config.timeout
+        )
+    
     async def send_batch_requests(self, config: RPCConfig) -> List[Dict[str, Any]]:
-        """배치 RPC 요청 전송"""
+        """배치 RPC 요청 전송 (결과는 요청 순서)"""
+        batcher = self.create_batcher(config)
+        results = []
         try:
-            with open(config.batch_file, 'r') as f:
-                batch_requests = json.load(f)
-            
-            if not isinstance(batch_requests, list):
-                self.log_error("Batch file must contain a JSON array")
-                return []
-            
-            results = []
-            for i, request in enumerate(batch_requests):
-                if not isinstance(request, dict):
-                    self.log_error(f"Request {i} is not a valid JSON object")
-                    continue
-                
-                # 기본값 설정
-                if "jsonrpc" not in request:
-                    request["jsonrpc"] = "2.0"
-                if "id" not in request:
-                    request["id"] = i + 1
-                
-                pawn.console.log(f"📤 Sending request {i+1}: {request.get('method', 'unknown')}")
-                
-                try:
-                    response = await self.http_client.post(
-                        config.url,
-                        json=request,
-                        timeout=config.timeout,
-                        headers={'Content-Type': 'application/json'}
-                    )
-                    
-                    if response.status_code == 200:
-                        results.append({
-                            "request_id": i + 1,
-                            "success": True,
-                            "response": response.json()
-                        })
-                    else:
-                        results.append({
-                            "request_id": i + 1,
-                            "success": False,
-                            "error": f"HTTP {response.status_code}: {response.text}"
-                        })
-                        
-                except Exception as e:
-                    results.append({
-                        "request_id": i + 1,
-                        "success": False,
-                        "error": str(e)
-                    })
-            
-            return results
-            
+            async for result in batcher.run(iter_batch_file(config.batch_file)):
+                results.append(result)
         except FileNotFoundError:
             self.log_error(f"Batch file not found: {config.batch_file}")
             return []
-        except json.JSONDecodeError as e:
-            self.log_error(f"Invalid JSON in batch file: {e}")
-            return []
+        except ValueError as e:
+            self.log_error(f"Invalid batch file: {e}")
+        
+        results.sort(key=lambda r: r["request_id"])
+        return results
+    
+    async def stream_batch_requests(self, config: RPCConfig) -> Dict[str, int]:
+        """배치 RPC 요청 전송 (결과를 JSON Lines 로 바로 기록하고 실패만 출력)"""
+        batcher = self.create_batcher(config)
+        try:
+            with JsonlSink(config.output, batch_size=1000, fsync=False) as sink:
+                async for result in batcher.run(iter_batch_file(config.batch_file)):
+                    sink.write(result)
+                    if not result["success"]:
+                        pawn.console.log(f"[red]❌ Request {result['request_id']}: {result['error']}[/red]")
+                    elif batcher.stats["requests"] % 10000 == 0:
+                        pawn.console.log(f"📊 Progress: {batcher.stats['requests']} requests")
+        except FileNotFoundError:
+            self.log_error(f"Batch file not found: {config.batch_file}")
+        except ValueError as e:
+            self.log_error(f"Invalid batch file: {e}")
+        return batcher.stats
     
     def display_response(self, result: Dict[str, Any]):
         """응답 결과 출력"""
@@ -236,6 +235,10 @@ class RPCCLI(AsyncBaseCLI):
         
         pawn.console.log(f"📊 Batch Results: {successful}/{total} successful")
         
+        if total > MAX_DISPLAY_RESULTS:
+            pawn.console.log(f"[yellow]Showing failures only ({total} results); use --output to save every result[/yellow]")
+            results = [r for r in results if not r["success"]]
+        
         for result in results:
             request_id = result["request_id"]
             
@@ -265,21 +268,30 @@ class RPCCLI(AsyncBaseCLI):
             self.log_error("RPC URL is required (--url)")
             return 1
         
-        if config.batch_file:
-            # 배치 모드
-            pawn.console.log(f"📦 Processing batch file: {config.batch_file}")
-            results = await self.send_batch_requests(config)
-            self.display_batch_results(results)
-        else:
-            # 단일 요청 모드
-            if not config.method:
-                self.log_error("RPC method is required (--method)")
-                return 1
-            
-            pawn.console.log(f"📤 Sending RPC request: {config.method}")
-            result = await self.send_rpc_request(config)
-            self.display_response(result)
-        
+        try:
+            if config.batch_file:
+                # 배치 모드
+                pawn.console.log(f"📦 Processing batch file: {config.batch_file} "
+                                 f"(batch size {config.batch_size}, concurrency {config.concurrency})")
+                if config.output:
+                    stats = await self.stream_batch_requests(config)
+                    pawn.console.log(f"📊 Batch Results: {stats['succeeded']}/{stats['requests']} successful, "
+                                     f"{stats['batches']} batches, saved to {config.output}")
+                else:
+                    results = await self.send_batch_requests(config)
+                    self.display_batch_results(results)
+            else:
+                # 단일 요청 모드
+                if not config.method:
+                    self.log_error("RPC method is required (--method)")
+                    return 1
+
+                pawn.console.log(f"📤 Sending RPC request: {config.method}")
+                result = await self.send_rpc_request(config)
+                self.display_response(result)
+        finally:
+            await self.http_client.aclose()
+
         return 0
 
 
@@ -6,14 +6,18 @@ AWS S3 버킷 및 객체 관리 기능을 제공합니다.
 """
 
 import os
-import asyncio
+import time
+from contextlib import AsyncExitStack
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 from argparse import ArgumentParser
-from datetime import datetime
 
 from pawnstack.cli.base import CloudBaseCLI, register_cli_command
+from pawnstack.cloud.s3_listing import PathMatcher, delete_keys, iter_object_pages, iter_objects
+from pawnstack.cloud.s3_sync import DEFAULT_MANIFEST_PATH, RemoteObject, SyncManifest, SyncStats, compute_etags, diff_objects
+from pawnstack.cloud.s3_transfer import S3TransferManager, TransferConfig, TransferJob, parse_size
 from pawnstack.config.global_config import pawn
+from pawnstack.utils.walk import FileEntry, iter_files
 
 
 @register_cli_command(
@@ -43,6 +47,12 @@ from pawnstack.config.global_config import pawn
 
   7. 버킷 정보 조회:
      pawns s3 info s3://my-bucket
+
+  8. 대용량 동기화 튜닝 (파일 32개 × 파트 8개 동시, 64MB 파트, 대역폭 200MB/s 제한):
+     pawns s3 --max-workers 32 --part-concurrency 8 --chunk-size 64MB --max-bandwidth 200MB sync ./build s3://my-bucket/build/
+
+  9. 체크섬 매니페스트로 변경분만 동기화 (원격 목록 조회 생략):
+     pawns s3 sync ./data s3://my-bucket/data/ --trust-manifest
 """
 )
 class S3CLI(CloudBaseCLI):
@@ -52,6 +62,9 @@ class S3CLI(CloudBaseCLI):
         super().__init__(args)
         self._s3_client = None
         self._s3_resource = None
+        self._s3_stack: Optional[AsyncExitStack] = None
+        self._transfer: Optional[S3TransferManager] = None
+        self._matcher: Optional[PathMatcher] = None
 
     def get_arguments(self, parser: ArgumentParser):
         """S3 CLI 인수 정의"""
@@ -68,9 +81,45 @@ class S3CLI(CloudBaseCLI):
 
         parser.add_argument(
             '--chunk-size',
-            type=int,
+            type=parse_size,
+            default=8388608,  # 8MB
+            help='multipart 파트 크기 (바이트 또는 64MB 형식, 최소 5MB, default: 8MB)'
+        )
+
+        parser.add_argument(
+            '--multipart-threshold',
+            type=parse_size,
             default=8388608,  # 8MB
-            help='업로드/다운로드 청크 크기 (바이트, default: 8MB)'
+            help='이 크기 이상인 파일은 병렬 multipart 로 전송 (default: 8MB)'
+        )
+
+        parser.add_argument(
+            '--part-concurrency',
+            type=int,
+            default=4,
+            help='파일 하나에서 동시에 전송하는 파트 수 (default: 4)'
+        )
+
+        parser.add_argument(
+            '--max-bandwidth',
+            type=parse_size,
+            default=0,
+            help='전체 전송 대역폭 상한 (초당 바이트 또는 50MB 형식, default: 제한 없음)'
+        )
+
+        parser.add_argument(
+            '--list-concurrency',
+            type=int,
+            default=8,
+            help='동시에 나열하는 하위 prefix 수 (default: 8)'
+        )
+
+        parser.add_argument(
+            '--list-shard-depth',
+            type=int,
+            default=1,
+            help='목록을 / 기준 하위 prefix 로 나눠 병렬 조회할 깊이 '
+                 '(나누면 재귀 목록이 하위 prefix 도착 순서로 출력됨, 0 이면 나누지 않고 키 순서, default: 1)'
         )
 
         parser.add_argument(
@@ -91,6 +140,13 @@ class S3CLI(CloudBaseCLI):
         sync_parser.add_argument('--dry-run', action='store_true', help='실제 실행하지 않고 계획만 표시')
         sync_parser.add_argument('--exclude', action='append', help='제외할 패턴')
         sync_parser.add_argument('--include', action='append', help='포함할 패턴')
+        sync_parser.add_argument('--manifest',
+                                 help=f'로컬 체크섬 매니페스트 파일 (stat 이 같은 파일은 해시 생략, default: {DEFAULT_MANIFEST_PATH})')
+        sync_parser.add_argument('--no-manifest', action='store_true',
+                                 help='매니페스트와 해시 없이 크기 + mtime 으로만 비교')
+        sync_parser.add_argument('--trust-manifest', action='store_true',
+                                 help='원격 목록 조회 없이 매니페스트에 기록된 원격 상태와 비교')
+        sync_parser.add_argument('--hash-workers', type=int, help='ETag 계산 스레드 수 (default: CPU 수 × 2, 최대 32)')
 
         # cp 서브커맨드
         cp_parser = subparsers.add_parser('cp', help='파일/디렉토리 복사')
@@ -103,7 +159,8 @@ class S3CLI(CloudBaseCLI):
         # ls 서브커맨드
         ls_parser = subparsers.add_parser('ls', help='버킷/객체 목록')
         ls_parser.add_argument('path', nargs='?', help='S3 경로 (생략시 버킷 목록)')
-        ls_parser.add_argument('--recursive', '-r', action='store_true', help='재귀적 목록')
+        ls_parser.add_argument('--recursive', '-r', action='store_true',
+                               help='재귀적 목록 (하위 prefix 단위 도착 순서, 키 순서는 --list-shard-depth 0)')
         ls_parser.add_argument('--human-readable', action='store_true', help='사람이 읽기 쉬운 크기 표시')
         ls_parser.add_argument('--summarize', action='store_true', help='요약 정보 표시')
 
@@ -165,12 +222,69 @@ class S3CLI(CloudBaseCLI):
         pawn.console.log("자세한 사용법은 --help 옵션을 사용하세요.")
         return 0
 
+    def get_transfer_config(self) -> TransferConfig:
+        """인수로 전송 설정 생성 (잘못된 값은 ValueError)"""
+        return TransferConfig(
+            multipart_threshold=getattr(self.args, 'multipart_threshold', 8388608),
+            part_size=getattr(self.args, 'chunk_size', 8388608),
+            part_concurrency=getattr(self.args, 'part_concurrency', 4),
+            max_concurrency=getattr(self.args, 'max_workers', 10),
+            max_bandwidth=getattr(self.args, 'max_bandwidth', 0),
+        )
+
     async def _get_s3_client(self):
-        """S3 클라이언트 반환"""
+        """
+        S3 클라이언트 반환
+
+        명령 하나에 클라이언트 하나만 열어 (``_cleanup_clients`` 에서 닫음) 모든 요청이 같은
+        커넥션 풀을 재사용합니다. 풀 크기는 동시 전송 수 × 파트 동시성입니다.
+        """
         if self._s3_client is None:
-            self._s3_client = await self.get_aws_client('s3')
+            from botocore.config import Config
+
+            session = await self.get_aws_session()
+            client_config = self.get_boto3_config()
+            pool_size = max(10, self.get_transfer_config().max_pool_connections)
+            client_config['config'] = client_config['config'].merge(Config(max_pool_connections=pool_size))
+
+            stack = AsyncExitStack()
+            self._s3_client = await stack.enter_async_context(session.client('s3', **client_config))
+            self._s3_stack = stack
+            self.log_debug(f"AWS s3 클라이언트 생성 완료 (max_pool_connections={pool_size})")
         return self._s3_client
 
+    async def _get_transfer_manager(self) -> S3TransferManager:
+        """공유 클라이언트와 대역폭 제한기를 쓰는 전송 관리자 반환"""
+        if self._transfer is None:
+            self._transfer = S3TransferManager(await self._get_s3_client(), self.get_transfer_config())
+        return self._transfer
+
+    def _extra_args(self) -> Dict[str, Any]:
+        """업로드 요청에 붙일 StorageClass / Metadata"""
+        extra_args = {'StorageClass': getattr(self.args, 'storage_class', 'STANDARD')}
+        metadata = {}
+        for meta in getattr(self.args, 'metadata', None) or []:
+            if '=' in meta:
+                k, v = meta.split('=', 1)
+                metadata[k] = v
+        if metadata:
+            extra_args['Metadata'] = metadata
+        return extra_args
+
+    async def _run_transfers(self, transfers, on_success=None) -> tuple[int, int]:
+        """병렬 전송 결과를 끝나는 순서대로 기록하고 (성공 파일 수, 성공 바이트 수) 반환"""
+        count = size = 0
+        async for result in transfers:
+            if result.ok:
+                count += 1
+                size += result.size
+                if on_success is not None:
+                    on_success(result)
+                self.log_info(f"✓ {os.path.basename(result.source)} ({self._format_size(result.size)})")
+            else:
+                self.log_error(f"✗ {result.source}: {result.error}")
+        return count, size
+
     async def _get_s3_resource(self):
         """S3 리소스 반환"""
         if self._s3_resource is None:
@@ -181,6 +295,15 @@ class S3CLI(CloudBaseCLI):
 
     async def _cleanup_clients(self):
         """클라이언트 정리"""
+        if self._s3_stack is not None:
+            try:
+                await self._s3_stack.aclose()
+            except Exception as e:
+                self.log_warning(f"AWS s3 클라이언트 종료 중 오류: {e}")
+            self._s3_stack = None
+            self._s3_client = None
+            self._transfer = None
+
         if self._s3_resource:
             try:
                 await self._s3_resource.close()
@@ -239,129 +362,139 @@ class S3CLI(CloudBaseCLI):
             return 1
 
     async def _sync_to_s3(self, local_path: str, s3_path: str) -> int:
-        """로컬에서 S3로 동기화"""
+        """
+        로컬에서 S3로 동기화
+
+        크기 + ETag 로 변경분을 찾습니다. 매니페스트 (default: ``DEFAULT_MANIFEST_PATH``) 에서 stat 이 같은
+        파일의 ETag 를 재사용하고, 업로드할 때 S3 가 돌려준 ETag 를 기록해 암호화된 객체도 다시 올리지
+        않습니다. ``--trust-manifest`` 이면 원격 목록 대신 매니페스트에 기록된 원격 상태와 비교하고,
+        ``--no-manifest`` 이면 해시 없이 크기 + mtime 으로만 비교합니다.
+        """
         try:
             bucket, prefix = self._parse_s3_path(s3_path)
             if not bucket:
                 self.log_error("유효하지 않은 S3 경로입니다")
                 return 1
 
-            local_dir = Path(local_path)
+            # 매니페스트는 여러 디렉토리가 함께 쓰므로 절대 경로로 기록
+            local_dir = Path(local_path).absolute()
             if not local_dir.exists():
                 self.log_error(f"로컬 경로를 찾을 수 없습니다: {local_path}")
                 return 1
 
-            s3_client = await self._get_s3_client()
+            config = self.get_transfer_config()
+            dry_run = getattr(self.args, 'dry_run', False)
+            trust_manifest = getattr(self.args, 'trust_manifest', False)
+            use_manifest = not getattr(self.args, 'no_manifest', False)
+            if trust_manifest and not use_manifest:
+                self.log_error("--trust-manifest 는 --no-manifest 와 함께 사용할 수 없습니다")
+                return 1
+            manifest_path = (getattr(self.args, 'manifest', None) or DEFAULT_MANIFEST_PATH) if use_manifest else ':memory:'
 
-            # 로컬 파일 목록
-            local_files = []
+            # 로컬 파일 목록 (S3 키 -> 파일)
             if local_dir.is_file():
-                local_files = [local_dir]
+                stat = local_dir.stat()
+                entries = [FileEntry(str(local_dir), stat.st_size, stat.st_mtime_ns)]
+                base_dir = str(local_dir.parent)
             else:
-                local_files = list(local_dir.rglob('*'))
-                local_files = [f for f in local_files if f.is_file()]
-
-            # 필터링 적용
-            local_files = self._apply_filters(local_files, local_dir)
-
-            # S3 객체 목록 (비교용)
-            s3_objects = {}
-            if not getattr(self.args, 'dry_run', False):
-                try:
-                    async with s3_client as s3:
-                        paginator = s3.get_paginator('list_objects_v2')
-                        async for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-                            for obj in page.get('Contents', []):
-                                s3_objects[obj['Key']] = obj
-                except Exception:
-                    # 버킷이 비어있거나 접근 권한이 없는 경우
-                    pass
-
-            # 업로드할 파일 결정
-            upload_tasks = []
-            total_size = 0
-
-            for local_file in local_files:
-                relative_path = local_file.relative_to(local_dir)
-                s3_key = f"{prefix.rstrip('/')}/{relative_path}".lstrip('/')
-
-                # 파일 크기 및 수정 시간 확인
-                file_stat = local_file.stat()
-                file_size = file_stat.st_size
-                file_mtime = datetime.fromtimestamp(file_stat.st_mtime)
-
-                should_upload = True
-
-                # S3에 이미 존재하는지 확인
-                if s3_key in s3_objects:
-                    s3_obj = s3_objects[s3_key]
-                    s3_size = s3_obj['Size']
-                    s3_mtime = s3_obj['LastModified'].replace(tzinfo=None)
-
-                    # 크기와 수정 시간이 같으면 건너뜀
-                    if file_size == s3_size and file_mtime <= s3_mtime:
-                        should_upload = False
-
-                if should_upload:
-                    upload_tasks.append((local_file, s3_key, file_size))
-                    total_size += file_size
-
-            if not upload_tasks:
-                self.log_info("업로드할 파일이 없습니다 (모든 파일이 최신 상태)")
-                return 0
-
-            # Dry run 모드
-            if getattr(self.args, 'dry_run', False):
-                self.log_info(f"업로드 예정: {len(upload_tasks)} 파일 ({self._format_size(total_size)})")
-                for local_file, s3_key, file_size in upload_tasks:
-                    pawn.console.log(f"  {local_file} -> s3://{bucket}/{s3_key} ({self._format_size(file_size)})")
-                return 0
-
-            # 실제 업로드 수행
-            self.log_info(f"업로드 시작: {len(upload_tasks)} 파일 ({self._format_size(total_size)})")
-
-            uploaded_count = 0
-            uploaded_size = 0
-
-            # 병렬 업로드
-            semaphore = asyncio.Semaphore(getattr(self.args, 'max_workers', 10))
-
-            async def upload_file(local_file, s3_key, file_size):
-                nonlocal uploaded_count, uploaded_size
-
-                async with semaphore:
-                    try:
-                        async with s3_client as s3:
-                            # 메타데이터 설정
-                            extra_args = {
-                                'StorageClass': getattr(self.args, 'storage_class', 'STANDARD')
-                            }
-
-                            # 파일 업로드
-                            await s3.upload_file(
-                                str(local_file),
-                                bucket,
-                                s3_key,
-                                ExtraArgs=extra_args
-                            )
+                entries = iter_files(local_dir)
+                base_dir = str(local_dir)
+            local_entries: Dict[str, FileEntry] = {}
+            for entry in entries:
+                relative_path = Path(os.path.relpath(entry.path, base_dir)).as_posix()
+                if self._is_included(relative_path):
+                    local_entries[f"{prefix.rstrip('/')}/{relative_path}".lstrip('/')] = entry
+
+            with SyncManifest(manifest_path) as manifest:
+                if use_manifest:
+                    # 바뀐 파일만 해시 계산
+                    stats = SyncStats()
+                    etags = await compute_etags(
+                        local_entries.values(), manifest, config, getattr(self.args, 'hash_workers', None), stats
+                    )
+                    if not local_dir.is_file():
+                        manifest.prune_local([entry.path for entry in local_entries.values()], str(local_dir))
+                    self.log_info(
+                        f"로컬 파일 {stats.files}개: 해시 계산 {stats.hashed}개 ({self._format_size(stats.hashed_bytes)}), "
+                        f"매니페스트 재사용 {stats.cached}개"
+                    )
+                    if stats.errors:
+                        self.log_warning(f"읽을 수 없는 파일 {stats.errors}개는 크기 + mtime 으로 비교합니다")
+                else:
+                    etags = {}
+                # 해시하지 않았거나 해시에 실패한 파일 (ETag None) 도 남겨 크기 + mtime 으로 비교
+                # (빼면 --delete 가 원격 사본을 지움)
+                local = {
+                    key: (entry.size, etags.get(entry.path), entry.mtime_ns / 1e9)
+                    for key, entry in local_entries.items()
+                }
 
-                            uploaded_count += 1
-                            uploaded_size += file_size
+                # 원격 상태 (신뢰하는 매니페스트 또는 목록 조회)
+                if trust_manifest:
+                    remote = manifest.remote_objects(bucket, prefix)
+                    self.log_info(f"원격 목록 조회 생략 (매니페스트의 원격 객체 {len(remote)}개 사용)")
+                else:
+                    remote = {
+                        obj['Key']: RemoteObject(
+                            obj['Size'], obj['ETag'].strip('"'),
+                            obj['LastModified'].timestamp() if 'LastModified' in obj else None
+                        )
+                        async for obj in self._iter_objects(bucket, prefix)
+                    }
+                    manifest.replace_remote(bucket, prefix, remote)
+                    # 업로드 때 기록한 source_etag 를 붙인 기록과 비교
+                    remote = manifest.remote_objects(bucket, prefix)
+
+                upload_keys, extra_keys = diff_objects(local, remote)
+                # 필터에 걸린 원격 객체는 삭제 대상이 아님
+                extra_keys = [key for key in extra_keys if self._is_included(key[len(prefix):].lstrip('/'))]
+                total_size = sum(local[key][0] for key in upload_keys)
+                delete = getattr(self.args, 'delete', False)
+
+                if not upload_keys and not (delete and extra_keys):
+                    self.log_info("업로드할 파일이 없습니다 (모든 파일이 최신 상태)")
+                    return 0
 
-                            self.log_info(f"✓ {local_file.name} ({self._format_size(file_size)})")
+                # Dry run 모드
+                if dry_run:
+                    self.log_info(f"업로드 예정: {len(upload_keys)} 파일 ({self._format_size(total_size)})")
+                    for key in upload_keys:
+                        pawn.console.log(f"  {local_entries[key].path} -> s3://{bucket}/{key} ({self._format_size(local[key][0])})")
+                    if delete:
+                        self.log_info(f"삭제 예정: {len(extra_keys)} 객체")
+                    return 0
 
-                    except Exception as e:
-                        self.log_error(f"✗ {local_file.name}: {e}")
+                uploaded_count = uploaded_size = 0
+                if upload_keys:
+                    self.log_info(f"업로드 시작: {len(upload_keys)} 파일 ({self._format_size(total_size)})")
+
+                    # 병렬 업로드 (공유 클라이언트, 큰 파일은 병렬 multipart)
+                    transfer = await self._get_transfer_manager()
+                    extra_args = self._extra_args()
+                    jobs = (
+                        TransferJob(bucket, key, local_entries[key].path, local[key][0], extra_args)
+                        for key in upload_keys
+                    )
+
+                    def uploaded(result):
+                        # 다음 목록의 ETag (암호화 객체는 MD5 가 아님) 를 이번 내용과 연결해 둠
+                        key = result.destination[len(f"s3://{bucket}/"):]
+                        size, etag, _ = local[key]
+                        manifest.set_remote(
+                            bucket, key, RemoteObject(size, result.etag or etag or "", time.time(), source_etag=etag)
+                        )
 
-            # 업로드 작업 실행
-            tasks = [upload_file(local_file, s3_key, file_size) for local_file, s3_key, file_size in upload_tasks]
-            await asyncio.gather(*tasks, return_exceptions=True)
+                    uploaded_count, uploaded_size = await self._run_transfers(transfer.upload_many(jobs), uploaded)
 
-            # 삭제 처리 (--delete 옵션)
-            if getattr(self.args, 'delete', False):
-                await self._delete_extra_s3_objects(s3_client, bucket, prefix, local_files, local_dir)
+                # 삭제 처리 (--delete 옵션)
+                if delete and extra_keys:
+                    self.log_info(f"삭제할 객체: {len(extra_keys)}개")
+                    deleted_count, _ = await self._delete_keys(
+                        bucket, extra_keys, lambda key: manifest.drop_remote(bucket, key)
+                    )
+                    self.log_success(f"{deleted_count}개 객체 삭제 완료")
 
-            self.log_success(f"동기화 완료: {uploaded_count}/{len(upload_tasks)} 파일 업로드 ({self._format_size(uploaded_size)})")
+            self.log_success(f"동기화 완료: {uploaded_count}/{len(upload_keys)} 파일 업로드 ({self._format_size(uploaded_size)})")
             return 0
 
         except Exception as e:
@@ -369,7 +502,7 @@ class S3CLI(CloudBaseCLI):
             return 1
 
     async def _sync_from_s3(self, s3_path: str, local_path: str) -> int:
-        """S3에서 로컬로 동기화"""
+        """S3에서 로컬로 동기화 (목록 페이지가 도착하는 대로 다운로드 시작)"""
         try:
             bucket, prefix = self._parse_s3_path(s3_path)
             if not bucket:
@@ -378,178 +511,106 @@ class S3CLI(CloudBaseCLI):
 
             local_dir = Path(local_path)
             local_dir.mkdir(parents=True, exist_ok=True)
-
-            s3_client = await self._get_s3_client()
-
-            # S3 객체 목록
-            s3_objects = []
-            async with s3_client as s3:
-                paginator = s3.get_paginator('list_objects_v2')
-                async for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-                    for obj in page.get('Contents', []):
-                        if not obj['Key'].endswith('/'):  # 디렉토리 제외
-                            s3_objects.append(obj)
-
-            if not s3_objects:
-                self.log_info("다운로드할 객체가 없습니다")
+            dry_run = getattr(self.args, 'dry_run', False)
+            counts = {'objects': 0, 'pending': 0, 'pending_size': 0}
+
+            async def jobs():
+                async for obj in self._iter_objects(bucket, prefix, self._path_matcher(), relative=True):
+                    s3_key = obj['Key']
+                    if s3_key.endswith('/'):  # 디렉토리 제외
+                        continue
+                    counts['objects'] += 1
+                    local_file = local_dir / (s3_key[len(prefix):].lstrip('/') if prefix else s3_key)
+
+                    # 크기가 같고 로컬 파일이 더 최신이면 건너뜀
+                    try:
+                        local_stat = local_file.stat()
+                        if local_stat.st_size == obj['Size'] and local_stat.st_mtime >= obj['LastModified'].timestamp():
+                            continue
+                    except FileNotFoundError:
+                        pass
+
+                    counts['pending'] += 1
+                    counts['pending_size'] += obj['Size']
+                    if dry_run:
+                        pawn.console.log(f"  s3://{bucket}/{s3_key} -> {local_file} ({self._format_size(obj['Size'])})")
+                        continue
+                    yield TransferJob(bucket, s3_key, str(local_file), obj['Size'])
+
+            if dry_run:
+                async for _ in jobs():
+                    pass
+                self.log_info(f"다운로드 예정: {counts['pending']} 파일 ({self._format_size(counts['pending_size'])})")
                 return 0
 
-            # 다운로드할 파일 결정
-            download_tasks = []
-            total_size = 0
-
-            for s3_obj in s3_objects:
-                s3_key = s3_obj['Key']
-
-                # 로컬 파일 경로 계산
-                if prefix:
-                    relative_key = s3_key[len(prefix):].lstrip('/')
-                else:
-                    relative_key = s3_key
-
-                local_file = local_dir / relative_key
-
-                should_download = True
-
-                # 로컬 파일이 이미 존재하는지 확인
-                if local_file.exists():
-                    local_stat = local_file.stat()
-                    local_size = local_stat.st_size
-                    local_mtime = datetime.fromtimestamp(local_stat.st_mtime)
-
-                    s3_size = s3_obj['Size']
-                    s3_mtime = s3_obj['LastModified'].replace(tzinfo=None)
+            # 병렬 다운로드 (큰 객체는 병렬 ranged GET)
+            transfer = await self._get_transfer_manager()
+            downloaded_count, downloaded_size = await self._run_transfers(transfer.download_many(jobs()))
 
-                    # 크기와 수정 시간이 같으면 건너뜀
-                    if local_size == s3_size and local_mtime >= s3_mtime:
-                        should_download = False
-
-                if should_download:
-                    download_tasks.append((s3_key, local_file, s3_obj['Size']))
-                    total_size += s3_obj['Size']
-
-            if not download_tasks:
+            if not counts['objects']:
+                self.log_info("다운로드할 객체가 없습니다")
+            elif not counts['pending']:
                 self.log_info("다운로드할 파일이 없습니다 (모든 파일이 최신 상태)")
-                return 0
-
-            # Dry run 모드
-            if getattr(self.args, 'dry_run', False):
-                self.log_info(f"다운로드 예정: {len(download_tasks)} 파일 ({self._format_size(total_size)})")
-                for s3_key, local_file, file_size in download_tasks:
-                    pawn.console.log(f"  s3://{bucket}/{s3_key} -> {local_file} ({self._format_size(file_size)})")
-                return 0
-
-            # 실제 다운로드 수행
-            self.log_info(f"다운로드 시작: {len(download_tasks)} 파일 ({self._format_size(total_size)})")
-
-            downloaded_count = 0
-            downloaded_size = 0
-
-            # 병렬 다운로드
-            semaphore = asyncio.Semaphore(getattr(self.args, 'max_workers', 10))
-
-            async def download_file(s3_key, local_file, file_size):
-                nonlocal downloaded_count, downloaded_size
-
-                async with semaphore:
-                    try:
-                        # 디렉토리 생성
-                        local_file.parent.mkdir(parents=True, exist_ok=True)
-
-                        async with s3_client as s3:
-                            await s3.download_file(bucket, s3_key, str(local_file))
-
-                            downloaded_count += 1
-                            downloaded_size += file_size
-
-                            self.log_info(f"✓ {local_file.name} ({self._format_size(file_size)})")
-
-                    except Exception as e:
-                        self.log_error(f"✗ {s3_key}: {e}")
-
-            # 다운로드 작업 실행
-            tasks = [download_file(s3_key, local_file, file_size) for s3_key, local_file, file_size in download_tasks]
-            await asyncio.gather(*tasks, return_exceptions=True)
-
-            self.log_success(f"동기화 완료: {downloaded_count}/{len(download_tasks)} 파일 다운로드 ({self._format_size(downloaded_size)})")
+            else:
+                self.log_success(f"동기화 완료: {downloaded_count}/{counts['pending']} 파일 다운로드 ({self._format_size(downloaded_size)})")
             return 0
 
         except Exception as e:
             self.log_error(f"S3 다운로드 동기화 실패: {e}")
             return 1
 
-    def _apply_filters(self, files: List[Path], base_dir: Path) -> List[Path]:
-        """파일 필터링 적용"""
-        import fnmatch
-
-        include_patterns = getattr(self.args, 'include', [])
-        exclude_patterns = getattr(self.args, 'exclude', [])
-
-        if not include_patterns and not exclude_patterns:
-            return files
-
-        filtered_files = []
-
-        for file_path in files:
-            relative_path = str(file_path.relative_to(base_dir))
-
-            # Include 패턴 확인 (지정된 경우)
-            if include_patterns:
-                included = any(fnmatch.fnmatch(relative_path, pattern) for pattern in include_patterns)
-                if not included:
-                    continue
-
-            # Exclude 패턴 확인
-            if exclude_patterns:
-                excluded = any(fnmatch.fnmatch(relative_path, pattern) for pattern in exclude_patterns)
-                if excluded:
-                    continue
-
-            filtered_files.append(file_path)
-
-        return filtered_files
-
-    async def _delete_extra_s3_objects(self, s3_client, bucket: str, prefix: str, local_files: List[Path], local_dir: Path):
-        """로컬에 없는 S3 객체 삭제"""
-        try:
-            # 로컬 파일 경로 집합 생성
-            local_keys = set()
-            for local_file in local_files:
-                relative_path = local_file.relative_to(local_dir)
-                s3_key = f"{prefix.rstrip('/')}/{relative_path}".lstrip('/')
-                local_keys.add(s3_key)
-
-            # S3 객체 목록 조회
-            delete_keys = []
-            async with s3_client as s3:
-                paginator = s3.get_paginator('list_objects_v2')
-                async for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-                    for obj in page.get('Contents', []):
-                        s3_key = obj['Key']
-                        if s3_key not in local_keys:
-                            delete_keys.append(s3_key)
-
-            if delete_keys:
-                self.log_info(f"삭제할 객체: {len(delete_keys)}개")
-
-                # 배치 삭제
-                for i in range(0, len(delete_keys), 1000):  # S3 배치 삭제 제한
-                    batch_keys = delete_keys[i:i+1000]
-                    delete_objects = [{'Key': key} for key in batch_keys]
-
-                    async with s3_client as s3:
-                        await s3.delete_objects(
-                            Bucket=bucket,
-                            Delete={'Objects': delete_objects}
-                        )
-
-                    for key in batch_keys:
-                        self.log_info(f"✗ 삭제: {key}")
-
-                self.log_success(f"{len(delete_keys)}개 객체 삭제 완료")
-
-        except Exception as e:
-            self.log_error(f"S3 객체 삭제 실패: {e}")
+    def _path_matcher(self) -> PathMatcher:
+        """--include/--exclude 를 한 번만 컴파일한 매처"""
+        if self._matcher is None:
+            self._matcher = PathMatcher(getattr(self.args, 'include', None), getattr(self.args, 'exclude', None))
+        return self._matcher
+
+    def _is_included(self, relative_path: str) -> bool:
+        """include/exclude 패턴 적용 (include 가 있으면 하나 이상 일치, exclude 는 하나도 일치하지 않아야 함)"""
+        return self._path_matcher()(relative_path)
+
+    async def _iter_objects(self, bucket: str, prefix: str, matcher: Optional[PathMatcher] = None, relative: bool = False):
+        """공유 클라이언트로 prefix 를 병렬 나열하며 객체를 도착하는 순서대로 생성"""
+        s3 = await self._get_s3_client()
+        async for obj in iter_objects(
+            s3, bucket, prefix, matcher=matcher if matcher is not None and matcher.active else None, relative=relative,
+            concurrency=getattr(self.args, 'list_concurrency', 8),
+            shard_depth=getattr(self.args, 'list_shard_depth', 1),
+        ):
+            yield obj
+
+    async def _summarize_prefix(self, bucket: str, prefix: str = '') -> tuple[int, int]:
+        """prefix 아래 (객체 수, 총 크기) - 키를 보관하지 않고 페이지 단위로 합산"""
+        s3 = await self._get_s3_client()
+        object_count = total_size = 0
+        async for page in iter_object_pages(
+            s3, bucket, prefix,
+            concurrency=getattr(self.args, 'list_concurrency', 8),
+            shard_depth=getattr(self.args, 'list_shard_depth', 1),
+        ):
+            object_count += len(page)
+            total_size += sum(obj['Size'] for obj in page)
+        return object_count, total_size
+
+    async def _delete_keys(self, bucket: str, keys, on_deleted=None) -> tuple[int, int]:
+        """
+        키를 1000 개 배치로 동시에 삭제 (``keys`` 는 동기/비동기 이터러블, ``on_deleted`` 는 삭제된 키마다 호출)
+
+        Returns:
+            (삭제된 수, 실패한 수)
+        """
+        s3 = await self._get_s3_client()
+        deleted_count = failed_count = 0
+        async for deleted, errors in delete_keys(s3, bucket, keys, concurrency=getattr(self.args, 'max_workers', 10)):
+            for key in deleted:
+                deleted_count += 1
+                self.log_info(f"✓ 삭제: {key}")
+                if on_deleted is not None:
+                    on_deleted(key)
+            for error in errors:
+                failed_count += 1
+                self.log_error(f"✗ 삭제 실패: {error['Key']} - {error.get('Message')}")
+        return deleted_count, failed_count
 
     async def _handle_copy(self) -> int:
         """복사 처리"""
@@ -587,31 +648,16 @@ class S3CLI(CloudBaseCLI):
                 self.log_error(f"로컬 파일을 찾을 수 없습니다: {local_path}")
                 return 1
 
-            s3_client = await self._get_s3_client()
-
             if local_file.is_file():
                 # 단일 파일 복사
                 if getattr(self.args, 'dry_run', False):
                     self.log_info(f"복사 예정: {local_file} -> s3://{bucket}/{key}")
                     return 0
 
-                async with s3_client as s3:
-                    extra_args = {'StorageClass': getattr(self.args, 'storage_class', 'STANDARD')}
-
-                    # 메타데이터 추가
-                    if hasattr(self.args, 'metadata') and self.args.metadata:
-                        metadata = {}
-                        for meta in self.args.metadata:
-                            if '=' in meta:
-                                k, v = meta.split('=', 1)
-                                metadata[k] = v
-                        if metadata:
-                            extra_args['Metadata'] = metadata
-
-                    await s3.upload_file(str(local_file), bucket, key, ExtraArgs=extra_args)
+                transfer = await self._get_transfer_manager()
+                result = await transfer.upload_file(local_file, bucket, key, self._extra_args())
 
-                file_size = local_file.stat().st_size
-                self.log_success(f"파일 업로드 완료: {local_file} -> s3://{bucket}/{key} ({self._format_size(file_size)})")
+                self.log_success(f"파일 업로드 완료: {local_file} -> s3://{bucket}/{key} ({self._format_size(result.size)})")
 
             elif local_file.is_dir() and getattr(self.args, 'recursive', False):
                 # 디렉토리 복사
@@ -622,25 +668,14 @@ class S3CLI(CloudBaseCLI):
                     self.log_info(f"복사 예정: {len(files)} 파일")
                     return 0
 
-                uploaded_count = 0
-                total_size = 0
-
-                for file_path in files:
-                    try:
-                        relative_path = file_path.relative_to(local_file)
-                        s3_key = f"{key.rstrip('/')}/{relative_path}".lstrip('/')
-
-                        async with s3_client as s3:
-                            await s3.upload_file(str(file_path), bucket, s3_key)
-
-                        file_size = file_path.stat().st_size
-                        total_size += file_size
-                        uploaded_count += 1
-
-                        self.log_info(f"✓ {file_path.name} ({self._format_size(file_size)})")
-
-                    except Exception as e:
-                        self.log_error(f"✗ {file_path.name}: {e}")
+                # 병렬 업로드 (--max-workers 개 파일 동시)
+                transfer = await self._get_transfer_manager()
+                extra_args = self._extra_args()
+                jobs = (
+                    TransferJob(bucket, f"{key.rstrip('/')}/{file_path.relative_to(local_file)}".lstrip('/'), str(file_path), extra_args=extra_args)
+                    for file_path in files
+                )
+                uploaded_count, total_size = await self._run_transfers(transfer.upload_many(jobs))
 
                 self.log_success(f"디렉토리 업로드 완료: {uploaded_count} 파일 ({self._format_size(total_size)})")
 
@@ -662,13 +697,12 @@ class S3CLI(CloudBaseCLI):
                 self.log_error("유효하지 않은 S3 경로입니다")
                 return 1
 
-            s3_client = await self._get_s3_client()
+            s3 = await self._get_s3_client()
 
             # S3 객체 존재 확인
             try:
-                async with s3_client as s3:
-                    await s3.head_object(Bucket=bucket, Key=key)
-                    is_single_object = True
+                head = await s3.head_object(Bucket=bucket, Key=key)
+                is_single_object = True
             except Exception:
                 is_single_object = False
 
@@ -680,13 +714,10 @@ class S3CLI(CloudBaseCLI):
                     self.log_info(f"다운로드 예정: s3://{bucket}/{key} -> {local_file}")
                     return 0
 
-                local_file.parent.mkdir(parents=True, exist_ok=True)
+                transfer = await self._get_transfer_manager()
+                result = await transfer.download_file(bucket, key, local_file, head['ContentLength'])
 
-                async with s3_client as s3:
-                    await s3.download_file(bucket, key, str(local_file))
-
-                file_size = local_file.stat().st_size
-                self.log_success(f"파일 다운로드 완료: s3://{bucket}/{key} -> {local_file} ({self._format_size(file_size)})")
+                self.log_success(f"파일 다운로드 완료: s3://{bucket}/{key} -> {local_file} ({self._format_size(result.size)})")
 
             else:
                 # 다중 객체 다운로드 (prefix 기반)
@@ -697,46 +728,30 @@ class S3CLI(CloudBaseCLI):
                 local_dir = Path(local_path)
                 local_dir.mkdir(parents=True, exist_ok=True)
 
-                # S3 객체 목록 조회
-                objects = []
-                async with s3_client as s3:
-                    paginator = s3.get_paginator('list_objects_v2')
-                    async for page in paginator.paginate(Bucket=bucket, Prefix=key):
-                        for obj in page.get('Contents', []):
-                            if not obj['Key'].endswith('/'):
-                                objects.append(obj)
+                # 목록 페이지가 도착하는 대로 병렬 다운로드 (--max-workers 개 객체 동시)
+                dry_run = getattr(self.args, 'dry_run', False)
+                found = 0
+
+                async def jobs():
+                    nonlocal found
+                    async for obj in self._iter_objects(bucket, key):
+                        if obj['Key'].endswith('/'):
+                            continue
+                        found += 1
+                        if not dry_run:
+                            yield TransferJob(bucket, obj['Key'], str(local_dir / obj['Key'][len(key):].lstrip('/')), obj['Size'])
+
+                transfer = await self._get_transfer_manager()
+                downloaded_count, total_size = await self._run_transfers(transfer.download_many(jobs()))
 
-                if not objects:
+                if not found:
                     self.log_error(f"S3 경로에서 객체를 찾을 수 없습니다: s3://{bucket}/{key}")
                     return 1
 
-                if getattr(self.args, 'dry_run', False):
-                    self.log_info(f"다운로드 예정: {len(objects)} 객체")
+                if dry_run:
+                    self.log_info(f"다운로드 예정: {found} 객체")
                     return 0
 
-                downloaded_count = 0
-                total_size = 0
-
-                for obj in objects:
-                    try:
-                        obj_key = obj['Key']
-                        relative_key = obj_key[len(key):].lstrip('/')
-                        local_file = local_dir / relative_key
-
-                        local_file.parent.mkdir(parents=True, exist_ok=True)
-
-                        async with s3_client as s3:
-                            await s3.download_file(bucket, obj_key, str(local_file))
-
-                        file_size = obj['Size']
-                        total_size += file_size
-                        downloaded_count += 1
-
-                        self.log_info(f"✓ {local_file.name} ({self._format_size(file_size)})")
-
-                    except Exception as e:
-                        self.log_error(f"✗ {obj_key}: {e}")
-
                 self.log_success(f"다운로드 완료: {downloaded_count} 파일 ({self._format_size(total_size)})")
 
             return 0
@@ -755,15 +770,14 @@ class S3CLI(CloudBaseCLI):
                 self.log_error("유효하지 않은 S3 경로입니다")
                 return 1
 
-            s3_client = await self._get_s3_client()
+            s3 = await self._get_s3_client()
 
             if getattr(self.args, 'dry_run', False):
                 self.log_info(f"복사 예정: {source_s3} -> {dest_s3}")
                 return 0
 
-            async with s3_client as s3:
-                copy_source = {'Bucket': source_bucket, 'Key': source_key}
-                await s3.copy_object(CopySource=copy_source, Bucket=dest_bucket, Key=dest_key)
+            copy_source = {'Bucket': source_bucket, 'Key': source_key}
+            await s3.copy_object(CopySource=copy_source, Bucket=dest_bucket, Key=dest_key)
 
             self.log_success(f"S3 객체 복사 완료: {source_s3} -> {dest_s3}")
             return 0
@@ -795,11 +809,10 @@ class S3CLI(CloudBaseCLI):
     async def _list_buckets(self) -> int:
         """버킷 목록 조회"""
         try:
-            s3_client = await self._get_s3_client()
+            s3 = await self._get_s3_client()
 
-            async with s3_client as s3:
-                response = await s3.list_buckets()
-                buckets = response.get('Buckets', [])
+            response = await s3.list_buckets()
+            buckets = response.get('Buckets', [])
 
             if not buckets:
                 self.log_info("버킷이 없습니다")
@@ -816,19 +829,11 @@ class S3CLI(CloudBaseCLI):
                 # 요약 정보 포함
                 if getattr(self.args, 'summarize', False):
                     try:
-                        async with s3_client as s3:
-                            # 객체 수 및 크기 계산
-                            paginator = s3.get_paginator('list_objects_v2')
-                            object_count = 0
-                            total_size = 0
-
-                            async for page in paginator.paginate(Bucket=bucket['Name']):
-                                objects = page.get('Contents', [])
-                                object_count += len(objects)
-                                total_size += sum(obj['Size'] for obj in objects)
+                        # 객체 수 및 크기 계산 (병렬 목록)
+                        object_count, total_size = await self._summarize_prefix(bucket['Name'])
 
-                            bucket_info['object_count'] = object_count
-                            bucket_info['total_size'] = self._format_size(total_size)
+                        bucket_info['object_count'] = object_count
+                        bucket_info['total_size'] = self._format_size(total_size)
 
                     except Exception as e:
                         bucket_info['error'] = str(e)
@@ -845,68 +850,108 @@ class S3CLI(CloudBaseCLI):
             self.log_error(f"버킷 목록 조회 실패: {e}")
             return 1
 
+    def _object_row(self, obj: Dict[str, Any]) -> Dict[str, str]:
+        """목록 출력 행"""
+        is_dir = obj.get('IsDirectory', False)
+        return {
+            'key': obj['Key'],
+            'size': self._format_size(obj['Size']) if not is_dir else '<DIR>',
+            'last_modified': obj['LastModified'].strftime('%Y-%m-%d %H:%M:%S') if obj['LastModified'] else '',
+            'type': 'Directory' if is_dir else 'File'
+        }
+
+    def _print_rows(self, rows: List[Dict[str, str]], first: bool):
+        """
+        목록 한 페이지 출력 (페이지를 이어 붙여도 하나의 출력이 되도록)
+
+        table 은 첫 페이지에만 헤더를 붙이고, csv 는 첫 페이지에만 헤더 줄을, json 은 배열을
+        나눠 출력합니다 (``_finish_rows`` 가 닫음). 열 순서는 ``_object_row`` 와 같습니다.
+        """
+        format_type = getattr(self.args, 'output_format', 'table')
+        if format_type == 'json':
+            import json
+
+            body = ",\n".join("  " + json.dumps(row, ensure_ascii=False) for row in rows)
+            pawn.console.print(("[\n" if first else ",\n") + body, end='', markup=False, highlight=False, soft_wrap=True)
+        elif format_type == 'table':
+            from rich.table import Table
+
+            table = Table(show_header=first, header_style="bold magenta", box=None, pad_edge=False)
+            # 페이지마다 열 위치가 크게 흔들리지 않도록 최소 폭 지정
+            table.add_column('key', style="dim", min_width=40, no_wrap=True)
+            table.add_column('size', style="dim", min_width=10, justify='right', no_wrap=True)
+            table.add_column('last_modified', style="dim", min_width=19, no_wrap=True)
+            table.add_column('type', style="dim", min_width=9, no_wrap=True)
+            for row in rows:
+                table.add_row(row['key'], row['size'], row['last_modified'], row['type'])
+            pawn.console.print(table)
+        else:
+            output = self.format_output(rows)
+            if format_type == 'csv' and not first:
+                output = output.split('\n', 1)[1]
+            pawn.console.print(output.rstrip('\n'), markup=False, highlight=False, soft_wrap=True)
+
+    def _finish_rows(self, printed: bool):
+        if printed and getattr(self.args, 'output_format', 'table') == 'json':
+            pawn.console.print("\n]", markup=False, highlight=False)
+
     async def _list_objects(self, bucket: str, prefix: str = '') -> int:
-        """객체 목록 조회"""
+        """
+        객체 목록 조회 (페이지가 도착하는 대로 출력)
+
+        재귀 목록은 하위 prefix 를 병렬로 조회하므로 페이지 안에서는 키 순서지만 하위 prefix 사이는
+        도착 순서입니다 (``--list-shard-depth 0`` 이면 전체가 키 순서).
+        """
         try:
-            s3_client = await self._get_s3_client()
+            s3 = await self._get_s3_client()
 
-            objects = []
-            total_size = 0
+            file_count = dir_count = total_size = 0
+            printed = False
 
-            async with s3_client as s3:
-                if getattr(self.args, 'recursive', False):
-                    # 재귀적 목록
-                    paginator = s3.get_paginator('list_objects_v2')
-                    async for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-                        for obj in page.get('Contents', []):
-                            objects.append(obj)
-                            total_size += obj['Size']
-                else:
-                    # 현재 레벨만
+            if getattr(self.args, 'recursive', False):
+                # 재귀적 목록 (하위 prefix 사이 순서는 도착 순서)
+                pages = iter_object_pages(
+                    s3, bucket, prefix,
+                    concurrency=getattr(self.args, 'list_concurrency', 8),
+                    shard_depth=getattr(self.args, 'list_shard_depth', 1),
+                )
+            else:
+                # 현재 레벨만
+                async def current_level():
                     paginator = s3.get_paginator('list_objects_v2')
                     async for page in paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter='/'):
-                        # 디렉토리
-                        for common_prefix in page.get('CommonPrefixes', []):
-                            objects.append({
-                                'Key': common_prefix['Prefix'],
-                                'Size': 0,
-                                'LastModified': None,
-                                'IsDirectory': True
-                            })
-
-                        # 파일
-                        for obj in page.get('Contents', []):
-                            if obj['Key'] != prefix:  # prefix 자체는 제외
-                                objects.append(obj)
-                                total_size += obj['Size']
-
-            if not objects:
-                self.log_info("객체가 없습니다")
-                return 0
+                        objects = [
+                            {'Key': common_prefix['Prefix'], 'Size': 0, 'LastModified': None, 'IsDirectory': True}
+                            for common_prefix in page.get('CommonPrefixes', [])
+                        ]
+                        # prefix 자체는 제외
+                        objects.extend(obj for obj in page.get('Contents', []) if obj['Key'] != prefix)
+                        yield objects
 
-            # 객체 정보 포맷팅
-            object_data = []
-            for obj in objects:
-                is_dir = obj.get('IsDirectory', False)
+                pages = current_level()
 
-                obj_info = {
-                    'key': obj['Key'],
-                    'size': self._format_size(obj['Size']) if not is_dir else '<DIR>',
-                    'last_modified': obj['LastModified'].strftime('%Y-%m-%d %H:%M:%S') if obj['LastModified'] else '',
-                    'type': 'Directory' if is_dir else 'File'
-                }
-
-                object_data.append(obj_info)
+            try:
+                async for page in pages:
+                    if not page:
+                        continue
+                    for obj in page:
+                        if obj.get('IsDirectory', False):
+                            dir_count += 1
+                        else:
+                            file_count += 1
+                            total_size += obj['Size']
+                    self._print_rows([self._object_row(obj) for obj in page], first=not printed)
+                    printed = True
+            finally:
+                # 목록 도중 실패해도 이미 연 JSON 배열은 닫음
+                self._finish_rows(printed)
 
-            # 출력
-            formatted_output = self.format_output(object_data)
-            pawn.console.print(formatted_output)
+            if not printed:
+                self.log_info("객체가 없습니다")
+                return 0
 
             # 요약 정보
             if getattr(self.args, 'summarize', False):
-                file_count = len([obj for obj in objects if not obj.get('IsDirectory', False)])
-                dir_count = len([obj for obj in objects if obj.get('IsDirectory', False)])
-
                 pawn.console.log("")
                 pawn.console.log(f"총 {file_count} 파일, {dir_count} 디렉토리")
                 pawn.console.log(f"총 크기: {self._format_size(total_size)}")
@@ -918,7 +963,7 @@ class S3CLI(CloudBaseCLI):
             return 1
 
     async def _handle_remove(self) -> int:
-        """삭제 처리"""
+        """삭제 처리 (재귀 삭제는 목록 페이지가 도착하는 대로 1000 개 배치를 동시에 삭제)"""
         try:
             path = self.args.path
             bucket, prefix = self._parse_s3_path(path)
@@ -927,96 +972,54 @@ class S3CLI(CloudBaseCLI):
                 self.log_error("유효하지 않은 S3 경로입니다")
                 return 1
 
-            s3_client = await self._get_s3_client()
-
-            # 삭제할 객체 목록 수집
-            delete_objects = []
+            s3 = await self._get_s3_client()
+            dry_run = getattr(self.args, 'dry_run', False)
+            matcher = self._path_matcher()
 
             if getattr(self.args, 'recursive', False):
-                # 재귀적 삭제
-                async with s3_client as s3:
-                    paginator = s3.get_paginator('list_objects_v2')
-                    async for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-                        for obj in page.get('Contents', []):
-                            delete_objects.append(obj['Key'])
-            else:
-                # 단일 객체 삭제
-                try:
-                    async with s3_client as s3:
-                        await s3.head_object(Bucket=bucket, Key=prefix)
-                        delete_objects.append(prefix)
-                except Exception:
-                    self.log_error(f"객체를 찾을 수 없습니다: s3://{bucket}/{prefix}")
-                    return 1
-
-            # 필터링 적용
-            if hasattr(self.args, 'include') or hasattr(self.args, 'exclude'):
-                import fnmatch
-
-                include_patterns = getattr(self.args, 'include', [])
-                exclude_patterns = getattr(self.args, 'exclude', [])
-
-                filtered_objects = []
-                for obj_key in delete_objects:
-                    # Include 패턴 확인
-                    if include_patterns:
-                        included = any(fnmatch.fnmatch(obj_key, pattern) for pattern in include_patterns)
-                        if not included:
-                            continue
-
-                    # Exclude 패턴 확인
-                    if exclude_patterns:
-                        excluded = any(fnmatch.fnmatch(obj_key, pattern) for pattern in exclude_patterns)
-                        if excluded:
-                            continue
+                # 재귀적 삭제 (include/exclude 는 전체 키에 적용)
+                planned = 0
+
+                async def keys():
+                    nonlocal planned
+                    async for obj in self._iter_objects(bucket, prefix, matcher):
+                        planned += 1
+                        if dry_run:
+                            pawn.console.log(f"  s3://{bucket}/{obj['Key']}")
+                        else:
+                            yield obj['Key']
+
+                if dry_run:
+                    async for _ in keys():
+                        pass
+                    self.log_info(f"삭제 예정: {planned} 객체")
+                    return 0
 
-                    filtered_objects.append(obj_key)
+                deleted_count, _ = await self._delete_keys(bucket, keys())
+                if not planned:
+                    self.log_info("삭제할 객체가 없습니다")
+                    return 0
+                self.log_success(f"삭제 완료: {deleted_count}/{planned} 객체")
+                return 0
 
-                delete_objects = filtered_objects
+            # 단일 객체 삭제
+            try:
+                await s3.head_object(Bucket=bucket, Key=prefix)
+            except Exception:
+                self.log_error(f"객체를 찾을 수 없습니다: s3://{bucket}/{prefix}")
+                return 1
 
-            if not delete_objects:
+            if not matcher(prefix):
                 self.log_info("삭제할 객체가 없습니다")
                 return 0
 
-            # Dry run 모드
-            if getattr(self.args, 'dry_run', False):
-                self.log_info(f"삭제 예정: {len(delete_objects)} 객체")
-                for obj_key in delete_objects:
-                    pawn.console.log(f"  s3://{bucket}/{obj_key}")
+            if dry_run:
+                self.log_info("삭제 예정: 1 객체")
+                pawn.console.log(f"  s3://{bucket}/{prefix}")
                 return 0
 
-            # 실제 삭제 수행
-            self.log_info(f"삭제 시작: {len(delete_objects)} 객체")
-
-            deleted_count = 0
-
-            # 배치 삭제 (최대 1000개씩)
-            for i in range(0, len(delete_objects), 1000):
-                batch_objects = delete_objects[i:i+1000]
-                delete_request = [{'Key': key} for key in batch_objects]
-
-                try:
-                    async with s3_client as s3:
-                        response = await s3.delete_objects(
-                            Bucket=bucket,
-                            Delete={'Objects': delete_request}
-                        )
-
-                    # 삭제 결과 처리
-                    deleted = response.get('Deleted', [])
-                    errors = response.get('Errors', [])
-
-                    for obj in deleted:
-                        deleted_count += 1
-                        self.log_info(f"✓ 삭제: {obj['Key']}")
-
-                    for error in errors:
-                        self.log_error(f"✗ 삭제 실패: {error['Key']} - {error['Message']}")
-
-                except Exception as e:
-                    self.log_error(f"배치 삭제 실패: {e}")
-
-            self.log_success(f"삭제 완료: {deleted_count}/{len(delete_objects)} 객체")
+            deleted_count, _ = await self._delete_keys(bucket, [prefix])
+            self.log_success(f"삭제 완료: {deleted_count}/1 객체")
             return 0
 
         except Exception as e:
@@ -1033,66 +1036,58 @@ class S3CLI(CloudBaseCLI):
                 self.log_error("유효하지 않은 S3 경로입니다")
                 return 1
 
-            s3_client = await self._get_s3_client()
+            s3 = await self._get_s3_client()
 
             if not key:
                 # 버킷 정보
-                return await self._get_bucket_info(s3_client, bucket)
+                return await self._get_bucket_info(s3, bucket)
             else:
                 # 객체 정보
-                return await self._get_object_info(s3_client, bucket, key)
+                return await self._get_object_info(s3, bucket, key)
 
         except Exception as e:
             self.log_error(f"정보 조회 실패: {e}")
             return 1
 
-    async def _get_bucket_info(self, s3_client, bucket: str) -> int:
+    async def _get_bucket_info(self, s3, bucket: str) -> int:
         """버킷 정보 조회"""
         try:
-            async with s3_client as s3:
-                # 기본 버킷 정보
-                bucket_info = {
-                    'name': bucket,
-                    'region': await self._get_bucket_region(s3, bucket)
-                }
+            # 기본 버킷 정보
+            bucket_info = {
+                'name': bucket,
+                'region': await self._get_bucket_region(s3, bucket)
+            }
 
-                # 버킷 생성 날짜
-                try:
-                    buckets_response = await s3.list_buckets()
-                    for b in buckets_response.get('Buckets', []):
-                        if b['Name'] == bucket:
-                            bucket_info['creation_date'] = b['CreationDate'].strftime('%Y-%m-%d %H:%M:%S')
-                            break
-                except Exception:
-                    pass
+            # 버킷 생성 날짜
+            try:
+                buckets_response = await s3.list_buckets()
+                for b in buckets_response.get('Buckets', []):
+                    if b['Name'] == bucket:
+                        bucket_info['creation_date'] = b['CreationDate'].strftime('%Y-%m-%d %H:%M:%S')
+                        break
+            except Exception:
+                pass
 
-                # 객체 통계
-                try:
-                    paginator = s3.get_paginator('list_objects_v2')
-                    object_count = 0
-                    total_size = 0
+            # 객체 통계
+            try:
+                object_count, total_size = await self._summarize_prefix(bucket)
 
-                    async for page in paginator.paginate(Bucket=bucket):
-                        objects = page.get('Contents', [])
-                        object_count += len(objects)
-                        total_size += sum(obj['Size'] for obj in objects)
+                bucket_info['object_count'] = object_count
+                bucket_info['total_size'] = self._format_size(total_size)
 
-                    bucket_info['object_count'] = object_count
-                    bucket_info['total_size'] = self._format_size(total_size)
+            except Exception as e:
+                bucket_info['statistics_error'] = str(e)
 
+            # 버킷 정책 (선택적)
+            if getattr(self.args, 'include_acl', False):
+                try:
+                    acl_response = await s3.get_bucket_acl(Bucket=bucket)
+                    bucket_info['acl'] = {
+                        'owner': acl_response['Owner'],
+                        'grants': acl_response['Grants']
+                    }
                 except Exception as e:
-                    bucket_info['statistics_error'] = str(e)
-
-                # 버킷 정책 (선택적)
-                if getattr(self.args, 'include_acl', False):
-                    try:
-                        acl_response = await s3.get_bucket_acl(Bucket=bucket)
-                        bucket_info['acl'] = {
-                            'owner': acl_response['Owner'],
-                            'grants': acl_response['Grants']
-                        }
-                    except Exception as e:
-                        bucket_info['acl_error'] = str(e)
+                    bucket_info['acl_error'] = str(e)
 
             # 출력
             formatted_output = self.format_output(bucket_info)
@@ -1104,39 +1099,38 @@ class S3CLI(CloudBaseCLI):
             self.log_error(f"버킷 정보 조회 실패: {e}")
             return 1
 
-    async def _get_object_info(self, s3_client, bucket: str, key: str) -> int:
+    async def _get_object_info(self, s3, bucket: str, key: str) -> int:
         """객체 정보 조회"""
         try:
-            async with s3_client as s3:
-                # 객체 메타데이터
-                response = await s3.head_object(Bucket=bucket, Key=key)
-
-                object_info = {
-                    'bucket': bucket,
-                    'key': key,
-                    'size': self._format_size(response['ContentLength']),
-                    'last_modified': response['LastModified'].strftime('%Y-%m-%d %H:%M:%S'),
-                    'etag': response['ETag'].strip('"'),
-                    'content_type': response.get('ContentType', 'unknown'),
-                    'storage_class': response.get('StorageClass', 'STANDARD')
-                }
-
-                # 메타데이터 포함
-                if getattr(self.args, 'include_metadata', False):
-                    metadata = response.get('Metadata', {})
-                    if metadata:
-                        object_info['metadata'] = metadata
-
-                # ACL 정보 포함
-                if getattr(self.args, 'include_acl', False):
-                    try:
-                        acl_response = await s3.get_object_acl(Bucket=bucket, Key=key)
-                        object_info['acl'] = {
-                            'owner': acl_response['Owner'],
-                            'grants': acl_response['Grants']
-                        }
-                    except Exception as e:
-                        object_info['acl_error'] = str(e)
+            # 객체 메타데이터
+            response = await s3.head_object(Bucket=bucket, Key=key)
+
+            object_info = {
+                'bucket': bucket,
+                'key': key,
+                'size': self._format_size(response['ContentLength']),
+                'last_modified': response['LastModified'].strftime('%Y-%m-%d %H:%M:%S'),
+                'etag': response['ETag'].strip('"'),
+                'content_type': response.get('ContentType', 'unknown'),
+                'storage_class': response.get('StorageClass', 'STANDARD')
+            }
+
+            # 메타데이터 포함
+            if getattr(self.args, 'include_metadata', False):
+                metadata = response.get('Metadata', {})
+                if metadata:
+                    object_info['metadata'] = metadata
+
+            # ACL 정보 포함
+            if getattr(self.args, 'include_acl', False):
+                try:
+                    acl_response = await s3.get_object_acl(Bucket=bucket, Key=key)
+                    object_info['acl'] = {
+                        'owner': acl_response['Owner'],
+                        'grants': acl_response['Grants']
+                    }
+                except Exception as e:
+                    object_info['acl_error'] = str(e)
 
             # 출력
             formatted_output = self.format_output(object_info)
@@ -1151,10 +1145,10 @@ class S3CLI(CloudBaseCLI):
                 self.log_error(f"객체 정보 조회 실패: {e}")
             return 1
 
-    async def _get_bucket_region(self, s3_client, bucket: str) -> str:
+    async def _get_bucket_region(self, s3, bucket: str) -> str:
         """버킷 리전 조회"""
         try:
-            response = await s3_client.get_bucket_location(Bucket=bucket)
+            response = await s3.get_bucket_location(Bucket=bucket)
             region = response.get('LocationConstraint')
             return region if region else 'us-east-1'  # None은 us-east-1을 의미
         except Exception:
@@ -5,10 +5,9 @@ ScanKey CLI - 키 스캔 및 보안 검사 도구
 """
 
 import asyncio
+import copy
 import json
-import re
-import hashlib
-import base64
+import sys
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Set, Tuple
 from argparse import ArgumentParser
@@ -16,6 +15,15 @@ from pathlib import Path
 
 from pawnstack.cli.base import AsyncBaseCLI, register_cli_command
 from pawnstack.config.global_config import pawn
+from pawnstack.security.scanner import (
+    DEFAULT_PATTERNS,
+    SecretScanner,
+    calculate_entropy,
+    is_base64_encoded,
+    mask_secret,
+)
+from pawnstack.security.git_diff import GitDiffScanner
+from pawnstack.security.repository import RepositoryScanner, ScanCache, iter_files
 
 
 @register_cli_command(
@@ -27,6 +35,9 @@ from pawnstack.config.global_config import pawn
   pawns scan-key --file config.json --check-patterns
   pawns scan-key --url https://api.example.com --check-exposed
   pawns scan-key --directory /var/log --exclude "*.log" --format json
+  pawns scan-key --git-range origin/main..HEAD
+  pawns scan-key --git-staged
+  pawns scan-key --git-pre-receive   # pre-receive 훅에서 stdin 으로 푸시 범위를 받음
     """
 )
 class ScanKeyCLI(AsyncBaseCLI):
@@ -38,71 +49,13 @@ class ScanKeyCLI(AsyncBaseCLI):
         self.security_issues = []
         self.scanned_files = 0
         self.total_files = 0
+        self.cached_files = 0
+        self.git_scanned = False
         
-        # 민감한 키 패턴 정의
-        self.key_patterns = {
-            'aws_access_key': {
-                'pattern': r'AKIA[0-9A-Z]{16}',
-                'description': 'AWS Access Key ID',
-                'severity': 'high'
-            },
-            'aws_secret_key': {
-                'pattern': r'[A-Za-z0-9/+=]{40}',
-                'description': 'AWS Secret Access Key (추정)',
-                'severity': 'high',
-                'context_required': True
-            },
-            'github_token': {
-                'pattern': r'ghp_[A-Za-z0-9]{36}',
-                'description': 'GitHub Personal Access Token',
-                'severity': 'high'
-            },
-            'github_oauth': {
-                'pattern': r'gho_[A-Za-z0-9]{36}',
-                'description': 'GitHub OAuth Token',
-                'severity': 'high'
-            },
-            'slack_token': {
-                'pattern': r'xox[baprs]-[A-Za-z0-9-]+',
-                'description': 'Slack Token',
-                'severity': 'medium'
-            },
-            'discord_token': {
-                'pattern': r'[MN][A-Za-z\d]{23}\.[\w-]{6}\.[\w-]{27}',
-                'description': 'Discord Bot Token',
-                'severity': 'medium'
-            },
-            'jwt_token': {
-                'pattern': r'eyJ[A-Za-z0-9_-]*\.eyJ[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*',
-                'description': 'JWT Token',
-                'severity': 'medium'
-            },
-            'api_key_generic': {
-                'pattern': r'[Aa][Pp][Ii]_?[Kk][Ee][Yy].*[\'"][A-Za-z0-9]{20,}[\'"]',
-                'description': '일반 API Key',
-                'severity': 'medium'
-            },
-            'private_key': {
-                'pattern': r'-----BEGIN [A-Z ]+PRIVATE KEY-----',
-                'description': 'Private Key',
-                'severity': 'high'
-            },
-            'password_field': {
-                'pattern': r'[Pp][Aa][Ss][Ss][Ww][Oo][Rr][Dd].*[\'"][^\'"\s]{8,}[\'"]',
-                'description': '비밀번호 필드',
-                'severity': 'low'
-            },
-            'database_url': {
-                'pattern': r'[a-zA-Z][a-zA-Z0-9+.-]*://[^\s]+:[^\s]+@[^\s]+',
-                'description': '데이터베이스 연결 URL',
-                'severity': 'high'
-            },
-            'email_credentials': {
-                'pattern': r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}:[^\s]{6,}',
-                'description': '이메일 인증 정보',
-                'severity': 'medium'
-            }
-        }
+        # 민감한 키 패턴 정의 (엔진 기본 규칙의 복사본, 커스텀 패턴은 --patterns-file)
+        self.key_patterns = copy.deepcopy(DEFAULT_PATTERNS)
+        # 패턴을 한 번만 컴파일하도록 첫 스캔 때 만든 엔진을 재사용
+        self._scanner: Optional[SecretScanner] = None
         
         # 의심스러운 파일 확장자
         self.suspicious_extensions = {
@@ -146,6 +99,39 @@ class ScanKeyCLI(AsyncBaseCLI):
             help='스캔할 URL (여러 개 지정 가능)'
         )
         
+        # Git 변경분 스캔 (추가된 줄만 검사)
+        parser.add_argument(
+            '--git-range',
+            type=str,
+            action='append',
+            help='검사할 커밋 범위 (예: origin/main..HEAD, 여러 개 지정 가능)'
+        )
+        
+        parser.add_argument(
+            '--git-staged',
+            action='store_true',
+            help='스테이징된 변경 검사 (pre-commit 훅)'
+        )
+        
+        parser.add_argument(
+            '--git-history',
+            action='store_true',
+            help='모든 참조의 전체 히스토리 검사'
+        )
+        
+        parser.add_argument(
+            '--git-pre-receive',
+            action='store_true',
+            help='stdin 의 pre-receive 훅 입력 (<old> <new> <ref>) 으로 푸시된 커밋 검사'
+        )
+        
+        parser.add_argument(
+            '--git-repo',
+            type=str,
+            default='.',
+            help='Git 저장소 경로 (default: .)'
+        )
+        
         # 스캔 옵션
         parser.add_argument(
             '--recursive', '-r',
@@ -180,6 +166,18 @@ class ScanKeyCLI(AsyncBaseCLI):
             help='최대 디렉토리 깊이'
         )
         
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='디렉토리 스캔 워커 프로세스 수 (default: CPU 수, 1 이면 단일 프로세스)'
+        )
+        
+        parser.add_argument(
+            '--cache-file',
+            type=str,
+            help='증분 스캔 캐시 파일 경로 (변경되지 않은 파일은 이전 결과 재사용)'
+        )
+        
         # 검사 옵션
         parser.add_argument(
             '--check-patterns',
@@ -372,148 +370,37 @@ class ScanKeyCLI(AsyncBaseCLI):
     
     def calculate_entropy(self, text: str) -> float:
         """문자열 엔트로피 계산"""
-        if not text:
-            return 0.0
-        
-        # 문자 빈도 계산
-        char_counts = {}
-        for char in text:
-            char_counts[char] = char_counts.get(char, 0) + 1
-        
-        # 엔트로피 계산
-        entropy = 0.0
-        text_length = len(text)
-        
-        for count in char_counts.values():
-            probability = count / text_length
-            if probability > 0:
-                entropy -= probability * (probability.bit_length() - 1)
-        
-        return entropy
+        return calculate_entropy(text)
     
     def is_base64_encoded(self, text: str) -> bool:
         """Base64 인코딩 여부 확인"""
-        if len(text) < 4 or len(text) % 4 != 0:
-            return False
-        
-        try:
-            # Base64 디코딩 시도
-            decoded = base64.b64decode(text, validate=True)
-            # 디코딩된 결과가 의미있는 데이터인지 간단히 확인
-            return len(decoded) > 0 and not all(b == 0 for b in decoded)
-        except Exception:
-            return False
+        return is_base64_encoded(text)
     
     def mask_secret(self, secret: str) -> str:
         """비밀 정보 마스킹"""
-        if not self.args.hash_secrets:
-            # 간단한 마스킹
-            if len(secret) <= 8:
-                return '*' * len(secret)
-            else:
-                return secret[:4] + '*' * (len(secret) - 8) + secret[-4:]
-        else:
-            # 해시 기반 마스킹
-            hash_obj = hashlib.sha256(secret.encode('utf-8'))
-            return f"[HASH:{hash_obj.hexdigest()[:16]}]"
+        return mask_secret(secret, hash_secrets=getattr(self.args, 'hash_secrets', False))
+    
+    def get_scanner(self) -> SecretScanner:
+        """탐지 엔진 (기본 + 커스텀 패턴을 한 번만 로드/컴파일)"""
+        if self._scanner is None:
+            patterns = dict(self.key_patterns)
+            patterns.update(self.load_custom_patterns())
+            self._scanner = SecretScanner(
+                patterns,
+                check_patterns=getattr(self.args, 'check_patterns', True),
+                check_entropy=getattr(self.args, 'check_entropy', False),
+                check_base64=getattr(self.args, 'check_base64', False),
+                entropy_threshold=getattr(self.args, 'entropy_threshold', 4.5),
+                min_length=getattr(self.args, 'min_length', 20),
+                hash_secrets=getattr(self.args, 'hash_secrets', False),
+                include_content=not getattr(self.args, 'no_content', False)
+            )
+            self.log_debug(f"탐지 규칙 컴파일 완료: {len(self._scanner.rules)}개 (version {self._scanner.version})")
+        return self._scanner
     
     def scan_text_content(self, content: str, file_path: str) -> List[Dict[str, Any]]:
-        """텍스트 내용 스캔"""
-        findings = []
-        lines = content.split('\n')
-        
-        # 패턴 기반 검사
-        if self.args.check_patterns:
-            all_patterns = self.key_patterns.copy()
-            custom_patterns = self.load_custom_patterns()
-            all_patterns.update(custom_patterns)
-            
-            for pattern_name, pattern_info in all_patterns.items():
-                pattern = pattern_info['pattern']
-                
-                for line_num, line in enumerate(lines, 1):
-                    matches = re.finditer(pattern, line, re.IGNORECASE)
-                    
-                    for match in matches:
-                        matched_text = match.group(0)
-                        
-                        # 컨텍스트 검사가 필요한 경우
-                        if pattern_info.get('context_required'):
-                            # AWS Secret Key 같은 경우 주변 컨텍스트 확인
-                            context = line.lower()
-                            if not any(keyword in context for keyword in ['secret', 'key', 'password', 'token']):
-                                continue
-                        
-                        finding = {
-                            'type': 'pattern',
-                            'pattern_name': pattern_name,
-                            'description': pattern_info['description'],
-                            'severity': pattern_info['severity'],
-                            'file_path': file_path,
-                            'line_number': line_num,
-                            'column': match.start() + 1,
-                            'matched_text': self.mask_secret(matched_text) if not self.args.no_content else '[MASKED]',
-                            'line_content': line.strip() if not self.args.no_content else '[MASKED]'
-                        }
-                        
-                        findings.append(finding)
-        
-        # 엔트로피 기반 검사
-        if self.args.check_entropy:
-            for line_num, line in enumerate(lines, 1):
-                # 문자열 리터럴 추출 (따옴표로 둘러싸인 부분)
-                string_patterns = [
-                    r'"([^"]{' + str(self.args.min_length) + r',})"',
-                    r"'([^']{" + str(self.args.min_length) + r",})'"
-                ]
-                
-                for pattern in string_patterns:
-                    matches = re.finditer(pattern, line)
-                    
-                    for match in matches:
-                        text = match.group(1)
-                        entropy = self.calculate_entropy(text)
-                        
-                        if entropy >= self.args.entropy_threshold:
-                            finding = {
-                                'type': 'entropy',
-                                'description': f'높은 엔트로피 문자열 (엔트로피: {entropy:.2f})',
-                                'severity': 'medium',
-                                'file_path': file_path,
-                                'line_number': line_num,
-                                'column': match.start() + 1,
-                                'matched_text': self.mask_secret(text) if not self.args.no_content else '[MASKED]',
-                                'entropy': entropy,
-                                'line_content': line.strip() if not self.args.no_content else '[MASKED]'
-                            }
-                            
-                            findings.append(finding)
-        
-        # Base64 검사
-        if self.args.check_base64:
-            base64_pattern = r'[A-Za-z0-9+/]{' + str(self.args.min_length) + r',}={0,2}'
-            
-            for line_num, line in enumerate(lines, 1):
-                matches = re.finditer(base64_pattern, line)
-                
-                for match in matches:
-                    text = match.group(0)
-                    
-                    if self.is_base64_encoded(text):
-                        finding = {
-                            'type': 'base64',
-                            'description': 'Base64 인코딩된 데이터',
-                            'severity': 'low',
-                            'file_path': file_path,
-                            'line_number': line_num,
-                            'column': match.start() + 1,
-                            'matched_text': self.mask_secret(text) if not self.args.no_content else '[MASKED]',
-                            'line_content': line.strip() if not self.args.no_content else '[MASKED]'
-                        }
-                        
-                        findings.append(finding)
-        
-        return findings
+        """텍스트 내용 스캔 (버퍼 전체를 한 번에 검사)"""
+        return self.get_scanner().scan_text(content, file_path)
     
     async def scan_file(self, file_path: Path) -> List[Dict[str, Any]]:
         """단일 파일 스캔"""
@@ -521,16 +408,9 @@ class ScanKeyCLI(AsyncBaseCLI):
         
         try:
             # 파일 확장자 검사
-            if file_path.suffix.lower() in self.suspicious_extensions:
-                finding = {
-                    'type': 'suspicious_file',
-                    'description': f'의심스러운 파일 확장자: {file_path.suffix}',
-                    'severity': 'medium',
-                    'file_path': str(file_path),
-                    'line_number': 0,
-                    'column': 0
-                }
-                findings.append(finding)
+            suspicious = self.suspicious_file_finding(file_path)
+            if suspicious:
+                findings.append(suspicious)
             
             # 파일 내용 읽기
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
@@ -550,32 +430,91 @@ class ScanKeyCLI(AsyncBaseCLI):
         
         return findings
     
-    async def scan_directory(self, directory: Path, current_depth: int = 0) -> List[Dict[str, Any]]:
-        """디렉토리 스캔"""
+    def suspicious_file_finding(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """의심스러운 확장자 파일 항목"""
+        if file_path.suffix.lower() not in self.suspicious_extensions:
+            return None
+        return {
+            'type': 'suspicious_file',
+            'description': f'의심스러운 파일 확장자: {file_path.suffix}',
+            'severity': 'medium',
+            'file_path': str(file_path),
+            'line_number': 0,
+            'column': 0
+        }
+    
+    def scan_directory_sync(self, directory: Path) -> List[Dict[str, Any]]:
+        """디렉토리 스캔 (scandir 워커 + 프로세스 풀 + 증분 캐시)"""
         findings = []
-        
-        if hasattr(self.args, 'max_depth') and self.args.max_depth and current_depth >= self.args.max_depth:
-            return findings
-        
+        entries = list(iter_files(
+            directory,
+            recursive=getattr(self.args, 'recursive', False),
+            max_depth=getattr(self.args, 'max_depth', None),
+            exclude_dirs=self.default_exclude_dirs,
+            include=getattr(self.args, 'include', None),
+            exclude=getattr(self.args, 'exclude', None),
+            max_size=int(self.args.max_size * 1024 * 1024)
+        ))
+        
+        cache_file = getattr(self.args, 'cache_file', None)
+        cache = ScanCache(cache_file) if cache_file else None
         try:
-            for item in directory.iterdir():
-                if item.is_file():
-                    if self.should_scan_file(item):
-                        self.total_files += 1
-                        file_findings = await self.scan_file(item)
-                        findings.extend(file_findings)
-                
-                elif item.is_dir() and self.args.recursive:
-                    # 제외 디렉토리 검사
-                    if item.name not in self.default_exclude_dirs:
-                        dir_findings = await self.scan_directory(item, current_depth + 1)
-                        findings.extend(dir_findings)
-        
-        except PermissionError:
-            self.log_debug(f"디렉토리 접근 권한 없음: {directory}")
+            runner = RepositoryScanner(self.get_scanner(), workers=getattr(self.args, 'workers', None), cache=cache)
+            for result in runner.scan(entries):
+                if result.error:
+                    self.log_debug(f"파일 스캔 실패: {result.path} - {result.error}")
+                    continue
+                if result.binary:
+                    continue
+                suspicious = self.suspicious_file_finding(Path(result.path))
+                if suspicious:
+                    findings.append(suspicious)
+                findings.extend(result.findings)
+                if self.args.verbose and result.findings:
+                    self.log_info(f"스캔 완료: {result.path} ({len(result.findings)}개 발견{', 캐시' if result.cached else ''})")
+            if cache is not None:
+                cache.prune((entry.path for entry in entries), under=str(directory))
+        finally:
+            if cache is not None:
+                cache.close()
+        
+        stats = runner.stats
+        self.total_files += stats.files
+        self.scanned_files += stats.files
+        self.cached_files += stats.cached
+        self.log_debug(
+            f"디렉토리 스캔 완료: {directory} (검사 {stats.scanned}, 캐시 {stats.cached}, "
+            f"바이너리 {stats.binary}, 오류 {stats.errors}, {stats.elapsed:.2f}s)"
+        )
+        return findings
+    
+    async def scan_directory(self, directory: Path) -> List[Dict[str, Any]]:
+        """디렉토리 스캔 (이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        try:
+            return await asyncio.to_thread(self.scan_directory_sync, directory)
         except Exception as e:
             self.log_debug(f"디렉토리 스캔 실패: {directory} - {e}")
+            return []
+    
+    def scan_git_sync(self) -> List[Dict[str, Any]]:
+        """Git 변경분 스캔 (커밋 범위/스테이징/전체 히스토리/pre-receive)"""
+        git_scanner = GitDiffScanner(self.get_scanner(), repo=getattr(self.args, 'git_repo', None) or '.')
+        findings = []
         
+        if getattr(self.args, 'git_staged', False):
+            findings.extend(git_scanner.scan_staged())
+        for rev_range in getattr(self.args, 'git_range', None) or []:
+            findings.extend(git_scanner.scan_revisions(rev_range))
+        if getattr(self.args, 'git_history', False):
+            findings.extend(git_scanner.scan_history())
+        if getattr(self.args, 'git_pre_receive', False):
+            findings.extend(git_scanner.scan_pre_receive(sys.stdin))
+        
+        stats = git_scanner.stats
+        self.git_scanned = True
+        self.total_files += stats.files
+        self.scanned_files += stats.files
+        self.log_debug(f"Git 스캔 완료: 커밋 {stats.commits}, 파일 {stats.files}, 추가된 줄 {stats.added_lines}")
         return findings
     
     async def scan_url(self, url: str) -> List[Dict[str, Any]]:
@@ -643,6 +582,7 @@ class ScanKeyCLI(AsyncBaseCLI):
                 'scan_summary': {
                     'total_files': self.total_files,
                     'scanned_files': self.scanned_files,
+                    'cached_files': self.cached_files,
                     'findings_count': len(findings),
                     'scan_time': datetime.now().isoformat()
                 },
@@ -716,7 +656,7 @@ class ScanKeyCLI(AsyncBaseCLI):
             summary_text = f"""
 스캔 완료 요약:
 • 총 파일 수: {self.total_files}
-• 스캔된 파일: {self.scanned_files}
+• 스캔된 파일: {self.scanned_files} (캐시 재사용 {self.cached_files})
 • 발견된 이슈: {len(findings)}
 """
             
@@ -752,6 +692,8 @@ class ScanKeyCLI(AsyncBaseCLI):
                     severity_color = severity_colors.get(finding.get('severity', 'low'), 'white')
                     
                     file_path = finding.get('file_path', '')
+                    if finding.get('commit'):
+                        file_path = f"{finding['commit'][:8]}:{file_path}"
                     if len(file_path) > 30:
                         file_path = '...' + file_path[-27:]
                     
@@ -781,6 +723,7 @@ class ScanKeyCLI(AsyncBaseCLI):
                 'scan_summary': {
                     'total_files': self.total_files,
                     'scanned_files': self.scanned_files,
+                    'cached_files': self.cached_files,
                     'findings_count': len(findings),
                     'scan_time': datetime.now().isoformat(),
                     'scan_args': vars(self.args)
@@ -815,6 +758,9 @@ class ScanKeyCLI(AsyncBaseCLI):
                     if not hasattr(self.args, key) or getattr(self.args, key) is None:
                         setattr(self.args, key, value)
             
+            # 규칙 컴파일 (잘못된 커스텀 패턴은 파일마다 실패하지 않고 여기서 바로 오류)
+            self.get_scanner()
+            
             self.log_info("키 스캔 시작")
             
             all_findings = []
@@ -860,6 +806,12 @@ class ScanKeyCLI(AsyncBaseCLI):
                 else:
                     self.log_warning(f"디렉토리를 찾을 수 없습니다: {directory_path}")
             
+            # Git 변경분 스캔
+            if any(getattr(self.args, name, None) for name in ('git_range', 'git_staged', 'git_history', 'git_pre_receive')):
+                self.log_info(f"Git 변경분 스캔: {getattr(self.args, 'git_repo', None) or '.'}")
+                findings = await asyncio.to_thread(self.scan_git_sync)
+                all_findings.extend(findings)
+            
             # URL 스캔
             if hasattr(self.args, 'url') and self.args.url:
                 for url in self.args.url:
@@ -868,7 +820,7 @@ class ScanKeyCLI(AsyncBaseCLI):
                     all_findings.extend(findings)
             
             # 스캔 대상이 없는 경우
-            if not all_findings and self.total_files == 0:
+            if not all_findings and self.total_files == 0 and not self.git_scanned:
                 self.log_error("스캔할 대상이 지정되지 않았습니다. --path, --file, --directory, 또는 --url 옵션을 사용하세요.")
                 return 1
             
@@ -9,7 +9,6 @@ import sys
 import time
 import asyncio
 from argparse import ArgumentParser
-from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
 from rich.layout import Layout
@@ -18,6 +17,7 @@ from rich.console import Group
 from pawnstack import __version__
 from pawnstack.config.global_config import pawn
 from pawnstack.cli.base import MonitoringBaseCLI
+from pawnstack.output.dashboard import DashboardRenderer
 from pawnstack.resource import (
     get_hostname,
     get_mem_info,
@@ -94,31 +94,60 @@ class ServerCLI(MonitoringBaseCLI):
         
         self.log_info(f"Starting server monitoring (interval: {interval}s)")
         
-        with Live(self.create_layout(), refresh_per_second=1/interval, screen=True) as live:
-            start_time = time.time()
-            
-            try:
-                while True:
-                    live.update(self.create_layout())
-                    
-                    if duration and (time.time() - start_time) >= duration:
-                        break
-                    
-                    await asyncio.sleep(interval)
-                    
-            except KeyboardInterrupt:
-                self.log_info("Monitoring stopped by user")
-    
+        layout = Layout()
+        layout.split_column(
+            Layout(name="header", size=3),
+            Layout(name="main")
+        )
+
+        # 수집은 interval 주기로 따로 돌고, 렌더러는 바뀐 영역만 다시 그림
+        # (get_cpu_info 가 1초간 블로킹하므로 패널 수집은 스레드에서 수행)
+        content = await asyncio.to_thread(self.create_content)
+        tick = 0
+
+        async def collect():
+            nonlocal content, tick
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    content = await asyncio.to_thread(self.create_content)
+                except Exception as e:
+                    # 한 번의 수집 실패로 화면 갱신이 멈추지 않도록 기록만 하고 다음 주기에 재시도
+                    self.log_error(f"Failed to collect server resources: {e}")
+                    continue
+                tick += 1
+
+        renderer = DashboardRenderer(layout, max_fps=2)
+        renderer.region("header", self.create_header, key=lambda: int(time.time()))
+        renderer.region("main", lambda: content, key=lambda: tick)
+
+        collector = asyncio.create_task(collect())
+        try:
+            await renderer.run(duration=duration)
+        except KeyboardInterrupt:
+            self.log_info("Monitoring stopped by user")
+        finally:
+            collector.cancel()
+            await asyncio.gather(collector, return_exceptions=True)
+
     def create_layout(self) -> Layout:
         """레이아웃 생성"""
         layout = Layout()
-        
-        # 헤더
-        header = Panel(
+        layout.split_column(
+            Layout(self.create_header(), size=3),
+            Layout(self.create_content())
+        )
+        return layout
+
+    def create_header(self) -> Panel:
+        """헤더 패널 생성"""
+        return Panel(
             f"[bold cyan]Server Resource Monitor[/bold cyan] - {get_hostname()} - {time.strftime('%Y-%m-%d %H:%M:%S')}",
             style="blue"
         )
-        
+
+    def create_content(self) -> Group:
+        """리소스 패널 그룹 생성 (수집 포함)"""
         # 메인 컨텐츠
         content_panels = []
         
@@ -155,15 +184,7 @@ class ServerCLI(MonitoringBaseCLI):
         if show_network:
             content_panels.append(self.create_network_panel())
         
-        # 레이아웃 구성
-        main_content = Group(*content_panels)
-        
-        layout.split_column(
-            Layout(header, size=3),
-            Layout(main_content)
-        )
-        
-        return layout
+        return Group(*content_panels)
     
     def create_cpu_panel(self) -> Panel:
         """CPU 패널 생성"""
@@ -6,10 +6,12 @@ PawnStack Top 도구
 
 import os
 import sys
+import math
 import time
+import heapq
 import asyncio
 import psutil
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass
 from argparse import ArgumentParser
 from datetime import datetime
@@ -27,7 +29,12 @@ from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
 from pawnstack import __version__
 from pawnstack.cli.base import AsyncBaseCLI
 from pawnstack.config.global_config import pawn
+from pawnstack.monitoring.timeseries import TimeSeriesBuffer, resample
+from pawnstack.output.dashboard import DashboardRenderer
 from pawnstack.resource import system, network, disk
+from pawnstack.resource.process import ProcessCache
+from pawnstack.resource.sampler import get_system_sampler
+from pawnstack.resource.sockdiag import ProcessNetMonitor, ProcessNetUsage
 # shorten_text is defined locally in this file
 
 # 모듈 메타데이터
@@ -64,6 +71,9 @@ __epilog__ = (
 )
 
 
+HISTORY_COLUMNS = ("cpu", "memory", "net_in", "net_out", "disk_read", "disk_write")
+
+
 @dataclass
 class TopConfig:
     """Top 명령어 설정"""
@@ -106,6 +116,9 @@ class SystemStats:
     load_average: Tuple[float, float, float]
     process_count: int
     uptime: float
+    cpu_user: float = 0.0
+    cpu_system: float = 0.0
+    cpu_iowait: float = 0.0
 
 
 class TopCLI(AsyncBaseCLI):
@@ -114,19 +127,53 @@ class TopCLI(AsyncBaseCLI):
     def __init__(self, args=None):
         super().__init__(args)
         self.prev_stats = None
-        self.prev_net_io = None
-        self.prev_disk_io = None
+        self.current_stats: Optional[SystemStats] = None
+        self.stats_tick = 0
+        # 직전 수집 대비 초당 속도 (collect_stats 에서 갱신)
+        self.rates: Optional[Dict[str, float]] = None
         self.console = Console()
         self.config = None
         self.start_time = time.time()
-        # History tracking for graphs
-        self.cpu_history = []
-        self.mem_history = []
-        self.net_in_history = []
-        self.net_out_history = []
-        self.disk_read_history = []
-        self.disk_write_history = []
+        # History tracking for graphs (컬럼형 링 버퍼, 속도는 MB/s)
         self.max_history = 60  # Keep last 60 data points
+        self.history = TimeSeriesBuffer(HISTORY_COLUMNS, capacity=self.max_history)
+        # 틱 사이에 Process 객체를 유지해 CPU% 를 실제 증분으로 계산
+        self.process_cache = ProcessCache()
+        self._cpu_counts: Optional[Tuple[int, int]] = None
+
+    def _history_values(self, column: str) -> List[float]:
+        """히스토리 컬럼의 기록된 값 목록 (첫 틱처럼 속도가 없는 행은 제외)"""
+        return [value for value in self.history.values(column) if not math.isnan(value)]
+
+    @property
+    def cpu_history(self) -> List[float]:
+        """CPU 사용률 히스토리 (%, 읽기 전용 복사본)"""
+        return self._history_values("cpu")
+
+    @property
+    def mem_history(self) -> List[float]:
+        """메모리 사용률 히스토리 (%, 읽기 전용 복사본)"""
+        return self._history_values("memory")
+
+    @property
+    def net_in_history(self) -> List[float]:
+        """수신 속도 히스토리 (MB/s, 읽기 전용 복사본)"""
+        return self._history_values("net_in")
+
+    @property
+    def net_out_history(self) -> List[float]:
+        """송신 속도 히스토리 (MB/s, 읽기 전용 복사본)"""
+        return self._history_values("net_out")
+
+    @property
+    def disk_read_history(self) -> List[float]:
+        """디스크 읽기 속도 히스토리 (MB/s, 읽기 전용 복사본)"""
+        return self._history_values("disk_read")
+
+    @property
+    def disk_write_history(self) -> List[float]:
+        """디스크 쓰기 속도 히스토리 (MB/s, 읽기 전용 복사본)"""
+        return self._history_values("disk_write")
 
     def get_arguments(self, parser: ArgumentParser):
         """인수 정의"""
@@ -277,44 +324,39 @@ class TopCLI(AsyncBaseCLI):
 
         return f"[{color}]{value:.2f} {unit}[/{color}]"
 
-    async def collect_system_stats(self) -> SystemStats:
-        """시스템 통계 수집"""
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        cpu_freq = psutil.cpu_freq()
-        memory = psutil.virtual_memory()
-        disk_usage = psutil.disk_usage('/')
-        net_io = psutil.net_io_counters()
-        disk_io = psutil.disk_io_counters()
+    def get_cpu_counts(self) -> Tuple[int, int]:
+        """(물리 코어 수, 논리 코어 수) - 물리 코어 조회는 sysfs 를 CPU 마다 읽으므로 한 번만 계산"""
+        if self._cpu_counts is None:
+            logical = psutil.cpu_count() or 1
+            self._cpu_counts = (psutil.cpu_count(logical=False) or logical, logical)
+        return self._cpu_counts
 
-        # Load average (Unix 시스템만)
-        try:
-            load_avg = os.getloadavg()
-        except:
-            load_avg = (0, 0, 0)
-
-        # Uptime
-        boot_time = psutil.boot_time()
-        uptime = time.time() - boot_time
+    async def collect_system_stats(self) -> SystemStats:
+        """시스템 통계 수집 (직전 틱 대비 카운터 차이로 계산하므로 이벤트 루프를 막지 않음)"""
+        sample = get_system_sampler().sample()
 
         return SystemStats(
-            timestamp=time.time(),
-            cpu_percent=cpu_percent,
-            cpu_freq=cpu_freq.current if cpu_freq else 0,
-            memory_percent=memory.percent,
-            memory_used=memory.used,
-            memory_total=memory.total,
-            disk_percent=disk_usage.percent,
-            disk_used=disk_usage.used,
-            disk_total=disk_usage.total,
-            net_bytes_sent=net_io.bytes_sent,
-            net_bytes_recv=net_io.bytes_recv,
-            net_packets_sent=net_io.packets_sent,
-            net_packets_recv=net_io.packets_recv,
-            disk_read_bytes=disk_io.read_bytes if disk_io else 0,
-            disk_write_bytes=disk_io.write_bytes if disk_io else 0,
-            load_average=load_avg,
-            process_count=len(psutil.pids()),
-            uptime=uptime
+            timestamp=sample.timestamp,
+            cpu_percent=sample.cpu_percent,
+            cpu_freq=sample.cpu_freq,
+            memory_percent=sample.memory_percent,
+            memory_used=sample.memory_used,
+            memory_total=sample.memory_total,
+            disk_percent=sample.disk_percent,
+            disk_used=sample.disk_used,
+            disk_total=sample.disk_total,
+            net_bytes_sent=sample.net_bytes_sent,
+            net_bytes_recv=sample.net_bytes_recv,
+            net_packets_sent=sample.net_packets_sent,
+            net_packets_recv=sample.net_packets_recv,
+            disk_read_bytes=sample.disk_read_bytes,
+            disk_write_bytes=sample.disk_write_bytes,
+            load_average=sample.load_average or (0.0, 0.0, 0.0),
+            process_count=sample.process_count,
+            uptime=sample.uptime,
+            cpu_user=sample.cpu_user,
+            cpu_system=sample.cpu_system,
+            cpu_iowait=sample.cpu_iowait
         )
 
     def create_header_panel(self, stats: SystemStats) -> Panel:
@@ -362,7 +404,7 @@ class TopCLI(AsyncBaseCLI):
 
         # Load Average
         load_colors = []
-        cpu_count = psutil.cpu_count()
+        physical_cores, cpu_count = self.get_cpu_counts()
         for load in stats.load_average:
             load_ratio = (load / cpu_count) * 100
             load_colors.append(self.get_color_by_percent(load_ratio))
@@ -378,14 +420,14 @@ class TopCLI(AsyncBaseCLI):
         # CPU Cores
         table.add_row(
             "CPU Cores",
-            f"{psutil.cpu_count(logical=False)} physical, {psutil.cpu_count()} logical",
+            f"{physical_cores} physical, {cpu_count} logical",
             ""
         )
 
         # Add CPU history graph if requested
-        if include_history and self.cpu_history:
-            sparkline = self.create_sparkline(self.cpu_history, width=35)
-            avg_cpu = sum(self.cpu_history) / len(self.cpu_history) if self.cpu_history else 0
+        if include_history and self.history:
+            sparkline = self.create_sparkline(self.history.downsample("cpu", 35), width=35)
+            avg_cpu = self.history.mean("cpu")
             table.add_row(
                 "CPU Trend",
                 f"Avg: {avg_cpu:.1f}%",
@@ -432,9 +474,9 @@ class TopCLI(AsyncBaseCLI):
         )
 
         # Add memory history graph if requested
-        if include_history and self.mem_history:
-            sparkline = self.create_sparkline(self.mem_history, width=35)
-            avg_mem = sum(self.mem_history) / len(self.mem_history) if self.mem_history else 0
+        if include_history and self.history:
+            sparkline = self.create_sparkline(self.history.downsample("memory", 35), width=35)
+            avg_mem = self.history.mean("memory")
             table.add_row(
                 "Memory Trend",
                 f"Avg: {avg_mem:.1f}%",
@@ -470,19 +512,15 @@ class TopCLI(AsyncBaseCLI):
             ""
         )
 
-        # I/O 통계
-        if self.prev_disk_io:
-            read_speed = stats.disk_read_bytes - self.prev_disk_io[0]
-            write_speed = stats.disk_write_bytes - self.prev_disk_io[1]
-
+        # I/O 통계 (collect_stats 에서 계산한 초당 속도)
+        rates = self.rates
+        if rates:
             table.add_row(
                 "Disk I/O",
-                f"R: {self.format_bytes(read_speed, 'MB')}/s  W: {self.format_bytes(write_speed, 'MB')}/s",
+                f"R: {self.format_bytes(rates['disk_read'], 'MB')}/s  W: {self.format_bytes(rates['disk_write'], 'MB')}/s",
                 ""
             )
 
-        self.prev_disk_io = (stats.disk_read_bytes, stats.disk_write_bytes)
-
         return Panel(
             table,
             title="[bold yellow]💿 Disk Information[/bold yellow]",
@@ -495,27 +533,22 @@ class TopCLI(AsyncBaseCLI):
         table.add_column("Metric", style="white", width=15)
         table.add_column("Value", style="white")
 
-        # 네트워크 속도 계산
-        if self.prev_net_io:
-            time_delta = stats.timestamp - self.prev_stats.timestamp if self.prev_stats else 1
-            bytes_sent_speed = (stats.net_bytes_sent - self.prev_net_io[0]) / time_delta
-            bytes_recv_speed = (stats.net_bytes_recv - self.prev_net_io[1]) / time_delta
-            packets_sent_speed = (stats.net_packets_sent - self.prev_net_io[2]) / time_delta
-            packets_recv_speed = (stats.net_packets_recv - self.prev_net_io[3]) / time_delta
-
+        # 네트워크 속도 (collect_stats 에서 계산한 초당 속도)
+        rates = self.rates
+        if rates:
             table.add_row(
                 "Upload Speed",
-                self.format_network_speed(bytes_sent_speed)
+                self.format_network_speed(rates["net_sent"])
             )
 
             table.add_row(
                 "Download Speed",
-                self.format_network_speed(bytes_recv_speed)
+                self.format_network_speed(rates["net_recv"])
             )
 
             table.add_row(
                 "Packets/s",
-                f"↑ {packets_sent_speed:.0f} / ↓ {packets_recv_speed:.0f}"
+                f"↑ {rates['packets_sent']:.0f} / ↓ {rates['packets_recv']:.0f}"
             )
 
         # 총 전송량
@@ -529,38 +562,33 @@ class TopCLI(AsyncBaseCLI):
             self.format_bytes(stats.net_bytes_recv, 'GB')
         )
 
-        self.prev_net_io = (
-            stats.net_bytes_sent,
-            stats.net_bytes_recv,
-            stats.net_packets_sent,
-            stats.net_packets_recv
-        )
-
         # Add network history graphs if requested
         if include_history:
-            if self.net_in_history:
+            net_in_count = self.history.summary("net_in")["count"]
+            if net_in_count:
                 table.add_row(
                     "Download History",
                     "",
                     ""
                 )
-                sparkline = self.create_sparkline(self.net_in_history, width=40, height=1)
+                sparkline = self.create_sparkline(self.history.downsample("net_in", 40), width=40, height=1)
                 table.add_row(
                     "",
-                    f"Last {len(self.net_in_history)} samples",
+                    f"Last {net_in_count} samples",
                     sparkline
                 )
 
-            if self.net_out_history:
+            net_out_count = self.history.summary("net_out")["count"]
+            if net_out_count:
                 table.add_row(
                     "Upload History",
                     "",
                     ""
                 )
-                sparkline = self.create_sparkline(self.net_out_history, width=40, height=1)
+                sparkline = self.create_sparkline(self.history.downsample("net_out", 40), width=40, height=1)
                 table.add_row(
                     "",
-                    f"Last {len(self.net_out_history)} samples",
+                    f"Last {net_out_count} samples",
                     sparkline
                 )
 
@@ -570,6 +598,52 @@ class TopCLI(AsyncBaseCLI):
             border_style="green"
         )
 
+    def select_processes(self, top_n: int, include_username: bool = False) -> List[Dict[str, Any]]:
+        """
+        필터를 적용한 상위 N 개 프로세스 정보
+
+        cmdline/username 같은 비싼 필드는 선택된 행에 대해서만 읽습니다.
+        """
+        config = self.config
+
+        def matches(info: Dict[str, Any]) -> bool:
+            if config and config.pid_filter and info['pid'] not in config.pid_filter:
+                return False
+            if config and config.proc_filter:
+                name = info.get('name') or ''
+                if not any(f in name for f in config.proc_filter):
+                    return False
+            return True
+
+        extra_fields = []
+        if config and config.show_cmdline:
+            extra_fields.append('cmdline')
+        if include_username:
+            extra_fields.append('username')
+
+        # 정렬 기준에 따라 선택 (None 값 처리)
+        if config and config.group_by == "name":
+            return self.process_cache.top(
+                top_n, key=lambda x: x.get('name') or '', extra_fields=extra_fields,
+                predicate=matches, reverse=False
+            )
+        return self.process_cache.top(top_n, extra_fields=extra_fields, predicate=matches)
+
+    @staticmethod
+    def format_cpu_time(cpu_times) -> str:
+        """누적 CPU 시간 (user + system) 표시 문자열"""
+        if not cpu_times:
+            return "N/A"
+        total_time = cpu_times.user + cpu_times.system
+        hours = int(total_time // 3600)
+        minutes = int((total_time % 3600) // 60)
+        seconds = int(total_time % 60)
+        if hours > 0:
+            return f"{hours}h{minutes:02d}m"
+        if minutes > 0:
+            return f"{minutes}m{seconds:02d}s"
+        return f"{seconds}s"
+
     def create_process_table(self) -> Panel:
         """프로세스 테이블 생성"""
         table = Table(show_header=True, header_style="bold bright_cyan", box=box.SIMPLE)
@@ -585,35 +659,10 @@ class TopCLI(AsyncBaseCLI):
         table.add_column("CPU Time", style="cyan", width=10)  # CPU 시간
         table.add_column("Status", style="green", width=10)
 
-        # 프로세스 정보 수집 - cmdline 추가
-        processes = []
-        info_fields = ['pid', 'name', 'cpu_percent', 'memory_percent', 'status', 'memory_info', 'cpu_times']
-        if self.config and self.config.show_cmdline:
-            info_fields.append('cmdline')
-
-        for proc in psutil.process_iter(info_fields):
-            try:
-                pinfo = proc.info
-
-                # 필터 적용
-                if self.config and self.config.pid_filter:
-                    if pinfo['pid'] not in self.config.pid_filter:
-                        continue
-
-                if self.config and self.config.proc_filter:
-                    if not any(f in pinfo['name'] for f in self.config.proc_filter):
-                        continue
-
-                processes.append(pinfo)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-
-        # CPU 사용률 기준 정렬 (None 값 처리)
-        processes.sort(key=lambda x: x.get('cpu_percent') or 0, reverse=True)
-
-        # 상위 N개만 표시
         top_n = self.config.top_n if self.config else 15  # 기본값을 15로 증가
-        for proc in processes[:top_n]:
+        processes = self.select_processes(top_n)
+
+        for proc in processes:
             cpu_val = proc.get('cpu_percent') or 0
             mem_val = proc.get('memory_percent') or 0
             cpu_color = self.get_color_by_percent(cpu_val * 10)
@@ -640,21 +689,7 @@ class TopCLI(AsyncBaseCLI):
             else:
                 rss_str = "N/A"
 
-            # CPU 시간
-            cpu_times = proc.get('cpu_times')
-            if cpu_times:
-                total_time = cpu_times.user + cpu_times.system
-                hours = int(total_time // 3600)
-                minutes = int((total_time % 3600) // 60)
-                seconds = int(total_time % 60)
-                if hours > 0:
-                    cpu_time_str = f"{hours}h{minutes:02d}m"
-                elif minutes > 0:
-                    cpu_time_str = f"{minutes}m{seconds:02d}s"
-                else:
-                    cpu_time_str = f"{seconds}s"
-            else:
-                cpu_time_str = "N/A"
+            cpu_time_str = self.format_cpu_time(proc.get('cpu_times'))
 
             table.add_row(
                 str(proc.get('pid', '')),
@@ -690,8 +725,9 @@ class TopCLI(AsyncBaseCLI):
         bar = f"[{color}]{'█' * filled_width}{'░' * empty_width}[/{color}]"
         return bar
 
-    def create_sparkline(self, data: List[float], width: int = 40, height: int = 1) -> str:
-        """스파크라인 히스토그램 생성"""
+    def create_sparkline(self, data: Sequence[float], width: int = 40, height: int = 1) -> str:
+        """스파크라인 히스토그램 생성 (``TimeSeriesBuffer.downsample()`` 결과 또는 임의 시퀀스)"""
+        data = [val for val in data if val == val]  # 아직 값이 없는 구간 (NaN) 제외
         if not data:
             return "No data"
 
@@ -710,15 +746,10 @@ class TopCLI(AsyncBaseCLI):
                 for val in data
             ]
 
-        # 너비에 맞춰 데이터 샘플링
-        if len(data) > width:
-            # 다운샘플링
-            step = len(data) / width
-            sampled = []
-            for i in range(width):
-                idx = int(i * step)
-                sampled.append(normalized[idx])
-            normalized = sampled
+        # 너비에 맞춰 데이터 샘플링 (다운샘플링된 입력이면 그대로)
+        if len(normalized) > width:
+            step = len(normalized) / width
+            normalized = [normalized[int(i * step)] for i in range(width)]
 
         # 스파크라인 생성
         sparkline = ""
@@ -731,22 +762,18 @@ class TopCLI(AsyncBaseCLI):
         # 최소/최대값 표시
         return f"{sparkline} [{min_val:.1f}-{max_val:.1f}]"
 
-    def create_ascii_graph(self, data: List[float], width: int = 60, height: int = 5, label: str = "") -> str:
-        """멀티라인 ASCII 그래프 생성"""
+    def create_ascii_graph(self, data: Sequence[float], width: int = 60, height: int = 5, label: str = "") -> str:
+        """멀티라인 ASCII 그래프 생성 (``TimeSeriesBuffer.downsample()`` 결과 또는 임의 시퀀스)"""
+        data = [val for val in data if val == val]
         if not data or height < 2:
             return "No data"
 
-        # 데이터 샘플링
+        # 데이터 샘플링 (구간 평균)
         if len(data) > width:
-            step = len(data) / width
-            sampled = []
-            for i in range(width):
-                idx = int(i * step)
-                sampled.append(data[idx])
-            data = sampled
+            data = resample(data, width)
         elif len(data) < width:
             # 데이터가 너비보다 적으면 패딩
-            data = data + [data[-1] if data else 0] * (width - len(data))
+            data = data + [data[-1]] * (width - len(data))
 
         # 최소/최대값 계산
         min_val = min(data) if data else 0
@@ -796,50 +823,38 @@ class TopCLI(AsyncBaseCLI):
 
         return "\n".join(graph_lines)
 
-    def update_history(self, stats: SystemStats):
-        """히스토리 데이터 업데이트"""
-        # CPU 히스토리
-        self.cpu_history.append(stats.cpu_percent)
-        if len(self.cpu_history) > self.max_history:
-            self.cpu_history.pop(0)
-
-        # 메모리 히스토리
-        self.mem_history.append(stats.memory_percent)
-        if len(self.mem_history) > self.max_history:
-            self.mem_history.pop(0)
-
-        # 네트워크 히스토리 (속도 계산)
-        if self.prev_net_io:
-            time_delta = stats.timestamp - self.prev_stats.timestamp if self.prev_stats else 1
-            if time_delta > 0:
-                bytes_in_speed = (stats.net_bytes_recv - self.prev_net_io[1]) / time_delta / (1024 * 1024)  # MB/s
-                bytes_out_speed = (stats.net_bytes_sent - self.prev_net_io[0]) / time_delta / (1024 * 1024)  # MB/s
-
-                self.net_in_history.append(bytes_in_speed)
-                self.net_out_history.append(bytes_out_speed)
-
-                if len(self.net_in_history) > self.max_history:
-                    self.net_in_history.pop(0)
-                if len(self.net_out_history) > self.max_history:
-                    self.net_out_history.pop(0)
-
-        # 디스크 히스토리
-        if self.prev_disk_io:
-            time_delta = stats.timestamp - self.prev_stats.timestamp if self.prev_stats else 1
-            if time_delta > 0:
-                disk_read_speed = (stats.disk_read_bytes - self.prev_disk_io[0]) / time_delta / (1024 * 1024)  # MB/s
-                disk_write_speed = (stats.disk_write_bytes - self.prev_disk_io[1]) / time_delta / (1024 * 1024)  # MB/s
-
-                self.disk_read_history.append(disk_read_speed)
-                self.disk_write_history.append(disk_write_speed)
-
-                if len(self.disk_read_history) > self.max_history:
-                    self.disk_read_history.pop(0)
-                if len(self.disk_write_history) > self.max_history:
-                    self.disk_write_history.pop(0)
+    @staticmethod
+    def compute_rates(stats: SystemStats, prev: Optional[SystemStats]) -> Optional[Dict[str, float]]:
+        """직전 통계 대비 초당 속도 (bytes/s, packets/s). 직전 통계가 없으면 None"""
+        time_delta = stats.timestamp - prev.timestamp if prev else 0
+        if time_delta <= 0:
+            return None
+        return {
+            "net_sent": (stats.net_bytes_sent - prev.net_bytes_sent) / time_delta,
+            "net_recv": (stats.net_bytes_recv - prev.net_bytes_recv) / time_delta,
+            "packets_sent": (stats.net_packets_sent - prev.net_packets_sent) / time_delta,
+            "packets_recv": (stats.net_packets_recv - prev.net_packets_recv) / time_delta,
+            "disk_read": (stats.disk_read_bytes - prev.disk_read_bytes) / time_delta,
+            "disk_write": (stats.disk_write_bytes - prev.disk_write_bytes) / time_delta,
+        }
 
-    def create_resource_layout(self, stats: SystemStats, include_history: bool = False) -> Layout:
-        """리소스 모니터링 레이아웃 생성"""
+    def update_history(self, stats: SystemStats):
+        """히스토리 데이터 업데이트 (틱당 한 행, 속도는 직전 통계가 있을 때만)"""
+        history_rates = {}
+        rates = self.compute_rates(stats, self.prev_stats)
+
+        # 네트워크/디스크 속도 (MB/s) - 직전 통계 대비
+        if rates:
+            mb = 1024 * 1024
+            history_rates["net_in"] = rates["net_recv"] / mb
+            history_rates["net_out"] = rates["net_sent"] / mb
+            history_rates["disk_read"] = rates["disk_read"] / mb
+            history_rates["disk_write"] = rates["disk_write"] / mb
+
+        self.history.append(stats.timestamp, cpu=stats.cpu_percent, memory=stats.memory_percent, **history_rates)
+
+    def create_layout_skeleton(self, include_history: bool = False) -> Layout:
+        """리소스 모니터링 레이아웃 골격 (이름 있는 빈 영역)"""
         layout = Layout()
 
         # 히스토리 포함 시 레이아웃 조정
@@ -877,6 +892,12 @@ class TopCLI(AsyncBaseCLI):
             Layout(name="network")
         )
 
+        return layout
+
+    def create_resource_layout(self, stats: SystemStats, include_history: bool = False) -> Layout:
+        """리소스 모니터링 레이아웃 생성"""
+        layout = self.create_layout_skeleton(include_history)
+
         # 패널 할당 (히스토리 포함 여부에 따라)
         layout["header"].update(self.create_header_panel(stats))
         layout["body"]["left"]["cpu"].update(self.create_cpu_panel(stats, include_history=include_history))
@@ -900,9 +921,9 @@ class TopCLI(AsyncBaseCLI):
         graphs = []
 
         # CPU 히스토리 그래프
-        if self.cpu_history:
+        if self.history:
             cpu_graph = self.create_ascii_graph(
-                self.cpu_history,
+                self.history.downsample("cpu", 40),
                 width=40,
                 height=4,
                 label="CPU Usage (%)"
@@ -916,9 +937,9 @@ class TopCLI(AsyncBaseCLI):
             graphs.append(cpu_panel)
 
         # 메모리 히스토리 그래프
-        if self.mem_history:
+        if self.history:
             mem_graph = self.create_ascii_graph(
-                self.mem_history,
+                self.history.downsample("memory", 40),
                 width=40,
                 height=4,
                 label="Memory Usage (%)"
@@ -932,14 +953,10 @@ class TopCLI(AsyncBaseCLI):
             graphs.append(mem_panel)
 
         # 네트워크 히스토리 그래프 (결합)
-        if self.net_in_history or self.net_out_history:
-            net_text = ""
-            if self.net_in_history:
-                net_in_spark = self.create_sparkline(self.net_in_history, width=35)
-                net_text += f"↓ IN:  {net_in_spark}\n"
-            if self.net_out_history:
-                net_out_spark = self.create_sparkline(self.net_out_history, width=35)
-                net_text += f"↑ OUT: {net_out_spark}"
+        if self.history.summary("net_in")["count"]:
+            net_in_spark = self.create_sparkline(self.history.downsample("net_in", 35), width=35)
+            net_out_spark = self.create_sparkline(self.history.downsample("net_out", 35), width=35)
+            net_text = f"↓ IN:  {net_in_spark}\n↑ OUT: {net_out_spark}"
 
             net_panel = Panel(
                 Text.from_markup(net_text),
@@ -969,7 +986,7 @@ class TopCLI(AsyncBaseCLI):
         """라인 모드 출력 (레거시 스타일)"""
         # 시스템 정보 계산
         hostname = os.uname().nodename[:20]
-        cores = psutil.cpu_count(logical=False)
+        cores = self.get_cpu_counts()[0]
         memory_gb = stats.memory_total / (1024**3)
 
         # 헤더를 주기적으로 출력
@@ -1019,11 +1036,10 @@ class TopCLI(AsyncBaseCLI):
                 disk_rd_rate = f"{disk_rd:.2f}M"
                 disk_wr_rate = f"{disk_wr:.2f}M"
 
-        # CPU 정보
-        cpu_times = psutil.cpu_times_percent(interval=0.1)
-        usr = f"{cpu_times.user:.1f}%"
-        sys = f"{cpu_times.system:.1f}%"
-        iowait = f"{getattr(cpu_times, 'iowait', 0):.2f}"
+        # CPU 정보 (샘플러가 직전 틱 대비로 계산한 값)
+        usr = f"{stats.cpu_user:.1f}%"
+        sys = f"{stats.cpu_system:.1f}%"
+        iowait = f"{stats.cpu_iowait:.2f}"
 
         # 로드 평균
         load = f"{stats.load_average[0]:.2f}"
@@ -1032,8 +1048,8 @@ class TopCLI(AsyncBaseCLI):
         mem_pct = f"{stats.memory_percent:.1f}%"
 
         # 색상 적용
-        usr_colored = self.apply_value_color("usr", usr, cpu_times.user)
-        sys_colored = self.apply_value_color("sys", sys, cpu_times.system)
+        usr_colored = self.apply_value_color("usr", usr, stats.cpu_user)
+        sys_colored = self.apply_value_color("sys", sys, stats.cpu_system)
         mem_colored = self.apply_value_color("mem", mem_pct, stats.memory_percent)
         load_colored = self.apply_value_color("load", load, stats.load_average[0], cores)
         io_colored = self.apply_value_color("io", iowait, float(iowait))
@@ -1063,36 +1079,63 @@ class TopCLI(AsyncBaseCLI):
         self.console.print(row_text, crop=False, overflow="ignore")
         self._line_count += 1
 
+    async def collect_stats(self) -> SystemStats:
+        """통계 수집 후 히스토리 반영 (수집마다 stats_tick 증가)"""
+        stats = await self.collect_system_stats()
+        self.prev_stats, self.current_stats = self.current_stats, stats
+        # 속도는 수집 시 한 번만 계산 (패널 빌더는 상태를 바꾸지 않으므로 리사이즈로 다시 그려도 같은 값)
+        self.rates = self.compute_rates(stats, self.prev_stats)
+        self.update_history(stats)
+        self.stats_tick += 1
+        return stats
+
+    async def collect_stats_loop(self):
+        """config.interval 주기 수집 루프 (렌더링과 분리)"""
+        while True:
+            await asyncio.sleep(self.config.interval)
+            await self.collect_stats()
+
+    async def run_dashboard(self, include_history: bool = False):
+        """
+        수집과 렌더링을 분리한 대시보드
+
+        수집은 config.interval 주기로 따로 돌고, 렌더러는 새 통계가 들어온 영역만 다시 그립니다.
+        헤더 시계만 초 단위로 갱신되므로 수집 주기 사이에는 패널을 다시 만들지 않습니다.
+        """
+        await self.collect_stats()
+        collector = asyncio.create_task(self.collect_stats_loop())
+
+        tick = lambda: self.stats_tick
+        renderer = DashboardRenderer(self.create_layout_skeleton(include_history), console=self.console)
+        renderer.region(
+            "header",
+            lambda: self.create_header_panel(self.current_stats),
+            key=lambda: (self.stats_tick, int(time.time()))
+        )
+        renderer.region("cpu", lambda: self.create_cpu_panel(self.current_stats, include_history=include_history), key=tick)
+        renderer.region("memory", lambda: self.create_memory_panel(self.current_stats, include_history=include_history), key=tick)
+        renderer.region("disk", lambda: self.create_disk_panel(self.current_stats), key=tick)
+        renderer.region("network", lambda: self.create_network_panel(self.current_stats, include_history=include_history), key=tick)
+        if include_history:
+            renderer.region("graphs", self.create_history_panel, key=tick)
+        renderer.region("footer", self.create_process_table, key=tick)
+
+        try:
+            await renderer.run()
+        finally:
+            collector.cancel()
+            await asyncio.gather(collector, return_exceptions=True)
+
     async def run_monitoring_loop(self):
         """모니터링 루프 실행"""
         self.config = self.create_config()
 
-        if self.config.print_type == "live":
-            # Live 모드 - 기본 대시보드
-            with Live(refresh_per_second=1, screen=True) as live:
-                while True:
-                    try:
-                        stats = await self.collect_system_stats()
-                        self.update_history(stats)
-                        layout = self.create_resource_layout(stats, include_history=False)
-                        live.update(layout)
-                        self.prev_stats = stats
-                        await asyncio.sleep(self.config.interval)
-                    except KeyboardInterrupt:
-                        break
-        elif self.config.print_type == "layout":
-            # Layout 모드 - 히스토리 그래프 포함
-            with Live(refresh_per_second=1, screen=True) as live:
-                while True:
-                    try:
-                        stats = await self.collect_system_stats()
-                        self.update_history(stats)
-                        layout = self.create_resource_layout(stats, include_history=True)
-                        live.update(layout)
-                        self.prev_stats = stats
-                        await asyncio.sleep(self.config.interval)
-                    except KeyboardInterrupt:
-                        break
+        if self.config.print_type in ("live", "layout"):
+            # Live 모드 - 기본 대시보드, Layout 모드 - 히스토리 그래프 포함
+            try:
+                await self.run_dashboard(include_history=self.config.print_type == "layout")
+            except KeyboardInterrupt:
+                pass
         else:
             # Line 모드 - 첫 측정을 위한 초기화
             self.prev_stats = await self.collect_system_stats()
@@ -1107,92 +1150,152 @@ class TopCLI(AsyncBaseCLI):
                 except KeyboardInterrupt:
                     break
 
+    def create_process_network_table(self, usages: List[ProcessNetUsage]) -> Table:
+        """프로세스별 네트워크 처리량 테이블 (전송량 합계 기준 상위 N개)"""
+        config = self.config
+        group_by_name = config.group_by == "name"
+
+        def matches(usage: ProcessNetUsage) -> bool:
+            if config.pid_filter and not any(pid in config.pid_filter for pid in usage.pids):
+                return False
+            if config.proc_filter and not any(f in usage.name for f in config.proc_filter):
+                return False
+            return usage.total_rate >= config.min_bytes_threshold
+
+        rows = heapq.nlargest(config.top_n, filter(matches, usages), key=lambda usage: usage.total_rate)
+
+        table = Table(title="[bold green]Network Usage by Process[/bold green]",
+                      show_header=True, header_style="bold green", box=box.SIMPLE)
+        table.add_column("PIDs" if group_by_name else "PID", width=12)
+        table.add_column("Name", width=30)
+        table.add_column("Sent", justify="right", width=16)
+        table.add_column("Recv", justify="right", width=16)
+        table.add_column("Total", justify="right", width=16)
+        table.add_column("Conns", justify="right", width=6)
+
+        for usage in rows:
+            if group_by_name:
+                pid_text = str(usage.pids[0]) if len(usage.pids) == 1 else f"{usage.pids[0]} +{len(usage.pids) - 1}"
+            else:
+                pid_text = str(usage.pid)
+            table.add_row(
+                pid_text,
+                shorten_text(usage.name, 30),
+                self.format_network_speed(usage.sent_rate),
+                self.format_network_speed(usage.recv_rate),
+                self.format_network_speed(usage.total_rate),
+                str(usage.connections)
+            )
+
+        protocols = "/".join(protocol.upper() for protocol in config.protocols)
+        table.caption = f"{protocols} sockets via sock_diag (UDP: connections only)"
+        return table
+
+    def create_connection_table(self) -> Table:
+        """소켓 연결 목록 테이블 (sock_diag 를 사용할 수 없는 플랫폼용)"""
+        # 네트워크 정보 수집 (권한 에러 처리)
+        try:
+            net_connections = psutil.net_connections(kind='inet')
+        except (psutil.AccessDenied, PermissionError, OSError) as e:
+            # 권한이 없는 경우 현재 프로세스의 연결만 가져오기
+            net_connections = []
+            self.log_warning(f"⚠️ Limited network access (try with sudo for full access)")
+
+        try:
+            net_if_stats = psutil.net_if_stats()
+        except Exception:
+            net_if_stats = {}
+
+        try:
+            net_if_addrs = psutil.net_if_addrs()
+        except Exception:
+            net_if_addrs = {}
+
+        # 네트워크 테이블 생성
+        table = Table(title="[bold green]Network Connections Monitor[/bold green]",
+                    show_header=True, header_style="bold green", box=box.SIMPLE)
+        table.add_column("Protocol", width=10)
+        table.add_column("Local Address", width=25)
+        table.add_column("Remote Address", width=25)
+        table.add_column("Status", width=15)
+        table.add_column("PID", width=10)
+
+        # 네트워크 I/O 통계 추가
+        net_io = psutil.net_io_counters()
+        if net_io:
+            # 헤더에 네트워크 통계 추가
+            stats_text = f"Total: ↑ {self.format_bytes(net_io.bytes_sent, 'GB')} ↓ {self.format_bytes(net_io.bytes_recv, 'GB')}"
+            table.caption = stats_text
+
+        # 연결 정보가 없는 경우 기본 네트워크 정보 표시
+        if not net_connections:
+            # 네트워크 인터페이스 정보 표시
+            for iface, addrs in net_if_addrs.items():
+                for addr in addrs:
+                    if addr.family.name == 'AF_INET':  # IPv4만
+                        table.add_row(
+                            "Interface",
+                            f"{iface}: {addr.address}",
+                            "-",
+                            "ACTIVE" if iface in net_if_stats and net_if_stats[iface].isup else "DOWN",
+                            "-"
+                        )
+        else:
+            # 프로토콜 필터링
+            for conn in net_connections:
+                try:
+                    protocol_name = conn.type.name.lower() if hasattr(conn.type, 'name') else str(conn.type)
+                    if protocol_name not in self.config.protocols:
+                        continue
+
+                    local_addr = f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "-"
+                    remote_addr = f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "-"
+
+                    status = conn.status if hasattr(conn, 'status') else "UNKNOWN"
+                    status_color = "green" if status == "ESTABLISHED" else "yellow"
+
+                    table.add_row(
+                        protocol_name.upper(),
+                        local_addr,
+                        remote_addr,
+                        f"[{status_color}]{status}[/{status_color}]",
+                        str(conn.pid) if conn.pid else "-"
+                    )
+                except Exception:
+                    continue
+
+        return table
+
     async def run_network_monitoring(self):
         """네트워크 전용 모니터링"""
         self.config = self.create_config()
 
-        with Live(refresh_per_second=1, screen=True) as live:
-            while True:
-                try:
-                    # 네트워크 정보 수집 (권한 에러 처리)
-                    try:
-                        net_connections = psutil.net_connections(kind='inet')
-                    except (psutil.AccessDenied, PermissionError, OSError) as e:
-                        # 권한이 없는 경우 현재 프로세스의 연결만 가져오기
-                        net_connections = []
-                        self.log_warning(f"⚠️ Limited network access (try with sudo for full access)")
-
-                    try:
-                        net_if_stats = psutil.net_if_stats()
-                    except Exception:
-                        net_if_stats = {}
+        try:
+            net_monitor = ProcessNetMonitor(self.config.protocols)
+        except OSError as e:
+            net_monitor = None
+            self.log_warning(f"⚠️ Per-process network usage unavailable ({e}), showing connections only")
 
+        try:
+            with Live(refresh_per_second=1, screen=True) as live:
+                while True:
                     try:
-                        net_if_addrs = psutil.net_if_addrs()
-                    except Exception:
-                        net_if_addrs = {}
-
-                    # 네트워크 테이블 생성
-                    table = Table(title="[bold green]Network Connections Monitor[/bold green]",
-                                show_header=True, header_style="bold green", box=box.SIMPLE)
-                    table.add_column("Protocol", width=10)
-                    table.add_column("Local Address", width=25)
-                    table.add_column("Remote Address", width=25)
-                    table.add_column("Status", width=15)
-                    table.add_column("PID", width=10)
-
-                    # 네트워크 I/O 통계 추가
-                    net_io = psutil.net_io_counters()
-                    if net_io:
-                        # 헤더에 네트워크 통계 추가
-                        stats_text = f"Total: ↑ {self.format_bytes(net_io.bytes_sent, 'GB')} ↓ {self.format_bytes(net_io.bytes_recv, 'GB')}"
-                        table.caption = stats_text
-
-                    # 연결 정보가 없는 경우 기본 네트워크 정보 표시
-                    if not net_connections:
-                        # 네트워크 인터페이스 정보 표시
-                        for iface, addrs in net_if_addrs.items():
-                            for addr in addrs:
-                                if addr.family.name == 'AF_INET':  # IPv4만
-                                    table.add_row(
-                                        "Interface",
-                                        f"{iface}: {addr.address}",
-                                        "-",
-                                        "ACTIVE" if iface in net_if_stats and net_if_stats[iface].isup else "DOWN",
-                                        "-"
-                                    )
-                    else:
-                        # 프로토콜 필터링
-                        for conn in net_connections:
-                            try:
-                                protocol_name = conn.type.name.lower() if hasattr(conn.type, 'name') else str(conn.type)
-                                if protocol_name not in self.config.protocols:
-                                    continue
-
-                                local_addr = f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "-"
-                                remote_addr = f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "-"
-
-                                status = conn.status if hasattr(conn, 'status') else "UNKNOWN"
-                                status_color = "green" if status == "ESTABLISHED" else "yellow"
-
-                                table.add_row(
-                                    protocol_name.upper(),
-                                    local_addr,
-                                    remote_addr,
-                                    f"[{status_color}]{status}[/{status_color}]",
-                                    str(conn.pid) if conn.pid else "-"
-                                )
-                            except Exception:
-                                continue
+                        if net_monitor:
+                            table = self.create_process_network_table(net_monitor.sample(self.config.group_by))
+                        else:
+                            table = self.create_connection_table()
 
-                    live.update(table)
-                    await asyncio.sleep(self.config.interval)
+                        live.update(table)
+                        await asyncio.sleep(self.config.interval)
 
-                except KeyboardInterrupt:
-                    break
-                except Exception as e:
-                    self.log_error(f"Network monitoring error: {e}")
-                    await asyncio.sleep(self.config.interval)
+                    except KeyboardInterrupt:
+                        break
+                    except Exception as e:
+                        self.log_error(f"Network monitoring error: {e}")
+                        await asyncio.sleep(self.config.interval)
+        finally:
+            if net_monitor:
+                net_monitor.close()
 
     async def run_process_monitoring(self):
         """프로세스 전용 모니터링"""
@@ -1214,37 +1317,9 @@ class TopCLI(AsyncBaseCLI):
                     table.add_column("Status", style="bright_green", width=12)
                     table.add_column("User", style="white", width=15)
 
-                    processes = []
-                    # cmdline 옵션 지원을 위해 info_fields 설정
-                    info_fields = ['pid', 'name', 'cpu_percent', 'memory_percent',
-                                 'num_threads', 'status', 'username', 'memory_info', 'cpu_times']
-                    if self.config and self.config.show_cmdline:
-                        info_fields.append('cmdline')
-
-                    for proc in psutil.process_iter(info_fields):
-                        try:
-                            pinfo = proc.info
-
-                            # 필터 적용
-                            if self.config.pid_filter and pinfo['pid'] not in self.config.pid_filter:
-                                continue
-
-                            if self.config.proc_filter:
-                                if not any(f in pinfo['name'] for f in self.config.proc_filter):
-                                    continue
-
-                            processes.append(pinfo)
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            pass
-
-                    # 정렬 기준에 따라 정렬 (None 값 처리)
-                    if self.config.group_by == "name":
-                        processes.sort(key=lambda x: x.get('name', ''))
-                    else:
-                        processes.sort(key=lambda x: x.get('cpu_percent') or 0, reverse=True)
-
-                    # 상위 N개만 표시
-                    for proc in processes[:self.config.top_n]:
+                    processes = self.select_processes(self.config.top_n, include_username=True)
+
+                    for proc in processes:
                         cpu_val = proc.get('cpu_percent') or 0
                         mem_val = proc.get('memory_percent') or 0
                         cpu_color = self.get_color_by_percent(cpu_val * 10)
@@ -1268,21 +1343,7 @@ class TopCLI(AsyncBaseCLI):
                         else:
                             rss_str = "N/A"
 
-                        # CPU 시간
-                        cpu_times = proc.get('cpu_times')
-                        if cpu_times:
-                            total_time = cpu_times.user + cpu_times.system
-                            hours = int(total_time // 3600)
-                            minutes = int((total_time % 3600) // 60)
-                            seconds = int(total_time % 60)
-                            if hours > 0:
-                                cpu_time_str = f"{hours}h{minutes:02d}m"
-                            elif minutes > 0:
-                                cpu_time_str = f"{minutes}m{seconds:02d}s"
-                            else:
-                                cpu_time_str = f"{seconds}s"
-                        else:
-                            cpu_time_str = "N/A"
+                        cpu_time_str = self.format_cpu_time(proc.get('cpu_times'))
 
                         table.add_row(
                             str(proc.get('pid', '')),
@@ -1293,7 +1354,7 @@ class TopCLI(AsyncBaseCLI):
                             cpu_time_str,
                             str(proc.get('num_threads', '')),
                             proc.get('status', ''),
-                            proc.get('username', '')[:15]
+                            (proc.get('username') or '')[:15]
                         )
 
                     live.update(table)
@@ -0,0 +1,24 @@
+"""
+PawnStack 클라우드 모듈
+
+S3 전송 관리자 (공유 클라이언트, 병렬 multipart, 대역폭 제한), 체크섬 매니페스트 기반 동기화,
+병렬 스트리밍 목록/배치 삭제, Route53 병렬 백업/차분 복원, 캐시되는 EC2 인스턴스 메타데이터 수집기
+"""
+
+from .metadata import DEFAULT_CACHE_PATH, SUMMARY_PATHS, InstanceMetadata, MetadataCache
+from .route53 import (
+    Backoff, ZoneBackup, apply_changes, backup_zones, batch_changes, diff_record_sets, find_hosted_zone,
+    list_hosted_zones, list_record_sets, normalize_name, rebase_records, record_key,
+)
+from .s3_listing import ListingStats, PathMatcher, batched, delete_keys, iter_object_pages, iter_objects
+from .s3_sync import DEFAULT_MANIFEST_PATH, RemoteObject, SyncManifest, SyncStats, compute_etags, diff_objects, etag_scheme, s3_etag
+from .s3_transfer import RateLimiter, S3TransferManager, TransferConfig, TransferJob, TransferResult, parse_size
+
+__all__ = [
+    'RateLimiter', 'S3TransferManager', 'TransferConfig', 'TransferJob', 'TransferResult', 'parse_size',
+    'ListingStats', 'PathMatcher', 'batched', 'delete_keys', 'iter_object_pages', 'iter_objects',
+    'DEFAULT_MANIFEST_PATH', 'RemoteObject', 'SyncManifest', 'SyncStats', 'compute_etags', 'diff_objects', 'etag_scheme', 's3_etag',
+    'Backoff', 'ZoneBackup', 'apply_changes', 'backup_zones', 'batch_changes', 'diff_record_sets', 'find_hosted_zone',
+    'list_hosted_zones', 'list_record_sets', 'normalize_name', 'rebase_records', 'record_key',
+    'DEFAULT_CACHE_PATH', 'SUMMARY_PATHS', 'InstanceMetadata', 'MetadataCache',
+]
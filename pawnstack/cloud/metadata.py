@@ -0,0 +1,375 @@
+"""
+EC2 인스턴스 메타데이터 (IMDS) 수집기
+
+경로를 하나씩 IMDSv1 으로 조회하고 매번 처음부터 다시 묻는 대신
+
+    - IMDSv2 세션 토큰을 한 번 받아 만료 전까지 재사용하고 (401 이면 새로 받아 한 번 재시도,
+      토큰 발급이 막혔거나 응답이 오지 않는 환경 (hop limit 1 인 컨테이너 등) 에서는 IMDSv1 으로 전환)
+    - 여러 경로를 ``concurrency`` 개까지 동시에 조회하며 (keep-alive ``HttpClient`` 공유)
+    - 전체 트리는 디렉토리 목록을 받는 대로 하위 경로를 동시에 내려가며 수집하고
+    - 결과를 TTL 이 있는 디스크 캐시에 저장해 같은 부팅 안의 반복 호출은 요청 없이 돌려줍니다.
+
+자격 증명 문서 (``iam/security-credentials/<role>`` 등) 의 ``SecretAccessKey``/``Token`` 은
+결과와 캐시에 남기지 않습니다.
+
+Example:
+    async with InstanceMetadata(cache_path=DEFAULT_CACHE_PATH, cache_ttl=300) as imds:
+        summary = await imds.collect(SUMMARY_PATHS)
+        tree = await imds.crawl()
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import httpx
+
+from pawnstack.http.client import HttpClient
+
+__all__ = [
+    "DEFAULT_CACHE_PATH",
+    "SUMMARY_PATHS",
+    "InstanceMetadata",
+    "MetadataCache",
+]
+
+DEFAULT_CACHE_PATH = "~/.cache/pawnstack/imds.json"
+
+# pawns aws metadata 기본 항목
+SUMMARY_PATHS = (
+    "instance-id",
+    "instance-type",
+    "local-hostname",
+    "local-ipv4",
+    "public-hostname",
+    "public-ipv4",
+    "ami-id",
+    "security-groups",
+    "placement/availability-zone",
+    "placement/region",
+)
+
+# 결과/캐시에 남기지 않는 자격 증명 필드
+_SECRET_FIELDS = frozenset({"SecretAccessKey", "Token"})
+
+_TOKEN_HEADER = "X-aws-ec2-metadata-token"
+_TOKEN_TTL_HEADER = "X-aws-ec2-metadata-token-ttl-seconds"
+# 만료 직전 토큰으로 요청하지 않도록 남기는 여유 (초)
+_TOKEN_MARGIN = 60
+
+
+def _boot_id() -> str:
+    # 재부팅 (또는 캐시가 든 이미지로 만든 다른 인스턴스) 이면 캐시를 쓰지 않기 위한 식별자
+    try:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _redact(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _redact(v) for k, v in value.items() if k not in _SECRET_FIELDS}
+    return value
+
+
+def _parse_value(text: str) -> Any:
+    # iam/info, 자격 증명 문서 등 JSON 값은 파싱
+    if text.startswith("{"):
+        try:
+            return _redact(json.loads(text))
+        except ValueError:
+            pass
+    return text
+
+
+def _set_nested(data: Dict[str, Any], path: str, value: Any):
+    keys = path.strip("/").split("/")
+    current = data
+    for key in keys[:-1]:
+        current = current.setdefault(key, {})
+    current[keys[-1]] = value
+
+
+class MetadataCache:
+    """
+    TTL 이 있는 메타데이터 디스크 캐시 (JSON 파일 하나)
+
+    항목마다 저장 시각과 부팅 ID 를 기록하며, 다른 사용자가 읽지 못하도록 0600 으로 저장합니다.
+
+    Args:
+        path: 캐시 파일 경로
+        ttl: 유효 시간 (초, 0 이면 캐시하지 않음)
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_PATH, ttl: float = 300):
+        self.path = Path(path).expanduser()
+        self.ttl = ttl
+        self._boot_id = _boot_id()
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, key: str) -> Optional[Any]:
+        if self.ttl <= 0:
+            return None
+        entry = self._load().get(key)
+        if not isinstance(entry, dict) or entry.get("boot_id") != self._boot_id:
+            return None
+        if time.time() - entry.get("time", 0) > self.ttl:
+            return None
+        return entry.get("data")
+
+    def set(self, key: str, data: Any):
+        if self.ttl <= 0:
+            return
+        entries = self._load()
+        now = time.time()
+        # 만료된 항목은 함께 정리
+        entries = {k: v for k, v in entries.items() if isinstance(v, dict) and now - v.get("time", 0) <= self.ttl}
+        entries[key] = {"time": now, "boot_id": self._boot_id, "data": data}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(self.path.parent), prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+class InstanceMetadata:
+    """
+    IMDS 클라이언트
+
+    Args:
+        host: 메타데이터 서비스 주소 (``host`` 또는 ``host:port``)
+        timeout: 요청별 타임아웃 (초)
+        concurrency: 동시에 보내는 요청 수
+        token_ttl: 요청할 IMDSv2 토큰 유효 시간 (초, 최대 21600)
+        cache_path: 디스크 캐시 경로 (None 이면 캐시하지 않음)
+        cache_ttl: 디스크 캐시 유효 시간 (초)
+        refresh: 캐시를 읽지 않고 새로 조회한 결과로 갱신
+        client: 공유할 ``HttpClient`` (없으면 만들고 ``aclose()`` 에서 닫음)
+    """
+
+    def __init__(
+        self,
+        host: str = "169.254.169.254",
+        timeout: float = 2.0,
+        concurrency: int = 16,
+        token_ttl: int = 21600,
+        cache_path: Optional[Union[str, Path]] = None,
+        cache_ttl: float = 300,
+        refresh: bool = False,
+        client: Optional[HttpClient] = None
+    ):
+        if not 1 <= token_ttl <= 21600:
+            raise ValueError("token_ttl must be between 1 and 21600 seconds")
+        self.base_url = f"http://{host}/latest/"
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.token_ttl = token_ttl
+        self._token_margin = min(_TOKEN_MARGIN, token_ttl / 10)
+        self.cache = MetadataCache(cache_path, cache_ttl) if cache_path else None
+        self.refresh = refresh
+        self._client = client
+        self._owns_client = client is None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._token: Optional[str] = None
+        self._token_expires = 0.0
+        self._imdsv1 = False
+        self._unreachable: Optional[BaseException] = None
+        self.stats = {"requests": 0, "tokens": 0, "cache_hits": 0}
+
+    @property
+    def client(self) -> HttpClient:
+        if self._client is None:
+            self._client = HttpClient(timeout=self.timeout)
+        return self._client
+
+    async def aclose(self):
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "InstanceMetadata":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    # 토큰
+
+    async def _token_headers(self, rejected: Optional[str] = None) -> Dict[str, str]:
+        # rejected: 401 을 받은 토큰 (다른 코루틴이 이미 새로 받았으면 다시 받지 않음)
+        if self._imdsv1:
+            return {}
+        if self._unreachable is not None:
+            raise self._unreachable
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        async with self._token_lock:
+            if self._unreachable is not None:
+                raise self._unreachable
+            expired = time.monotonic() >= self._token_expires - self._token_margin
+            if self._token is None or expired or (rejected is not None and rejected == self._token):
+                await self._fetch_token()
+        return {_TOKEN_HEADER: self._token} if self._token else {}
+
+    async def _fetch_token(self):
+        self.stats["requests"] += 1
+        try:
+            response = await self.client.put(
+                self.base_url + "api/token", headers={_TOKEN_TTL_HEADER: str(self.token_ttl)}, timeout=self.timeout
+            )
+        except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+            # EC2 가 아니면 대기 중인 나머지 요청도 타임아웃을 기다리지 않고 바로 실패
+            self._unreachable = e
+            raise
+        except httpx.TimeoutException:
+            # 연결은 되지만 PUT 응답이 오지 않음: hop limit 1 인 컨테이너에서는 토큰 응답만 버려짐
+            self._imdsv1, self._token = True, None
+            return
+        if response.status_code in (403, 404, 405):
+            # IMDSv2 를 지원하지 않거나 토큰 발급이 막힌 환경
+            self._imdsv1, self._token = True, None
+            return
+        if not response.is_success():
+            raise ValueError(f"IMDS token request failed: HTTP {response.status_code}")
+        self.stats["tokens"] += 1
+        self._token = response.text.strip()
+        self._token_expires = time.monotonic() + self.token_ttl
+
+    # 조회
+
+    async def get(self, path: str) -> Optional[str]:
+        """``meta-data/`` 아래 경로 하나 (없으면 None)"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            headers = await self._token_headers()
+            response = await self._request(path, headers)
+            if response.status_code == 401 and not self._imdsv1:
+                headers = await self._token_headers(rejected=headers.get(_TOKEN_HEADER))
+                response = await self._request(path, headers)
+        if response.status_code == 404:
+            return None
+        if not response.is_success():
+            raise ValueError(f"IMDS request failed: {path} HTTP {response.status_code}")
+        return response.text
+
+    async def _request(self, path: str, headers: Dict[str, str]):
+        self.stats["requests"] += 1
+        return await self.client.get(self.base_url + "meta-data/" + path, headers=headers, timeout=self.timeout)
+
+    async def fetch(self, paths: Iterable[str]) -> Dict[str, Optional[str]]:
+        """여러 경로를 동시에 조회 (경로 -> 값, 없거나 실패한 경로는 None)"""
+        async def fetch_one(path: str) -> Tuple[str, Optional[str]]:
+            try:
+                return path, await self.get(path)
+            except (httpx.HTTPError, ValueError):
+                return path, None
+
+        return dict(await asyncio.gather(*(fetch_one(path) for path in paths)))
+
+    async def _cached(self, key: str, produce):
+        if self.cache is not None and not self.refresh:
+            data = self.cache.get(key)
+            if data is not None:
+                self.stats["cache_hits"] += 1
+                return data
+        data = await produce()
+        if self.cache is not None and data:
+            self.cache.set(key, data)
+        return data
+
+    async def collect(self, paths: Iterable[str] = SUMMARY_PATHS, iam: bool = True) -> Dict[str, Any]:
+        """
+        지정한 경로를 동시에 조회해 중첩 딕셔너리로 반환 (``placement/region`` -> ``{"placement": {"region": ..}}``)
+
+        ``iam`` 이면 인스턴스 프로파일 역할과 자격 증명 요약 (키 ID, 만료, 유형) 을 ``iam`` 에 넣습니다.
+        """
+        paths = list(paths)
+
+        async def produce() -> Dict[str, Any]:
+            wanted = paths + (["iam/security-credentials/"] if iam else [])
+            values = await self.fetch(wanted)
+            metadata: Dict[str, Any] = {}
+            for path in paths:
+                if values.get(path) is not None:
+                    _set_nested(metadata, path, _parse_value(values[path]))
+            role_name = (values.get("iam/security-credentials/") or "").strip().split("\n")[0]
+            if role_name:
+                document = (await self.fetch([f"iam/security-credentials/{role_name}"])).popitem()[1]
+                role = _parse_value(document) if document else {}
+                role = role if isinstance(role, dict) else {}
+                metadata["iam"] = {
+                    "role_name": role_name,
+                    "credentials": {
+                        "access_key_id": role.get("AccessKeyId", ""),
+                        "expiration": role.get("Expiration", ""),
+                        "type": role.get("Type", ""),
+                    },
+                }
+            return metadata
+
+        return await self._cached(f"{self.base_url}collect:{','.join(paths)}:{iam}", produce)
+
+    async def crawl(self, root: str = "") -> Dict[str, Any]:
+        """
+        ``root`` 아래 전체 트리를 동시에 수집
+
+        디렉토리 목록 (``/`` 로 끝나는 항목) 을 받는 대로 하위 경로를 동시에 내려갑니다.
+        ``public-keys/`` 처럼 ``0=<이름>`` 형식인 항목은 ``0/`` 디렉토리로 따라갑니다.
+        """
+        async def walk(path: str) -> Any:
+            listing = await self.get(path)
+            if listing is None:
+                return None
+            children: List[Tuple[str, str]] = []
+            for line in listing.splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                if "=" in line and path.endswith("public-keys/"):
+                    index, _ = line.split("=", 1)
+                    children.append((index, path + index + "/"))
+                else:
+                    children.append((line.rstrip("/"), path + line))
+
+            async def visit(name: str, child_path: str):
+                try:
+                    if child_path.endswith("/"):
+                        return name, await walk(child_path)
+                    value = await self.get(child_path)
+                except (httpx.HTTPError, ValueError):
+                    # 하위 항목 하나의 실패는 None 으로 남기고 계속 수집
+                    return name, None
+                return name, _parse_value(value) if value is not None else None
+
+            return dict(await asyncio.gather(*(visit(name, child_path) for name, child_path in children)))
+
+        root = root if not root or root.endswith("/") else root + "/"
+
+        async def produce() -> Dict[str, Any]:
+            tree = await walk(root)
+            return tree or {}
+
+        return await self._cached(f"{self.base_url}crawl:{root}", produce)
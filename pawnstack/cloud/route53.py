@@ -0,0 +1,377 @@
+"""
+Route53 백업/복원
+
+``list_hosted_zones`` / ``list_resource_record_sets`` 를 한 번만 호출하고 영역을 하나씩 처리하는 대신
+
+    - 두 API 를 끝까지 페이지 단위로 나열하고 (레코드는 요청당 최대 300 개)
+    - 여러 영역의 레코드를 ``concurrency`` 개까지 동시에 조회하며
+    - 스로틀링 오류 (``Throttling``, ``PriorRequestNotComplete`` 등) 는 full jitter 지수 백오프로 재시도하고
+    - 복원 시 현재 영역의 레코드와 비교해 바뀐 레코드만 ``ChangeResourceRecordSets`` 요청 한도
+      (ResourceRecord 1000 개, Value 32000 자, UPSERT 는 두 배로 계산) 를 꽉 채운 배치로 보냅니다.
+
+한 영역에 대한 변경 요청은 동시에 보내면 ``PriorRequestNotComplete`` 가 나므로 배치는 순서대로 보냅니다.
+
+Example:
+    backoff = Backoff()
+    zones = await list_hosted_zones(route53, backoff)
+    async for result in backup_zones(route53, zones, concurrency=8, backoff=backoff):
+        print(result.zone["Name"], len(result.records), result.error)
+
+    changes = diff_record_sets(live, desired, "example.com.")
+    async for batch, error in apply_changes(route53, zone_id, changes, backoff=backoff):
+        print(len(batch), error)
+"""
+
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from pawnstack.utils.aio import windowed
+
+__all__ = [
+    "MAX_BATCH_CHARS",
+    "MAX_BATCH_RECORDS",
+    "Backoff",
+    "ZoneBackup",
+    "apply_changes",
+    "backup_zones",
+    "batch_changes",
+    "diff_record_sets",
+    "find_hosted_zone",
+    "list_hosted_zones",
+    "list_record_sets",
+    "normalize_name",
+    "rebase_records",
+    "record_key",
+]
+
+# ChangeResourceRecordSets 한 요청의 한도
+MAX_BATCH_RECORDS = 1000
+MAX_BATCH_CHARS = 32000
+
+# 재시도할 스로틀링 오류 코드
+THROTTLE_CODES = frozenset({
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestLimitExceeded",
+    "TooManyRequestsException",
+    "PriorRequestNotComplete",
+})
+
+Change = Dict[str, Any]
+
+
+def _error_code(error: BaseException) -> Optional[str]:
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        return response.get("Error", {}).get("Code")
+    return None
+
+
+def _error_text(error: BaseException) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+@dataclass
+class Backoff:
+    """
+    스로틀링 오류를 full jitter 지수 백오프로 재시도하는 호출기
+
+    botocore 의 재시도 (``retries``) 가 모두 실패한 뒤에도 ``retries`` 번 더 기다렸다가 다시 호출합니다.
+    여러 코루틴이 공유하면 ``throttled`` 에 전체 재시도 횟수가 쌓입니다.
+    """
+    retries: int = 8
+    base_delay: float = 0.2
+    max_delay: float = 20.0
+    throttled: int = field(default=0, init=False)
+
+    async def call(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        attempt = 0
+        while True:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if _error_code(e) not in THROTTLE_CODES or attempt >= self.retries:
+                    raise
+            self.throttled += 1
+            await asyncio.sleep(random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt)))
+            attempt += 1
+
+
+@dataclass
+class ZoneBackup:
+    """영역 하나의 백업 결과"""
+    zone: Dict[str, Any]
+    records: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def list_hosted_zones(client, backoff: Optional[Backoff] = None) -> List[Dict[str, Any]]:
+    """모든 호스팅 영역 (``Marker`` 로 끝까지 나열)"""
+    backoff = backoff or Backoff()
+    zones: List[Dict[str, Any]] = []
+    kwargs: Dict[str, Any] = {}
+    while True:
+        response = await backoff.call(client.list_hosted_zones, **kwargs)
+        zones.extend(response.get("HostedZones", []))
+        if not response.get("IsTruncated"):
+            return zones
+        kwargs = {"Marker": response["NextMarker"]}
+
+
+async def list_record_sets(
+    client,
+    zone_id: str,
+    backoff: Optional[Backoff] = None,
+    page_size: int = 300
+) -> List[Dict[str, Any]]:
+    """영역의 모든 레코드 세트 (``NextRecordName``/``Type``/``Identifier`` 로 끝까지 나열)"""
+    backoff = backoff or Backoff()
+    records: List[Dict[str, Any]] = []
+    kwargs: Dict[str, Any] = {"HostedZoneId": zone_id, "MaxItems": str(page_size)}
+    while True:
+        response = await backoff.call(client.list_resource_record_sets, **kwargs)
+        records.extend(response.get("ResourceRecordSets", []))
+        if not response.get("IsTruncated"):
+            return records
+        kwargs = {"HostedZoneId": zone_id, "MaxItems": str(page_size), "StartRecordName": response["NextRecordName"]}
+        if response.get("NextRecordType"):
+            kwargs["StartRecordType"] = response["NextRecordType"]
+        if response.get("NextRecordIdentifier"):
+            kwargs["StartRecordIdentifier"] = response["NextRecordIdentifier"]
+
+
+async def find_hosted_zone(
+    client,
+    name: str,
+    private: Optional[bool] = None,
+    backoff: Optional[Backoff] = None
+) -> List[Dict[str, Any]]:
+    """이름이 ``name`` 인 호스팅 영역 (``private`` 가 주어지면 공개/비공개도 일치)"""
+    backoff = backoff or Backoff()
+    name = normalize_name(name)
+    matches: List[Dict[str, Any]] = []
+    kwargs: Dict[str, Any] = {"DNSName": name}
+    while True:
+        response = await backoff.call(client.list_hosted_zones_by_name, **kwargs)
+        for zone in response.get("HostedZones", []):
+            # 이름 순으로 정렬되어 오므로 다른 이름이 나오면 끝
+            if normalize_name(zone["Name"]) != name:
+                return matches
+            if private is None or zone.get("Config", {}).get("PrivateZone", False) == private:
+                matches.append(zone)
+        if not response.get("IsTruncated"):
+            return matches
+        kwargs = {"DNSName": response["NextDNSName"], "HostedZoneId": response["NextHostedZoneId"]}
+
+
+async def backup_zones(
+    client,
+    zones: Iterable[Dict[str, Any]],
+    concurrency: int = 8,
+    backoff: Optional[Backoff] = None
+) -> AsyncIterator[ZoneBackup]:
+    """
+    영역별 레코드를 ``concurrency`` 개 영역까지 동시에 조회해 끝나는 순서대로 생성
+
+    한 영역의 실패는 ``ZoneBackup.error`` 로 돌려주고 나머지 영역은 계속 조회합니다.
+    """
+    backoff = backoff or Backoff()
+
+    async def fetch(zone: Dict[str, Any]) -> ZoneBackup:
+        try:
+            records = await list_record_sets(client, zone["Id"], backoff)
+        except Exception as e:
+            return ZoneBackup(zone, error=_error_text(e))
+        return ZoneBackup(zone, records)
+
+    async for result in windowed(zones, fetch, concurrency):
+        yield result
+
+
+# 레코드 비교
+
+def normalize_name(name: str) -> str:
+    """소문자 + 끝에 ``.``"""
+    name = name.lower()
+    return name if name.endswith(".") else name + "."
+
+
+def _zone_id(zone_id: str) -> str:
+    # ``/hostedzone/Z123`` 과 ``Z123`` 은 같은 영역
+    return zone_id.rsplit("/", 1)[-1]
+
+
+def record_key(record: Dict[str, Any]) -> Tuple[str, str, str]:
+    """레코드 세트 식별자 (이름, 타입, SetIdentifier)"""
+    return normalize_name(record["Name"]), record["Type"], record.get("SetIdentifier", "")
+
+
+def _is_zone_managed(record: Dict[str, Any], zone_name: str) -> bool:
+    # 영역 apex 의 SOA/NS 는 Route53 이 만들고 관리함
+    return record["Type"] in ("SOA", "NS") and normalize_name(record["Name"]) == zone_name
+
+
+def _comparable(record: Dict[str, Any]) -> Dict[str, Any]:
+    # 이름의 대소문자/끝 ``.`` 과 값 순서는 의미가 없으므로 맞춰서 비교
+    record = dict(record, Name=normalize_name(record["Name"]))
+    if "ResourceRecords" in record:
+        record["ResourceRecords"] = sorted(item["Value"] for item in record["ResourceRecords"])
+    if "AliasTarget" in record:
+        alias = record["AliasTarget"]
+        record["AliasTarget"] = dict(
+            alias, DNSName=normalize_name(alias["DNSName"]), HostedZoneId=_zone_id(alias["HostedZoneId"])
+        )
+    return record
+
+
+def _rebase(name: str, old: str, new: str) -> str:
+    normalized = normalize_name(name)
+    if normalized == old:
+        return new
+    if normalized.endswith("." + old):
+        return normalized[:-len(old)] + new
+    return name
+
+
+def rebase_records(
+    records: Iterable[Dict[str, Any]],
+    old_zone: str,
+    new_zone: str,
+    old_zone_id: Optional[str] = None,
+    new_zone_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    ``old_zone`` 아래 레코드 이름과 영역 내부를 가리키는 alias 를 ``new_zone`` 아래로 옮김
+
+    두 영역 ID 를 주면 원래 영역을 가리키던 alias 의 ``HostedZoneId`` 도 새 영역 ID 로 바꿉니다
+    (새 영역이 아직 없으면 ``new_zone_id`` 없이 호출하고, 만든 뒤 다시 계산).
+    """
+    old, new = normalize_name(old_zone), normalize_name(new_zone)
+    rezone = old_zone_id is not None and new_zone_id is not None and _zone_id(old_zone_id) != _zone_id(new_zone_id)
+    if old == new and not rezone:
+        return list(records)
+    rebased = []
+    for record in records:
+        record = dict(record, Name=_rebase(record["Name"], old, new))
+        if "AliasTarget" in record:
+            alias = dict(record["AliasTarget"], DNSName=_rebase(record["AliasTarget"]["DNSName"], old, new))
+            if rezone and _zone_id(alias["HostedZoneId"]) == _zone_id(old_zone_id):
+                alias["HostedZoneId"] = _zone_id(new_zone_id)
+            record["AliasTarget"] = alias
+        rebased.append(record)
+    return rebased
+
+
+def diff_record_sets(
+    live: Iterable[Dict[str, Any]],
+    desired: Iterable[Dict[str, Any]],
+    zone_name: str,
+    delete: bool = False
+) -> List[Change]:
+    """
+    현재 영역 (``live``) 을 ``desired`` 로 만드는 변경 목록
+
+    apex SOA/NS 는 건드리지 않습니다. 없는 레코드는 ``CREATE``, 내용이 다르면 ``UPSERT``,
+    ``delete`` 이면 ``desired`` 에 없는 레코드를 ``DELETE`` 합니다 (현재 값 그대로 보내야 함).
+    삭제가 먼저, alias 레코드는 대상 레코드가 만들어진 뒤에 오도록 정렬합니다.
+    """
+    zone_name = normalize_name(zone_name)
+    current = {record_key(r): r for r in live if not _is_zone_managed(r, zone_name)}
+    wanted = {record_key(r): r for r in desired if not _is_zone_managed(r, zone_name)}
+
+    deletes: List[Change] = []
+    if delete:
+        deletes = [{"Action": "DELETE", "ResourceRecordSet": record}
+                   for key, record in current.items() if key not in wanted]
+    records: List[Change] = []
+    aliases: List[Change] = []
+    for key, record in wanted.items():
+        existing = current.get(key)
+        if existing is None:
+            action = "CREATE"
+        elif _comparable(existing) != _comparable(record):
+            action = "UPSERT"
+        else:
+            continue
+        (aliases if "AliasTarget" in record else records).append({"Action": action, "ResourceRecordSet": record})
+    return deletes + records + aliases
+
+
+def _change_size(change: Change) -> Tuple[int, int]:
+    record = change["ResourceRecordSet"]
+    values = record.get("ResourceRecords", [])
+    weight = 2 if change["Action"] == "UPSERT" else 1
+    return weight * max(1, len(values)), weight * sum(len(item["Value"]) for item in values)
+
+
+def batch_changes(
+    changes: Iterable[Change],
+    max_records: int = MAX_BATCH_RECORDS,
+    max_chars: int = MAX_BATCH_CHARS
+) -> List[List[Change]]:
+    """
+    순서를 유지하며 ``ChangeResourceRecordSets`` 한도를 넘지 않는 가장 큰 배치로 묶음
+
+    한 변경이 한도를 넘으면 단독 배치가 됩니다 (API 가 거부하면 해당 배치 오류로 보고).
+    """
+    batches: List[List[Change]] = []
+    batch: List[Change] = []
+    used_records = used_chars = 0
+    for change in changes:
+        records, chars = _change_size(change)
+        if batch and (used_records + records > max_records or used_chars + chars > max_chars):
+            batches.append(batch)
+            batch, used_records, used_chars = [], 0, 0
+        batch.append(change)
+        used_records += records
+        used_chars += chars
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+async def apply_changes(
+    client,
+    zone_id: str,
+    changes: Iterable[Change],
+    comment: Optional[str] = None,
+    backoff: Optional[Backoff] = None,
+    max_records: int = MAX_BATCH_RECORDS,
+    max_chars: int = MAX_BATCH_CHARS
+) -> AsyncIterator[Tuple[List[Change], Optional[str]]]:
+    """
+    변경을 배치로 묶어 순서대로 적용하고 배치별 (변경 목록, 오류) 생성
+
+    배치는 원자적으로 적용되므로 ``InvalidChangeBatch`` 로 거부되면 반으로 나눠 다시 보내
+    문제가 있는 변경만 실패로 남깁니다.
+    """
+    backoff = backoff or Backoff()
+
+    async def submit(batch: List[Change]):
+        change_batch: Dict[str, Any] = {"Changes": batch}
+        if comment:
+            change_batch["Comment"] = comment
+        try:
+            await backoff.call(client.change_resource_record_sets, HostedZoneId=zone_id, ChangeBatch=change_batch)
+        except Exception as e:
+            if _error_code(e) == "InvalidChangeBatch" and len(batch) > 1:
+                middle = len(batch) // 2
+                async for result in submit(batch[:middle]):
+                    yield result
+                async for result in submit(batch[middle:]):
+                    yield result
+                return
+            yield batch, _error_text(e)
+            return
+        yield batch, None
+
+    for batch in batch_changes(changes, max_records, max_chars):
+        async for result in submit(batch):
+            yield result
@@ -0,0 +1,250 @@
+"""
+S3 스트리밍 목록 파이프라인
+
+prefix 의 모든 키를 리스트/딕셔너리에 모은 뒤 처리하는 대신
+
+    - ``Delimiter="/"`` 로 하위 prefix 를 찾아 각 하위 prefix 를 ``concurrency`` 개까지 동시에 나열하고
+      (하위 prefix 가 ``max_shards`` 를 넘으면 나누지 않고 한 번에 나열)
+    - 응답 페이지를 도착하는 대로 (순서 무관) 크기가 제한된 큐로 내보내며
+    - include/exclude 패턴은 정규식 하나로 미리 컴파일하고
+    - 삭제는 1000 개 단위 ``DeleteObjects`` 배치를 여러 개 동시에 보냅니다.
+
+소비자가 느리면 큐가 차서 나열도 멈추므로 키가 수천만 개여도 메모리는 페이지 몇 개 분량입니다.
+
+Example:
+    matcher = PathMatcher(include=["*.log"], exclude=["tmp/*"])
+    keys = (obj["Key"] async for obj in iter_objects(s3, "bucket", "logs/", matcher=matcher))
+    async for deleted, errors in delete_keys(s3, "bucket", keys, concurrency=4):
+        print(len(deleted), errors)
+"""
+
+import asyncio
+import fnmatch
+import re
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from pawnstack.utils.aio import windowed
+
+__all__ = [
+    "DELETE_BATCH_SIZE",
+    "ListingStats",
+    "PathMatcher",
+    "batched",
+    "delete_keys",
+    "iter_object_pages",
+    "iter_objects",
+]
+
+# DeleteObjects 한 요청의 최대 키 수
+DELETE_BATCH_SIZE = 1000
+
+_DONE = object()
+
+
+class PathMatcher:
+    """
+    include/exclude glob 패턴을 각각 정규식 하나로 컴파일한 매처
+
+    include 가 있으면 하나 이상 일치해야 하고, exclude 와는 하나도 일치하지 않아야 합니다
+    (``fnmatch.fnmatchcase`` 와 같은 규칙).
+    """
+
+    def __init__(self, include: Optional[Sequence[str]] = None, exclude: Optional[Sequence[str]] = None):
+        self.include = self._compile(include)
+        self.exclude = self._compile(exclude)
+
+    @staticmethod
+    def _compile(patterns: Optional[Sequence[str]]):
+        if not patterns:
+            return None
+        return re.compile("|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns))
+
+    @property
+    def active(self) -> bool:
+        return self.include is not None or self.exclude is not None
+
+    def __call__(self, path: str) -> bool:
+        if self.include is not None and not self.include.match(path):
+            return False
+        if self.exclude is not None and self.exclude.match(path):
+            return False
+        return True
+
+
+@dataclass
+class ListingStats:
+    """목록 조회 통계"""
+    requests: int = 0
+    prefixes: int = 0
+    objects: int = 0
+
+
+async def iter_object_pages(
+    client,
+    bucket: str,
+    prefix: str = "",
+    concurrency: int = 8,
+    shard_depth: int = 1,
+    max_shards: int = 1000,
+    stats: Optional[ListingStats] = None
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    ``prefix`` 아래 객체를 페이지 (``Contents`` 목록) 단위로 도착하는 순서대로 생성
+
+    Args:
+        client: 열린 S3 클라이언트
+        concurrency: 동시에 나열하는 prefix 수
+        shard_depth: ``/`` 기준으로 나눌 깊이 (0 이면 나누지 않음)
+        max_shards: 한 단계의 하위 prefix 가 이보다 많으면 나누지 않고 한 번에 나열
+            (작은 디렉토리가 아주 많을 때 요청 수가 페이지 수보다 커지는 것을 막음)
+        stats: 통계를 기록할 객체
+    """
+    stats = stats if stats is not None else ListingStats()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = set()
+    active = 0
+
+    async def paginate(**kwargs):
+        paginator = client.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(Bucket=bucket, **kwargs):
+            stats.requests += 1
+            yield page
+
+    async def emit(contents: List[Dict[str, Any]]):
+        if contents:
+            stats.objects += len(contents)
+            await queue.put(contents)
+
+    async def list_flat(current: str, skip_direct: bool = False):
+        async with semaphore:
+            async for page in paginate(Prefix=current):
+                contents = page.get("Contents", [])
+                if skip_direct:
+                    # 바로 아래 객체는 구분자 나열에서 이미 내보냄
+                    contents = [obj for obj in contents if "/" in obj["Key"][len(current):]]
+                await emit(contents)
+
+    async def list_sharded(current: str, depth: int):
+        children: List[str] = []
+        async with semaphore:
+            async for page in paginate(Prefix=current, Delimiter="/"):
+                await emit(page.get("Contents", []))
+                children.extend(item["Prefix"] for item in page.get("CommonPrefixes", []))
+        if len(children) > max_shards:
+            await list_flat(current, skip_direct=True)
+            return
+        stats.prefixes += len(children)
+        for child in children:
+            spawn(child, depth + 1)
+
+    async def run(coro):
+        # 취소 (CancelledError) 시에는 큐에 아무것도 넣지 않음
+        nonlocal active
+        error = None
+        try:
+            await coro
+        except Exception as e:
+            error = e
+        active -= 1
+        if error is not None:
+            await queue.put(error)
+        if active == 0:
+            await queue.put(_DONE)
+
+    def spawn(current: str, depth: int):
+        nonlocal active
+        active += 1
+        coro = list_sharded(current, depth) if depth < shard_depth else list_flat(current)
+        task = asyncio.ensure_future(run(coro))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    spawn(prefix, 0)
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        for task in list(tasks):
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def iter_objects(
+    client,
+    bucket: str,
+    prefix: str = "",
+    matcher: Optional[PathMatcher] = None,
+    relative: bool = False,
+    **kwargs
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    ``iter_object_pages`` 의 객체를 하나씩 생성 (``matcher`` 로 거름)
+
+    Args:
+        matcher: 키 (``relative`` 이면 ``prefix`` 를 뺀 상대 경로) 에 적용할 매처
+        kwargs: ``iter_object_pages`` 인수
+    """
+    offset = len(prefix) if relative else 0
+    async for page in iter_object_pages(client, bucket, prefix, **kwargs):
+        for obj in page:
+            if matcher is None or matcher(obj["Key"][offset:].lstrip("/") if relative else obj["Key"]):
+                yield obj
+
+
+async def batched(items: Union[Iterable[Any], AsyncIterator[Any]], size: int) -> AsyncIterator[List[Any]]:
+    """(비)동기 이터러블을 ``size`` 개씩 묶음"""
+    if not hasattr(items, "__aiter__"):
+        iterator = iter(items)
+
+        async def from_iterable():
+            for item in iterator:
+                yield item
+
+        items = from_iterable()
+
+    batch: List[Any] = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def delete_keys(
+    client,
+    bucket: str,
+    keys: Union[Iterable[str], AsyncIterator[str]],
+    concurrency: int = 4,
+    batch_size: int = DELETE_BATCH_SIZE
+) -> AsyncIterator[Tuple[List[str], List[Dict[str, Any]]]]:
+    """
+    키를 ``batch_size`` 개씩 ``DeleteObjects`` 로 삭제하며 배치를 ``concurrency`` 개까지 동시에 전송
+
+    Yields:
+        배치별 (삭제된 키, ``Errors`` 항목) - 요청 자체가 실패하면 모든 키가 ``Errors`` 에 들어감
+    """
+    if not 1 <= batch_size <= DELETE_BATCH_SIZE:
+        raise ValueError(f"batch_size must be between 1 and {DELETE_BATCH_SIZE}")
+
+    async def delete_batch(batch: List[str]):
+        try:
+            response = await client.delete_objects(
+                Bucket=bucket, Delete={"Objects": [{"Key": key} for key in batch], "Quiet": False}
+            )
+        except Exception as e:
+            message = f"{type(e).__name__}: {e}"
+            return [], [{"Key": key, "Message": message} for key in batch]
+        return [item["Key"] for item in response.get("Deleted", [])], response.get("Errors", [])
+
+    async for result in windowed(batched(keys, batch_size), delete_batch, concurrency):
+        yield result
@@ -0,0 +1,336 @@
+"""
+체크섬 기반 S3 동기화 (로컬 매니페스트)
+
+크기 + mtime 을 전체 ``list_objects_v2`` 결과와 매번 비교하는 대신
+
+    - 로컬 파일의 (경로, 크기, mtime_ns, S3 호환 ETag) 를 SQLite 매니페스트에 보관하고
+    - stat 이 바뀐 파일만 스레드 풀에서 해시를 다시 계산하며 (``hashlib`` 은 GIL 을 놓음)
+    - 크기가 같아도 내용이 바뀐 파일을 ETag 비교로 찾아냅니다.
+
+ETag 는 S3 와 같은 방식으로 계산합니다. ``multipart_threshold`` 미만은 파일 MD5, 이상이면
+``S3TransferManager`` 가 쓰는 파트 크기로 나눈 파트별 MD5 를 이어 붙인 값의 MD5 + ``-<파트 수>``
+입니다. SSE-KMS/SSE-C 로 암호화되었거나 다른 파트 크기로 올라간 객체의 ETag 는 이 값과 다르므로,
+매니페스트는 업로드할 때 S3 가 돌려준 ETag 와 그때의 로컬 ETag (``source_etag``) 를 함께 기록해 두고
+다음 목록의 ETag 가 기록과 같으면 같은 내용으로 봅니다. 어느 쪽으로도 판단할 수 없는 객체는
+기존처럼 크기 + mtime 으로 비교합니다.
+
+매니페스트는 업로드에 성공한 원격 객체도 기록하므로, 다른 도구가 버킷을 바꾸지 않는다고 믿을 수
+있으면 원격 목록 조회 없이 로컬 stat 만으로 변경분을 찾습니다.
+
+Example:
+    with SyncManifest(DEFAULT_MANIFEST_PATH) as manifest:
+        etags = await compute_etags(entries, manifest, TransferConfig())
+        uploads, deletes = diff_objects(local, manifest.remote_objects("bucket", "prefix/"))
+"""
+
+import asyncio
+import hashlib
+import math
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from pawnstack.utils.aio import windowed
+from pawnstack.utils.walk import FileEntry
+
+from .s3_transfer import TransferConfig
+
+__all__ = [
+    "DEFAULT_MANIFEST_PATH",
+    "RemoteObject",
+    "SyncManifest",
+    "SyncStats",
+    "compute_etags",
+    "diff_objects",
+    "etag_scheme",
+    "s3_etag",
+]
+
+DEFAULT_MANIFEST_PATH = "~/.cache/pawnstack/s3-sync.db"
+
+_READ_SIZE = 1024 * 1024
+# 테이블 구성이 바뀌면 올림 (다르면 매니페스트를 비우고 새로 만듦)
+_SCHEMA_VERSION = 2
+
+
+@dataclass(frozen=True)
+class RemoteObject:
+    """
+    원격 객체 요약 (ETag 는 따옴표 제거)
+
+    Attributes:
+        last_modified: 마지막 수정 시각 (epoch 초, 모르면 None)
+        source_etag: 이 도구가 업로드할 때의 로컬 ETag (다른 곳에서 올라간 객체는 None)
+    """
+    size: int
+    etag: str
+    last_modified: Optional[float] = None
+    source_etag: Optional[str] = None
+
+
+@dataclass
+class SyncStats:
+    """동기화 비교 통계"""
+    files: int = 0
+    hashed: int = 0          # 해시를 새로 계산한 파일
+    cached: int = 0          # stat 이 같아 매니페스트 ETag 재사용
+    hashed_bytes: int = 0
+    errors: int = 0
+
+
+def etag_scheme(config: TransferConfig) -> str:
+    """ETag 계산 방식 식별자 (임계값/파트 크기가 바뀌면 매니페스트의 ETag 를 다시 계산)"""
+    return f"md5:{config.multipart_threshold}:{config.part_size}"
+
+
+def s3_etag(path: Union[str, os.PathLike], config: TransferConfig, size: Optional[int] = None) -> str:
+    """
+    ``S3TransferManager`` 로 업로드했을 때 S3 가 돌려줄 ETag 계산
+
+    한 번만 읽으며 전체 MD5 와 파트별 MD5 를 함께 계산합니다.
+    """
+    if size is None:
+        size = os.stat(path).st_size
+    multipart = size >= config.multipart_threshold
+    part_size = config.part_size_for(size)
+
+    whole = hashlib.md5()
+    part_digests: List[bytes] = []
+    part = hashlib.md5()
+    part_filled = 0
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            block = f.read(_READ_SIZE)
+            if not block:
+                break
+            if not multipart:
+                whole.update(block)
+                continue
+            view = memoryview(block)
+            while view:
+                take = min(len(view), part_size - part_filled)
+                part.update(view[:take])
+                part_filled += take
+                view = view[take:]
+                if part_filled == part_size:
+                    part_digests.append(part.digest())
+                    part, part_filled = hashlib.md5(), 0
+
+    if not multipart:
+        return whole.hexdigest()
+    if part_filled or not part_digests:
+        part_digests.append(part.digest())
+    count = max(1, math.ceil(size / part_size))
+    return f"{hashlib.md5(b''.join(part_digests)).hexdigest()}-{count}"
+
+
+class SyncManifest:
+    """
+    동기화 매니페스트 (SQLite)
+
+    ``files`` 는 로컬 파일의 stat 과 ETag, ``objects`` 는 마지막으로 확인한 원격 객체입니다.
+    ``ScanCache`` 처럼 열 때 전부 메모리로 읽고 변경분은 ``flush()``/``close()`` 에서 한 트랜잭션으로 기록합니다.
+
+    Args:
+        path: 매니페스트 파일 경로 (``":memory:"`` 이면 저장하지 않음)
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        if str(path) != ":memory:":
+            path = Path(path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._db = sqlite3.connect(str(path))
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            with self._db:
+                self._db.execute("DROP TABLE IF EXISTS files")
+                self._db.execute("DROP TABLE IF EXISTS objects")
+                self._db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, scheme TEXT, etag TEXT)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS objects (bucket TEXT, key TEXT, size INTEGER, etag TEXT, "
+            "last_modified REAL, source_etag TEXT, PRIMARY KEY (bucket, key))"
+        )
+        self._files: Dict[str, Tuple[int, int, str, str]] = {
+            path: (size, mtime_ns, scheme, etag)
+            for path, size, mtime_ns, scheme, etag in self._db.execute("SELECT * FROM files")
+        }
+        self._objects: Dict[Tuple[str, str], RemoteObject] = {
+            (bucket, key): RemoteObject(*row)
+            for bucket, key, *row in self._db.execute("SELECT * FROM objects")
+        }
+        self._dirty_files: Set[str] = set()
+        self._dirty_objects: Set[Tuple[str, str]] = set()
+
+    # 로컬 파일
+
+    def local_etag(self, entry: FileEntry, scheme: str) -> Optional[str]:
+        """크기/mtime/계산 방식이 모두 같으면 저장된 ETag, 아니면 None"""
+        row = self._files.get(entry.path)
+        if row is not None and row[:3] == (entry.size, entry.mtime_ns, scheme):
+            return row[3]
+        return None
+
+    def store_local(self, entry: FileEntry, scheme: str, etag: str):
+        self._files[entry.path] = (entry.size, entry.mtime_ns, scheme, etag)
+        self._dirty_files.add(entry.path)
+
+    def prune_local(self, keep: Iterable[str], under: str):
+        """``under`` 디렉토리 아래에서 ``keep`` 에 없는 (삭제된) 파일 항목 제거"""
+        keep = set(keep)
+        prefix = os.path.join(under, "")
+        for path in [p for p in self._files if p.startswith(prefix) and p not in keep]:
+            del self._files[path]
+            self._dirty_files.add(path)
+
+    # 원격 객체
+
+    def remote_objects(self, bucket: str, prefix: str = "") -> Dict[str, RemoteObject]:
+        """매니페스트에 기록된 ``prefix`` 아래 원격 객체"""
+        return {key: obj for (b, key), obj in self._objects.items() if b == bucket and key.startswith(prefix)}
+
+    def replace_remote(self, bucket: str, prefix: str, objects: Dict[str, RemoteObject]):
+        """
+        원격 목록을 새로 조회한 결과로 ``prefix`` 아래 기록 교체
+
+        크기와 ETag 가 기록과 같은 객체는 업로드 당시의 ``source_etag`` 를 유지합니다.
+        """
+        for item in [item for item in self._objects if item[0] == bucket and item[1].startswith(prefix)]:
+            if item[1] not in objects:
+                del self._objects[item]
+                self._dirty_objects.add(item)
+        for key, obj in objects.items():
+            known = self._objects.get((bucket, key))
+            if known is not None and known.source_etag and (known.size, known.etag) == (obj.size, obj.etag):
+                obj = replace(obj, source_etag=known.source_etag)
+            self.set_remote(bucket, key, obj)
+
+    def set_remote(self, bucket: str, key: str, obj: RemoteObject):
+        if self._objects.get((bucket, key)) != obj:
+            self._objects[(bucket, key)] = obj
+            self._dirty_objects.add((bucket, key))
+
+    def drop_remote(self, bucket: str, key: str):
+        if self._objects.pop((bucket, key), None) is not None:
+            self._dirty_objects.add((bucket, key))
+
+    def flush(self):
+        if not self._dirty_files and not self._dirty_objects:
+            return
+        with self._db:
+            for path in self._dirty_files:
+                row = self._files.get(path)
+                if row is None:
+                    self._db.execute("DELETE FROM files WHERE path = ?", (path,))
+                else:
+                    self._db.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)", (path, *row))
+            for bucket, key in self._dirty_objects:
+                obj = self._objects.get((bucket, key))
+                if obj is None:
+                    self._db.execute("DELETE FROM objects WHERE bucket = ? AND key = ?", (bucket, key))
+                else:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?, ?)",
+                        (bucket, key, obj.size, obj.etag, obj.last_modified, obj.source_etag)
+                    )
+        self._dirty_files.clear()
+        self._dirty_objects.clear()
+
+    def close(self):
+        self.flush()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+async def compute_etags(
+    entries: Iterable[FileEntry],
+    manifest: SyncManifest,
+    config: TransferConfig,
+    workers: Optional[int] = None,
+    stats: Optional[SyncStats] = None
+) -> Dict[str, Optional[str]]:
+    """
+    파일별 ETag 반환 (stat 이 바뀐 파일만 스레드 풀에서 계산하고 매니페스트에 기록)
+
+    읽을 수 없는 파일은 None 입니다.
+    """
+    scheme = etag_scheme(config)
+    stats = stats if stats is not None else SyncStats()
+    etags: Dict[str, Optional[str]] = {}
+    changed: List[FileEntry] = []
+    for entry in entries:
+        stats.files += 1
+        etag = manifest.local_etag(entry, scheme)
+        if etag is None:
+            changed.append(entry)
+        else:
+            stats.cached += 1
+            etags[entry.path] = etag
+
+    if not changed:
+        return etags
+
+    loop = asyncio.get_running_loop()
+    workers = workers or min(32, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="s3-etag") as pool:
+        async def hash_entry(entry: FileEntry):
+            try:
+                etag = await loop.run_in_executor(pool, s3_etag, entry.path, config, entry.size)
+            except OSError:
+                stats.errors += 1
+                return entry, None
+            return entry, etag
+
+        # 큰 트리에서도 대기 중인 future 수를 제한
+        async for entry, etag in windowed(changed, hash_entry, workers * 4):
+            etags[entry.path] = etag
+            if etag is not None:
+                stats.hashed += 1
+                stats.hashed_bytes += entry.size
+                manifest.store_local(entry, scheme, etag)
+    return etags
+
+
+def _needs_upload(size: int, etag: Optional[str], mtime: Optional[float], obj: Optional[RemoteObject]) -> bool:
+    if obj is None or obj.size != size:
+        return True
+    if etag is not None:
+        if etag in (obj.etag, obj.source_etag):
+            return False
+        if obj.source_etag is not None:
+            # 이 도구가 올린 뒤 로컬 내용이 바뀜
+            return True
+    # ETag 로 판단할 수 없음 (해시 안 함, 암호화/다른 파트 크기): 로컬이 더 최근이면 업로드
+    return obj.last_modified is None or mtime is None or mtime > obj.last_modified
+
+
+def diff_objects(
+    local: Dict[str, Tuple[int, Optional[str], Optional[float]]],
+    remote: Dict[str, RemoteObject]
+) -> Tuple[List[str], List[str]]:
+    """
+    업로드할 키와 원격에만 있는 키 계산
+
+    로컬 ETag 가 원격 ETag 나 업로드 당시 기록한 ``source_etag`` 와 같으면 건너뛰고, 둘 다
+    판단할 수 없으면 크기 + mtime (로컬이 원격보다 최근인지) 으로 비교합니다.
+
+    Args:
+        local: 키 -> (크기, ETag 또는 None, mtime epoch 초)
+        remote: 키 -> 원격 객체
+
+    Returns:
+        (내용이 다르거나 원격에 없는 키, 로컬에 없는 원격 키)
+    """
+    uploads = [key for key, (size, etag, mtime) in local.items() if _needs_upload(size, etag, mtime, remote.get(key))]
+    deletes = [key for key in remote if key not in local]
+    return uploads, deletes
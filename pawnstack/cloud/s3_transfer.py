@@ -0,0 +1,381 @@
+"""
+S3 전송 관리자
+
+파일마다 클라이언트를 새로 만들고 ``upload_file`` 을 하나씩 기다리는 대신
+
+    - 명령 하나가 여는 **장수 (long-lived) 클라이언트 하나**를 모든 전송이 공유하고
+      (커넥션 풀 크기 = 동시 파일 수 × 파트 동시성)
+    - ``multipart_threshold`` 이상인 객체는 ``part_size`` 파트로 나눠 ``part_concurrency`` 개씩
+      병렬 multipart 업로드 / ranged GET 다운로드로 전송하며
+    - 모든 전송이 하나의 토큰 버킷 ``RateLimiter`` 를 공유해 전체 대역폭을 제한합니다.
+
+업로드 파트는 ``os.pread`` 로 필요한 구간만 읽고, 다운로드는 임시 파일에 ``os.pwrite`` 로 쓴 뒤
+완료되면 ``os.replace`` 로 바꾸므로 중단된 다운로드가 기존 파일을 깨뜨리지 않습니다.
+실패한 multipart 업로드는 ``abort_multipart_upload`` 로 정리합니다.
+
+클라이언트는 aioboto3/aiobotocore S3 클라이언트 (``async with session.client("s3")`` 로 연 것)
+와 같은 인터페이스면 됩니다.
+
+Example:
+    async with session.client("s3", config=Config(max_pool_connections=40)) as s3:
+        manager = S3TransferManager(s3, TransferConfig(max_concurrency=10, max_bandwidth=parse_size("50MB")))
+        async for result in manager.upload_many(jobs):
+            print(result.destination, result.ok)
+"""
+
+import asyncio
+import math
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional, Tuple, TypeVar, Union
+
+from pawnstack.utils.aio import windowed
+
+__all__ = [
+    "RateLimiter",
+    "S3TransferManager",
+    "TransferConfig",
+    "TransferJob",
+    "TransferResult",
+    "parse_size",
+]
+
+R = TypeVar("R")
+
+KB = 1024
+MB = 1024 * KB
+# S3 multipart 제약: 마지막 파트를 제외한 최소 파트 크기, 최대 파트 수
+MIN_PART_SIZE = 5 * MB
+MAX_PARTS = 10000
+# 다운로드 스트림에서 한 번에 읽는 크기 (대역폭 제한 단위)
+_READ_CHUNK = 1 * MB
+_TEMP_SUFFIX = ".pawns-part"
+
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmgt]?)(?:i?b)?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "k": KB, "m": MB, "g": 1024 * MB, "t": 1024 * 1024 * MB}
+
+
+def parse_size(value: Union[str, int, float]) -> int:
+    """
+    ``"8MB"``, ``"512k"``, ``"1.5GiB"``, ``1048576`` 같은 크기를 바이트로 변환 (1024 단위)
+
+    형식 오류는 ValueError 입니다.
+    """
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = _SIZE_RE.match(value)
+    if not match:
+        raise ValueError(f"Invalid size: {value!r}")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).lower()])
+
+
+class RateLimiter:
+    """
+    비동기 토큰 버킷 (초당 바이트)
+
+    여러 코루틴이 공유하며, 버킷보다 큰 요청도 허용하되 그만큼 이후 요청을 늦춰 평균 속도를 지킵니다.
+    대기 중인 요청은 도착 순서대로 처리됩니다.
+
+    Args:
+        rate: 초당 바이트 (0 이하면 제한 없음)
+        burst: 버킷 크기 (기본값: 1초 분량)
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    async def acquire(self, amount: int):
+        """``amount`` 바이트를 보낼 수 있을 때까지 대기"""
+        if not self.enabled or amount <= 0:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= amount
+            if self._tokens < 0:
+                # 부족분이 채워질 때까지 잠금을 쥔 채 대기해 뒤 요청이 앞지르지 못하게 함
+                await asyncio.sleep(-self._tokens / self.rate)
+
+
+@dataclass
+class TransferConfig:
+    """
+    전송 설정
+
+    Args:
+        multipart_threshold: 이 크기 이상이면 multipart 전송
+        part_size: 파트 크기 (최소 5 MiB, 10000 파트를 넘으면 자동으로 키움)
+        part_concurrency: 객체 하나에서 동시에 전송하는 파트 수
+        max_concurrency: 동시에 전송하는 객체 수
+        max_bandwidth: 전체 대역폭 상한 (초당 바이트, 0 이면 제한 없음)
+    """
+    multipart_threshold: int = 8 * MB
+    part_size: int = 8 * MB
+    part_concurrency: int = 4
+    max_concurrency: int = 10
+    max_bandwidth: int = 0
+
+    def __post_init__(self):
+        if self.part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be >= {MIN_PART_SIZE} bytes")
+        if self.part_concurrency < 1 or self.max_concurrency < 1:
+            raise ValueError("part_concurrency and max_concurrency must be >= 1")
+        if self.multipart_threshold < 0 or self.max_bandwidth < 0:
+            raise ValueError("multipart_threshold and max_bandwidth must be >= 0")
+
+    @property
+    def max_pool_connections(self) -> int:
+        """모든 전송이 동시에 쓸 수 있는 최대 연결 수 (botocore ``max_pool_connections``)"""
+        return self.max_concurrency * self.part_concurrency
+
+    def part_size_for(self, size: int) -> int:
+        """``size`` 바이트 객체에 쓸 파트 크기 (파트 수가 ``MAX_PARTS`` 를 넘지 않게)"""
+        return max(self.part_size, math.ceil(size / MAX_PARTS))
+
+
+@dataclass
+class TransferJob:
+    """전송 작업 하나 (``size`` 를 모르면 업로드는 stat, 다운로드는 HEAD 로 확인)"""
+    bucket: str
+    key: str
+    path: str
+    size: Optional[int] = None
+    extra_args: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class TransferResult:
+    """전송 결과"""
+    source: str
+    destination: str
+    size: int = 0
+    parts: int = 0
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    etag: Optional[str] = None  # 업로드 시 S3 가 돌려준 ETag (따옴표 제거)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _response_etag(response: Optional[Dict[str, Any]]) -> Optional[str]:
+    etag = (response or {}).get("ETag")
+    return etag.strip('"') if etag else None
+
+
+def _error_text(e: BaseException) -> str:
+    return f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+
+
+class S3TransferManager:
+    """
+    공유 S3 클라이언트로 업로드/다운로드를 병렬 처리
+
+    Args:
+        client: 열린 S3 클라이언트 (호출자가 닫음)
+        config: 전송 설정
+        limiter: 대역폭 제한기 (기본값: ``config.max_bandwidth`` 로 생성, 여러 관리자가 공유 가능)
+    """
+
+    def __init__(self, client, config: Optional[TransferConfig] = None, limiter: Optional[RateLimiter] = None):
+        self.client = client
+        self.config = config or TransferConfig()
+        self.limiter = limiter or RateLimiter(self.config.max_bandwidth)
+        self.stats = {"files": 0, "failed": 0, "bytes": 0, "multipart": 0, "parts": 0}
+
+    async def _parallel_parts(self, count: int, func: Callable[[int], Awaitable[R]]) -> list:
+        """파트 번호 0..count-1 을 ``part_concurrency`` 개씩 실행하고 번호 순서대로 결과 반환"""
+        results: Dict[int, R] = {}
+
+        async def run(index: int):
+            results[index] = await func(index)
+
+        async for _ in windowed(range(count), run, self.config.part_concurrency):
+            pass
+        return [results[index] for index in range(count)]
+
+    # 업로드
+
+    async def upload_file(
+        self,
+        path: Union[str, os.PathLike],
+        bucket: str,
+        key: str,
+        extra_args: Optional[Dict[str, Any]] = None,
+        size: Optional[int] = None
+    ) -> TransferResult:
+        """
+        파일 하나 업로드 (크기에 따라 ``put_object`` 또는 병렬 multipart)
+
+        ``extra_args`` (``StorageClass``, ``Metadata``, ``ContentType`` 등) 는 ``put_object`` /
+        ``create_multipart_upload`` 에 그대로 전달됩니다. 실패는 예외로 전파됩니다.
+        """
+        path = os.fspath(path)
+        extra_args = extra_args or {}
+        if size is None:
+            size = os.stat(path).st_size
+        started = time.monotonic()
+
+        if size < self.config.multipart_threshold:
+            body = await asyncio.to_thread(_read_file, path)
+            await self.limiter.acquire(len(body))
+            response = await self.client.put_object(Bucket=bucket, Key=key, Body=body, **extra_args)
+            parts, etag = 0, _response_etag(response)
+        else:
+            parts, etag = await self._multipart_upload(path, bucket, key, size, extra_args)
+
+        self.stats["bytes"] += size
+        return TransferResult(path, f"s3://{bucket}/{key}", size, parts, elapsed=time.monotonic() - started, etag=etag)
+
+    async def _multipart_upload(
+        self, path: str, bucket: str, key: str, size: int, extra_args: Dict[str, Any]
+    ) -> Tuple[int, Optional[str]]:
+        """(파트 수, S3 가 돌려준 ETag)"""
+        part_size = self.config.part_size_for(size)
+        count = max(1, math.ceil(size / part_size))
+        response = await self.client.create_multipart_upload(Bucket=bucket, Key=key, **extra_args)
+        upload_id = response["UploadId"]
+
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            async def upload_part(index: int) -> Dict[str, Any]:
+                offset = index * part_size
+                body = await asyncio.to_thread(os.pread, fd, min(part_size, size - offset), offset)
+                await self.limiter.acquire(len(body))
+                part = await self.client.upload_part(
+                    Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=index + 1, Body=body
+                )
+                self.stats["parts"] += 1
+                return {"PartNumber": index + 1, "ETag": part["ETag"]}
+
+            completed = await self._parallel_parts(count, upload_part)
+            response = await self.client.complete_multipart_upload(
+                Bucket=bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": completed}
+            )
+        except BaseException:
+            # 완료되지 않은 파트는 과금되므로 업로드 자체를 취소 (취소 실패는 원래 오류를 가리지 않음)
+            try:
+                await self.client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+            except Exception:
+                pass
+            raise
+        finally:
+            os.close(fd)
+
+        self.stats["multipart"] += 1
+        return count, _response_etag(response)
+
+    # 다운로드
+
+    async def download_file(self, bucket: str, key: str, path: Union[str, os.PathLike], size: Optional[int] = None) -> TransferResult:
+        """
+        객체 하나 다운로드 (크기에 따라 단일 GET 또는 병렬 ranged GET)
+
+        상위 디렉토리는 자동으로 만들고, 임시 파일에 받은 뒤 완료되면 ``path`` 로 교체합니다.
+        실패는 예외로 전파됩니다.
+        """
+        path = os.fspath(path)
+        if size is None:
+            size = (await self.client.head_object(Bucket=bucket, Key=key))["ContentLength"]
+        started = time.monotonic()
+
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        temp_path = path + _TEMP_SUFFIX
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            if size < self.config.multipart_threshold:
+                await self._download_range(fd, bucket, key, 0, None)
+                parts = 0
+            else:
+                os.ftruncate(fd, size)
+                part_size = self.config.part_size_for(size)
+                count = math.ceil(size / part_size)
+
+                async def download_part(index: int):
+                    start = index * part_size
+                    end = min(start + part_size, size) - 1
+                    await self._download_range(fd, bucket, key, start, f"bytes={start}-{end}")
+                    self.stats["parts"] += 1
+
+                await self._parallel_parts(count, download_part)
+                self.stats["multipart"] += 1
+                parts = count
+        except BaseException:
+            os.close(fd)
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        os.close(fd)
+        os.replace(temp_path, path)
+
+        self.stats["bytes"] += size
+        return TransferResult(f"s3://{bucket}/{key}", path, size, parts, elapsed=time.monotonic() - started)
+
+    async def _download_range(self, fd: int, bucket: str, key: str, offset: int, byte_range: Optional[str]):
+        """GET 응답 본문을 ``offset`` 부터 파일에 기록 (읽는 단위마다 대역폭 토큰 소비)"""
+        kwargs = {"Range": byte_range} if byte_range else {}
+        response = await self.client.get_object(Bucket=bucket, Key=key, **kwargs)
+        body = response["Body"]
+        try:
+            while True:
+                chunk = await body.read(_READ_CHUNK)
+                if not chunk:
+                    break
+                await self.limiter.acquire(len(chunk))
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+        finally:
+            close = getattr(body, "close", None)
+            if close is not None:
+                close()
+
+    # 여러 파일
+
+    async def _run_job(self, job: TransferJob, upload: bool) -> TransferResult:
+        try:
+            if upload:
+                result = await self.upload_file(job.path, job.bucket, job.key, job.extra_args, job.size)
+            else:
+                result = await self.download_file(job.bucket, job.key, job.path, job.size)
+        except Exception as e:
+            self.stats["failed"] += 1
+            remote = f"s3://{job.bucket}/{job.key}"
+            source, destination = (job.path, remote) if upload else (remote, job.path)
+            return TransferResult(source, destination, job.size or 0, error=_error_text(e))
+        self.stats["files"] += 1
+        return result
+
+    def upload_many(self, jobs: Union[Iterable[TransferJob], AsyncIterator[TransferJob]]) -> AsyncIterator[TransferResult]:
+        """
+        여러 파일을 ``max_concurrency`` 개씩 동시에 업로드하고 끝나는 순서대로 결과 반환
+
+        개별 실패는 예외 대신 ``TransferResult.error`` 로 보고합니다.
+        """
+        return windowed(jobs, lambda job: self._run_job(job, True), self.config.max_concurrency)
+
+    def download_many(self, jobs: Union[Iterable[TransferJob], AsyncIterator[TransferJob]]) -> AsyncIterator[TransferResult]:
+        """여러 객체를 ``max_concurrency`` 개씩 동시에 다운로드 (``upload_many`` 와 같은 규칙)"""
+        return windowed(jobs, lambda job: self._run_job(job, False), self.config.max_concurrency)
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
@@ -32,6 +32,17 @@ class HttpConfig:
         self.user_agent = f"PawnStack/{__version__}"
         self.verify_ssl = True
         self.follow_redirects = True
+        self.proxy = None
+        self.http2 = False
+
+        # 커넥션 풀 설정 (keep-alive 재사용)
+        self.max_connections = 100
+        self.max_keepalive_connections = 20
+        self.keepalive_expiry = 5.0
+        self.pool_idle_timeout = 300.0
+
+        # 응답 본문 보관 한도 (None: 전체, 0: 버리고 크기만 기록)
+        self.max_body_size = None
 
 
 class SystemConfig:
@@ -65,7 +65,7 @@ class PawnStack(LoggerMixin):
     def http(self) -> HttpClient:
         """HTTP 클라이언트 인스턴스"""
         if self._http is None:
-            self._http = HttpClient()
+            self._http = HttpClient(self.config.http)
         return self._http
 
     @property
@@ -86,7 +86,10 @@ class PawnStack(LoggerMixin):
 
     async def close(self) -> None:
         """리소스 정리"""
-        # HTTPClient는 각 요청마다 새로운 클라이언트를 생성하므로 별도 정리 불필요
+        # HTTP 커넥션 풀 해제
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
         self.logger.info("PawnStack 리소스 정리 완료")
 
     def __repr__(self) -> str:
@@ -5,5 +5,7 @@ HTTP 클라이언트 및 관련 유틸리티
 """
 
 from .client import HttpClient, HttpResponse
+from .criteria import SuccessCriteria, compile_criteria
+from .jsonrpc import JsonRpcBatcher, iter_batch_file
 
-__all__ = ['HttpClient', 'HttpResponse']
\ No newline at end of file
+__all__ = ['HttpClient', 'HttpResponse', 'SuccessCriteria', 'compile_criteria', 'JsonRpcBatcher', 'iter_batch_file']
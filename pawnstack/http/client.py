@@ -4,43 +4,266 @@ PawnStack HTTP 클라이언트
 비동기 HTTP 요청을 위한 클라이언트
 """
 
+import asyncio
+import time
 import httpx
-from dataclasses import dataclass
-from typing import Dict, Any, Optional, Union
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple, Union
+
+from pawnstack.config.settings import HttpConfig
+
+
+# 커넥션 풀 키: (verify_ssl, proxy, http2)
+PoolKey = Tuple[bool, Optional[str], bool]
+
+
+_UNSET = object()
 
 
-@dataclass
 class HttpResponse:
-    """HTTP 응답 데이터 클래스"""
-    status_code: int
-    headers: Dict[str, str]
-    content: bytes
-    text: str
-    url: str
-    
+    """
+    HTTP 응답
+
+    본문 바이트만 보관하고 ``text`` 는 처음 접근할 때 디코딩하며, ``json()`` 은 한 번만
+    파싱하여 캐시합니다. ``max_body_size`` 로 본문이 잘린 경우 ``truncated`` 가 True 이고
+    ``size`` 에는 실제 수신한 전체 본문 크기가 기록됩니다.
+    """
+
+    __slots__ = ('status_code', 'headers', 'content', 'url', 'encoding', 'size', 'truncated', '_text', '_json')
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes = b"",
+        text: Optional[str] = None,
+        url: str = "",
+        encoding: Optional[str] = None,
+        size: Optional[int] = None,
+        truncated: bool = False,
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content or b""
+        self.url = url
+        self.encoding = encoding or "utf-8"
+        self.size = size if size is not None else len(self.content)
+        self.truncated = truncated
+        self._text = text
+        self._json: Any = _UNSET
+
+    @property
+    def text(self) -> str:
+        """본문 문자열 (최초 접근 시 디코딩)"""
+        if self._text is None:
+            self._text = self.content.decode(self.encoding, errors="replace")
+        return self._text
+
     def json(self) -> Dict[str, Any]:
-        """JSON 응답 파싱"""
-        import json
-        return json.loads(self.text)
-    
+        """JSON 응답 파싱 (결과 캐시)"""
+        if self._json is _UNSET:
+            import json
+            self._json = json.loads(self._text if self._text is not None else self.content)
+        return self._json
+
     def is_success(self) -> bool:
         """성공 응답인지 확인"""
         return 200 <= self.status_code < 300
 
+    def __repr__(self) -> str:
+        return f"HttpResponse(status_code={self.status_code}, url={self.url!r}, size={self.size}, truncated={self.truncated})"
+
+
+@dataclass
+class _PoolEntry:
+    """커넥션 풀 항목 (httpx.AsyncClient 와 사용 상태)"""
+    client: httpx.AsyncClient
+    loop: Optional[asyncio.AbstractEventLoop]
+    last_used: float = field(default_factory=time.monotonic)
+    in_flight: int = 0
+
 
 class HttpClient:
-    """비동기 HTTP 클라이언트"""
-    
+    """
+    비동기 HTTP 클라이언트
+
+    (verify_ssl, proxy, http2) 조합마다 keep-alive 커넥션 풀을 하나씩 유지하여
+    반복 요청 시 DNS/TCP/TLS 핸드셰이크를 다시 하지 않습니다.
+    사용하지 않는 풀은 ``pool_idle_timeout`` 이후 정리되며, ``aclose()`` 또는
+    ``async with`` 블록 종료 시 모든 풀이 해제됩니다.
+    """
+
     def __init__(
         self,
-        timeout: float = 30.0,
-        verify_ssl: bool = True,
-        default_headers: Optional[Dict[str, str]] = None
+        config: Optional[HttpConfig] = None,
+        timeout: Optional[float] = None,
+        verify_ssl: Optional[bool] = None,
+        default_headers: Optional[Dict[str, str]] = None,
+        proxy: Optional[str] = None,
+        http2: Optional[bool] = None,
     ):
-        self.timeout = timeout
-        self.verify_ssl = verify_ssl
+        # 레거시 호환: HttpClient(30.0) 처럼 timeout 을 첫 인자로 받은 경우
+        if isinstance(config, (int, float)):
+            timeout, config = float(config), None
+
+        self.config = config or HttpConfig()
+        self.timeout = timeout if timeout is not None else self.config.timeout
+        self.verify_ssl = verify_ssl if verify_ssl is not None else self.config.verify_ssl
+        self.proxy = proxy if proxy is not None else getattr(self.config, 'proxy', None)
+        self.http2 = http2 if http2 is not None else getattr(self.config, 'http2', False)
         self.default_headers = default_headers or {}
-    
+
+        self.limits = httpx.Limits(
+            max_connections=getattr(self.config, 'max_connections', 100),
+            max_keepalive_connections=getattr(self.config, 'max_keepalive_connections', 20),
+            keepalive_expiry=getattr(self.config, 'keepalive_expiry', 5.0),
+        )
+        self.pool_idle_timeout = getattr(self.config, 'pool_idle_timeout', 300.0)
+
+        self._pools: Dict[PoolKey, _PoolEntry] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        # 이벤트 루프가 바뀌어 교체된 클라이언트 (다음 요청 또는 aclose() 에서 해제)
+        self._retired: List[httpx.AsyncClient] = []
+        self._last_eviction = time.monotonic()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """기본 설정 (verify_ssl, proxy, http2) 의 풀 클라이언트"""
+        return self._get_pool(self._default_key()).client
+
+    def _default_key(self) -> PoolKey:
+        return (self.verify_ssl, self.proxy, self.http2)
+
+    def _create_client(self, key: PoolKey) -> httpx.AsyncClient:
+        """풀 키에 맞는 httpx.AsyncClient 생성"""
+        verify, proxy, http2 = key
+        client_kwargs: Dict[str, Any] = dict(
+            timeout=self.timeout,
+            verify=verify,
+            http2=http2,
+            limits=self.limits,
+        )
+        if proxy:
+            client_kwargs['proxy'] = proxy
+        return httpx.AsyncClient(**client_kwargs)
+
+    def _get_pool(self, key: PoolKey) -> _PoolEntry:
+        """풀 키에 해당하는 커넥션 풀 반환 (없으면 생성)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        entry = self._pools.get(key)
+        # 다른 이벤트 루프에서 만든 커넥션은 재사용할 수 없으므로 버리고 새로 생성
+        if entry is not None and entry.loop is not None and loop is not None and entry.loop is not loop:
+            self._retired.append(entry.client)
+            entry = None
+
+        if entry is None:
+            entry = _PoolEntry(client=self._create_client(key), loop=loop)
+            self._pools[key] = entry
+            if key == self._default_key():
+                self._client = entry.client
+        elif entry.loop is None:
+            entry.loop = loop
+
+        return entry
+
+    async def _acquire_pool(self, key: PoolKey) -> _PoolEntry:
+        """요청에 쓸 풀 반환 (이벤트 루프가 바뀌어 교체된 이전 클라이언트는 여기서 해제)"""
+        entry = self._get_pool(key)
+        if self._retired:
+            await self._close_retired()
+        return entry
+
+    async def _close_retired(self):
+        """교체된 클라이언트 해제"""
+        retired, self._retired = self._retired, []
+        for client in retired:
+            try:
+                await client.aclose()
+            except Exception:
+                # 다른 (또는 이미 종료된) 이벤트 루프에 묶인 커넥션
+                pass
+
+    async def _evict_idle_pools(self):
+        """pool_idle_timeout 동안 사용되지 않은 풀 정리"""
+        now = time.monotonic()
+        if not self.pool_idle_timeout or now - self._last_eviction < min(self.pool_idle_timeout, 60.0):
+            return
+        self._last_eviction = now
+
+        idle_keys = [
+            key for key, entry in self._pools.items()
+            if entry.in_flight == 0 and now - entry.last_used > self.pool_idle_timeout
+        ]
+        for key in idle_keys:
+            entry = self._pools.pop(key)
+            if entry.client is self._client:
+                self._client = None
+            await entry.client.aclose()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """풀 상태 요약"""
+        return {
+            "pools": len(self._pools),
+            "retired": len(self._retired),
+            "in_flight": sum(entry.in_flight for entry in self._pools.values()),
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "keepalive_expiry": self.limits.keepalive_expiry,
+        }
+
+    async def aclose(self):
+        """모든 커넥션 풀 해제 (이후 요청 시 풀은 다시 생성됨)"""
+        pools, self._pools = self._pools, {}
+        self._client = None
+        await self._close_retired()
+        for entry in pools.values():
+            try:
+                await entry.client.aclose()
+            except RuntimeError:
+                # 이미 종료된 이벤트 루프에 묶인 커넥션
+                pass
+
+    async def close(self):
+        """aclose() 별칭"""
+        await self.aclose()
+
+    async def __aenter__(self) -> "HttpClient":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.aclose()
+
+    def _prepare_request(
+        self,
+        headers: Optional[Dict[str, str]],
+        json: Optional[Dict[str, Any]],
+        data: Optional[Union[str, bytes, Dict[str, Any]]],
+        timeout: Optional[float],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """요청 파라미터 준비"""
+        # 헤더 병합
+        request_headers = self.default_headers.copy()
+        if headers:
+            request_headers.update(headers)
+
+        request_kwargs = kwargs.copy()
+        request_kwargs['headers'] = request_headers
+        # 타임아웃 설정
+        request_kwargs['timeout'] = timeout if timeout is not None else self.timeout
+
+        if json is not None:
+            request_kwargs['json'] = json
+        elif data is not None:
+            request_kwargs['data'] = data
+
+        return request_kwargs
+
     async def request(
         self,
         method: str,
@@ -50,67 +273,131 @@ class HttpClient:
         data: Optional[Union[str, bytes, Dict[str, Any]]] = None,
         timeout: Optional[float] = None,
         verify_ssl: Optional[bool] = None,
+        max_body_size: Optional[int] = None,
         **kwargs
     ) -> HttpResponse:
-        """HTTP 요청 실행"""
-        # 헤더 병합
-        request_headers = self.default_headers.copy()
-        if headers:
-            request_headers.update(headers)
-        
-        # 타임아웃 설정
-        request_timeout = timeout if timeout is not None else self.timeout
-        
+        """
+        HTTP 요청 실행
+
+        Args:
+            max_body_size: 보관할 최대 본문 바이트 수. 0 이면 본문을 버리고 크기만 기록하며,
+                None 이면 HttpConfig.max_body_size (기본: 전체 보관) 를 따릅니다.
+                잘린 나머지도 끝까지 읽어 커넥션은 재사용됩니다.
+        """
+        if max_body_size is None:
+            max_body_size = getattr(self.config, 'max_body_size', None)
+
+        if max_body_size is not None:
+            return await self._request_capped(
+                method, url, max_body_size,
+                headers=headers, json=json, data=data, timeout=timeout, verify_ssl=verify_ssl, **kwargs
+            )
+
+        request_kwargs = self._prepare_request(headers, json, data, timeout, kwargs)
+
+        await self._evict_idle_pools()
         # SSL 검증 설정
         request_verify = verify_ssl if verify_ssl is not None else self.verify_ssl
-        
-        async with httpx.AsyncClient(
-            timeout=request_timeout,
-            verify=request_verify,
-            headers=request_headers
-        ) as client:
-            # 요청 파라미터 준비
-            request_kwargs = kwargs.copy()
-            
-            if json is not None:
-                request_kwargs['json'] = json
-            elif data is not None:
-                request_kwargs['data'] = data
-            
-            response = await client.request(method, url, **request_kwargs)
-            
-            return HttpResponse(
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                content=response.content,
-                text=response.text,
-                url=str(response.url)
-            )
-    
+        entry = await self._acquire_pool((request_verify, self.proxy, self.http2))
+
+        entry.in_flight += 1
+        try:
+            response = await entry.client.request(method, url, **request_kwargs)
+        finally:
+            entry.in_flight -= 1
+            entry.last_used = time.monotonic()
+
+        return HttpResponse(
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            content=response.content,
+            url=str(response.url),
+            encoding=response.charset_encoding,
+        )
+
+    async def _request_capped(self, method: str, url: str, max_body_size: int, **kwargs) -> HttpResponse:
+        """본문을 max_body_size 바이트까지만 보관하는 요청"""
+        chunks = []
+        kept = 0
+        size = 0
+
+        async with self.stream(method, url, **kwargs) as response:
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                if kept < max_body_size:
+                    piece = chunk[:max_body_size - kept]
+                    chunks.append(piece)
+                    kept += len(piece)
+
+        return HttpResponse(
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            content=b"".join(chunks),
+            url=str(response.url),
+            encoding=response.charset_encoding,
+            size=size,
+            truncated=size > kept,
+        )
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[str, bytes, Dict[str, Any]]] = None,
+        timeout: Optional[float] = None,
+        verify_ssl: Optional[bool] = None,
+        **kwargs
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        스트리밍 요청 (큰 응답용)
+
+        본문을 메모리에 올리지 않고 ``aiter_bytes()`` / ``aiter_lines()`` 로 순회합니다.
+
+            async with client.stream("GET", url) as response:
+                async for chunk in response.aiter_bytes():
+                    ...
+        """
+        request_kwargs = self._prepare_request(headers, json, data, timeout, kwargs)
+
+        await self._evict_idle_pools()
+        request_verify = verify_ssl if verify_ssl is not None else self.verify_ssl
+        entry = await self._acquire_pool((request_verify, self.proxy, self.http2))
+
+        entry.in_flight += 1
+        try:
+            async with entry.client.stream(method, url, **request_kwargs) as response:
+                yield response
+        finally:
+            entry.in_flight -= 1
+            entry.last_used = time.monotonic()
+
     async def get(self, url: str, **kwargs) -> HttpResponse:
         """GET 요청"""
         return await self.request('GET', url, **kwargs)
-    
+
     async def post(self, url: str, **kwargs) -> HttpResponse:
         """POST 요청"""
         return await self.request('POST', url, **kwargs)
-    
+
     async def put(self, url: str, **kwargs) -> HttpResponse:
         """PUT 요청"""
         return await self.request('PUT', url, **kwargs)
-    
+
     async def delete(self, url: str, **kwargs) -> HttpResponse:
         """DELETE 요청"""
         return await self.request('DELETE', url, **kwargs)
-    
+
     async def patch(self, url: str, **kwargs) -> HttpResponse:
         """PATCH 요청"""
         return await self.request('PATCH', url, **kwargs)
-    
+
     async def head(self, url: str, **kwargs) -> HttpResponse:
         """HEAD 요청"""
         return await self.request('HEAD', url, **kwargs)
-    
+
     async def options(self, url: str, **kwargs) -> HttpResponse:
         """OPTIONS 요청"""
-        return await self.request('OPTIONS', url, **kwargs)
\ No newline at end of file
+        return await self.request('OPTIONS', url, **kwargs)
@@ -0,0 +1,517 @@
+"""
+HTTP 성공 기준 (success criteria) 엔진
+
+``status_code==200``, ``response_time<0.5``, ``result.items[0].id != 0`` 같은 기준 문자열을
+한 번만 파싱하여 응답마다 바로 평가할 수 있는 술어(predicate) 객체로 컴파일합니다.
+
+지원 문법:
+    - 비교 연산자: ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``
+    - 정규식: ``key=~pattern`` (re.search), ``key!~pattern``
+    - 포함: ``key in [200, 201]``, ``key not in [500, 502]``
+    - 그룹: ``and`` / ``or`` (또는 ``&&`` / ``||``) 와 괄호
+    - 키: ``status_code``, ``response_time``, ``content_length``, ``headers.<이름>``, ``text``,
+      그 외에는 JSON 경로 (``a.b[0].c``, ``a.b.0.c``, ``a["x.y"]``)
+    - 공백이나 and/or 가 포함된 값은 따옴표로 감쌉니다: ``result.msg=="up and running"``
+
+HTTPMonitor 와 ``pawns http`` 가 같은 엔진을 사용하므로 두 경로의 판정이 항상 같습니다.
+"""
+
+import re
+import operator as _operator
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+__all__ = [
+    "Criterion",
+    "SuccessCriteria",
+    "compile_criteria",
+    "parse_json_path",
+    "resolve_json_path",
+]
+
+_MISSING = object()
+
+# 연산자 우선순위대로 정렬 (긴 연산자 먼저)
+_COMPARISON_RE = re.compile(
+    r"^\s*(?P<key>[^\s=!<>~]+?)\s*"
+    r"(?P<op>==|!=|<=|>=|=~|!~|<|>|\s+not\s+in\s+|\s+in\s+)"
+    r"\s*(?P<value>.*?)\s*$",
+    re.DOTALL,
+)
+_LOGICAL_RE = re.compile(r"\s+(and|or)(?:\s+|$)", re.IGNORECASE)
+_PATH_TOKEN_RE = re.compile(r'\[\s*(-?\d+)\s*\]|\[\s*"([^"]*)"\s*\]|\[\s*\'([^\']*)\'\s*\]|([^.\[\]]+)')
+
+_ORDERING_OPS = {
+    "<": _operator.lt,
+    "<=": _operator.le,
+    ">": _operator.gt,
+    ">=": _operator.ge,
+}
+
+_RESPONSE_KEYS = {
+    "status_code": lambda ctx: ctx.response.status_code,
+    "response_time": lambda ctx: ctx.response_time,
+    "content_length": lambda ctx: ctx.size(),
+    "size": lambda ctx: ctx.size(),
+    "text": lambda ctx: ctx.response.text,
+    "body": lambda ctx: ctx.response.text,
+}
+
+
+class _Context:
+    """평가 컨텍스트 (JSON 은 필요한 경우 한 번만 파싱)"""
+
+    __slots__ = ("response", "response_time", "_json")
+
+    def __init__(self, response: Any, response_time: float):
+        self.response = response
+        self.response_time = response_time
+        self._json = _MISSING
+
+    def json(self) -> Any:
+        if self._json is _MISSING:
+            try:
+                self._json = self.response.json() if self.size() else None
+            except Exception:
+                self._json = None
+        return self._json
+
+    def size(self) -> int:
+        size = getattr(self.response, "size", None)
+        if size is None:
+            content = getattr(self.response, "content", None)
+            size = len(content) if content else 0
+        return size
+
+
+def parse_json_path(key_path: str) -> Tuple[Union[str, int], ...]:
+    """``a.b[0]["c.d"]`` 형태의 경로를 세그먼트 튜플로 변환"""
+    segments: List[Union[str, int]] = []
+    for index, dq_key, sq_key, name in _PATH_TOKEN_RE.findall(key_path):
+        if index:
+            segments.append(int(index))
+        elif dq_key or sq_key:
+            segments.append(dq_key or sq_key)
+        elif name.strip():
+            segments.append(name.strip())
+    return tuple(segments)
+
+
+def resolve_json_path(data: Any, key_path: Union[str, Sequence[Union[str, int]]]) -> Any:
+    """JSON 데이터에서 경로 값을 찾아 반환 (없으면 None)"""
+    segments = parse_json_path(key_path) if isinstance(key_path, str) else key_path
+    current = data
+
+    for segment in segments:
+        if isinstance(current, dict):
+            if segment in current:
+                current = current[segment]
+            elif isinstance(segment, int) and str(segment) in current:
+                current = current[str(segment)]
+            else:
+                return None
+        elif isinstance(current, (list, tuple)):
+            try:
+                current = current[int(segment)]
+            except (ValueError, IndexError, TypeError):
+                return None
+        else:
+            return None
+
+    return current
+
+
+def _parse_literal(raw: str) -> Any:
+    """기준 값 문자열을 파이썬 값으로 변환"""
+    value = raw.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+
+    lowered = value.lower()
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+    if lowered in ("null", "none"):
+        return None
+
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _parse_list(raw: str) -> List[Any]:
+    """``[a, b]`` 또는 ``a, b`` 를 값 목록으로 변환"""
+    value = raw.strip()
+    if value.startswith("[") and value.endswith("]"):
+        value = value[1:-1]
+    items = []
+    for item in _split_top_level(value, ","):
+        if item.strip():
+            items.append(_parse_literal(item))
+    return items
+
+
+def _split_top_level(text: str, separator: str) -> List[str]:
+    """따옴표 밖의 구분자로 분리"""
+    parts, buf, quote = [], [], None
+    for ch in text:
+        if quote:
+            buf.append(ch)
+            if ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+            buf.append(ch)
+        elif ch == separator:
+            parts.append("".join(buf))
+            buf = []
+        else:
+            buf.append(ch)
+    parts.append("".join(buf))
+    return parts
+
+
+def _to_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(str(value).strip())
+    except ValueError:
+        return None
+
+
+def _values_equal(actual: Any, expected: Any) -> bool:
+    """타입을 고려한 동등 비교 (숫자/불리언/null 은 값으로, 나머지는 문자열로)"""
+    if expected is None:
+        return actual is None or str(actual).lower() in ("null", "none")
+    if isinstance(expected, bool):
+        if isinstance(actual, bool):
+            return actual is expected
+        return str(actual).lower() == str(expected).lower()
+    if isinstance(expected, (int, float)):
+        number = _to_number(actual)
+        return number is not None and number == expected
+    if actual is None:
+        return False
+    return str(actual) == expected
+
+
+class Criterion:
+    """단일 비교 기준 (컴파일된 술어)"""
+
+    __slots__ = ("source", "key", "op", "expected", "needs_body", "_getter", "_test")
+
+    def __init__(self, source: str, key: str, op: str, raw_value: str):
+        self.source = source
+        self.key = key
+        self.op = op
+        self._getter, self.needs_body = self._compile_getter(key)
+        self.expected, self._test = self._compile_test(op, raw_value)
+
+    @staticmethod
+    def _compile_getter(key: str) -> Tuple[Callable[[_Context], Any], bool]:
+        if key in _RESPONSE_KEYS:
+            return _RESPONSE_KEYS[key], key in ("text", "body")
+
+        lowered = key.lower()
+        if lowered.startswith("headers.") or lowered.startswith("header."):
+            header_name = key.split(".", 1)[1].lower()
+
+            def get_header(ctx: _Context) -> Any:
+                for name, value in (getattr(ctx.response, "headers", None) or {}).items():
+                    if name.lower() == header_name:
+                        return value
+                return None
+            return get_header, False
+
+        path = key[5:] if lowered.startswith("json.") else key
+        segments = parse_json_path(path)
+        if not segments:
+            raise ValueError(f"Invalid key path in success criteria: {key!r}")
+        return (lambda ctx: resolve_json_path(ctx.json(), segments)), True
+
+    @staticmethod
+    def _compile_test(op: str, raw_value: str) -> Tuple[Any, Callable[[Any], bool]]:
+        if op in ("==", "!="):
+            expected = _parse_literal(raw_value)
+            if op == "==":
+                return expected, lambda actual: _values_equal(actual, expected)
+            return expected, lambda actual: not _values_equal(actual, expected)
+
+        if op in _ORDERING_OPS:
+            expected = _parse_literal(raw_value)
+            threshold = _to_number(expected)
+            if threshold is None:
+                raise ValueError(f"Numeric value required for '{op}': {raw_value!r}")
+            compare = _ORDERING_OPS[op]
+
+            def test_ordering(actual: Any) -> bool:
+                number = _to_number(actual)
+                return number is not None and compare(number, threshold)
+            return threshold, test_ordering
+
+        if op in ("=~", "!~"):
+            pattern_text = _parse_literal(raw_value)
+            try:
+                pattern = re.compile(str(pattern_text))
+            except re.error as e:
+                raise ValueError(f"Invalid regular expression {raw_value!r}: {e}")
+            if op == "=~":
+                return pattern, lambda actual: actual is not None and pattern.search(str(actual)) is not None
+            return pattern, lambda actual: actual is None or pattern.search(str(actual)) is None
+
+        if op in ("in", "not in"):
+            options = _parse_list(raw_value)
+
+            def test_membership(actual: Any) -> bool:
+                return any(_values_equal(actual, option) for option in options)
+            if op == "in":
+                return options, test_membership
+            return options, lambda actual: not test_membership(actual)
+
+        raise ValueError(f"Unsupported operator: {op!r}")
+
+    def evaluate_context(self, ctx: _Context) -> bool:
+        try:
+            return bool(self._test(self._getter(ctx)))
+        except Exception:
+            return False
+
+    def actual_value_context(self, ctx: _Context) -> Any:
+        try:
+            return self._getter(ctx)
+        except Exception:
+            return None
+
+    def evaluate(self, response: Any, response_time: float = 0.0) -> bool:
+        """응답이 이 기준을 만족하는지 평가"""
+        return self.evaluate_context(_Context(response, response_time))
+
+    def __repr__(self) -> str:
+        return f"Criterion({self.source!r})"
+
+
+class _Group:
+    """and/or 그룹 노드"""
+
+    __slots__ = ("mode", "children")
+
+    def __init__(self, mode: str, children: List[Any]):
+        self.mode = mode
+        self.children = children
+
+    def evaluate_context(self, ctx: _Context) -> bool:
+        if self.mode == "or":
+            return any(child.evaluate_context(ctx) for child in self.children)
+        return all(child.evaluate_context(ctx) for child in self.children)
+
+    def leaves(self) -> Iterable[Criterion]:
+        for child in self.children:
+            if isinstance(child, _Group):
+                yield from child.leaves()
+            else:
+                yield child
+
+
+def _tokenize(expression: str) -> List[str]:
+    """
+    논리 연산자/괄호 기준으로 토큰 분리
+
+    비교식 내부의 괄호(예: 정규식 ``=~^(a|b)$``)는 균형이 맞으면 비교식의 일부로 취급합니다.
+    """
+    tokens: List[str] = []
+    buf: List[str] = []
+    quote: Optional[str] = None
+    leaf_depth = 0   # 비교식 내부 괄호/대괄호 깊이
+    i, n = 0, len(expression)
+
+    def flush():
+        text = "".join(buf).strip()
+        if text:
+            tokens.append(text)
+        buf.clear()
+
+    while i < n:
+        ch = expression[i]
+        if quote:
+            buf.append(ch)
+            if ch == quote:
+                quote = None
+            i += 1
+            continue
+        if ch in "\"'":
+            quote = ch
+            buf.append(ch)
+            i += 1
+            continue
+
+        at_leaf_start = not "".join(buf).strip()
+        if leaf_depth == 0:
+            if ch == "(" and at_leaf_start:
+                tokens.append("(")
+                i += 1
+                continue
+            if ch == ")":
+                flush()
+                tokens.append(")")
+                i += 1
+                continue
+            if expression.startswith("&&", i) or expression.startswith("||", i):
+                flush()
+                tokens.append("and" if ch == "&" else "or")
+                i += 2
+                continue
+            match = _LOGICAL_RE.match(expression, i)
+            if match and (not at_leaf_start or (tokens and tokens[-1] == ")")):
+                flush()
+                tokens.append(match.group(1).lower())
+                i = match.end()
+                continue
+
+        if ch in "([":
+            leaf_depth += 1
+        elif ch in ")]" and leaf_depth > 0:
+            leaf_depth -= 1
+        buf.append(ch)
+        i += 1
+
+    flush()
+    return tokens
+
+
+class _Parser:
+    """재귀 하강 파서: or_expr := and_expr ('or' and_expr)* ; and_expr := atom ('and' atom)*"""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.tokens = _tokenize(source)
+        self.pos = 0
+
+    def parse(self):
+        if not self.tokens:
+            raise ValueError(f"Empty success criterion: {self.source!r}")
+        node = self._or_expr()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Unexpected token {self.tokens[self.pos]!r} in success criterion: {self.source!r}")
+        return node
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _or_expr(self):
+        children = [self._and_expr()]
+        while self._peek() == "or":
+            self.pos += 1
+            children.append(self._and_expr())
+        return children[0] if len(children) == 1 else _Group("or", children)
+
+    def _and_expr(self):
+        children = [self._atom()]
+        while self._peek() == "and":
+            self.pos += 1
+            children.append(self._atom())
+        return children[0] if len(children) == 1 else _Group("and", children)
+
+    def _atom(self):
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"Incomplete success criterion: {self.source!r}")
+        self.pos += 1
+        if token == "(":
+            node = self._or_expr()
+            if self._peek() != ")":
+                raise ValueError(f"Missing ')' in success criterion: {self.source!r}")
+            self.pos += 1
+            return node
+        if token in ("and", "or", ")"):
+            raise ValueError(f"Unexpected {token!r} in success criterion: {self.source!r}")
+        return _compile_comparison(token)
+
+
+def _compile_comparison(text: str) -> Criterion:
+    match = _COMPARISON_RE.match(text)
+    if not match:
+        raise ValueError(f"Invalid success criterion: {text!r}")
+    op = " ".join(match.group("op").split())
+    return Criterion(text, match.group("key"), op, match.group("value"))
+
+
+class SuccessCriteria:
+    """
+    컴파일된 성공 기준
+
+    기준 목록은 ``operator`` (and/or) 로 결합되며, 각 항목은 그 자체로 and/or/괄호를 포함한
+    식일 수 있습니다. 기준이 비어 있으면 2xx 응답을 성공으로 판정합니다
+    (``pawns http`` 는 기존처럼 비어 있으면 ``status_code==200`` 을 씁니다).
+    """
+
+    __slots__ = ("criteria", "operator", "_root", "needs_body")
+
+    def __init__(self, criteria: Sequence[str] = (), operator: str = "and"):
+        self.criteria = tuple(c for c in criteria if c)
+        self.operator = "or" if str(operator).lower() == "or" else "and"
+        children = [_Parser(str(c)).parse() for c in self.criteria]
+
+        if not children:
+            self._root = None
+        elif len(children) == 1:
+            self._root = children[0]
+        else:
+            self._root = _Group(self.operator, children)
+
+        self.needs_body = any(leaf.needs_body for leaf in self.leaves())
+
+    def leaves(self) -> List[Criterion]:
+        """모든 단일 비교 기준"""
+        if self._root is None:
+            return []
+        if isinstance(self._root, _Group):
+            return list(self._root.leaves())
+        return [self._root]
+
+    def evaluate(self, response: Any, response_time: float = 0.0) -> bool:
+        """응답이 성공 기준을 만족하는지 평가"""
+        if self._root is None:
+            return 200 <= response.status_code < 300
+        return self._root.evaluate_context(_Context(response, response_time))
+
+    __call__ = evaluate
+
+    def explain(self, response: Any, response_time: float = 0.0) -> List[Tuple[str, Any, bool]]:
+        """기준별 (원문, 실제 값, 결과) 목록 반환 (디버그 출력용)"""
+        ctx = _Context(response, response_time)
+        return [
+            (leaf.source, leaf.actual_value_context(ctx), leaf.evaluate_context(ctx))
+            for leaf in self.leaves()
+        ]
+
+    def __repr__(self) -> str:
+        return f"SuccessCriteria({list(self.criteria)!r}, operator={self.operator!r})"
+
+
+def compile_criteria(
+    criteria: Union[str, Sequence[Optional[str]], None],
+    operator: str = "and",
+) -> SuccessCriteria:
+    """
+    성공 기준 컴파일
+
+    Args:
+        criteria: 기준 문자열 또는 목록 (예: ``["status_code==200", "response_time<1"]``)
+        operator: 목록 항목을 결합할 논리 연산자 (``and`` / ``or``)
+
+    Raises:
+        ValueError: 기준 문법이 잘못된 경우
+    """
+    if criteria is None:
+        criteria = []
+    elif isinstance(criteria, str):
+        criteria = [criteria]
+    return SuccessCriteria([c for c in criteria if c], operator)
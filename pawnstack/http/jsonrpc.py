@@ -0,0 +1,254 @@
+"""
+JSON-RPC 2.0 배치 전송
+
+요청을 하나씩 POST 하고 응답을 기다리는 대신
+
+    - 요청을 ``batch_size`` 개씩 JSON-RPC 배치 배열로 묶어 한 번에 보내고
+    - 여러 배치를 ``concurrency`` 개까지 동시에 같은 keep-alive 커넥션 풀로 전송하며
+    - 응답 배열은 순서가 아니라 ``id`` 로 요청과 다시 연결합니다.
+
+배치 파일은 JSON 배열 또는 JSON Lines 형식이며 한 요청씩 읽으므로 10만 건 파일도
+메모리에 전부 올리지 않습니다. 배치를 지원하지 않는 서버 (응답이 배열이 아님) 는
+해당 배치를 개별 요청으로 나눠 동시에 다시 보냅니다.
+
+Example:
+    async with HttpClient() as client:
+        batcher = JsonRpcBatcher(client, "http://localhost:9000/api/v3", batch_size=100, concurrency=4)
+        async for result in batcher.run(iter_batch_file("requests.jsonl")):
+            print(result["request_id"], result["success"])
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .client import HttpClient
+
+__all__ = ["JsonRpcBatcher", "iter_batch_file"]
+
+_READ_SIZE = 64 * 1024
+_SEPARATORS = " \t\r\n,"
+
+
+def _iter_json_array(f, buffer: str) -> Iterator[Any]:
+    """``[`` 뒤부터 배열 원소를 하나씩 디코딩"""
+    decoder = json.JSONDecoder()
+    pos = 0
+    eof = False
+    while True:
+        # 공백과 구분자 건너뛰기
+        while True:
+            while pos < len(buffer) and buffer[pos] in _SEPARATORS:
+                pos += 1
+            if pos < len(buffer) or eof:
+                break
+            chunk = f.read(_READ_SIZE)
+            buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+
+        if pos >= len(buffer):
+            raise ValueError("Unterminated JSON array in batch file")
+        if buffer[pos] == "]":
+            return
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            value, end = None, -1
+        # 버퍼 끝에서 끝난 값은 잘렸을 수 있으므로 더 읽고 다시 디코딩
+        if end < 0 or (end == len(buffer) and not eof):
+            if eof:
+                raise ValueError(f"Invalid JSON in batch file near: {buffer[pos:pos + 80]!r}")
+            chunk = f.read(_READ_SIZE)
+            buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+            continue
+        yield value
+        pos = end
+        # 처리한 앞부분은 버려 버퍼가 커지지 않게 함
+        if pos > _READ_SIZE:
+            buffer, pos = buffer[pos:], 0
+
+
+def iter_batch_file(path: Union[str, Path]) -> Iterator[Any]:
+    """
+    배치 파일에서 요청을 하나씩 읽기
+
+    첫 문자가 ``[`` 이면 JSON 배열을 점진적으로 디코딩하고, 아니면 JSON Lines (빈 줄 무시) 로 읽습니다.
+    형식 오류는 ValueError 입니다.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(_READ_SIZE)
+        stripped = head.lstrip()
+        if stripped.startswith("["):
+            yield from _iter_json_array(f, stripped[1:])
+            return
+
+        pending = head
+        line_number = 0
+        while True:
+            chunk = f.read(_READ_SIZE)
+            lines = (pending + chunk).split("\n")
+            # 마지막 줄은 다음 청크와 이어질 수 있음
+            pending = lines.pop() if chunk else ""
+            for line in lines:
+                line_number += 1
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise ValueError(f"Invalid JSON on line {line_number}: {e}") from None
+            if not chunk:
+                return
+
+
+class JsonRpcBatcher:
+    """
+    JSON-RPC 배치 전송기
+
+    Args:
+        client: 커넥션 풀을 가진 HTTP 클라이언트 (호출자가 닫음)
+        url: JSON-RPC 엔드포인트
+        batch_size: 배치 하나에 담을 요청 수 (1 이면 배치 없이 개별 요청)
+        concurrency: 동시에 전송 중인 배치 수
+        timeout: 요청 타임아웃 (초)
+        headers: 추가 헤더
+    """
+
+    def __init__(
+        self,
+        client: HttpClient,
+        url: str,
+        batch_size: int = 100,
+        concurrency: int = 4,
+        timeout: float = 30.0,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        if batch_size < 1 or concurrency < 1:
+            raise ValueError("batch_size and concurrency must be >= 1")
+        self.client = client
+        self.url = url
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.stats = {"requests": 0, "succeeded": 0, "failed": 0, "batches": 0, "fallbacks": 0}
+
+    @staticmethod
+    def _result(request_id: int, request: Any, response: Any = None, error: Optional[str] = None) -> Dict[str, Any]:
+        result = {
+            "request_id": request_id,
+            "id": request.get("id") if isinstance(request, dict) else None,
+            "method": request.get("method") if isinstance(request, dict) else None,
+            "success": error is None,
+        }
+        if error is None:
+            result["response"] = response
+        else:
+            result["error"] = error
+        return result
+
+    def _chunks(self, requests: Iterable[Any]) -> Iterator[Tuple[List[Tuple[int, Dict[str, Any]]], List[Dict[str, Any]]]]:
+        """
+        (배치, 형식 오류 결과) 를 하나씩 생성
+
+        ``jsonrpc``/``id`` 가 없으면 채우고 (id 는 파일 내 순번), 배치 안에서 id 가 겹치면
+        응답을 구분할 수 없으므로 새 배치를 시작합니다.
+        """
+        chunk: List[Tuple[int, Dict[str, Any]]] = []
+        ids = set()
+        invalid: List[Dict[str, Any]] = []
+        for index, request in enumerate(requests):
+            request_id = index + 1
+            if not isinstance(request, dict):
+                invalid.append(self._result(request_id, request, error="Request is not a valid JSON object"))
+                continue
+            request.setdefault("jsonrpc", "2.0")
+            request.setdefault("id", request_id)
+            key = json.dumps(request["id"])
+            if len(chunk) >= self.batch_size or key in ids:
+                yield chunk, invalid
+                chunk, ids, invalid = [], set(), []
+            chunk.append((request_id, request))
+            ids.add(key)
+        if chunk or invalid:
+            yield chunk, invalid
+
+    async def _post(self, payload: Any) -> Tuple[Any, Optional[str]]:
+        """(응답 JSON, 오류) - HTTP/전송/파싱 오류는 문자열로"""
+        try:
+            response = await self.client.post(self.url, json=payload, timeout=self.timeout, headers=self.headers)
+        except Exception as e:
+            return None, f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+        if response.status_code != 200:
+            return None, f"HTTP {response.status_code}: {response.text[:200]}"
+        try:
+            return response.json(), None
+        except ValueError as e:
+            return None, f"Invalid JSON response: {e}"
+
+    async def _send_single(self, request_id: int, request: Dict[str, Any]) -> Dict[str, Any]:
+        body, error = await self._post(request)
+        return self._result(request_id, request, body, error)
+
+    async def _send_chunk(self, chunk: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """배치 하나 전송 후 id 로 응답을 다시 연결"""
+        if len(chunk) == 1:
+            return [await self._send_single(*chunk[0])]
+
+        self.stats["batches"] += 1
+        body, error = await self._post([request for _, request in chunk])
+        if error is not None:
+            return [self._result(request_id, request, error=error) for request_id, request in chunk]
+
+        if not isinstance(body, list):
+            # 배치 미지원 (또는 배치 자체 거부): 개별 요청으로 나눠 동시에 전송
+            self.stats["fallbacks"] += 1
+            return list(await asyncio.gather(*(self._send_single(*item) for item in chunk)))
+
+        responses = {json.dumps(item.get("id")): item for item in body if isinstance(item, dict)}
+        results = []
+        for request_id, request in chunk:
+            response = responses.get(json.dumps(request["id"]))
+            if response is None:
+                results.append(self._result(request_id, request, error="No response for request id in batch"))
+            else:
+                results.append(self._result(request_id, request, response))
+        return results
+
+    async def run(self, requests: Iterable[Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        요청을 배치로 전송하고 결과를 배치가 끝나는 순서대로 반환
+
+        결과의 ``success`` 는 전송 성공 여부이며, JSON-RPC 오류 응답은 ``response["error"]`` 에 있습니다.
+        """
+        chunks = self._chunks(requests)
+        pending = set()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < self.concurrency:
+                    try:
+                        chunk, invalid = next(chunks)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    for result in invalid:
+                        self._count(result)
+                        yield result
+                    if chunk:
+                        pending.add(asyncio.ensure_future(self._send_chunk(chunk)))
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for result in task.result():
+                        self._count(result)
+                        yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def _count(self, result: Dict[str, Any]):
+        self.stats["requests"] += 1
+        self.stats["succeeded" if result["success"] else "failed"] += 1
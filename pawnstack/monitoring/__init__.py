@@ -5,8 +5,12 @@ HTTP 모니터링, 성능 측정, 실시간 대시보드, 벤치마킹 및 회
 """
 
 from .http_monitor import HTTPMonitor, HTTPMonitorConfig, MonitorResult
-from .performance import PerformanceMonitor, BenchmarkResult, PerformanceMetrics
+from .performance import PerformanceMonitor, BenchmarkResult, PerformanceMetrics, LoadStage, BenchmarkRecorder
 from .benchmark import BenchmarkManager, BenchmarkBaseline, RegressionTestConfig, RegressionTestResult
+from .scheduler import FixedRateScheduler, ScheduleStats
+from .stats import RollingStats, P2Quantile
+from .histogram import LatencyHistogram
+from .timeseries import TimeSeriesBuffer
 
 # 편의 함수들
 from .http_monitor import monitor_single_url, monitor_multiple_urls
@@ -21,10 +25,18 @@ __all__ = [
     'PerformanceMonitor',
     'BenchmarkResult',
     'PerformanceMetrics',
+    'LoadStage',
+    'BenchmarkRecorder',
     'BenchmarkManager',
     'BenchmarkBaseline',
     'RegressionTestConfig',
     'RegressionTestResult',
+    'FixedRateScheduler',
+    'ScheduleStats',
+    'RollingStats',
+    'P2Quantile',
+    'LatencyHistogram',
+    'TimeSeriesBuffer',
 
     # 편의 함수들
     'monitor_single_url',
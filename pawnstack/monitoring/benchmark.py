@@ -3,6 +3,9 @@
 
 HTTP 요청 성능 측정, 메모리 사용량 모니터링, 성능 회귀 테스트를 위한
 벤치마크 기준 설정 및 비교 기능을 제공합니다.
+
+기준선에는 지연시간 히스토그램 전체가 압축 저장되며, 회귀 테스트는 p95/p99 단일 값뿐 아니라
+분포의 여러 백분위수 (p50 ~ p99.9) 를 비교합니다.
 """
 
 import asyncio
@@ -22,6 +25,12 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeEl
 from rich.text import Text
 
 from .performance import PerformanceMonitor, BenchmarkResult
+from .histogram import LatencyHistogram
+
+# 분포 비교에 사용할 백분위수
+DISTRIBUTION_PERCENTILES = (50, 75, 90, 95, 99, 99.9)
+# 꼬리 백분위수를 비교하려면 해당 백분위수 위에 최소 이만큼의 샘플이 있어야 함
+_MIN_TAIL_SAMPLES = 5
 
 
 @dataclass
@@ -33,6 +42,7 @@ class BenchmarkBaseline:
     metrics: Dict[str, float]
     environment: Dict[str, Any] = field(default_factory=dict)
     description: Optional[str] = None
+    histogram: Optional[LatencyHistogram] = None  # 응답시간 분포
 
 
 @dataclass
@@ -95,7 +105,8 @@ class BenchmarkManager:
                     timestamp=datetime.fromisoformat(data['timestamp']),
                     metrics=data['metrics'],
                     environment=data.get('environment', {}),
-                    description=data.get('description')
+                    description=data.get('description'),
+                    histogram=LatencyHistogram.decode(data['histogram']) if data.get('histogram') else None
                 )
 
                 self.baselines[baseline.name] = baseline
@@ -112,22 +123,32 @@ class BenchmarkManager:
         requests: int = 200,
         concurrency: int = 10,
         description: Optional[str] = None,
+        runs: int = 1,
         **kwargs
     ) -> BenchmarkBaseline:
-        """새로운 성능 기준선 생성"""
+        """
+        새로운 성능 기준선 생성
+
+        Args:
+            runs: 벤치마크 반복 횟수. 여러 번 실행하면 히스토그램을 병합하고
+                스칼라 메트릭은 평균을 사용하여 실행 간 편차를 줄입니다.
+        """
         self.console.print(f"[blue]성능 기준선 생성 중: {name} (v{version})[/blue]")
 
         # 벤치마크 실행
-        result = asyncio.run(
-            self.performance_monitor.run_benchmark(
-                name=f"{name}_baseline",
-                url=url,
-                method=method,
-                concurrent_requests=concurrency,
-                total_requests=requests,
-                **kwargs
+        results = [
+            asyncio.run(
+                self.performance_monitor.run_benchmark(
+                    name=f"{name}_baseline",
+                    url=url,
+                    method=method,
+                    concurrent_requests=concurrency,
+                    total_requests=requests,
+                    **kwargs
+                )
             )
-        )
+            for _ in range(max(1, runs))
+        ]
 
         # 환경 정보 수집
         import platform
@@ -141,19 +162,19 @@ class BenchmarkManager:
             "timestamp": datetime.now().isoformat()
         }
 
-        # 기준선 메트릭 추출
-        metrics = {
-            "requests_per_second": result.requests_per_second,
-            "avg_response_time": result.avg_response_time,
-            "p95_response_time": result.percentiles.get(95, 0),
-            "p99_response_time": result.percentiles.get(99, 0),
-            "error_rate": result.error_rate,
-            "throughput_bytes_per_sec": result.throughput_bytes_per_sec,
-            "peak_memory_mb": result.memory_usage.get('peak', 0),
-            "avg_memory_mb": result.memory_usage.get('average', 0),
-            "peak_cpu_percent": result.cpu_usage.get('peak', 0),
-            "avg_cpu_percent": result.cpu_usage.get('average', 0)
-        }
+        # 실행별 히스토그램 병합
+        histogram = None
+        for result in results:
+            if result.histogram is not None:
+                histogram = result.histogram.copy() if histogram is None else histogram.merge(result.histogram)
+
+        # 기준선 메트릭 추출 (실행 간 평균, 백분위수는 병합된 분포 기준)
+        run_metrics = [self._extract_metrics(result) for result in results]
+        metrics = {key: statistics.mean(m[key] for m in run_metrics) for key in run_metrics[0]}
+        if histogram is not None and histogram.count:
+            metrics["avg_response_time"] = histogram.mean
+            metrics["p95_response_time"] = histogram.percentile(95)
+            metrics["p99_response_time"] = histogram.percentile(99)
 
         baseline = BenchmarkBaseline(
             name=name,
@@ -161,7 +182,8 @@ class BenchmarkManager:
             timestamp=datetime.now(),
             metrics=metrics,
             environment=environment,
-            description=description
+            description=description,
+            histogram=histogram
         )
 
         # 기준선 저장
@@ -183,7 +205,9 @@ class BenchmarkManager:
             "timestamp": baseline.timestamp.isoformat(),
             "metrics": baseline.metrics,
             "environment": baseline.environment,
-            "description": baseline.description
+            "description": baseline.description,
+            # 압축 인코딩된 응답시간 히스토그램 (수 KB)
+            "histogram": baseline.histogram.encode() if baseline.histogram is not None else None
         }
 
         with open(filename, 'w', encoding='utf-8') as f:
@@ -227,6 +251,12 @@ class BenchmarkManager:
                 else:
                     table.add_row(label, f"{value:.2f} {unit}")
 
+        if baseline.histogram is not None and baseline.histogram.count:
+            table.add_row("", "")  # 구분선
+            table.add_row("분포 샘플 수", f"{baseline.histogram.count:,}")
+            for p in DISTRIBUTION_PERCENTILES:
+                table.add_row(f"p{p:g}", f"{baseline.histogram.percentile(p):.3f} 초")
+
         self.console.print(table)
 
     def list_baselines(self) -> List[BenchmarkBaseline]:
@@ -366,18 +396,7 @@ class BenchmarkManager:
         changes = {}
 
         # 현재 결과에서 메트릭 추출
-        current_metrics = {
-            "requests_per_second": current.requests_per_second,
-            "avg_response_time": current.avg_response_time,
-            "p95_response_time": current.percentiles.get(95, 0),
-            "p99_response_time": current.percentiles.get(99, 0),
-            "error_rate": current.error_rate,
-            "throughput_bytes_per_sec": current.throughput_bytes_per_sec,
-            "peak_memory_mb": current.memory_usage.get('peak', 0),
-            "avg_memory_mb": current.memory_usage.get('average', 0),
-            "peak_cpu_percent": current.cpu_usage.get('peak', 0),
-            "avg_cpu_percent": current.cpu_usage.get('average', 0)
-        }
+        current_metrics = self._extract_metrics(current)
 
         # 각 메트릭별 변화율 계산
         for metric_name in baseline.metrics:
@@ -396,6 +415,54 @@ class BenchmarkManager:
                     "change_percent": change_percent
                 }
 
+        # 응답시간 분포 비교 (양쪽 모두 히스토그램이 있는 경우)
+        if baseline.histogram is not None and current.histogram is not None:
+            changes.update(self._compare_distributions(baseline.histogram, current.histogram))
+
+        return changes
+
+    @staticmethod
+    def _extract_metrics(result: BenchmarkResult) -> Dict[str, float]:
+        """벤치마크 결과에서 기준선 메트릭 추출"""
+        return {
+            "requests_per_second": result.requests_per_second,
+            "avg_response_time": result.avg_response_time,
+            "p95_response_time": result.percentile(95),
+            "p99_response_time": result.percentile(99),
+            "error_rate": result.error_rate,
+            "throughput_bytes_per_sec": result.throughput_bytes_per_sec,
+            "peak_memory_mb": result.memory_usage.get('peak', 0),
+            "avg_memory_mb": result.memory_usage.get('average', 0),
+            "peak_cpu_percent": result.cpu_usage.get('peak', 0),
+            "avg_cpu_percent": result.cpu_usage.get('average', 0)
+        }
+
+    @staticmethod
+    def _compare_distributions(
+        baseline: LatencyHistogram,
+        current: LatencyHistogram
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        두 응답시간 분포를 백분위수별로 비교 (``latency_p{p}`` 키)
+
+        샘플 수가 부족해 사실상 최대값이 되는 꼬리 백분위수는 비교하지 않습니다.
+        """
+        changes = {}
+        samples = min(baseline.count, current.count)
+
+        for p in DISTRIBUTION_PERCENTILES:
+            if samples * (100 - p) / 100 < _MIN_TAIL_SAMPLES:
+                continue
+            baseline_value = baseline.percentile(p)
+            current_value = current.percentile(p)
+            change_percent = ((current_value - baseline_value) / baseline_value * 100) if baseline_value > 0 else 0
+
+            changes[f"latency_p{p:g}"] = {
+                "baseline": baseline_value,
+                "current": current_value,
+                "change_percent": change_percent
+            }
+
         return changes
 
     def _detect_regression(
@@ -417,6 +484,11 @@ class BenchmarkManager:
         regression_detected = False
         severity = "none"
 
+        # 분포 백분위수는 모두 낮을수록 좋음
+        for metric in changes:
+            if metric.startswith("latency_p"):
+                important_metrics[metric] = False
+
         for metric, is_higher_better in important_metrics.items():
             if metric not in changes:
                 continue
@@ -487,7 +559,7 @@ class BenchmarkManager:
                     change_color = "green"  # 낮을수록 좋은 메트릭
 
             # 값 포맷팅
-            if metric.endswith("_time"):
+            if metric.endswith("_time") or metric.startswith("latency_p"):
                 baseline_str = f"{baseline_val:.3f}s"
                 current_str = f"{current_val:.3f}s"
             elif metric.endswith("_rate") or metric.endswith("_percent"):
@@ -0,0 +1,200 @@
+"""
+HDR 스타일 로그-선형 지연시간 히스토그램
+
+값을 마이크로초 정수로 변환한 뒤 2의 거듭제곱 구간마다 ``2 ** (sub_bucket_bits - 1)`` 개의
+선형 하위 버킷에 누적합니다. 상대 오차는 ``1 / 2 ** (sub_bucket_bits - 1)`` 이하이며
+(기본 7 비트 → 약 1.6%), 기록은 O(1), 메모리는 값의 범위에만 비례합니다.
+
+    - 임의 백분위수 조회 (p50, p99, p99.9 ...)
+    - 히스토그램 병합 (여러 워커/프로세스 결과 합산)
+    - 딕셔너리 직렬화 (프로세스 간 전송) 및 압축 문자열 인코딩 (기준선 파일 저장)
+"""
+
+import base64
+import json
+import math
+import zlib
+from typing import Any, Dict, Iterable, Iterator, Sequence, Tuple
+
+# 기록 단위: 1 마이크로초
+_UNITS_PER_SECOND = 1_000_000
+# encode() 문자열 형식 버전
+_ENCODING_PREFIX = "lh1:"
+
+
+class LatencyHistogram:
+    """
+    로그-선형 지연시간 히스토그램 (초 단위 입력)
+
+    Args:
+        sub_bucket_bits: 2의 거듭제곱 구간당 해상도 비트 수 (클수록 정밀, 버킷 수 증가)
+    """
+
+    __slots__ = ("sub_bucket_bits", "_sub_count", "_half_count", "_counts", "count", "total", "min", "max")
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        if not 2 <= sub_bucket_bits <= 16:
+            raise ValueError(f"sub_bucket_bits must be between 2 and 16: {sub_bucket_bits}")
+        self.sub_bucket_bits = sub_bucket_bits
+        self._sub_count = 1 << sub_bucket_bits
+        self._half_count = self._sub_count >> 1
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, units: int) -> int:
+        if units < self._sub_count:
+            return units
+        shift = units.bit_length() - self.sub_bucket_bits
+        return self._sub_count + (shift - 1) * self._half_count + (units >> shift) - self._half_count
+
+    def _bounds(self, index: int) -> Tuple[int, int]:
+        """버킷의 [하한, 상한) (마이크로초)"""
+        if index < self._sub_count:
+            return index, index + 1
+        offset = index - self._sub_count
+        shift = offset // self._half_count + 1
+        lower = (offset % self._half_count + self._half_count) << shift
+        return lower, lower + (1 << shift)
+
+    def record(self, value: float, count: int = 1):
+        """값 기록 (초). 음수는 0 으로 취급"""
+        if value < 0:
+            value = 0.0
+        index = self._index(int(value * _UNITS_PER_SECOND))
+        self._counts[index] = self._counts.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def extend(self, values: Iterable[float]):
+        """여러 값 기록"""
+        for value in values:
+            self.record(value)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """다른 히스토그램을 현재 히스토그램에 합산 (self 반환)"""
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError(
+                f"Cannot merge histograms with different resolution: "
+                f"{self.sub_bucket_bits} != {other.sub_bucket_bits}"
+            )
+        counts = self._counts
+        for index, bucket_count in other._counts.items():
+            counts[index] = counts.get(index, 0) + bucket_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def reset(self):
+        """기록 초기화"""
+        self._counts.clear()
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """
+        백분위수 (초)
+
+        Args:
+            p: 0~100 사이 백분위 (예: 99.9)
+        """
+        if not 0 <= p <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100: {p}")
+        if not self.count:
+            return 0.0
+        if p == 0:
+            return self.min
+        if p == 100:
+            return self.max
+
+        rank = max(1, math.ceil(p / 100 * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                lower, upper = self._bounds(index)
+                value = (lower + upper - 1) / 2 / _UNITS_PER_SECOND
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def percentiles(self, ps: Sequence[float] = (50, 90, 95, 99)) -> Dict[float, float]:
+        """여러 백분위수를 한 번에 조회"""
+        return {p: self.percentile(p) for p in ps}
+
+    def buckets(self) -> Iterator[Tuple[float, float, int]]:
+        """비어 있지 않은 버킷 ``(하한 초, 상한 초, 개수)`` 을 값 순서대로 반환"""
+        for index in sorted(self._counts):
+            lower, upper = self._bounds(index)
+            yield lower / _UNITS_PER_SECOND, upper / _UNITS_PER_SECOND, self._counts[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화 (비어 있지 않은 버킷만 ``[index, count]`` 목록으로 저장)"""
+        return {
+            "sub_bucket_bits": self.sub_bucket_bits,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "buckets": [[index, self._counts[index]] for index in sorted(self._counts)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """``to_dict()`` 결과로부터 복원"""
+        histogram = cls(data.get("sub_bucket_bits", 7))
+        histogram._counts = {int(index): int(count) for index, count in data.get("buckets", [])}
+        histogram.count = int(data.get("count", 0))
+        histogram.total = float(data.get("total", 0.0))
+        if histogram.count:
+            histogram.min = float(data["min"])
+            histogram.max = float(data["max"])
+        return histogram
+
+    def encode(self) -> str:
+        """zlib 압축 + base64 문자열로 인코딩 (수백만 샘플도 수 KB)"""
+        payload = json.dumps(self.to_dict(), separators=(",", ":")).encode()
+        return _ENCODING_PREFIX + base64.b64encode(zlib.compress(payload, 9)).decode("ascii")
+
+    @classmethod
+    def decode(cls, encoded: str) -> "LatencyHistogram":
+        """``encode()`` 결과로부터 복원
+
+        Raises:
+            ValueError: 형식이 잘못된 경우
+        """
+        if not encoded.startswith(_ENCODING_PREFIX):
+            raise ValueError("Unsupported histogram encoding")
+        try:
+            payload = zlib.decompress(base64.b64decode(encoded[len(_ENCODING_PREFIX):]))
+            return cls.from_dict(json.loads(payload))
+        except (zlib.error, ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid histogram encoding: {e}") from None
+
+    def copy(self) -> "LatencyHistogram":
+        clone = LatencyHistogram(self.sub_bucket_bits)
+        return clone.merge(self)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        if not self.count:
+            return "LatencyHistogram(count=0)"
+        return (
+            f"LatencyHistogram(count={self.count}, mean={self.mean:.6f}, "
+            f"p50={self.percentile(50):.6f}, p99={self.percentile(99):.6f}, max={self.max:.6f})"
+        )
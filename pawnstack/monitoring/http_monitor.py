@@ -9,20 +9,26 @@ import asyncio
 import time
 import json
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Union, Callable
+from typing import List, Dict, Any, Optional, Sequence, Union, Callable
 from datetime import datetime, timedelta
 from collections import deque
 
 from rich.console import Console
 from rich.table import Table
-from rich.live import Live
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.layout import Layout
 from rich.text import Text
 
 from pawnstack.http.client import HttpClient, HttpResponse
+from pawnstack.http.criteria import SuccessCriteria, compile_criteria, resolve_json_path
 from pawnstack.typing.validators import is_valid_url
+from pawnstack.monitoring.stats import RollingStats
+from pawnstack.monitoring.timeseries import TimeSeriesBuffer, resample
+from pawnstack.output.dashboard import DashboardRenderer
+
+
+HISTORY_COLUMNS = ("response_time", "success")
 
 
 @dataclass
@@ -39,6 +45,9 @@ class HTTPMonitorConfig:
     name: Optional[str] = None
     verify_ssl: bool = True
     max_history: int = 100
+    max_body_size: Optional[int] = None  # 보관할 최대 본문 바이트 (0: 본문 버림)
+    discard_unused_body: bool = False  # 기준이 본문을 보지 않으면 본문을 버리고 크기만 기록
+    criteria: SuccessCriteria = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """초기화 후 처리"""
@@ -48,6 +57,9 @@ class HTTPMonitorConfig:
         if not is_valid_url(self.url):
             raise ValueError(f"Invalid URL: {self.url}")
 
+        # 성공 기준은 한 번만 컴파일
+        self.criteria = compile_criteria(self.success_criteria, self.logical_operator)
+
 
 @dataclass
 class MonitorResult:
@@ -76,20 +88,34 @@ class HTTPMonitor:
         self.configs: List[HTTPMonitorConfig] = []
         self.results: Dict[str, deque] = {}
         self.statistics: Dict[str, Dict[str, Any]] = {}
-        self.response_time_history: Dict[str, deque] = {}  # sparkline용 히스토리
-        self.status_history: Dict[str, deque] = {}  # 상태 히스토리
+        self.response_stats: Dict[str, RollingStats] = {}  # 엔드포인트별 고정 메모리 응답 시간 통계
+        # 엔드포인트별 sparkline/그래프용 히스토리 (response_time 초, success 1/0)
+        self.history: Dict[str, TimeSeriesBuffer] = {}
+        # 결과가 저장될 때마다 증가 (대시보드 영역의 변경 키)
+        self.version = 0
+        # 엔드포인트별 그래프 마크업 캐시 {name: (key, markup)}
+        self._graph_cache: Dict[str, tuple] = {}
         self.client = HttpClient()
         self.is_running = False
         self._tasks: List[asyncio.Task] = []
         # 터미널 너비 감지
         self.terminal_width = self.console.width
 
+    @property
+    def response_time_history(self) -> Dict[str, List[float]]:
+        """엔드포인트별 최근 응답 시간 (초, 읽기 전용 복사본)"""
+        return {name: history.values("response_time") for name, history in self.history.items()}
+
+    @property
+    def status_history(self) -> Dict[str, List[int]]:
+        """엔드포인트별 최근 성공 여부 (1/0, 읽기 전용 복사본)"""
+        return {name: [int(value) for value in history.values("success")] for name, history in self.history.items()}
+
     def add_endpoint(self, config: HTTPMonitorConfig):
         """모니터링할 엔드포인트 추가"""
         self.configs.append(config)
         self.results[config.name] = deque(maxlen=config.max_history)
-        self.response_time_history[config.name] = deque(maxlen=60)  # 60개 데이터 포인트 유지
-        self.status_history[config.name] = deque(maxlen=60)  # 성공/실패 히스토리
+        self.history[config.name] = TimeSeriesBuffer(HISTORY_COLUMNS, capacity=60)  # 60개 데이터 포인트 유지
         self.statistics[config.name] = {
             'total_requests': 0,
             'successful_requests': 0,
@@ -99,8 +125,13 @@ class HTTPMonitor:
             'min_response_time': float('inf'),
             'max_response_time': 0.0,
             'last_check': None,
-            'uptime_percentage': 0.0
+            'uptime_percentage': 0.0,
+            'ewma_response_time': 0.0,
+            'p50_response_time': 0.0,
+            'p95_response_time': 0.0,
+            'p99_response_time': 0.0,
         }
+        self.response_stats[config.name] = RollingStats()
 
     def remove_endpoint(self, name: str):
         """엔드포인트 제거"""
@@ -109,17 +140,24 @@ class HTTPMonitor:
             del self.results[name]
         if name in self.statistics:
             del self.statistics[name]
+        self.response_stats.pop(name, None)
 
     def clear_endpoints(self):
         """모든 엔드포인트 제거"""
         self.configs.clear()
         self.results.clear()
         self.statistics.clear()
+        self.response_stats.clear()
 
     async def check_endpoint(self, config: HTTPMonitorConfig) -> MonitorResult:
         """단일 엔드포인트 체크"""
         start_time = time.time()
 
+        # discard_unused_body 이고 본문을 참조하는 기준이 없으면 본문은 버리고 크기만 기록
+        max_body_size = config.max_body_size
+        if max_body_size is None and config.discard_unused_body and not config.criteria.needs_body:
+            max_body_size = 0
+
         try:
             # HTTP 요청 실행
             response = await self.client.request(
@@ -129,15 +167,14 @@ class HTTPMonitor:
                 json=config.data if isinstance(config.data, dict) else None,
                 data=config.data if isinstance(config.data, str) else None,
                 timeout=config.timeout,
-                verify_ssl=config.verify_ssl
+                verify_ssl=config.verify_ssl,
+                max_body_size=max_body_size
             )
 
             response_time = time.time() - start_time
 
             # 성공 기준 검사
-            success = self._check_success_criteria(
-                response, response_time, config.success_criteria, config.logical_operator
-            )
+            success = config.criteria.evaluate(response, response_time)
 
             result = MonitorResult(
                 timestamp=datetime.now(),
@@ -146,7 +183,7 @@ class HTTPMonitor:
                 status_code=response.status_code,
                 response_time=response_time,
                 success=success,
-                content_length=len(response.content) if response.content else 0,
+                content_length=response.size,
                 headers=dict(response.headers) if hasattr(response, 'headers') else {}
             )
 
@@ -175,87 +212,27 @@ class HTTPMonitor:
         criteria: List[str],
         operator: str = "and"
     ) -> bool:
-        """성공 기준 검사"""
-        if not criteria:
-            return 200 <= response.status_code < 300
-
-        results = []
-
-        for criterion in criteria:
-            if "==" in criterion:
-                key, expected = criterion.split("==", 1)
-                key = key.strip()
-                expected = expected.strip()
-
-                if key == "status_code":
-                    results.append(response.status_code == int(expected))
-                elif key == "response_time":
-                    results.append(response_time == float(expected))
-                else:
-                    # 응답 데이터에서 키 검색
-                    try:
-                        if hasattr(response, 'json') and response.content:
-                            data = response.json()
-                            actual = self._get_nested_value(data, key)
-                            results.append(str(actual) == expected)
-                        else:
-                            results.append(False)
-                    except:
-                        results.append(False)
-
-            elif "<" in criterion:
-                key, threshold = criterion.split("<", 1)
-                key = key.strip()
-                threshold = float(threshold.strip())
-
-                if key == "response_time":
-                    results.append(response_time < threshold)
-                else:
-                    results.append(False)
-
-            elif ">" in criterion:
-                key, threshold = criterion.split(">", 1)
-                key = key.strip()
-                threshold = float(threshold.strip())
-
-                if key == "response_time":
-                    results.append(response_time > threshold)
-                else:
-                    results.append(False)
-
-        # 논리 연산자 적용
-        if operator.lower() == "and":
-            return all(results)
-        elif operator.lower() == "or":
-            return any(results)
-        else:
-            return all(results)
+        """성공 기준 검사 (설정에 없는 임시 기준용, 매번 컴파일됨)"""
+        return compile_criteria(criteria, operator).evaluate(response, response_time)
 
     def _get_nested_value(self, data: Dict[str, Any], key_path: str) -> Any:
-        """중첩된 딕셔너리에서 값 추출"""
-        keys = key_path.split(".")
-        current = data
-
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return None
-
-        return current
+        """중첩된 딕셔너리에서 값 추출 (리스트 인덱스 지원)"""
+        return resolve_json_path(data, key_path)
 
     def _store_result(self, name: str, result: MonitorResult):
         """결과 저장"""
         if name in self.results:
             self.results[name].append(result)
-
-            # Sparkline 히스토리 업데이트
-            if name in self.response_time_history:
-                self.response_time_history[name].append(result.response_time)
-
-            if name in self.status_history:
-                # 성공: 1, 실패: 0
-                self.status_history[name].append(1 if result.success else 0)
+            self.version += 1
+
+            # Sparkline 히스토리 업데이트 (성공: 1, 실패: 0)
+            history = self.history.get(name)
+            if history is not None:
+                history.append(
+                    result.timestamp.timestamp(),
+                    response_time=result.response_time,
+                    success=1.0 if result.success else 0.0
+                )
 
     def _update_statistics(self, name: str, result: MonitorResult):
         """통계 업데이트"""
@@ -274,17 +251,18 @@ class HTTPMonitor:
             else:
                 stats['failed_requests'] += 1
 
-        # 응답 시간 통계
-        if result.response_time > 0:
-            stats['min_response_time'] = min(stats['min_response_time'], result.response_time)
-            stats['max_response_time'] = max(stats['max_response_time'], result.response_time)
+        # 응답 시간 통계 (O(1) 갱신)
+        if result.response_time > 0 and name in self.response_stats:
+            rolling = self.response_stats[name]
+            rolling.add(result.response_time)
 
-            # 평균 응답 시간 계산 (최근 결과들 기준)
-            recent_results = list(self.results[name])
-            if recent_results:
-                response_times = [r.response_time for r in recent_results if r.response_time > 0]
-                if response_times:
-                    stats['avg_response_time'] = sum(response_times) / len(response_times)
+            stats['min_response_time'] = rolling.min
+            stats['max_response_time'] = rolling.max
+            stats['avg_response_time'] = rolling.mean
+            stats['ewma_response_time'] = rolling.ewma
+            stats['p50_response_time'] = rolling.quantile(0.5)
+            stats['p95_response_time'] = rolling.quantile(0.95)
+            stats['p99_response_time'] = rolling.quantile(0.99)
 
         # 가동률 계산
         if stats['total_requests'] > 0:
@@ -344,6 +322,9 @@ class HTTPMonitor:
 
         self._tasks.clear()
 
+        # 커넥션 풀 해제
+        await self.client.aclose()
+
     async def _monitor_endpoint(self, config: HTTPMonitorConfig):
         """엔드포인트 모니터링 루프"""
         while self.is_running:
@@ -374,46 +355,46 @@ class HTTPMonitor:
             Layout(name="statistics", ratio=1)   # 통계는 작게
         )
 
-        with Live(layout, refresh_per_second=2, screen=True) as live:
-            while self.is_running:
-                try:
-                    # 헤더 업데이트
-                    layout["header"].update(
-                        Panel(
-                            f"[bold blue]HTTP 모니터링 대시보드[/bold blue] - "
-                            f"엔드포인트: {len(self.configs)}개 | "
-                            f"실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                            style="blue"
-                        )
-                    )
-
-                    # 엔드포인트 상태 테이블
-                    endpoints_table = self._create_endpoints_table()
-                    layout["endpoints"].update(Panel(endpoints_table, title="엔드포인트 상태"))
-
-                    # 통계 테이블
-                    stats_table = self._create_statistics_table()
-                    layout["statistics"].update(Panel(stats_table, title="통계"))
-
-                    # 향상된 그래프 패널
-                    graph_content = self._create_sparkline_panel()
-                    layout["graphs"].update(Panel(Text.from_markup(graph_content), title="[bold cyan]📈 Performance Graphs[/bold cyan]", border_style="cyan"))
-
-                    # 푸터
-                    layout["footer"].update(
-                        Panel(
-                            "[dim]Ctrl+C를 눌러 모니터링을 중단하세요[/dim]",
-                            style="dim"
-                        )
-                    )
-
-                    await asyncio.sleep(0.5)
-
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    # 에러 처리
-                    pass
+        # 결과가 바뀐 영역만 다시 그리고, 화면 갱신은 초당 2회 이하로 제한
+        renderer = DashboardRenderer(layout, console=self.console, max_fps=2)
+        renderer.region(
+            "header",
+            lambda: Panel(
+                f"[bold blue]HTTP 모니터링 대시보드[/bold blue] - "
+                f"엔드포인트: {len(self.configs)}개 | "
+                f"실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                style="blue"
+            ),
+            key=lambda: (len(self.configs), int(time.time()))
+        )
+        renderer.region(
+            "endpoints",
+            lambda: Panel(self._create_endpoints_table(), title="엔드포인트 상태"),
+            key=lambda: self.version
+        )
+        renderer.region(
+            "statistics",
+            lambda: Panel(self._create_statistics_table(), title="통계"),
+            key=lambda: self.version
+        )
+        renderer.region(
+            "graphs",
+            lambda: Panel(
+                Text.from_markup(self._create_sparkline_panel()),
+                title="[bold cyan]📈 Performance Graphs[/bold cyan]",
+                border_style="cyan"
+            ),
+            key=lambda: self.version
+        )
+        renderer.region(
+            "footer",
+            lambda: Panel("[dim]Ctrl+C를 눌러 모니터링을 중단하세요[/dim]", style="dim")
+        )
+
+        try:
+            await renderer.run(lambda: self.is_running)
+        except asyncio.CancelledError:
+            pass
 
     def _create_endpoints_table(self) -> Table:
         """엔드포인트 상태 테이블 생성"""
@@ -541,7 +522,7 @@ class HTTPMonitor:
 
         return table
 
-    def create_sparkline(self, data: List[float], width: int = 40, height: int = 4) -> str:
+    def create_sparkline(self, data: Sequence[float], width: int = 40, height: int = 4) -> str:
         """응답 시간 데이터를 sparkline으로 변환 - 색상과 함께"""
         if not data or len(data) < 2:
             return "데이터 수집 중..."
@@ -558,31 +539,8 @@ class HTTPMonitor:
 
         range_val = max_val - min_val
 
-        # 너비에 맞게 리샘플링 및 확장
-        if len(data) > width:
-            step = len(data) / width
-            sampled_data = []
-            for i in range(width):
-                idx = int(i * step)
-                sampled_data.append(data[idx])
-        elif len(data) < width:
-            # 선형 보간으로 데이터를 width 크기로 확장
-            if len(data) >= 2:
-                sampled_data = []
-                for i in range(width):
-                    pos = (i / (width - 1)) * (len(data) - 1) if width > 1 else 0
-                    idx = int(pos)
-                    if idx < len(data) - 1:
-                        frac = pos - idx
-                        val = data[idx] * (1 - frac) + data[idx + 1] * frac
-                        sampled_data.append(val)
-                    else:
-                        sampled_data.append(data[-1])
-            else:
-                # 데이터가 1개면 전체 너비로 반복
-                sampled_data = [data[0] if data else 0] * width
-        else:
-            sampled_data = data
+        # 너비에 맞게 리샘플링 (많으면 구간 평균, 적으면 선형 보간)
+        sampled_data = resample(data, width)
 
         # sparkline 생성 - 값에 따른 색상 적용
         sparkline = ""
@@ -605,42 +563,13 @@ class HTTPMonitor:
 
         return sparkline
 
-    def create_ascii_graph(self, data: List[float], width: int = 50, height: int = 6, label: str = "") -> str:
+    def create_ascii_graph(self, data: Sequence[float], width: int = 50, height: int = 6, label: str = "") -> str:
         """멀티라인 ASCII 그래프 생성 - 더 높은 가시성"""
         if not data or height < 2:
             return "데이터 수집 중..."
 
-        # 데이터를 정확히 width 크기로 조정
-        original_data = data[:]
-        if len(data) > width:
-            # 다운샘플링
-            step = len(data) / width
-            sampled = []
-            for i in range(width):
-                idx = int(i * step)
-                sampled.append(data[idx])
-            data = sampled
-        elif len(data) < width:
-            # 선형 보간으로 데이터 확장
-            if len(data) >= 2:
-                # 수동 선형 보간
-                expanded = []
-                for i in range(width):
-                    # 현재 위치를 원본 데이터 인덱스로 매핑
-                    pos = (i / (width - 1)) * (len(data) - 1) if width > 1 else 0
-                    idx = int(pos)
-                    
-                    if idx < len(data) - 1:
-                        # 두 점 사이를 보간
-                        frac = pos - idx
-                        val = data[idx] * (1 - frac) + data[idx + 1] * frac
-                        expanded.append(val)
-                    else:
-                        expanded.append(data[-1])
-                data = expanded
-            else:
-                # 데이터가 1개면 반복
-                data = data * width if data else [0] * width
+        # 데이터를 정확히 width 크기로 조정 (많으면 구간 평균, 적으면 선형 보간)
+        data = resample(data, width)
 
         # 최소/최대값 계산
         min_val = min(data) if data else 0
@@ -722,7 +651,7 @@ class HTTPMonitor:
 
         return "\n".join(graph_lines)
 
-    def create_status_sparkline(self, data: List[int], width: int = 40) -> str:
+    def create_status_sparkline(self, data: Sequence[float], width: int = 40) -> str:
         """상태 히스토리를 sparkline으로 변환 - 더 세밀한 표현"""
         if not data:
             return "데이터 수집 중..."
@@ -774,39 +703,13 @@ class HTTPMonitor:
 
         return sparkline
 
-    def create_status_bar_graph(self, data: List[int], width: int = 50, height: int = 3) -> str:
+    def create_status_bar_graph(self, data: Sequence[float], width: int = 50, height: int = 3) -> str:
         """상태 히스토리를 막대 그래프로 변환 - 향상된 시각화"""
         if not data:
             return "데이터 수집 중..."
 
-        # 데이터를 정확히 width 크기로 조정
-        if len(data) > width:
-            # 구간별 집계
-            step = len(data) / width
-            aggregated = []
-            for i in range(width):
-                start_idx = int(i * step)
-                end_idx = int((i + 1) * step)
-                section = data[start_idx:end_idx]
-                success_rate = sum(section) / len(section) if section else 0
-                aggregated.append(success_rate)
-        else:
-            # 데이터 확장 - width에 맞게 보간
-            aggregated = []
-            if len(data) >= 2:
-                # 선형 보간
-                for i in range(width):
-                    pos = (i / (width - 1)) * (len(data) - 1) if width > 1 else 0
-                    idx = int(pos)
-                    if idx < len(data) - 1:
-                        frac = pos - idx
-                        val = data[idx] * (1 - frac) + data[idx + 1] * frac
-                        aggregated.append(val)
-                    else:
-                        aggregated.append(float(data[-1]) if data else 1.0)
-            else:
-                # 데이터가 1개면 전체 너비로 반복
-                aggregated = [float(data[0]) if data else 1.0] * width
+        # 데이터를 정확히 width 크기로 조정 (많으면 구간별 성공률, 적으면 선형 보간)
+        aggregated = resample(data, width)
 
         # 그래프 생성 - 더 세밀한 표현
         lines = []
@@ -848,6 +751,82 @@ class HTTPMonitor:
 
         return "\n".join(lines)
 
+    def _create_endpoint_graph(self, name: str, graph_width: int, separator_width: int) -> List[str]:
+        """엔드포인트 하나의 그래프 마크업 라인 생성"""
+        lines = []
+
+        # 엔드포인트 이름
+        lines.append(f"[bold cyan]{'═' * separator_width}[/bold cyan]")
+        lines.append(f"[bold cyan]📊 {name}[/bold cyan]")
+        lines.append("")
+
+        # 응답 시간 ASCII 그래프 (높은 가시성)
+        history = self.history.get(name)
+        if history:
+            response_times = history.downsample("response_time", graph_width)
+            # 멀티라인 그래프 생성
+            ascii_graph = self.create_ascii_graph(
+                response_times,
+                width=graph_width,
+                height=8,  # 높이도 약간 증가
+                label="응답 시간"
+            )
+            lines.append("[bold]Response Time Graph:[/bold]")
+            lines.append(ascii_graph)
+
+            # 통계 정보
+            summary = history.summary("response_time")
+            latest = summary["latest"]
+            avg = summary["mean"]
+            min_val = summary["min"]
+            max_val = summary["max"]
+
+            # 색상 적용
+            if latest < 1.0:
+                latest_str = f"[green]{latest:.3f}s[/green]"
+            elif latest < 2.0:
+                latest_str = f"[yellow]{latest:.3f}s[/yellow]"
+            else:
+                latest_str = f"[red]{latest:.3f}s[/red]"
+
+            lines.append("")
+            lines.append(f"  📈 현재: {latest_str} | 평균: {avg:.3f}s | 최소: {min_val:.3f}s | 최대: {max_val:.3f}s")
+
+            # 작은 sparkline도 함께 표시 (보조 지표)
+            sparkline = self.create_sparkline(response_times, width=graph_width)
+            lines.append(f"  Trend: {sparkline}")
+            lines.append("")
+
+            # 상태 막대 그래프
+            statuses = history.downsample("success", graph_width)
+            if statuses:
+                lines.append("[bold]Success Rate:[/bold]")
+                status_bar = self.create_status_bar_graph(statuses, width=graph_width, height=4)
+                lines.append(status_bar)
+
+                success_count = int(sum(history.view("success")))
+                success_rate = success_count / len(history) * 100
+
+                if success_rate >= 99:
+                    rate_str = f"[green]{success_rate:.1f}%[/green]"
+                elif success_rate >= 95:
+                    rate_str = f"[yellow]{success_rate:.1f}%[/yellow]"
+                else:
+                    rate_str = f"[red]{success_rate:.1f}%[/red]"
+
+                # 상태 sparkline (보조)
+                # 구간에 실패가 하나라도 있으면 실패로 표시
+                status_sparkline = self.create_status_sparkline(
+                    history.downsample("success", graph_width, method="min"), width=graph_width
+                )
+                lines.append("")
+                lines.append(f"  Status: {status_sparkline}")
+                lines.append(f"  📊 성공률: {rate_str} ({success_count}/{len(history)})")
+
+            lines.append("")  # 빈 줄 추가
+
+        return lines
+
     def _create_sparkline_panel(self) -> str:
         """향상된 그래프 패널 생성"""
         lines = []
@@ -865,70 +844,14 @@ class HTTPMonitor:
 
         for config in self.configs:
             name = config.name
-
-            # 엔드포인트 이름
-            lines.append(f"[bold cyan]{'═' * separator_width}[/bold cyan]")
-            lines.append(f"[bold cyan]📊 {name}[/bold cyan]")
-            lines.append("")
-
-            # 응답 시간 ASCII 그래프 (높은 가시성)
-            response_times = list(self.response_time_history.get(name, []))
-            if response_times:
-                # 멀티라인 그래프 생성
-                ascii_graph = self.create_ascii_graph(
-                    response_times,
-                    width=graph_width,
-                    height=8,  # 높이도 약간 증가
-                    label="응답 시간"
-                )
-                lines.append("[bold]Response Time Graph:[/bold]")
-                lines.append(ascii_graph)
-
-                # 통계 정보
-                latest = response_times[-1] if response_times else 0
-                avg = sum(response_times) / len(response_times) if response_times else 0
-                min_val = min(response_times) if response_times else 0
-                max_val = max(response_times) if response_times else 0
-
-                # 색상 적용
-                if latest < 1.0:
-                    latest_str = f"[green]{latest:.3f}s[/green]"
-                elif latest < 2.0:
-                    latest_str = f"[yellow]{latest:.3f}s[/yellow]"
-                else:
-                    latest_str = f"[red]{latest:.3f}s[/red]"
-
-                lines.append("")
-                lines.append(f"  📈 현재: {latest_str} | 평균: {avg:.3f}s | 최소: {min_val:.3f}s | 최대: {max_val:.3f}s")
-
-                # 작은 sparkline도 함께 표시 (보조 지표)
-                sparkline = self.create_sparkline(response_times, width=graph_width)
-                lines.append(f"  Trend: {sparkline}")
-                lines.append("")
-
-                # 상태 막대 그래프
-                statuses = list(self.status_history.get(name, []))
-                if statuses:
-                    lines.append("[bold]Success Rate:[/bold]")
-                    status_bar = self.create_status_bar_graph(statuses, width=graph_width, height=4)
-                    lines.append(status_bar)
-
-                    success_rate = (sum(statuses) / len(statuses)) * 100 if statuses else 0
-
-                    if success_rate >= 99:
-                        rate_str = f"[green]{success_rate:.1f}%[/green]"
-                    elif success_rate >= 95:
-                        rate_str = f"[yellow]{success_rate:.1f}%[/yellow]"
-                    else:
-                        rate_str = f"[red]{success_rate:.1f}%[/red]"
-
-                    # 상태 sparkline (보조)
-                    status_sparkline = self.create_status_sparkline(statuses, width=graph_width)
-                    lines.append("")
-                    lines.append(f"  Status: {status_sparkline}")
-                    lines.append(f"  📊 성공률: {rate_str} ({sum(statuses)}/{len(statuses)})")
-
-                lines.append("")  # 빈 줄 추가
+            history = self.history.get(name)
+            # 결과가 바뀐 엔드포인트만 그래프 마크업을 다시 만듦
+            key = (id(history), getattr(history, "version", None), graph_width, separator_width)
+            cached = self._graph_cache.get(name)
+            if cached is None or cached[0] != key:
+                cached = (key, self._create_endpoint_graph(name, graph_width, separator_width))
+                self._graph_cache[name] = cached
+            lines.extend(cached[1])
 
         return "\n".join(lines) if lines else "모니터링 데이터 수집 중..."
 
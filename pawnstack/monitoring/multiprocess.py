@@ -0,0 +1,314 @@
+"""
+멀티 프로세스 부하 생성
+
+asyncio 루프 하나는 코어 하나에서 수천 RPS 수준이면 포화됩니다. 부하를 N 개의 워커 프로세스
+(각자 이벤트 루프와 커넥션 풀 보유) 로 나눠 실행하고, 각 워커는 ``stream_interval`` 마다
+구간 지연시간 히스토그램과 카운터를 부모 프로세스로 보냅니다. 부모는 이를 병합해
+하나의 BenchmarkResult 를 만듭니다.
+
+모든 워커가 워밍업을 마치고 준비되면 동시에 시작 신호를 보내므로, 프로세스 기동 시간은
+측정 구간에 포함되지 않습니다.
+
+워커는 ``spawn`` 방식으로 시작하므로, 스크립트에서 직접 호출할 때는
+``if __name__ == "__main__":`` 가드 안에서 실행해야 합니다.
+"""
+
+import asyncio
+import io
+import math
+import multiprocessing
+import queue
+import time
+from collections import namedtuple
+from typing import Any, Dict, List, Optional, Sequence
+
+from rich.console import Console
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+
+from .performance import BenchmarkRecorder, BenchmarkResult, LoadStage, PerformanceMonitor, _plan_load
+
+_CpuTimes = namedtuple("_CpuTimes", ["user", "system"])
+
+# 부모 프로세스의 이벤트 큐 polling 간격 (초)
+_POLL_INTERVAL = 0.2
+
+
+def _split(total: int, parts: int) -> List[int]:
+    """정수를 parts 개로 최대한 균등하게 분할"""
+    base, extra = divmod(total, parts)
+    return [base + (1 if i < extra else 0) for i in range(parts)]
+
+
+def _worker_specs(
+    processes: int,
+    mode: str,
+    concurrent_requests: int,
+    total_requests: int,
+    duration: Optional[float],
+    warmup_requests: int,
+    rate: Optional[float],
+    stages: Optional[Sequence[LoadStage]],
+    max_in_flight: int
+) -> List[Dict[str, Any]]:
+    """워커별 부하 분담 (RPS/단계 목표값은 균등 분할, 요청 수/동시 실행 수는 정수 분할)"""
+    concurrency_shares = _split(concurrent_requests, processes)
+    request_shares = _split(total_requests, processes)
+    warmup_shares = _split(warmup_requests, processes)
+
+    return [
+        {
+            "mode": mode,
+            "concurrent_requests": max(1, concurrency_shares[i]),
+            "total_requests": request_shares[i],
+            "duration": duration,
+            "warmup_requests": warmup_shares[i],
+            "rate": rate / processes if rate else None,
+            "stages": [LoadStage(stage.duration, stage.target / processes) for stage in stages] if stages else None,
+            "max_in_flight": max(1, math.ceil(max_in_flight / processes)),
+        }
+        for i in range(processes)
+    ]
+
+
+def _worker_main(
+    worker_id: int,
+    url: str,
+    method: str,
+    spec: Dict[str, Any],
+    request_kwargs: Dict[str, Any],
+    resource_sample_interval: float,
+    stream_interval: float,
+    events: "multiprocessing.Queue",
+    start_event: "multiprocessing.Event"
+):
+    """워커 프로세스 진입점"""
+    try:
+        asyncio.run(_run_worker(
+            worker_id, url, method, spec, request_kwargs, resource_sample_interval,
+            stream_interval, events, start_event
+        ))
+    except Exception as e:
+        events.put({"type": "error", "worker": worker_id, "error": f"{type(e).__name__}: {e}"})
+
+
+async def _run_worker(
+    worker_id: int,
+    url: str,
+    method: str,
+    spec: Dict[str, Any],
+    request_kwargs: Dict[str, Any],
+    resource_sample_interval: float,
+    stream_interval: float,
+    events: "multiprocessing.Queue",
+    start_event: "multiprocessing.Event"
+):
+    """워커: 워밍업 → 시작 신호 대기 → 부하 실행 (구간 히스토그램 스트리밍)"""
+    monitor = PerformanceMonitor(Console(file=io.StringIO()), resource_sample_interval=resource_sample_interval)
+    plan = _plan_load(
+        spec["mode"], spec["rate"], spec["stages"], spec["duration"],
+        spec["total_requests"], spec["concurrent_requests"]
+    )
+    recorder = BenchmarkRecorder(corrected=plan.mode == "rate")
+    loop = asyncio.get_running_loop()
+
+    try:
+        if spec["warmup_requests"]:
+            await asyncio.gather(*(
+                monitor.measure_single_request(url, method, **request_kwargs)
+                for _ in range(spec["warmup_requests"])
+            ))
+
+        events.put({"type": "ready", "worker": worker_id})
+        await loop.run_in_executor(None, start_event.wait)
+
+        start_time = time.perf_counter()
+        start_cpu_times = monitor._process.cpu_times()
+        resource_monitor_task = asyncio.create_task(monitor._monitor_system_resources(math.inf))
+
+        async def stream():
+            while True:
+                await asyncio.sleep(stream_interval)
+                events.put({"type": "partial", "worker": worker_id, "stats": recorder.drain().to_dict()})
+
+        stream_task = asyncio.create_task(stream())
+        try:
+            await monitor._run_load(
+                plan, url, method, start_time, spec["max_in_flight"], recorder.record, request_kwargs
+            )
+        finally:
+            stream_task.cancel()
+
+        total_time = time.perf_counter() - start_time
+        end_cpu_times = monitor._process.cpu_times()
+
+        resource_monitor_task.cancel()
+        try:
+            resource_stats = await resource_monitor_task
+        except asyncio.CancelledError:
+            resource_stats = {"memory": {"peak": 0, "average": 0}, "cpu": {"peak": 0, "average": 0}}
+
+        events.put({
+            "type": "done",
+            "worker": worker_id,
+            "stats": recorder.drain().to_dict(),
+            "total_time": total_time,
+            "resource_stats": resource_stats,
+            "cpu_user": end_cpu_times.user - start_cpu_times.user,
+            "cpu_system": end_cpu_times.system - start_cpu_times.system,
+        })
+    finally:
+        await monitor.close()
+
+
+def _get_event(events: "multiprocessing.Queue", timeout: float) -> Optional[Dict[str, Any]]:
+    try:
+        return events.get(timeout=timeout)
+    except queue.Empty:
+        return None
+
+
+def _sum_resource_stats(reports: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """워커별 리소스 사용량 합산 (프로세스 전체 사용량의 상한)"""
+    totals = {"memory": {"peak": 0.0, "average": 0.0}, "cpu": {"peak": 0.0, "average": 0.0}}
+    for report in reports:
+        for resource, values in report["resource_stats"].items():
+            for key in ("peak", "average"):
+                totals[resource][key] += values.get(key, 0)
+    return totals
+
+
+async def run_benchmark_processes(
+    name: str,
+    url: str,
+    processes: int,
+    method: str = "GET",
+    concurrent_requests: int = 10,
+    total_requests: int = 100,
+    duration: Optional[float] = None,
+    warmup_requests: int = 10,
+    rate: Optional[float] = None,
+    stages: Optional[Sequence[LoadStage]] = None,
+    mode: Optional[str] = None,
+    max_in_flight: int = 1000,
+    resource_sample_interval: float = 0.1,
+    console: Optional[Console] = None,
+    stream_interval: float = 0.5,
+    **kwargs
+) -> BenchmarkResult:
+    """
+    여러 워커 프로세스로 HTTP 벤치마크 실행
+
+    파라미터는 ``PerformanceMonitor.run_benchmark`` 와 같으며, 전체 부하 (RPS, 동시 실행 수,
+    요청 수) 를 워커 수로 나눠 분담합니다.
+
+    Args:
+        processes: 워커 프로세스 수
+        stream_interval: 워커가 구간 히스토그램을 보내는 간격 (초)
+
+    Raises:
+        RuntimeError: 모든 워커가 실패한 경우
+    """
+    console = console or Console()
+    plan = _plan_load(mode, rate, stages, duration, total_requests, concurrent_requests)
+
+    # 분담할 부하보다 워커가 많으면 놀고 있는 프로세스가 생기므로 제한
+    if plan.mode == "concurrency" and not stages:
+        processes = min(processes, concurrent_requests)
+    if plan.limit is not None:
+        processes = min(processes, plan.limit)
+    processes = max(1, processes)
+
+    specs = _worker_specs(
+        processes, plan.mode, concurrent_requests, total_requests, duration,
+        warmup_requests, rate, stages, max_in_flight
+    )
+
+    context = multiprocessing.get_context("spawn")
+    events = context.Queue()
+    start_event = context.Event()
+    workers = [
+        context.Process(
+            target=_worker_main,
+            args=(i, url, method, spec, kwargs, resource_sample_interval, stream_interval, events, start_event),
+            daemon=True
+        )
+        for i, spec in enumerate(specs)
+    ]
+
+    console.print(f"[blue]벤치마크 시작: {name} ({plan.mode}, {processes} processes)[/blue]")
+    for worker in workers:
+        worker.start()
+
+    loop = asyncio.get_running_loop()
+    recorder = BenchmarkRecorder(corrected=plan.mode == "rate")
+    ready = set()
+    reports: Dict[int, Dict[str, Any]] = {}
+    errors: Dict[int, str] = {}
+    start_time: Optional[float] = None
+
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeElapsedColumn(),
+            console=console
+        ) as progress:
+            task = progress.add_task(f"벤치마크 실행: {name}", total=plan.duration or plan.limit)
+
+            while len(reports) + len(errors) < processes:
+                message = await loop.run_in_executor(None, _get_event, events, _POLL_INTERVAL)
+
+                if message is None:
+                    # 메시지 없이 종료된 워커 (크래시, 강제 종료)
+                    for i, worker in enumerate(workers):
+                        if worker.exitcode is not None and i not in reports and i not in errors:
+                            errors[i] = f"worker exited with code {worker.exitcode}"
+                else:
+                    worker_id = message["worker"]
+                    kind = message["type"]
+                    if kind == "ready":
+                        ready.add(worker_id)
+                    elif kind == "partial":
+                        recorder.merge(BenchmarkRecorder.from_dict(message["stats"]))
+                    elif kind == "done":
+                        recorder.merge(BenchmarkRecorder.from_dict(message["stats"]))
+                        reports[worker_id] = message
+                    elif kind == "error":
+                        errors[worker_id] = message["error"]
+
+                # 살아 있는 워커가 모두 준비되면 동시에 시작
+                if start_time is None and ready and len(ready) + len(errors) >= processes:
+                    start_event.set()
+                    start_time = time.perf_counter()
+
+                if start_time is not None:
+                    completed = time.perf_counter() - start_time if plan.duration else recorder.total
+                    progress.update(task, completed=completed)
+    finally:
+        start_event.set()
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+
+    for worker_id, error in sorted(errors.items()):
+        console.print(f"[red]벤치마크 워커 {worker_id} 실패: {error}[/red]")
+    if not reports:
+        raise RuntimeError(f"All {processes} benchmark workers failed")
+
+    report_list = list(reports.values())
+    total_time = max(report["total_time"] for report in report_list)
+
+    result = PerformanceMonitor._result_from_recorder(
+        name, recorder, total_time, _sum_resource_stats(report_list), plan
+    )
+    result.client_overhead = PerformanceMonitor._client_overhead(
+        _CpuTimes(0.0, 0.0),
+        _CpuTimes(sum(r["cpu_user"] for r in report_list), sum(r["cpu_system"] for r in report_list)),
+        total_time,
+        recorder.total
+    )
+    result.client_overhead["processes"] = len(report_list)
+    return result
@@ -2,14 +2,20 @@
 성능 측정 및 벤치마킹 모듈
 
 HTTP 요청 성능, 메모리 사용량, 시스템 리소스를 측정하고 벤치마크를 제공합니다.
+
+벤치마크 부하 모드:
+    - concurrency (closed-loop): N 개의 워커가 응답을 받는 즉시 다음 요청을 보냅니다.
+    - rate (open-loop): 응답과 무관하게 목표 RPS 의 도착 일정에 맞춰 요청을 보냅니다.
+      지연시간은 예정 시각부터 측정한 값(보정값)도 함께 기록하여 coordinated omission 을 제거합니다.
 """
 
 import asyncio
+import math
 import time
 import psutil
 import statistics
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Callable, Union
+from typing import List, Dict, Any, Optional, Callable, Union, Sequence
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
 
@@ -20,6 +26,111 @@ from rich.panel import Panel
 from rich.text import Text
 
 from pawnstack.http.client import HttpClient
+from .histogram import LatencyHistogram
+
+# open-loop 디스패처의 도착 일정 계산 단위 (초)
+_DISPATCH_TICK = 0.05
+# ramp 단계에서 비활성 워커의 대기 간격 (초)
+_IDLE_WAIT = 0.01
+
+
+@dataclass
+class LoadStage:
+    """
+    부하 단계 (ramp-up / ramp-down)
+
+    이전 단계의 목표값 (첫 단계는 0) 에서 ``target`` 까지 ``duration`` 초 동안 선형으로 변화합니다.
+    rate 모드에서는 초당 요청 수, concurrency 모드에서는 동시 실행 워커 수입니다.
+    """
+    duration: float
+    target: float
+
+
+def parse_load_stages(spec: str) -> List[LoadStage]:
+    """
+    ``"30:100,60:500,10:0"`` 형식 (duration:target, 쉼표 구분) 의 부하 단계 파싱
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    stages = []
+    for item in spec.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            duration, target = item.split(':')
+            stage = LoadStage(duration=float(duration), target=float(target))
+        except ValueError:
+            raise ValueError(f"Invalid load stage '{item}' (expected duration:target)") from None
+        if stage.duration <= 0 or stage.target < 0:
+            raise ValueError(f"Invalid load stage '{item}' (duration must be positive, target non-negative)")
+        stages.append(stage)
+    if not stages:
+        raise ValueError(f"No load stages in '{spec}'")
+    return stages
+
+
+def _stage_target(stages: Sequence[LoadStage], elapsed: float) -> Optional[float]:
+    """경과 시간의 목표값 (모든 단계가 끝났으면 None)"""
+    previous = 0.0
+    for stage in stages:
+        if elapsed < stage.duration:
+            return previous + (stage.target - previous) * (elapsed / stage.duration)
+        elapsed -= stage.duration
+        previous = stage.target
+    return None
+
+
+@dataclass
+class _LoadPlan:
+    """벤치마크 부하 계획"""
+    mode: str
+    target_at: Callable[[float], Optional[float]]  # 경과 시간 → 목표 RPS/동시 실행 수 (종료 시 None)
+    duration: Optional[float]
+    limit: Optional[int]  # 총 요청 수 제한 (시간 기반이면 None)
+    workers: int  # concurrency 모드 워커 수
+    target_rps: Optional[float]
+
+
+def _plan_load(
+    mode: Optional[str],
+    rate: Optional[float],
+    stages: Optional[Sequence[LoadStage]],
+    duration: Optional[float],
+    total_requests: int,
+    concurrent_requests: int
+) -> _LoadPlan:
+    """
+    벤치마크 파라미터를 부하 계획으로 변환
+
+    Raises:
+        ValueError: 모드나 파라미터 조합이 잘못된 경우
+    """
+    mode = mode or ("rate" if rate is not None else "concurrency")
+    if mode not in ("concurrency", "rate"):
+        raise ValueError(f"Unknown benchmark mode: {mode}")
+    if mode == "rate" and not stages and not rate:
+        raise ValueError("rate mode requires a target rate or load stages")
+
+    if stages:
+        # 단계 전체 시간이 실행 시간을 결정
+        stages = list(stages)
+        target_at = lambda elapsed: _stage_target(stages, elapsed)
+        duration = sum(stage.duration for stage in stages)
+        peak = max(stage.target for stage in stages)
+    else:
+        peak = rate if mode == "rate" else concurrent_requests
+        target_at = lambda elapsed: peak if duration is None or elapsed < duration else None
+
+    return _LoadPlan(
+        mode=mode,
+        target_at=target_at,
+        duration=duration,
+        limit=None if duration else total_requests,
+        workers=int(math.ceil(peak)) if mode == "concurrency" else 0,
+        target_rps=peak if mode == "rate" else None
+    )
 
 
 @dataclass
@@ -40,6 +151,52 @@ class BenchmarkResult:
     memory_usage: Dict[str, float]  # peak, average memory usage
     cpu_usage: Dict[str, float]  # peak, average CPU usage
     timestamp: datetime = field(default_factory=datetime.now)
+    mode: str = "concurrency"  # concurrency (closed-loop) / rate (open-loop)
+    target_rps: Optional[float] = None
+    corrected_percentiles: Dict[int, float] = field(default_factory=dict)  # 예정 시각 기준 (rate 모드)
+    histogram: Optional[LatencyHistogram] = field(default=None, repr=False, compare=False)
+    corrected_histogram: Optional[LatencyHistogram] = field(default=None, repr=False, compare=False)
+    client_overhead: Dict[str, float] = field(default_factory=dict)  # 부하 생성기 자체 CPU 사용량
+
+    def percentile(self, p: float, corrected: bool = False) -> float:
+        """
+        임의 백분위수 (초). 히스토그램이 있으면 분포에서 직접 조회합니다.
+
+        Args:
+            p: 0~100 사이 백분위 (예: 99.9)
+            corrected: 예정 시각 기준 (coordinated omission 보정) 분포 사용
+        """
+        histogram = self.corrected_histogram if corrected else self.histogram
+        if histogram is not None and histogram.count:
+            return histogram.percentile(p)
+        values = self.corrected_percentiles if corrected else self.percentiles
+        return values.get(p, 0.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 딕셔너리 (히스토그램 포함)"""
+        return {
+            "name": self.name,
+            "timestamp": self.timestamp.isoformat(),
+            "mode": self.mode,
+            "target_rps": self.target_rps,
+            "total_requests": self.total_requests,
+            "successful_requests": self.successful_requests,
+            "failed_requests": self.failed_requests,
+            "total_time": self.total_time,
+            "requests_per_second": self.requests_per_second,
+            "avg_response_time": self.avg_response_time,
+            "min_response_time": self.min_response_time,
+            "max_response_time": self.max_response_time,
+            "percentiles": self.percentiles,
+            "corrected_percentiles": self.corrected_percentiles,
+            "error_rate": self.error_rate,
+            "throughput_bytes_per_sec": self.throughput_bytes_per_sec,
+            "memory_usage": self.memory_usage,
+            "cpu_usage": self.cpu_usage,
+            "client_overhead": self.client_overhead,
+            "histogram": self.histogram.to_dict() if self.histogram is not None else None,
+            "corrected_histogram": self.corrected_histogram.to_dict() if self.corrected_histogram is not None else None
+        }
 
 
 @dataclass
@@ -49,10 +206,92 @@ class PerformanceMetrics:
     response_time: float
     status_code: Optional[int]
     content_length: int
-    memory_usage_mb: float
-    cpu_percent: float
     success: bool
     error: Optional[str] = None
+    start_delay: float = 0.0  # 예정 시각 대비 실제 전송 지연 (open-loop)
+
+    @property
+    def corrected_response_time(self) -> float:
+        """예정 시각부터 응답까지의 시간 (coordinated omission 보정)"""
+        return self.start_delay + self.response_time
+
+
+class BenchmarkRecorder:
+    """
+    벤치마크 요청 결과 누적기
+
+    요청별 메트릭 대신 지연시간 히스토그램과 카운터만 유지합니다.
+    여러 워커/프로세스의 결과를 병합하거나 딕셔너리로 직렬화할 수 있습니다.
+
+    Args:
+        corrected: 예정 시각 기준 (coordinated omission 보정) 히스토그램도 기록할지 여부
+    """
+
+    __slots__ = ("histogram", "corrected_histogram", "successful", "failed", "bytes")
+
+    def __init__(self, corrected: bool = False):
+        self.histogram = LatencyHistogram()
+        self.corrected_histogram = LatencyHistogram() if corrected else None
+        self.successful = 0
+        self.failed = 0
+        self.bytes = 0
+
+    @property
+    def total(self) -> int:
+        return self.successful + self.failed
+
+    def record(self, metrics: PerformanceMetrics):
+        """요청 결과 기록"""
+        self.histogram.record(metrics.response_time)
+        if self.corrected_histogram is not None:
+            self.corrected_histogram.record(metrics.corrected_response_time)
+        if metrics.success:
+            self.successful += 1
+        else:
+            self.failed += 1
+        self.bytes += metrics.content_length
+
+    def merge(self, other: "BenchmarkRecorder") -> "BenchmarkRecorder":
+        """다른 누적기를 합산 (self 반환)"""
+        self.histogram.merge(other.histogram)
+        if other.corrected_histogram is not None:
+            if self.corrected_histogram is None:
+                self.corrected_histogram = LatencyHistogram(other.corrected_histogram.sub_bucket_bits)
+            self.corrected_histogram.merge(other.corrected_histogram)
+        self.successful += other.successful
+        self.failed += other.failed
+        self.bytes += other.bytes
+        return self
+
+    def drain(self) -> "BenchmarkRecorder":
+        """지금까지의 누적분을 반환하고 초기화 (구간별 스트리밍용)"""
+        snapshot = BenchmarkRecorder(self.corrected_histogram is not None)
+        snapshot.histogram, self.histogram = self.histogram, snapshot.histogram
+        snapshot.corrected_histogram, self.corrected_histogram = self.corrected_histogram, snapshot.corrected_histogram
+        snapshot.successful, self.successful = self.successful, 0
+        snapshot.failed, self.failed = self.failed, 0
+        snapshot.bytes, self.bytes = self.bytes, 0
+        return snapshot
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "histogram": self.histogram.to_dict(),
+            "corrected_histogram": self.corrected_histogram.to_dict() if self.corrected_histogram else None,
+            "successful": self.successful,
+            "failed": self.failed,
+            "bytes": self.bytes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkRecorder":
+        recorder = cls()
+        recorder.histogram = LatencyHistogram.from_dict(data["histogram"])
+        if data.get("corrected_histogram"):
+            recorder.corrected_histogram = LatencyHistogram.from_dict(data["corrected_histogram"])
+        recorder.successful = data.get("successful", 0)
+        recorder.failed = data.get("failed", 0)
+        recorder.bytes = data.get("bytes", 0)
+        return recorder
 
 
 class PerformanceMonitor:
@@ -60,15 +299,27 @@ class PerformanceMonitor:
     성능 모니터링 및 벤치마킹 클래스
 
     HTTP 요청 성능, 시스템 리소스 사용량을 측정하고 벤치마크를 수행합니다.
+    요청별 메트릭은 시간/상태/크기만 기록하고, 프로세스 리소스는 백그라운드 샘플러가
+    ``resource_sample_interval`` 간격으로 수집합니다.
+
+    Args:
+        console: 출력 콘솔
+        resource_sample_interval: 리소스 샘플링 간격 (초)
     """
 
-    def __init__(self, console: Optional[Console] = None):
+    def __init__(self, console: Optional[Console] = None, resource_sample_interval: float = 0.1):
         self.console = console or Console()
         self.client = HttpClient()
+        self.resource_sample_interval = resource_sample_interval
+        self._process = psutil.Process()
         self.metrics_history: deque = deque(maxlen=10000)
         self.benchmark_results: List[BenchmarkResult] = []
         self.baseline_metrics: Optional[Dict[str, float]] = None
 
+    async def close(self):
+        """HTTP 커넥션 풀 해제"""
+        await self.client.aclose()
+
     def set_baseline(self, metrics: Dict[str, float]):
         """성능 기준선 설정"""
         self.baseline_metrics = metrics.copy()
@@ -83,52 +334,39 @@ class PerformanceMonitor:
         self,
         url: str,
         method: str = "GET",
+        scheduled_at: Optional[float] = None,
         **kwargs
     ) -> PerformanceMetrics:
-        """단일 요청 성능 측정"""
-        # 시작 시점 메모리/CPU 측정
-        process = psutil.Process()
-        start_memory = process.memory_info().rss / 1024 / 1024  # MB
-        start_cpu = process.cpu_percent()
+        """
+        단일 요청 성능 측정
 
-        start_time = time.time()
+        Args:
+            scheduled_at: 요청 예정 시각 (``time.perf_counter()`` 기준). 주어지면 실제 전송까지의
+                지연을 ``start_delay`` 에 기록합니다.
+        """
+        start_time = time.perf_counter()
+        start_delay = max(0.0, start_time - scheduled_at) if scheduled_at is not None else 0.0
 
         try:
             response = await self.client.request(method, url, **kwargs)
-
-            end_time = time.time()
-            response_time = end_time - start_time
-
-            # 종료 시점 메모리/CPU 측정
-            end_memory = process.memory_info().rss / 1024 / 1024  # MB
-            end_cpu = process.cpu_percent()
-
             metrics = PerformanceMetrics(
                 timestamp=datetime.now(),
-                response_time=response_time,
+                response_time=time.perf_counter() - start_time,
                 status_code=response.status_code,
-                content_length=len(response.content) if response.content else 0,
-                memory_usage_mb=max(start_memory, end_memory),
-                cpu_percent=max(start_cpu, end_cpu),
-                success=200 <= response.status_code < 300
+                content_length=response.size,
+                success=200 <= response.status_code < 300,
+                start_delay=start_delay
             )
 
         except Exception as e:
-            end_time = time.time()
-            response_time = end_time - start_time
-
-            end_memory = process.memory_info().rss / 1024 / 1024  # MB
-            end_cpu = process.cpu_percent()
-
             metrics = PerformanceMetrics(
                 timestamp=datetime.now(),
-                response_time=response_time,
+                response_time=time.perf_counter() - start_time,
                 status_code=None,
                 content_length=0,
-                memory_usage_mb=max(start_memory, end_memory),
-                cpu_percent=max(start_cpu, end_cpu),
                 success=False,
-                error=str(e)
+                error=str(e),
+                start_delay=start_delay
             )
 
         # 메트릭 히스토리에 저장
@@ -145,6 +383,11 @@ class PerformanceMonitor:
         total_requests: int = 100,
         duration: Optional[float] = None,
         warmup_requests: int = 10,
+        rate: Optional[float] = None,
+        stages: Optional[Sequence[LoadStage]] = None,
+        mode: Optional[str] = None,
+        max_in_flight: int = 1000,
+        processes: int = 1,
         **kwargs
     ) -> BenchmarkResult:
         """
@@ -154,13 +397,34 @@ class PerformanceMonitor:
             name: 벤치마크 이름
             url: 테스트할 URL
             method: HTTP 메서드
-            concurrent_requests: 동시 요청 수
-            total_requests: 총 요청 수 (duration이 None인 경우)
+            concurrent_requests: 동시 요청 수 (concurrency 모드의 워커 수)
+            total_requests: 총 요청 수 (duration/stages 가 없는 경우)
             duration: 실행 시간(초) (total_requests 대신 사용 가능)
             warmup_requests: 워밍업 요청 수
+            rate: 목표 초당 요청 수. 지정하면 open-loop (rate) 모드로 실행
+            stages: 부하 단계 목록 (ramp-up). 지정하면 단계 전체 시간 동안 실행
+            mode: "concurrency" 또는 "rate" (기본: rate 지정 시 "rate")
+            max_in_flight: rate 모드에서 동시에 진행 중인 요청 상한.
+                초과한 요청은 대기하며, 대기 시간은 보정 지연시간에 포함됩니다.
+            processes: 부하 생성 프로세스 수. 2 이상이면 부하를 워커 프로세스에 나눠 실행하고
+                지연시간 히스토그램을 병합합니다.
             **kwargs: HTTP 요청 추가 파라미터
         """
-        self.console.print(f"[blue]벤치마크 시작: {name}[/blue]")
+        plan = _plan_load(mode, rate, stages, duration, total_requests, concurrent_requests)
+        if processes > 1:
+            from .multiprocess import run_benchmark_processes
+            result = await run_benchmark_processes(
+                name, url, processes, method=method, concurrent_requests=concurrent_requests,
+                total_requests=total_requests, duration=duration, warmup_requests=warmup_requests,
+                rate=rate, stages=stages, mode=plan.mode, max_in_flight=max_in_flight,
+                resource_sample_interval=self.resource_sample_interval, console=self.console, **kwargs
+            )
+            self.benchmark_results.append(result)
+            self._display_benchmark_result(result)
+            return result
+
+        mode, duration = plan.mode, plan.duration
+        self.console.print(f"[blue]벤치마크 시작: {name} ({mode})[/blue]")
 
         # 워밍업
         if warmup_requests > 0:
@@ -171,81 +435,38 @@ class PerformanceMonitor:
             ]
             await asyncio.gather(*warmup_tasks, return_exceptions=True)
 
-        # 벤치마크 실행
-        start_time = time.time()
-        metrics_list: List[PerformanceMetrics] = []
-
-        # 시스템 리소스 모니터링 시작
-        resource_monitor_task = asyncio.create_task(
-            self._monitor_system_resources(duration or (total_requests / concurrent_requests * 2))
-        )
-
-        if duration:
-            # 시간 기반 벤치마크
-            end_time = start_time + duration
-            request_count = 0
-
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TimeElapsedColumn(),
-                console=self.console
-            ) as progress:
-                task = progress.add_task(f"벤치마크 실행: {name}", total=100)
-
-                while time.time() < end_time:
-                    # 동시 요청 실행
-                    batch_tasks = [
-                        self.measure_single_request(url, method, **kwargs)
-                        for _ in range(concurrent_requests)
-                    ]
-
-                    batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-
-                    for result in batch_results:
-                        if isinstance(result, PerformanceMetrics):
-                            metrics_list.append(result)
-                            request_count += 1
-
-                    # 진행률 업데이트
-                    elapsed = time.time() - start_time
-                    progress.update(task, completed=(elapsed / duration) * 100)
-
-                    # 짧은 대기 (과부하 방지)
-                    await asyncio.sleep(0.01)
+        # 요청별 메트릭은 보관하지 않고 히스토그램과 카운터에만 누적
+        recorder = BenchmarkRecorder(corrected=mode == "rate")
 
-        else:
-            # 요청 수 기반 벤치마크
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TimeElapsedColumn(),
-                console=self.console
-            ) as progress:
-                task = progress.add_task(f"벤치마크 실행: {name}", total=total_requests)
-
-                completed = 0
-                while completed < total_requests:
-                    # 배치 크기 계산
-                    batch_size = min(concurrent_requests, total_requests - completed)
-
-                    # 동시 요청 실행
-                    batch_tasks = [
-                        self.measure_single_request(url, method, **kwargs)
-                        for _ in range(batch_size)
-                    ]
-
-                    batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-
-                    for result in batch_results:
-                        if isinstance(result, PerformanceMetrics):
-                            metrics_list.append(result)
-                            completed += 1
-                            progress.update(task, completed=completed)
+        # 벤치마크 실행
+        start_time = time.perf_counter()
+        start_cpu_times = self._process.cpu_times()
+
+        # 시스템 리소스 모니터링 시작 (종료 시 취소)
+        resource_monitor_task = asyncio.create_task(self._monitor_system_resources(math.inf))
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeElapsedColumn(),
+            console=self.console
+        ) as progress:
+            task = progress.add_task(f"벤치마크 실행: {name}", total=duration or total_requests)
+
+            async def update_progress():
+                while True:
+                    completed = time.perf_counter() - start_time if duration else recorder.total
+                    progress.update(task, completed=completed)
+                    await asyncio.sleep(0.1)
+
+            progress_task = asyncio.create_task(update_progress())
+            try:
+                await self._run_load(plan, url, method, start_time, max_in_flight, recorder.record, kwargs)
+            finally:
+                progress_task.cancel()
+            progress.update(task, completed=duration or total_requests)
 
         # 시스템 리소스 모니터링 중단
         resource_monitor_task.cancel()
@@ -254,10 +475,12 @@ class PerformanceMonitor:
         except asyncio.CancelledError:
             resource_stats = {"memory": {"peak": 0, "average": 0}, "cpu": {"peak": 0, "average": 0}}
 
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
+        end_cpu_times = self._process.cpu_times()
 
         # 결과 분석
-        result = self._analyze_benchmark_results(name, metrics_list, total_time, resource_stats)
+        result = self._result_from_recorder(name, recorder, total_time, resource_stats, plan)
+        result.client_overhead = self._client_overhead(start_cpu_times, end_cpu_times, total_time, recorder.total)
         self.benchmark_results.append(result)
 
         # 결과 출력
@@ -265,23 +488,134 @@ class PerformanceMonitor:
 
         return result
 
+    async def _run_load(
+        self,
+        plan: _LoadPlan,
+        url: str,
+        method: str,
+        start_time: float,
+        max_in_flight: int,
+        record: Callable[[PerformanceMetrics], None],
+        request_kwargs: Dict[str, Any]
+    ):
+        """부하 계획에 따라 open-loop / closed-loop 부하 실행"""
+        if plan.mode == "rate":
+            await self._run_open_loop(
+                url, method, plan.target_at, plan.limit, start_time, max_in_flight, record, request_kwargs
+            )
+        else:
+            await self._run_closed_loop(
+                url, method, plan.workers, plan.target_at, plan.limit, start_time, record, request_kwargs
+            )
+
+    async def _run_closed_loop(
+        self,
+        url: str,
+        method: str,
+        workers: int,
+        target_at: Callable[[float], Optional[float]],
+        limit: Optional[int],
+        start_time: float,
+        record: Callable[[PerformanceMetrics], None],
+        request_kwargs: Dict[str, Any]
+    ):
+        """
+        closed-loop 부하: 각 워커가 응답을 받는 즉시 다음 요청을 보냄
+
+        배치 단위로 기다리지 않으므로 느린 요청 하나가 다른 워커를 막지 않습니다.
+        ramp 단계에서는 목표 동시 실행 수보다 번호가 큰 워커가 대기합니다.
+        """
+        issued = 0
+
+        async def worker(slot: int):
+            nonlocal issued
+            while True:
+                target = target_at(time.perf_counter() - start_time)
+                if target is None:
+                    return
+                if slot >= target:
+                    await asyncio.sleep(_IDLE_WAIT)
+                    continue
+                if limit is not None:
+                    if issued >= limit:
+                        return
+                    issued += 1
+                record(await self.measure_single_request(url, method, **request_kwargs))
+
+        await asyncio.gather(*(worker(slot) for slot in range(workers)))
+
+    async def _run_open_loop(
+        self,
+        url: str,
+        method: str,
+        rate_at: Callable[[float], Optional[float]],
+        limit: Optional[int],
+        start_time: float,
+        max_in_flight: int,
+        record: Callable[[PerformanceMetrics], None],
+        request_kwargs: Dict[str, Any]
+    ):
+        """
+        open-loop 부하: 응답과 무관하게 목표 RPS 의 도착 일정대로 요청을 보냄
+
+        도착 시각은 ``_DISPATCH_TICK`` 구간마다 해당 시점의 목표 RPS 로 계산하고, 남은 분수 요청은
+        다음 구간으로 이월합니다 (토큰 버킷). in-flight 상한에 도달하면 디스패처가 슬롯이 빌 때까지
+        대기하므로 대기 중인 태스크 수도 ``max_in_flight`` 를 넘지 않습니다. 디스패처나 상한 때문에
+        늦게 전송된 요청은 예정 시각 기준으로 지연시간이 보정됩니다.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_in_flight))
+        pending = set()
+
+        async def fire(scheduled_at: float):
+            try:
+                record(await self.measure_single_request(url, method, scheduled_at=scheduled_at, **request_kwargs))
+            finally:
+                semaphore.release()
+
+        issued = 0
+        credit = 0.0
+        offset = 0.0
+        while limit is None or issued < limit:
+            current_rate = rate_at(offset)
+            if current_rate is None:
+                break
+            tick_end = offset + _DISPATCH_TICK
+            if current_rate > 0:
+                next_at = offset + (1.0 - credit) / current_rate
+                while next_at < tick_end and (limit is None or issued < limit):
+                    scheduled_at = start_time + next_at
+                    delay = scheduled_at - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    await semaphore.acquire()
+                    task = asyncio.create_task(fire(scheduled_at))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                    issued += 1
+                    next_at += 1.0 / current_rate
+                credit = max(0.0, 1.0 - (next_at - tick_end) * current_rate)
+            offset = tick_end
+
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def _monitor_system_resources(self, duration: float) -> Dict[str, Dict[str, float]]:
-        """시스템 리소스 모니터링"""
-        process = psutil.Process()
+        """시스템 리소스 모니터링 (``resource_sample_interval`` 간격, 취소될 때까지)"""
+        process = self._process
         memory_samples = []
         cpu_samples = []
 
-        start_time = time.time()
+        # 첫 cpu_percent() 호출은 항상 0 을 반환하므로 기준점만 설정
+        process.cpu_percent()
+        start_time = time.perf_counter()
 
         try:
-            while time.time() - start_time < duration:
-                memory_mb = process.memory_info().rss / 1024 / 1024
-                cpu_percent = process.cpu_percent()
-
-                memory_samples.append(memory_mb)
-                cpu_samples.append(cpu_percent)
+            while time.perf_counter() - start_time < duration:
+                await asyncio.sleep(self.resource_sample_interval)
 
-                await asyncio.sleep(0.1)  # 100ms 간격으로 샘플링
+                with process.oneshot():
+                    memory_samples.append(process.memory_info().rss / 1024 / 1024)
+                    cpu_samples.append(process.cpu_percent())
 
         except asyncio.CancelledError:
             pass
@@ -297,6 +631,21 @@ class PerformanceMonitor:
             }
         }
 
+    @staticmethod
+    def _client_overhead(start_cpu_times, end_cpu_times, total_time: float, requests: int) -> Dict[str, float]:
+        """벤치마크 구간 동안 부하 생성기 프로세스가 사용한 CPU 시간"""
+        user = end_cpu_times.user - start_cpu_times.user
+        system = end_cpu_times.system - start_cpu_times.system
+        cpu_seconds = user + system
+        return {
+            "cpu_seconds": cpu_seconds,
+            "user_seconds": user,
+            "system_seconds": system,
+            # 코어 1개 기준 사용률. 100% 에 가까우면 클라이언트가 병목
+            "cpu_percent": cpu_seconds / total_time * 100 if total_time > 0 else 0.0,
+            "cpu_per_request_ms": cpu_seconds / requests * 1000 if requests else 0.0
+        }
+
     def _analyze_benchmark_results(
         self,
         name: str,
@@ -304,69 +653,48 @@ class PerformanceMonitor:
         total_time: float,
         resource_stats: Dict[str, Dict[str, float]]
     ) -> BenchmarkResult:
-        """벤치마크 결과 분석"""
-        if not metrics_list:
-            return BenchmarkResult(
-                name=name,
-                total_requests=0,
-                successful_requests=0,
-                failed_requests=0,
-                total_time=total_time,
-                requests_per_second=0,
-                avg_response_time=0,
-                min_response_time=0,
-                max_response_time=0,
-                percentiles={},
-                error_rate=100.0,
-                throughput_bytes_per_sec=0,
-                memory_usage=resource_stats.get("memory", {}),
-                cpu_usage=resource_stats.get("cpu", {})
-            )
-
-        # 기본 통계
-        total_requests = len(metrics_list)
-        successful_requests = sum(1 for m in metrics_list if m.success)
-        failed_requests = total_requests - successful_requests
-
-        # 응답 시간 분석
-        response_times = [m.response_time for m in metrics_list]
-        avg_response_time = statistics.mean(response_times)
-        min_response_time = min(response_times)
-        max_response_time = max(response_times)
-
-        # 백분위수 계산
-        percentiles = {}
-        for p in [50, 90, 95, 99]:
-            try:
-                percentiles[p] = statistics.quantiles(response_times, n=100)[p-1]
-            except:
-                percentiles[p] = 0
-
-        # 처리량 계산
-        requests_per_second = total_requests / total_time if total_time > 0 else 0
-
-        # 데이터 처리량 계산
-        total_bytes = sum(m.content_length for m in metrics_list)
-        throughput_bytes_per_sec = total_bytes / total_time if total_time > 0 else 0
-
-        # 에러율 계산
-        error_rate = (failed_requests / total_requests * 100) if total_requests > 0 else 0
+        """요청별 메트릭 목록으로부터 벤치마크 결과 생성"""
+        recorder = BenchmarkRecorder()
+        for metrics in metrics_list:
+            recorder.record(metrics)
+        plan = _plan_load("concurrency", None, None, None, len(metrics_list), 1)
+        return self._result_from_recorder(name, recorder, total_time, resource_stats, plan)
+
+    @staticmethod
+    def _result_from_recorder(
+        name: str,
+        recorder: BenchmarkRecorder,
+        total_time: float,
+        resource_stats: Dict[str, Dict[str, float]],
+        plan: _LoadPlan
+    ) -> BenchmarkResult:
+        """누적기 (히스토그램 + 카운터) 로부터 벤치마크 결과 생성"""
+        histogram = recorder.histogram
+        total_requests = recorder.total
+        corrected = recorder.corrected_histogram
 
         return BenchmarkResult(
             name=name,
             total_requests=total_requests,
-            successful_requests=successful_requests,
-            failed_requests=failed_requests,
+            successful_requests=recorder.successful,
+            failed_requests=recorder.failed,
             total_time=total_time,
-            requests_per_second=requests_per_second,
-            avg_response_time=avg_response_time,
-            min_response_time=min_response_time,
-            max_response_time=max_response_time,
-            percentiles=percentiles,
-            error_rate=error_rate,
-            throughput_bytes_per_sec=throughput_bytes_per_sec,
+            requests_per_second=total_requests / total_time if total_time > 0 else 0,
+            avg_response_time=histogram.mean,
+            min_response_time=histogram.min if histogram.count else 0,
+            max_response_time=histogram.max if histogram.count else 0,
+            percentiles={p: histogram.percentile(p) for p in (50, 90, 95, 99)} if histogram.count else {},
+            error_rate=(recorder.failed / total_requests * 100) if total_requests else 100.0,
+            throughput_bytes_per_sec=recorder.bytes / total_time if total_time > 0 else 0,
             memory_usage=resource_stats.get("memory", {}),
-            cpu_usage=resource_stats.get("cpu", {})
+            cpu_usage=resource_stats.get("cpu", {}),
+            mode=plan.mode,
+            target_rps=plan.target_rps,
+            corrected_percentiles=(
+                {p: corrected.percentile(p) for p in (50, 90, 95, 99)} if corrected is not None and corrected.count else {}
+            ),
+            histogram=histogram,
+            corrected_histogram=corrected
         )
 
     def _display_benchmark_result(self, result: BenchmarkResult):
@@ -376,6 +704,9 @@ class PerformanceMonitor:
         table.add_column("값", style="magenta")
 
         # 기본 통계
+        table.add_row("부하 모드", result.mode)
+        if result.target_rps:
+            table.add_row("목표 RPS", f"{result.target_rps:.2f}")
         table.add_row("총 요청 수", f"{result.total_requests:,}")
         table.add_row("성공 요청", f"{result.successful_requests:,}")
         table.add_row("실패 요청", f"{result.failed_requests:,}")
@@ -393,6 +724,10 @@ class PerformanceMonitor:
         for p, value in result.percentiles.items():
             table.add_row(f"{p}th 백분위수", f"{value:.3f}초")
 
+        # 예정 시각 기준 백분위수 (coordinated omission 보정)
+        for p, value in result.corrected_percentiles.items():
+            table.add_row(f"{p}th 백분위수 (보정)", f"{value:.3f}초")
+
         # 처리량
         table.add_row("", "")  # 구분선
         table.add_row("데이터 처리량", f"{result.throughput_bytes_per_sec / 1024:.2f} KB/s")
@@ -407,6 +742,14 @@ class PerformanceMonitor:
             table.add_row("최대 CPU 사용률", f"{result.cpu_usage.get('peak', 0):.2f}%")
             table.add_row("평균 CPU 사용률", f"{result.cpu_usage.get('average', 0):.2f}%")
 
+        if result.client_overhead:
+            overhead = result.client_overhead
+            table.add_row("", "")  # 구분선
+            table.add_row("부하 생성기 CPU 시간", f"{overhead['cpu_seconds']:.2f}초 ({overhead['cpu_percent']:.1f}% of 1 core)")
+            if overhead.get("processes"):
+                table.add_row("부하 생성 프로세스", f"{overhead['processes']}")
+            table.add_row("요청당 CPU 시간", f"{overhead['cpu_per_request_ms']:.3f}ms")
+
         self.console.print(table)
 
         # 성능 기준선과 비교
@@ -481,7 +824,7 @@ class PerformanceMonitor:
         response_times = [m.response_time for m in recent_metrics]
         successful_requests = sum(1 for m in recent_metrics if m.success)
 
-        return {
+        summary = {
             "period_minutes": last_n_minutes,
             "total_requests": len(recent_metrics),
             "successful_requests": successful_requests,
@@ -490,10 +833,16 @@ class PerformanceMonitor:
             "min_response_time": min(response_times),
             "max_response_time": max(response_times),
             "p95_response_time": statistics.quantiles(response_times, n=20)[18] if len(response_times) > 20 else max(response_times),
-            "avg_memory_usage": statistics.mean([m.memory_usage_mb for m in recent_metrics]),
-            "avg_cpu_usage": statistics.mean([m.cpu_percent for m in recent_metrics])
         }
 
+        # 리소스 사용량은 요청별로 측정하지 않으므로 최근 벤치마크의 샘플러 결과 사용
+        if self.benchmark_results:
+            latest = self.benchmark_results[-1]
+            summary["avg_memory_usage"] = latest.memory_usage.get("average", 0)
+            summary["avg_cpu_usage"] = latest.cpu_usage.get("average", 0)
+
+        return summary
+
     def detect_performance_regression(self, threshold_percent: float = 10.0) -> List[str]:
         """성능 회귀 감지"""
         if not self.baseline_metrics or len(self.benchmark_results) < 2:
@@ -541,23 +890,7 @@ class PerformanceMonitor:
         }
 
         for result in self.benchmark_results:
-            data["benchmark_results"].append({
-                "name": result.name,
-                "timestamp": result.timestamp.isoformat(),
-                "total_requests": result.total_requests,
-                "successful_requests": result.successful_requests,
-                "failed_requests": result.failed_requests,
-                "total_time": result.total_time,
-                "requests_per_second": result.requests_per_second,
-                "avg_response_time": result.avg_response_time,
-                "min_response_time": result.min_response_time,
-                "max_response_time": result.max_response_time,
-                "percentiles": result.percentiles,
-                "error_rate": result.error_rate,
-                "throughput_bytes_per_sec": result.throughput_bytes_per_sec,
-                "memory_usage": result.memory_usage,
-                "cpu_usage": result.cpu_usage
-            })
+            data["benchmark_results"].append(result.to_dict())
 
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
@@ -578,13 +911,16 @@ async def quick_benchmark(
 
     benchmark_name = name or f"Quick benchmark: {url}"
 
-    return await monitor.run_benchmark(
-        name=benchmark_name,
-        url=url,
-        concurrent_requests=concurrency,
-        total_requests=requests,
-        **kwargs
-    )
+    try:
+        return await monitor.run_benchmark(
+            name=benchmark_name,
+            url=url,
+            concurrent_requests=concurrency,
+            total_requests=requests,
+            **kwargs
+        )
+    finally:
+        await monitor.close()
 
 
 async def compare_endpoints(
@@ -596,21 +932,24 @@ async def compare_endpoints(
     monitor = PerformanceMonitor()
     results = []
 
-    for endpoint in endpoints:
-        name = endpoint.get('name', endpoint['url'])
-        url = endpoint['url']
-        method = endpoint.get('method', 'GET')
+    try:
+        for endpoint in endpoints:
+            name = endpoint.get('name', endpoint['url'])
+            url = endpoint['url']
+            method = endpoint.get('method', 'GET')
 
-        result = await monitor.run_benchmark(
-            name=name,
-            url=url,
-            method=method,
-            concurrent_requests=concurrency,
-            total_requests=requests_per_endpoint,
-            **endpoint.get('kwargs', {})
-        )
+            result = await monitor.run_benchmark(
+                name=name,
+                url=url,
+                method=method,
+                concurrent_requests=concurrency,
+                total_requests=requests_per_endpoint,
+                **endpoint.get('kwargs', {})
+            )
 
-        results.append(result)
+            results.append(result)
+    finally:
+        await monitor.close()
 
     # 비교 결과 출력
     comparison_table = Table(title="엔드포인트 성능 비교")
@@ -0,0 +1,185 @@
+"""
+고정 주기 (fixed-rate) 작업 스케줄러
+
+각 작업은 자신만의 타이머를 가지며 ``start + offset + k * interval`` 시각에 실행됩니다.
+실행 시간이 길어져도 다음 실행 시각이 밀리지 않고 (drift 없음), 느린 작업이 다른 작업을
+지연시키지 않습니다. 동시 실행 수는 세마포어로 제한되며, 이전 실행이 끝나지 않았거나
+이벤트 루프가 밀려 건너뛴 틱은 ``missed`` 로 집계됩니다.
+"""
+
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set
+
+
+@dataclass
+class ScheduleStats:
+    """작업별 스케줄 통계"""
+    scheduled: int = 0      # 도래한 틱 수
+    started: int = 0        # 실제 실행 시작 수
+    completed: int = 0      # 실행 완료 수
+    errors: int = 0         # 예외로 끝난 실행 수
+    missed: int = 0         # 건너뛴 틱 수 (이전 실행 진행 중 / 루프 지연)
+    total_lag: float = 0.0  # 예정 시각 대비 실행 시작 지연 합계 (초)
+    max_lag: float = 0.0
+
+    @property
+    def avg_lag(self) -> float:
+        return self.total_lag / self.started if self.started else 0.0
+
+
+@dataclass
+class _Job:
+    key: Hashable
+    func: Callable[[], Awaitable[Any]]
+    interval: float
+    offset: float = 0.0
+    running: bool = False
+    stats: ScheduleStats = field(default_factory=ScheduleStats)
+
+
+class FixedRateScheduler:
+    """
+    고정 주기 스케줄러
+
+    Args:
+        interval: 기본 실행 주기 (초)
+        max_concurrency: 동시에 실행할 수 있는 작업 수
+        jitter: 작업별 시작 위상을 ``[0, jitter * interval)`` 범위에서 무작위로 분산 (0~1).
+            많은 작업이 같은 순간에 몰리는 thundering herd 를 막습니다.
+        on_error: 작업 예외 콜백 ``on_error(key, exc)``
+    """
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        max_concurrency: int = 10,
+        jitter: float = 0.1,
+        on_error: Optional[Callable[[Hashable, BaseException], Any]] = None,
+    ):
+        if interval <= 0:
+            raise ValueError(f"interval must be positive: {interval}")
+        self.interval = interval
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.jitter = min(max(jitter, 0.0), 1.0)
+        self.on_error = on_error
+
+        self._jobs: Dict[Hashable, _Job] = {}
+        self._timers: List[asyncio.Task] = []
+        self._inflight: Set[asyncio.Task] = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._stop_event: Optional[asyncio.Event] = None
+
+    def add(self, key: Hashable, func: Callable[[], Awaitable[Any]], interval: Optional[float] = None):
+        """작업 등록 (func 는 인자 없는 코루틴 함수)"""
+        job_interval = interval or self.interval
+        offset = random.uniform(0, self.jitter * job_interval) if self.jitter else 0.0
+        self._jobs[key] = _Job(key=key, func=func, interval=job_interval, offset=offset)
+
+    @property
+    def stats(self) -> Dict[Hashable, ScheduleStats]:
+        """작업별 통계"""
+        return {key: job.stats for key, job in self._jobs.items()}
+
+    def total_stats(self) -> ScheduleStats:
+        """전체 작업 통계 합계"""
+        total = ScheduleStats()
+        for job in self._jobs.values():
+            s = job.stats
+            total.scheduled += s.scheduled
+            total.started += s.started
+            total.completed += s.completed
+            total.errors += s.errors
+            total.missed += s.missed
+            total.total_lag += s.total_lag
+            total.max_lag = max(total.max_lag, s.max_lag)
+        return total
+
+    def stop(self):
+        """스케줄러 중단 요청"""
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    async def run(self, duration: Optional[float] = None):
+        """
+        스케줄러 실행
+
+        Args:
+            duration: 실행 시간 (초). None 이면 stop() 또는 취소될 때까지 실행
+        """
+        if not self._jobs:
+            raise ValueError("No jobs registered")
+
+        loop = asyncio.get_running_loop()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._stop_event = asyncio.Event()
+        start = loop.time()
+
+        self._timers = [asyncio.create_task(self._timer(job, start)) for job in self._jobs.values()]
+
+        try:
+            if duration is not None:
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=duration)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await self._stop_event.wait()
+        finally:
+            pending = self._timers + list(self._inflight)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            self._timers.clear()
+            self._inflight.clear()
+
+    async def _timer(self, job: _Job, start: float):
+        """작업별 고정 주기 타이머"""
+        loop = asyncio.get_running_loop()
+        next_tick = start + job.offset
+
+        while True:
+            delay = next_tick - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            # 이벤트 루프 지연으로 한 주기 이상 밀린 틱은 실행하지 않고 건너뜀
+            behind = int((loop.time() - next_tick) // job.interval)
+            if behind > 0:
+                job.stats.scheduled += behind
+                job.stats.missed += behind
+                next_tick += behind * job.interval
+
+            job.stats.scheduled += 1
+            if job.running:
+                # 이전 실행이 아직 끝나지 않음
+                job.stats.missed += 1
+            else:
+                job.running = True
+                task = asyncio.create_task(self._execute(job, next_tick))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+
+            next_tick += job.interval
+
+    async def _execute(self, job: _Job, scheduled_at: float):
+        """동시 실행 수 제한 하에 작업 실행"""
+        loop = asyncio.get_running_loop()
+        try:
+            async with self._semaphore:
+                lag = max(0.0, loop.time() - scheduled_at)
+                job.stats.started += 1
+                job.stats.total_lag += lag
+                job.stats.max_lag = max(job.stats.max_lag, lag)
+                try:
+                    await job.func()
+                    job.stats.completed += 1
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    job.stats.errors += 1
+                    if self.on_error:
+                        self.on_error(job.key, e)
+        finally:
+            job.running = False
@@ -0,0 +1,186 @@
+"""
+고정 메모리 스트리밍 통계
+
+샘플을 보관하지 않고 O(1) 로 갱신되는 통계 프리미티브입니다.
+
+    - Welford 알고리즘 기반 평균/분산
+    - 최소/최대
+    - EWMA (지수 가중 이동 평균)
+    - P² 알고리즘 기반 스트리밍 분위수 (p50/p95/p99 등, 분위수당 마커 5개)
+
+엔드포인트가 하루 종일 수백만 건을 기록해도 메모리 사용량은 일정합니다.
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Sequence
+
+
+class P2Quantile:
+    """
+    P² (Jain & Chlamtac) 스트리밍 분위수 추정기
+
+    5개의 마커만 유지하면서 분위수를 근사합니다. 처음 5개 샘플까지는 정확한 값을 반환합니다.
+    """
+
+    __slots__ = ("p", "_heights", "_positions", "_desired", "_increments", "_count")
+
+    def __init__(self, p: float):
+        if not 0 < p < 1:
+            raise ValueError(f"Quantile must be between 0 and 1: {p}")
+        self.p = p
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self._increments = [0, p / 2, p, (1 + p) / 2, 1]
+        self._count = 0
+
+    def add(self, value: float):
+        """샘플 추가"""
+        self._count += 1
+        heights = self._heights
+
+        if self._count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        # 샘플이 속한 구간 k 찾기 (마커 높이 갱신)
+        if value < heights[0]:
+            heights[0] = value
+            k = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            k = 3
+        else:
+            k = 0
+            while k < 3 and value >= heights[k + 1]:
+                k += 1
+
+        positions = self._positions
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        desired = self._desired
+        for i in range(5):
+            desired[i] += self._increments[i]
+
+        # 중간 마커 높이 조정
+        for i in range(1, 4):
+            d = desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (d <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not heights[i - 1] < candidate < heights[i + 1]:
+                    candidate = self._linear(i, step)
+                heights[i] = candidate
+                positions[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, d: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+
+    @property
+    def value(self) -> float:
+        """현재 분위수 추정치"""
+        if not self._heights:
+            return 0.0
+        if self._count <= 5:
+            # 샘플이 적을 때는 정렬된 값에서 최근접 순위 사용
+            index = min(len(self._heights) - 1, max(0, math.ceil(self.p * len(self._heights)) - 1))
+            return self._heights[index]
+        return self._heights[2]
+
+
+class RollingStats:
+    """
+    O(1) 스트리밍 통계
+
+    Args:
+        quantiles: 추적할 분위수 (0~1). 기본은 p50/p95/p99
+        ewma_alpha: EWMA 가중치 (0~1, 클수록 최근 값에 민감)
+    """
+
+    __slots__ = ("count", "mean", "_m2", "min", "max", "ewma", "ewma_alpha", "last", "_quantiles")
+
+    def __init__(self, quantiles: Sequence[float] = (0.5, 0.95, 0.99), ewma_alpha: float = 0.1):
+        self.ewma_alpha = ewma_alpha
+        self._quantiles: Dict[float, P2Quantile] = {q: P2Quantile(q) for q in quantiles}
+        self.reset()
+
+    def reset(self):
+        """통계 초기화"""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.ewma: Optional[float] = None
+        self.last: Optional[float] = None
+        self._quantiles = {q: P2Quantile(q) for q in self._quantiles}
+
+    def add(self, value: float):
+        """샘플 추가"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        self.ewma = value if self.ewma is None else self.ewma + self.ewma_alpha * (value - self.ewma)
+        self.last = value
+
+        for estimator in self._quantiles.values():
+            estimator.add(value)
+
+    def extend(self, values: Iterable[float]):
+        """여러 샘플 추가"""
+        for value in values:
+            self.add(value)
+
+    @property
+    def variance(self) -> float:
+        """표본 분산"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """표본 표준편차"""
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> float:
+        """추적 중인 분위수 추정치 (추적하지 않는 분위수는 KeyError)"""
+        return self._quantiles[q].value
+
+    def percentiles(self) -> Dict[int, float]:
+        """추적 중인 분위수를 {50: ..., 95: ...} 형태로 반환"""
+        return {int(round(q * 100)): est.value for q, est in self._quantiles.items()}
+
+    def to_dict(self) -> Dict[str, float]:
+        """요약 딕셔너리"""
+        summary = {
+            "count": self.count,
+            "mean": self.mean,
+            "stddev": self.stddev,
+            "min": self.min if self.count else 0.0,
+            "max": self.max if self.count else 0.0,
+            "ewma": self.ewma or 0.0,
+        }
+        for percentile, value in self.percentiles().items():
+            summary[f"p{percentile}"] = value
+        return summary
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"RollingStats(count={self.count}, mean={self.mean:.6f}, min={self.min}, max={self.max})"
@@ -0,0 +1,239 @@
+"""
+고정 용량 컬럼형 시계열 버퍼
+
+지표마다 ``array('d')`` 컬럼 하나를 두고, 각 값을 ``i`` 와 ``i + capacity`` 두 위치에 기록하는
+미러링 링 버퍼입니다. 덕분에 최근 N 개 구간은 언제나 연속 메모리이므로 복사 없이
+``memoryview`` 로 반환할 수 있고, min/max/sum 은 C 루프로 한 번에 계산됩니다.
+
+    - O(1) append (boxed float 리스트, pop(0) 없음)
+    - 최근 N 개 구간의 zero-copy 뷰
+    - 그래프 너비에 맞춘 구간 집계 다운샘플링 (mean/max/min/last)
+
+대시보드는 매 프레임 리스트를 다시 만들지 않고 ``downsample()`` 결과만 그립니다.
+"""
+
+import math
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+_AGGREGATES = ("mean", "max", "min", "last")
+
+
+class TimeSeriesBuffer:
+    """
+    컬럼형 링 버퍼 (timestamp 컬럼 자동 포함)
+
+    Args:
+        columns: 지표 이름 목록
+        capacity: 보관할 최대 샘플 수
+
+    Example:
+        history = TimeSeriesBuffer(["cpu", "memory"], capacity=60)
+        history.append(cpu=12.5, memory=40.1)
+        history.downsample("cpu", width=30)
+    """
+
+    __slots__ = ("capacity", "columns", "version", "_data", "_next", "_size")
+
+    def __init__(self, columns: Sequence[str], capacity: int = 60):
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive: {capacity}")
+        if "timestamp" in columns:
+            raise ValueError("'timestamp' is a reserved column name")
+        self.capacity = capacity
+        self.columns: Tuple[str, ...] = tuple(columns)
+        self._data: Dict[str, array] = {
+            name: array("d", bytes(16 * capacity)) for name in ("timestamp",) + self.columns
+        }
+        self._next = 0
+        self._size = 0
+        # 변경될 때마다 증가 (대시보드가 다시 그릴지 판단하는 키)
+        self.version = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __contains__(self, column: str) -> bool:
+        return column in self._data
+
+    def append(self, timestamp: Optional[float] = None, **values: float):
+        """
+        샘플 하나 추가 (빠진 지표는 NaN)
+
+        Raises:
+            KeyError: 정의되지 않은 지표 이름
+        """
+        unknown = values.keys() - self._data.keys()
+        if unknown:
+            raise KeyError(f"Unknown columns: {sorted(unknown)}")
+
+        index = self._next
+        mirror = index + self.capacity
+        for name, column in self._data.items():
+            if name == "timestamp":
+                value = timestamp if timestamp is not None else math.nan
+            else:
+                value = values.get(name, math.nan)
+                value = math.nan if value is None else value
+            column[index] = column[mirror] = value
+
+        self._next = (index + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+        self.version += 1
+
+    def append_row(self, row: Mapping[str, float], timestamp: Optional[float] = None):
+        """딕셔너리 샘플 추가 (``row`` 의 timestamp 키도 인식)"""
+        row = dict(row)
+        if timestamp is None:
+            timestamp = row.pop("timestamp", None)
+        else:
+            row.pop("timestamp", None)
+        self.append(timestamp, **{name: row.get(name) for name in self.columns})
+
+    def clear(self):
+        self._next = 0
+        self._size = 0
+        self.version += 1
+
+    def _window(self, last: Optional[int]) -> Tuple[int, int]:
+        count = self._size if last is None else max(0, min(last, self._size))
+        end = self._next + self.capacity
+        return end - count, end
+
+    def view(self, column: str, last: Optional[int] = None) -> memoryview:
+        """
+        오래된 것부터 최근 ``last`` 개 값의 zero-copy 뷰 (기본: 전체)
+
+        뷰는 이후 append 로 덮어써질 수 있으므로 같은 프레임 안에서만 사용합니다.
+        """
+        start, end = self._window(last)
+        return memoryview(self._data[column])[start:end]
+
+    def values(self, column: str, last: Optional[int] = None) -> List[float]:
+        """``view()`` 의 리스트 복사본"""
+        return self.view(column, last).tolist()
+
+    def latest(self, column: str, default: float = math.nan) -> float:
+        """가장 최근 값"""
+        if not self._size:
+            return default
+        return self._data[column][self._next + self.capacity - 1]
+
+    def _finite(self, column: str, last: Optional[int]) -> Sequence[float]:
+        data = self.view(column, last)
+        # NaN 이 없으면 (sum 이 유한) 뷰를 그대로 사용
+        if math.isfinite(sum(data)):
+            return data
+        return [value for value in data if not math.isnan(value)]
+
+    def min(self, column: str, last: Optional[int] = None) -> float:
+        data = self._finite(column, last)
+        return min(data) if len(data) else math.nan
+
+    def max(self, column: str, last: Optional[int] = None) -> float:
+        data = self._finite(column, last)
+        return max(data) if len(data) else math.nan
+
+    def mean(self, column: str, last: Optional[int] = None) -> float:
+        data = self._finite(column, last)
+        return sum(data) / len(data) if len(data) else math.nan
+
+    def summary(self, column: str, last: Optional[int] = None) -> Dict[str, float]:
+        """NaN 을 제외한 min/max/mean/latest"""
+        data = self._finite(column, last)
+        if not len(data):
+            return {"min": math.nan, "max": math.nan, "mean": math.nan, "latest": math.nan, "count": 0}
+        return {
+            "min": min(data),
+            "max": max(data),
+            "mean": sum(data) / len(data),
+            "latest": data[-1],
+            "count": len(data),
+        }
+
+    def since(self, timestamp: float) -> int:
+        """``timestamp`` 이후 샘플 수 (timestamp 컬럼이 단조 증가한다고 가정)"""
+        timestamps = self.view("timestamp")
+        return len(timestamps) - bisect_left(timestamps, timestamp)
+
+    def downsample(
+        self,
+        column: str,
+        width: int,
+        method: str = "mean",
+        last: Optional[int] = None
+    ) -> List[float]:
+        """
+        그래프 너비에 맞춘 값 목록
+
+        값이 ``width`` 보다 많으면 연속 구간별로 집계하고, 적으면 그대로 반환합니다.
+
+        Args:
+            method: 구간 집계 방식 ("mean", "max", "min", "last")
+        """
+        if method not in _AGGREGATES:
+            raise ValueError(f"Unsupported downsample method: {method}")
+        data = self.view(column, last)
+        count = len(data)
+        if width <= 0 or count <= width:
+            return data.tolist()
+
+        result = []
+        for i in range(width):
+            start = i * count // width
+            end = (i + 1) * count // width
+            segment = data[start:end]
+            if method == "mean":
+                result.append(sum(segment) / len(segment))
+            elif method == "max":
+                result.append(max(segment))
+            elif method == "min":
+                result.append(min(segment))
+            else:
+                result.append(segment[-1])
+        return result
+
+    def rows(self, last: Optional[int] = None) -> Iterable[Dict[str, float]]:
+        """오래된 것부터 행 단위 딕셔너리 (timestamp 포함)"""
+        views = {name: self.view(name, last) for name in self._data}
+        for i in range(len(views["timestamp"])):
+            yield {name: view[i] for name, view in views.items()}
+
+    def __repr__(self) -> str:
+        return f"TimeSeriesBuffer(columns={list(self.columns)}, size={self._size}, capacity={self.capacity})"
+
+
+def resample(data: Sequence[float], width: int) -> List[float]:
+    """
+    임의 시퀀스를 정확히 ``width`` 개로 맞춤 (많으면 구간 평균, 적으면 선형 보간)
+
+    대시보드 그래프가 리스트/뷰 어느 쪽을 받아도 같은 방식으로 그리도록 하는 보조 함수입니다.
+    """
+    count = len(data)
+    if width <= 0 or not count:
+        return []
+    if count == width:
+        return list(data)
+    if count > width:
+        return [
+            sum(data[i * count // width:(i + 1) * count // width]) / ((i + 1) * count // width - i * count // width)
+            for i in range(width)
+        ]
+    if count == 1 or width == 1:
+        return [float(data[-1])] * width
+    result = []
+    scale = (count - 1) / (width - 1)
+    for i in range(width):
+        pos = i * scale
+        index = int(pos)
+        if index >= count - 1:
+            result.append(float(data[-1]))
+        else:
+            frac = pos - index
+            result.append(data[index] * (1 - frac) + data[index + 1] * frac)
+    return result
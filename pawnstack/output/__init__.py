@@ -1,3 +1,13 @@
 """출력 및 포매팅 모듈"""
 
-# 향후 Rich 기반 출력 도구들이 추가될 예정
\ No newline at end of file
+from pawnstack.output.dashboard import CachedRenderable, DashboardRenderer, RenderStats
+from pawnstack.output.jsonl import JsonlReader, JsonlSink, rotated_files
+
+__all__ = [
+    "CachedRenderable",
+    "DashboardRenderer",
+    "RenderStats",
+    "JsonlReader",
+    "JsonlSink",
+    "rotated_files",
+]
@@ -0,0 +1,250 @@
+"""
+변경분만 다시 그리는 Rich 대시보드 렌더러
+
+``rich.live.Live`` 의 자동 새로고침은 입력이 바뀌지 않아도 매 주기 레이아웃 전체
+(테이블 배치, 마크업 파싱, 그래프 문자열) 를 다시 렌더링합니다. ``DashboardRenderer`` 는
+
+    - 레이아웃의 영역(region)마다 입력 키를 두고, 키가 바뀐 영역만 다시 만들고
+    - 만들어진 영역은 ``CachedRenderable`` 로 감싸 크기가 같으면 렌더링된 라인을 재사용하며
+    - 바뀐 영역이 있을 때만 ``Live.refresh()`` 를 호출하고 (``auto_refresh=False``)
+    - 렌더링 시간이 프레임 예산을 넘으면 다음 프레임을 미뤄 (프레임 드롭) 수집 루프를 굶기지 않습니다.
+
+데이터 수집은 별도 태스크가 자기 주기로 수행하고, 렌더러는 ``max_fps`` 이하로만 그립니다.
+
+Example:
+    renderer = DashboardRenderer(layout, console=console, max_fps=4)
+    renderer.region("header", make_header, key=lambda: int(time.time()))
+    renderer.region("table", make_table, key=lambda: store.version)
+    await renderer.run(lambda: monitor.is_running)
+"""
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.layout import Layout
+from rich.live import Live
+from rich.segment import Segment
+
+# 키가 없는 영역은 invalidate() 될 때만 다시 만듦
+_STATIC = object()
+_UNSET = object()
+
+
+class CachedRenderable:
+    """
+    렌더링된 라인을 크기 (너비, 높이) 별로 캐시하는 래퍼
+
+    감싼 renderable 이 바뀌지 않는 동안에는 같은 크기로 다시 그릴 때 캐시된 세그먼트를
+    그대로 내보내므로, 테이블 배치나 마크업 파싱 비용이 새로고침마다 반복되지 않습니다.
+    """
+
+    __slots__ = ("renderable", "_shape", "_lines")
+
+    def __init__(self, renderable: RenderableType):
+        self.renderable = renderable
+        self._shape: Optional[Tuple[int, Optional[int]]] = None
+        self._lines: List[List[Segment]] = []
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        shape = (options.max_width, options.height)
+        if shape != self._shape:
+            self._lines = console.render_lines(self.renderable, options)
+            self._shape = shape
+        new_line = Segment.line()
+        for line in self._lines:
+            yield from line
+            yield new_line
+
+
+@dataclass
+class RenderStats:
+    """렌더러 통계"""
+    frames: int = 0              # 실제로 화면을 갱신한 프레임
+    idle_frames: int = 0         # 바뀐 영역이 없어 건너뛴 프레임
+    dropped_frames: int = 0      # 렌더링이 예산을 넘어 건너뛴 프레임
+    regions_rendered: int = 0    # 다시 만든 영역 수 (누적)
+    last_render_time: float = 0.0
+    total_render_time: float = 0.0
+
+    @property
+    def avg_render_time(self) -> float:
+        return self.total_render_time / self.frames if self.frames else 0.0
+
+
+class _Region:
+    __slots__ = ("name", "build", "key", "last_key", "dirty")
+
+    def __init__(self, name: str, build: Callable[[], RenderableType], key: Optional[Callable[[], Hashable]]):
+        self.name = name
+        self.build = build
+        self.key = key
+        self.last_key = _UNSET
+        self.dirty = True
+
+
+class DashboardRenderer:
+    """
+    영역별 변경 감지와 프레임 예산을 적용한 Live 렌더러
+
+    Args:
+        layout: 이름 있는 영역으로 나뉜 레이아웃
+        console: 출력 콘솔 (기본: 새 Console)
+        max_fps: 초당 최대 화면 갱신 횟수
+        max_render_share: 렌더링이 차지할 수 있는 최대 시간 비율 (0~1).
+            렌더링이 느리면 이 비율을 지키도록 다음 프레임을 미룹니다.
+        screen: 대체 화면 사용 여부
+    """
+
+    def __init__(
+        self,
+        layout: Layout,
+        console: Optional[Console] = None,
+        max_fps: float = 4.0,
+        max_render_share: float = 0.5,
+        screen: bool = True
+    ):
+        if max_fps <= 0:
+            raise ValueError(f"max_fps must be positive: {max_fps}")
+        if not 0 < max_render_share <= 1:
+            raise ValueError(f"max_render_share must be in (0, 1]: {max_render_share}")
+
+        self.layout = layout
+        self.console = console or Console()
+        self.max_fps = max_fps
+        self.max_render_share = max_render_share
+        self.screen = screen
+        self.stats = RenderStats()
+        self._regions: Dict[str, _Region] = {}
+        self._live: Optional[Live] = None
+        self._size = None
+
+    @property
+    def frame_interval(self) -> float:
+        return 1.0 / self.max_fps
+
+    def region(
+        self,
+        name: str,
+        build: Callable[[], RenderableType],
+        key: Optional[Callable[[], Hashable]] = None
+    ):
+        """
+        영역 등록
+
+        Args:
+            name: 레이아웃 영역 이름
+            build: 영역 renderable 을 만드는 함수
+            key: 영역 입력을 나타내는 값을 반환하는 함수. 값이 바뀔 때만 ``build`` 를 호출합니다.
+                생략하면 처음과 ``invalidate()`` 이후에만 다시 만듭니다.
+        """
+        self.layout[name]  # 없는 영역이면 KeyError
+        self._regions[name] = _Region(name, build, key)
+
+    def invalidate(self, *names: str):
+        """영역을 강제로 다시 만들도록 표시 (이름이 없으면 전체)"""
+        for name in names or self._regions:
+            self._regions[name].dirty = True
+
+    def update(self) -> int:
+        """
+        키가 바뀐 영역만 다시 만들어 레이아웃에 반영
+
+        Returns:
+            다시 만든 영역 수
+        """
+        updated = 0
+        for region in self._regions.values():
+            key = region.key() if region.key else _STATIC
+            if not region.dirty and key == region.last_key:
+                continue
+            self.layout[region.name].update(CachedRenderable(region.build()))
+            region.last_key = key
+            region.dirty = False
+            updated += 1
+        self.stats.regions_rendered += updated
+        return updated
+
+    def render(self, force: bool = False) -> bool:
+        """
+        한 프레임 처리: 바뀐 영역을 반영하고 필요할 때만 화면 갱신
+
+        Returns:
+            화면을 갱신했으면 True
+        """
+        started = time.perf_counter()
+        size = self.console.size
+        if size != self._size:
+            # 터미널 크기가 바뀌면 너비에 의존하는 영역이 많으므로 전부 다시 만듦
+            self._size = size
+            self.invalidate()
+            force = True
+
+        if not self.update() and not force:
+            self.stats.idle_frames += 1
+            return False
+
+        if self._live is not None:
+            self._live.refresh()
+        elapsed = time.perf_counter() - started
+        self.stats.frames += 1
+        self.stats.last_render_time = elapsed
+        self.stats.total_render_time += elapsed
+        return True
+
+    def next_delay(self, elapsed: float, rendered: bool) -> float:
+        """
+        다음 프레임까지 대기 시간
+
+        렌더링이 ``max_render_share`` 를 넘으면 그만큼 쉬고, 그 사이 지나간 프레임은 드롭으로 셉니다.
+        """
+        interval = self.frame_interval
+        delay = interval - elapsed
+        if rendered and self.max_render_share < 1:
+            budget_delay = elapsed * (1 / self.max_render_share - 1)
+            if budget_delay > delay:
+                delay = budget_delay
+                self.stats.dropped_frames += max(0, math.ceil((elapsed + delay) / interval) - 1)
+        return max(delay, 0.0)
+
+    def start(self):
+        if self._live is None:
+            self._size = self.console.size
+            self.update()
+            self._live = Live(
+                self.layout,
+                console=self.console,
+                auto_refresh=False,
+                screen=self.screen
+            )
+            self._live.start(refresh=True)
+
+    def stop(self):
+        if self._live is not None:
+            self._live.stop()
+            self._live = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    async def run(self, until: Callable[[], bool] = lambda: True, duration: Optional[float] = None):
+        """
+        ``until()`` 이 False 가 되거나 ``duration`` 초가 지날 때까지 렌더링 루프 실행
+
+        데이터 수집은 다른 태스크에서 수행하고, 이 루프는 바뀐 영역만 ``max_fps`` 이하로 그립니다.
+        """
+        deadline = time.monotonic() + duration if duration else None
+        with self:
+            while until():
+                if deadline and time.monotonic() >= deadline:
+                    break
+                started = time.perf_counter()
+                rendered = self.render()
+                await asyncio.sleep(self.next_delay(time.perf_counter() - started, rendered))
@@ -0,0 +1,429 @@
+"""
+추가 전용 JSON Lines 싱크와 리더
+
+매 틱마다 전체 JSON 배열을 다시 쓰는 대신 레코드를 한 줄씩 이어 씁니다.
+
+    - 메모리에 모았다가 ``batch_size`` 개 또는 ``flush_interval`` 초마다 한 번에 기록 + fsync
+    - 파일 확장자로 압축 선택 (``.gz`` → gzip, ``.zst`` → zstd, 그 외 평문)
+    - 크기 (``max_bytes``) / 시간 (``rotate_interval``) 기준 로테이션, ``backup_count`` 개만 보관
+    - 리더는 로테이션된 파일까지 시간 범위로 조회하거나 마지막 N 개 / 실시간 추적 지원
+
+로테이션된 파일 이름은 ``<stem>-<UTC 시각><확장자>`` 형식입니다 (예: ``metrics-20250101T000000000000.jsonl.gz``).
+파일 이름의 시각은 그 파일의 마지막 레코드 이후이므로, 범위 조회 시 앞쪽 파일을 열지 않고 건너뜁니다.
+
+Example:
+    with JsonlSink("metrics.jsonl.gz", max_bytes=64 * 1024 * 1024) as sink:
+        sink.write({"timestamp": time.time(), "cpu": 12.5})
+
+    for record in JsonlReader("metrics.jsonl.gz").read(start=time.time() - 3600):
+        ...
+"""
+
+import gzip
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+_ROTATED_FORMAT = "%Y%m%dT%H%M%S%f"
+_COMPRESSIONS = (None, "gzip", "zstd")
+_CHUNK_SIZE = 256 * 1024
+
+
+def detect_compression(path: Union[str, Path]) -> Optional[str]:
+    """확장자로 압축 방식 판단"""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".gz":
+        return "gzip"
+    if suffix in (".zst", ".zstd"):
+        return "zstd"
+    return None
+
+
+def _split_name(path: Path):
+    """``metrics.jsonl.gz`` → (``metrics``, ``.jsonl.gz``)"""
+    stem, dot, suffixes = path.name.partition(".")
+    return stem, dot + suffixes
+
+
+def _import_zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다") from None
+    return zstandard
+
+
+def to_epoch(value: Any) -> Optional[float]:
+    """레코드 timestamp (epoch 숫자, ISO 문자열, datetime) 를 epoch 초로 변환"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+class JsonlSink:
+    """
+    추가 전용 JSON Lines 싱크
+
+    Args:
+        path: 출력 파일 경로
+        compression: "gzip", "zstd", None (기본: 확장자로 판단)
+        batch_size: 이 개수만큼 모이면 기록
+        flush_interval: 마지막 기록 후 이 시간(초)이 지나면 다음 write 에서 기록
+        fsync: 기록할 때마다 fsync 수행 여부
+        max_bytes: 파일 크기가 이 값을 넘으면 로테이션 (압축 후 크기 기준)
+        rotate_interval: 파일을 연 뒤 이 시간(초)이 지나면 로테이션
+        backup_count: 보관할 로테이션 파일 수 (None 이면 모두 보관)
+
+    프로세스가 비정상 종료하면 마지막 flush 이후 버퍼에 남은 레코드 (최대 ``batch_size`` 개,
+    ``flush_interval`` 초 분량) 만 잃습니다.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        compression: Optional[str] = "auto",
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        fsync: bool = True,
+        max_bytes: Optional[int] = None,
+        rotate_interval: Optional[float] = None,
+        backup_count: Optional[int] = None
+    ):
+        if compression == "auto":
+            compression = detect_compression(path)
+        if compression not in _COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive: {batch_size}")
+
+        self.path = Path(path)
+        self.compression = compression
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+
+        self.records_written = 0
+        self._buffer: List[bytes] = []
+        self._lock = threading.Lock()
+        self._raw = None
+        self._stream = None
+        self._opened_at = 0.0
+        self._last_flush = time.monotonic()
+        self._size = 0
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._raw = open(self.path, "ab")
+        if self.compression == "gzip":
+            # 이어 쓰면 새 gzip 멤버가 추가되고, gzip 리더는 멤버를 이어서 읽음
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode="ab")
+        elif self.compression == "zstd":
+            zstandard = _import_zstd()
+            self._stream = zstandard.ZstdCompressor().stream_writer(self._raw, closefd=False)
+        else:
+            self._stream = self._raw
+        self._size = os.fstat(self._raw.fileno()).st_size
+        self._opened_at = time.monotonic()
+
+    def _close_file(self):
+        if self._stream is not None and self._stream is not self._raw:
+            self._stream.close()
+        if self._raw is not None:
+            self._raw.flush()
+            if self.fsync:
+                os.fsync(self._raw.fileno())
+            self._raw.close()
+        self._raw = self._stream = None
+
+    def write(self, record: Dict[str, Any]):
+        """레코드 하나 추가 (batch_size / flush_interval 에 도달하면 기록)"""
+        line = json.dumps(record, ensure_ascii=False, default=str, separators=(",", ":"))
+        with self._lock:
+            self._buffer.append(line.encode("utf-8") + b"\n")
+            if (len(self._buffer) >= self.batch_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush()
+
+    def write_many(self, records: Iterator[Dict[str, Any]]):
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        """버퍼를 파일에 기록하고 fsync"""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        if self._raw is None:
+            self._open()
+
+        self._stream.write(b"".join(self._buffer))
+        self.records_written += len(self._buffer)
+        self._buffer.clear()
+
+        if self.compression == "gzip":
+            self._stream.flush()  # Z_SYNC_FLUSH - 여기까지는 비정상 종료 후에도 읽을 수 있음
+        elif self.compression == "zstd":
+            self._stream.flush(_import_zstd().FLUSH_BLOCK)
+        self._raw.flush()
+        if self.fsync:
+            os.fsync(self._raw.fileno())
+        self._size = os.fstat(self._raw.fileno()).st_size
+
+        if self._should_rotate():
+            self._rotate()
+
+    def _should_rotate(self) -> bool:
+        if self.max_bytes and self._size >= self.max_bytes:
+            return True
+        if self.rotate_interval and time.monotonic() - self._opened_at >= self.rotate_interval:
+            return True
+        return False
+
+    def rotate(self):
+        """현재 파일을 닫고 시각이 붙은 이름으로 옮김"""
+        with self._lock:
+            self._flush()
+            self._rotate()
+
+    def _rotate(self):
+        self._close_file()
+        if not self.path.exists():
+            return
+        stem, suffixes = _split_name(self.path)
+        stamp = datetime.now(timezone.utc).strftime(_ROTATED_FORMAT)
+        os.replace(self.path, self.path.with_name(f"{stem}-{stamp}{suffixes}"))
+
+        if self.backup_count is not None:
+            for old in rotated_files(self.path)[:-self.backup_count or None]:
+                old.unlink(missing_ok=True)
+
+    def close(self):
+        with self._lock:
+            self._flush()
+            self._close_file()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"JsonlSink(path='{self.path}', compression={self.compression}, records={self.records_written})"
+
+
+def rotated_files(path: Union[str, Path]) -> List[Path]:
+    """``path`` 의 로테이션된 파일 목록 (오래된 순)"""
+    path = Path(path)
+    stem, suffixes = _split_name(path)
+    pattern = re.compile(rf"^{re.escape(stem)}-(\d{{8}}T\d{{12}}){re.escape(suffixes)}$")
+    if not path.parent.is_dir():
+        return []
+    matches = []
+    for candidate in path.parent.iterdir():
+        match = pattern.match(candidate.name)
+        if match:
+            matches.append((match.group(1), candidate))
+    return [candidate for _, candidate in sorted(matches)]
+
+
+def _rotated_at(path: Path) -> Optional[float]:
+    stamp = path.name.rsplit("-", 1)[-1][:21]
+    try:
+        return datetime.strptime(stamp, _ROTATED_FORMAT).replace(tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None
+
+
+class JsonlReader:
+    """
+    ``JsonlSink`` 출력 리더 (로테이션된 파일 포함)
+
+    Args:
+        path: 싱크와 같은 경로
+        timestamp_key: 범위 조회에 사용할 레코드 키
+    """
+
+    def __init__(self, path: Union[str, Path], timestamp_key: str = "timestamp"):
+        self.path = Path(path)
+        self.timestamp_key = timestamp_key
+        self.compression = detect_compression(path)
+
+    def files(self) -> List[Path]:
+        """오래된 순 파일 목록 (로테이션 파일 + 현재 파일)"""
+        files = rotated_files(self.path)
+        if self.path.exists():
+            files.append(self.path)
+        return files
+
+    def _chunks(self, path: Path) -> Iterator[bytes]:
+        """압축을 푼 바이트 청크 (비정상 종료로 끝나지 않은 스트림은 읽을 수 있는 데까지)"""
+        with open(path, "rb") as raw:
+            if self.compression == "gzip":
+                # 이어 쓴 여러 gzip 멤버를 차례로 풀고, 트레일러 없는 마지막 멤버도 허용
+                decompressor = zlib.decompressobj(31)
+                while True:
+                    data = raw.read(_CHUNK_SIZE)
+                    if not data:
+                        return
+                    while data:
+                        yield decompressor.decompress(data)
+                        if not decompressor.eof:
+                            break
+                        data = decompressor.unused_data
+                        decompressor = zlib.decompressobj(31)
+            elif self.compression == "zstd":
+                zstandard = _import_zstd()
+                reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+                try:
+                    while True:
+                        data = reader.read(_CHUNK_SIZE)
+                        if not data:
+                            return
+                        yield data
+                except zstandard.ZstdError:
+                    return
+            else:
+                while True:
+                    data = raw.read(_CHUNK_SIZE)
+                    if not data:
+                        return
+                    yield data
+
+    def _iter_file(self, path: Path) -> Iterator[Dict[str, Any]]:
+        pending = b""
+        for chunk in self._chunks(path):
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                if line:
+                    yield json.loads(line)
+        if pending.strip():
+            try:
+                yield json.loads(pending)
+            except ValueError:
+                # 비정상 종료로 잘린 마지막 줄
+                pass
+
+    def read(
+        self,
+        start: Union[float, datetime, str, None] = None,
+        end: Union[float, datetime, str, None] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        ``start`` 이상 ``end`` 이하 레코드 (오래된 순)
+
+        싱크가 시간순으로 기록한다고 가정하고, ``start`` 이전에 로테이션된 파일은 건너뛰며
+        ``end`` 이후 레코드를 만나면 멈춥니다.
+        """
+        start = to_epoch(start)
+        end = to_epoch(end)
+        key = self.timestamp_key
+
+        for path in self.files():
+            if start is not None and path != self.path:
+                rotated_at = _rotated_at(path)
+                if rotated_at is not None and rotated_at < start:
+                    continue
+            for record in self._iter_file(path):
+                if start is None and end is None:
+                    yield record
+                    continue
+                ts = to_epoch(record.get(key))
+                if ts is None:
+                    continue
+                if end is not None and ts > end:
+                    return
+                if start is None or ts >= start:
+                    yield record
+
+    def tail(self, count: int = 10) -> List[Dict[str, Any]]:
+        """마지막 ``count`` 개 레코드"""
+        chunks = []
+        needed = count
+        for path in reversed(self.files()):
+            if needed <= 0:
+                break
+            chunk = list(deque(self._iter_file(path), maxlen=needed))
+            chunks.append(chunk)
+            needed -= len(chunk)
+        return [record for chunk in reversed(chunks) for record in chunk]
+
+    def follow(
+        self,
+        poll_interval: float = 0.5,
+        from_start: bool = False,
+        until: Callable[[], bool] = lambda: True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        새로 추가되는 레코드를 계속 반환 (``tail -F`` 처럼 로테이션되면 새 파일을 다시 엶)
+
+        평문 파일만 지원합니다. ``until()`` 이 False 가 되면 종료합니다.
+        """
+        if self.compression is not None:
+            raise ValueError("follow() supports uncompressed files only")
+
+        f = None
+        inode = None
+        pending = b""
+        try:
+            while until():
+                if f is None:
+                    try:
+                        f = open(self.path, "rb")
+                    except FileNotFoundError:
+                        time.sleep(poll_interval)
+                        continue
+                    inode = os.fstat(f.fileno()).st_ino
+                    if not from_start:
+                        f.seek(0, os.SEEK_END)
+                    from_start = True  # 로테이션 이후 새 파일은 처음부터
+
+                chunk = f.read()
+                if chunk:
+                    pending += chunk
+                    *lines, pending = pending.split(b"\n")
+                    for line in lines:
+                        try:
+                            yield json.loads(line)
+                        except ValueError:
+                            continue
+                    continue
+
+                # 새 데이터가 없으면 로테이션 여부 확인
+                try:
+                    rotated = os.stat(self.path).st_ino != inode
+                except FileNotFoundError:
+                    rotated = True
+                if rotated:
+                    f.close()
+                    f = None
+                    pending = b""
+                else:
+                    time.sleep(poll_interval)
+        finally:
+            if f is not None:
+                f.close()
@@ -18,6 +18,10 @@ from pawnstack.resource.network import (
 )
 
 from pawnstack.resource.disk import DiskUsage
+from pawnstack.resource.process import ProcessCache
+from pawnstack.resource.sampler import SystemSample, SystemSampler, get_system_sampler
+from pawnstack.resource.portscan import PortResult, PortScanner, count_hosts, iter_hosts, parse_ports
+from pawnstack.resource.sockdiag import ProcessNetMonitor, ProcessNetUsage, SockDiag, SocketInodeIndex
 
 __all__ = [
     "get_hostname",
@@ -31,5 +35,18 @@ __all__ = [
     "get_public_ip",
     "get_location",
     "get_location_with_ip_api",
-    "DiskUsage"
+    "DiskUsage",
+    "ProcessCache",
+    "SystemSample",
+    "SystemSampler",
+    "get_system_sampler",
+    "ProcessNetMonitor",
+    "ProcessNetUsage",
+    "SockDiag",
+    "SocketInodeIndex",
+    "PortResult",
+    "PortScanner",
+    "count_hosts",
+    "iter_hosts",
+    "parse_ports"
 ]
\ No newline at end of file
@@ -0,0 +1,331 @@
+"""
+asyncio 기반 대량 TCP 포트 스캐너
+
+``ThreadPoolExecutor`` 에 블로킹 ``connect_ex`` 를 (호스트 × 포트) 개 모두 제출하는 대신
+
+    - 논블로킹 소켓을 ``loop.sock_connect`` 로 연결하고 (스트림/트랜스포트 생성 없음)
+    - 진행 중인 연결 수를 ``concurrency`` 이하로 유지하는 창 (window) 으로 처리하며
+    - 대상은 CIDR/범위에서 정수 연산으로 하나씩 생성하므로 /16 스캔도 메모리가 일정하고
+    - 응답 (열림/RST) 으로 관측한 RTT 로 타임아웃을 조정합니다 (RFC 6298 SRTT/RTTVAR)
+
+``ping=True`` 이면 레거시 ``AsyncPortScanner`` 의 fast scan 처럼 ``ping_ports`` 로 먼저
+살아 있는 호스트만 고르고, 그 호스트의 포트만 검사합니다 (RST 응답도 살아 있는 것으로 간주).
+
+Example:
+    scanner = PortScanner(concurrency=1000, timeout=1.0)
+    async for result in scanner.scan(iter_hosts("10.0.0.0/16"), [22, 80, 443]):
+        if result.state == "open":
+            print(result.host, result.port)
+"""
+
+import asyncio
+import ipaddress
+import socket
+import struct
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from pawnstack.utils.aio import windowed
+
+__all__ = [
+    "AdaptiveTimeout",
+    "PortResult",
+    "PortScanner",
+    "PortScanStats",
+    "count_hosts",
+    "iter_hosts",
+    "parse_ports",
+]
+
+# 즉시 RST 로 닫아 대량 스캔 중 TIME_WAIT 소켓이 쌓이지 않게 함
+_LINGER_RESET = struct.pack("ii", 1, 0)
+
+
+def _parse_host_spec(spec: str) -> Tuple[int, int, int]:
+    """호스트 지정 하나를 (버전, 시작 정수, 끝 정수) 로 변환"""
+    spec = spec.strip()
+    if "/" in spec:
+        network = ipaddress.ip_network(spec, strict=False)
+        first, last = int(network.network_address), int(network.broadcast_address)
+        # /31, /32 (IPv6 /127, /128) 가 아니면 네트워크/브로드캐스트 주소 제외
+        if network.num_addresses > 2:
+            first, last = first + 1, last - (1 if network.version == 4 else 0)
+        return network.version, first, last
+    if "-" in spec:
+        start_text, end_text = spec.split("-", 1)
+        start = ipaddress.ip_address(start_text.strip())
+        end_text = end_text.strip()
+        if end_text.isdigit() and start.version == 4:
+            # 192.168.1.10-20 형식
+            end = ipaddress.ip_address(f"{start_text.rsplit('.', 1)[0]}.{end_text}")
+        else:
+            end = ipaddress.ip_address(end_text)
+        if start.version != end.version:
+            raise ValueError(f"IP version mismatch: {spec}")
+        if start > end:
+            raise ValueError("Start IP must be less than or equal to end IP")
+        return start.version, int(start), int(end)
+    address = ipaddress.ip_address(spec)
+    return address.version, int(address), int(address)
+
+
+def _host_specs(host_range: str) -> List[Tuple[int, int, int]]:
+    return [_parse_host_spec(part) for part in host_range.split(",") if part.strip()]
+
+
+def iter_hosts(host_range: str) -> Iterator[str]:
+    """
+    호스트 범위를 하나씩 생성 (목록을 만들지 않음)
+
+    ``,`` 로 여러 개를 지정할 수 있고 각 항목은 단일 IP, ``시작-끝`` 범위
+    (``192.168.1.10-20`` 축약 포함), CIDR (``10.0.0.0/16``, 네트워크/브로드캐스트 주소 제외) 입니다.
+    형식이 잘못되면 생성 전에 ValueError 가 발생합니다.
+    """
+    specs = _host_specs(host_range)
+
+    def generate():
+        for version, first, last in specs:
+            factory = ipaddress.IPv4Address if version == 4 else ipaddress.IPv6Address
+            for value in range(first, last + 1):
+                yield str(factory(value))
+
+    return generate()
+
+
+def count_hosts(host_range: str) -> int:
+    """``iter_hosts`` 가 생성할 호스트 수 (생성하지 않고 계산)"""
+    return sum(last - first + 1 for _, first, last in _host_specs(host_range))
+
+
+def parse_ports(port_range: str) -> List[int]:
+    """``22,80,8000-8100`` 형식 포트 목록 (중복 제거, 순서 유지)"""
+    ports: Dict[int, None] = {}
+    for part in port_range.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = end = int(part)
+        if not (0 <= start <= 65535 and 0 <= end <= 65535):
+            raise ValueError("Ports must be between 0-65535")
+        if start > end:
+            raise ValueError("Start port must be less than or equal to end port")
+        ports.update(dict.fromkeys(range(start, end + 1)))
+    return list(ports)
+
+
+class AdaptiveTimeout:
+    """
+    관측 RTT 기반 연결 타임아웃 (RFC 6298)
+
+    ``min_samples`` 개를 관측하기 전에는 ``maximum`` 을, 이후에는
+    ``SRTT + 4 * RTTVAR`` 를 ``[minimum, maximum]`` 으로 제한해 사용합니다.
+    """
+
+    __slots__ = ("minimum", "maximum", "min_samples", "srtt", "rttvar", "samples")
+
+    def __init__(self, maximum: float, minimum: float = 0.05, min_samples: int = 8):
+        self.minimum = min(minimum, maximum)
+        self.maximum = maximum
+        self.min_samples = min_samples
+        self.srtt: Optional[float] = None
+        self.rttvar = 0.0
+        self.samples = 0
+
+    def observe(self, rtt: float):
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+        self.samples += 1
+
+    @property
+    def current(self) -> float:
+        if self.srtt is None or self.samples < self.min_samples:
+            return self.maximum
+        return min(self.maximum, max(self.minimum, self.srtt + 4 * self.rttvar))
+
+
+@dataclass
+class PortResult:
+    """포트 하나의 검사 결과 (state: open, closed, filtered, error)"""
+    host: str
+    port: int
+    state: str
+    rtt: float
+    error: Optional[str] = None
+
+    @property
+    def open(self) -> bool:
+        return self.state == "open"
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["open"] = self.open
+        return data
+
+
+@dataclass
+class PortScanStats:
+    """스캔 통계"""
+    probed: int = 0
+    open: int = 0
+    closed: int = 0
+    filtered: int = 0
+    errors: int = 0
+    hosts_checked: int = 0
+    hosts_alive: int = 0
+
+    def record(self, result: PortResult):
+        self.probed += 1
+        if result.state == "open":
+            self.open += 1
+        elif result.state == "closed":
+            self.closed += 1
+        elif result.state == "filtered":
+            self.filtered += 1
+        else:
+            self.errors += 1
+
+
+class PortScanner:
+    """
+    논블로킹 connect 기반 TCP 포트 스캐너
+
+    Args:
+        concurrency: 동시에 진행 중인 연결 수 상한 (RLIMIT_NOFILE 에 맞춰 줄어듦)
+        timeout: 최대 연결 타임아웃 (초), RTT 관측 전에는 이 값을 사용
+        min_timeout: 적응형 타임아웃 하한 (초)
+        adaptive: 관측 RTT 로 타임아웃을 줄일지 여부
+        ping: 포트 검사 전에 ``ping_ports`` 로 살아 있는 호스트만 선별
+        ping_ports: 호스트 생존 확인에 사용할 포트
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 500,
+        timeout: float = 1.0,
+        min_timeout: float = 0.05,
+        adaptive: bool = True,
+        ping: bool = False,
+        ping_ports: Sequence[int] = (22, 80, 443)
+    ):
+        self.concurrency = max(1, min(concurrency, self._fd_budget()))
+        self.timeout = timeout
+        self.rtt = AdaptiveTimeout(timeout, min_timeout) if adaptive else None
+        self.ping = ping
+        self.ping_ports = tuple(ping_ports)
+        self.stats = PortScanStats()
+        self._resolved: Dict[str, Tuple[int, str]] = {}
+
+    @staticmethod
+    def _fd_budget() -> int:
+        """열 수 있는 파일 디스크립터 여유분"""
+        try:
+            import resource
+            soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+        except (ImportError, ValueError, OSError):
+            return 1 << 20
+        if soft == resource.RLIM_INFINITY:
+            return 1 << 20
+        return max(1, soft - 64)
+
+    @property
+    def current_timeout(self) -> float:
+        return self.rtt.current if self.rtt is not None else self.timeout
+
+    async def _resolve(self, host: str) -> Tuple[int, str]:
+        """(주소 패밀리, IP) - IP 리터럴이 아니면 한 번만 조회"""
+        cached = self._resolved.get(host)
+        if cached is not None:
+            return cached
+        try:
+            address = ipaddress.ip_address(host)
+            resolved = (socket.AF_INET6 if address.version == 6 else socket.AF_INET, host)
+        except ValueError:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, None, type=socket.SOCK_STREAM)
+            family, _, _, _, sockaddr = infos[0]
+            resolved = (family, sockaddr[0])
+        self._resolved[host] = resolved
+        return resolved
+
+    async def probe(self, host: str, port: int, timeout: Optional[float] = None) -> PortResult:
+        """포트 하나 연결 시도"""
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            family, address = await self._resolve(host)
+            sock = socket.socket(family, socket.SOCK_STREAM)
+        except OSError as e:
+            return PortResult(host, port, "error", time.perf_counter() - started, str(e))
+
+        timeout = timeout if timeout is not None else self.current_timeout
+        state, error = "open", None
+        try:
+            sock.setblocking(False)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RESET)
+            await asyncio.wait_for(loop.sock_connect(sock, (address, port)), timeout)
+        except ConnectionRefusedError:
+            state = "closed"
+        except asyncio.TimeoutError:
+            state = "filtered"
+        except OSError as e:
+            state, error = "error", e.strerror or str(e)
+        finally:
+            sock.close()
+
+        rtt = time.perf_counter() - started
+        if self.rtt is not None and state in ("open", "closed"):
+            self.rtt.observe(rtt)
+        return PortResult(host, port, state, rtt, error)
+
+    async def is_alive(self, host: str) -> bool:
+        """``ping_ports`` 중 하나라도 응답 (열림 또는 RST) 하면 살아 있는 호스트"""
+        results = await asyncio.gather(*(self.probe(host, port) for port in self.ping_ports))
+        return any(result.state in ("open", "closed") for result in results)
+
+    async def alive_hosts(self, hosts: Iterable[str], concurrency: Optional[int] = None) -> AsyncIterator[str]:
+        """살아 있는 호스트만 생성 (진행 중인 연결은 ``concurrency`` 개 이하)"""
+        limit = max(1, (concurrency or self.concurrency) // max(1, len(self.ping_ports)))
+
+        async def check(host: str) -> Tuple[str, bool]:
+            return host, await self.is_alive(host)
+
+        async for host, alive in windowed(hosts, check, limit):
+            self.stats.hosts_checked += 1
+            if alive:
+                self.stats.hosts_alive += 1
+                yield host
+
+    async def scan(self, hosts: Iterable[str], ports: Sequence[int]) -> AsyncIterator[PortResult]:
+        """
+        (호스트 × 포트) 를 스캔하며 끝나는 순서대로 결과 반환
+
+        진행 중인 연결은 ``concurrency`` 개 이하이며 (``ping`` 이면 생존 확인과 절반씩),
+        대상은 필요할 때 생성합니다.
+        """
+        ports = list(ports)
+        window = self.concurrency
+
+        if self.ping:
+            window = max(1, self.concurrency // 2)
+            source = self.alive_hosts(hosts, window)
+
+            async def targets():
+                async for host in source:
+                    for port in ports:
+                        yield host, port
+
+            pairs: Union[Iterable, AsyncIterator] = targets()
+        else:
+            pairs = ((host, port) for host in hosts for port in ports)
+
+        async for result in windowed(pairs, lambda target: self.probe(*target), window):
+            self.stats.record(result)
+            yield result
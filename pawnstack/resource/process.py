@@ -0,0 +1,202 @@
+"""
+프로세스 리소스 모니터링 유틸리티
+
+``psutil.process_iter()`` 를 매 틱마다 호출하면 모든 프로세스의 cmdline/username 까지 읽고,
+새 Process 객체의 첫 ``cpu_percent()`` 는 의미 없는 0 을 반환합니다. ProcessCache 는
+PID 별 Process 객체를 틱 사이에 유지해 CPU% 를 실제 증분으로 계산하고, 비싼 필드는
+화면에 표시되는 행에 대해서만 한 번 읽어 캐시합니다.
+"""
+
+import heapq
+import os
+import sys
+import psutil
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# 모든 프로세스에 대해 매 틱 수집하는 필드 (oneshot 으로 stat/status 파일 1회 읽기)
+CHEAP_FIELDS = ("cpu_percent", "memory_percent", "memory_info", "cpu_times", "status", "num_threads")
+# 표시되는 행에 대해서만 수집하는 필드 (프로세스가 살아 있는 동안 값이 바뀌지 않으므로 캐시)
+EXPENSIVE_FIELDS = ("cmdline", "username")
+
+
+@dataclass
+class _CacheEntry:
+    process: psutil.Process
+    create_time: float
+    # 15자 이상 이름은 psutil 이 cmdline 을 읽어 보정하므로 생성 시 한 번만 조회
+    name: str
+    info: Dict[str, Any] = field(default_factory=dict)
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+_PROCFS = sys.platform.startswith("linux")
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+# 직접 계산한 값과 psutil 값의 부동소수점 오차 허용 범위 (1 클럭 틱 미만)
+_CREATE_TIME_TOLERANCE = 0.5 / _CLOCK_TICKS
+_boot_time: Optional[float] = None
+
+
+def _read_create_time(process: psutil.Process) -> float:
+    """
+    현재 PID 의 생성 시각
+
+    ``Process.create_time()`` 은 처음 읽은 값을 캐시하므로 PID 재사용을 감지할 수 없습니다.
+    Linux 에서는 /proc/<pid>/stat 의 starttime 을 직접 읽고, 그 외 플랫폼에서는 새 Process 로 조회합니다.
+    """
+    global _boot_time
+    if _PROCFS:
+        try:
+            with open(f"/proc/{process.pid}/stat", "rb") as f:
+                stat = f.read()
+        except FileNotFoundError:
+            raise psutil.NoSuchProcess(process.pid)
+        except OSError:
+            return psutil.Process(process.pid).create_time()
+        # comm 에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후부터 필드 분리 (starttime 은 22번째 필드)
+        start_ticks = int(stat.rsplit(b")", 1)[1].split()[19])
+        if _boot_time is None:
+            _boot_time = psutil.boot_time()
+        return _boot_time + start_ticks / _CLOCK_TICKS
+    return psutil.Process(process.pid).create_time()
+
+
+class ProcessCache:
+    """
+    PID 키 기반 psutil.Process 캐시
+
+    ``refresh()`` 를 호출할 때마다 종료된 PID 는 제거하고, 생성 시각이 달라진 PID
+    (PID 재사용) 는 새 Process 객체로 교체합니다.
+
+    Example:
+        cache = ProcessCache()
+        cache.refresh()
+        for info in cache.top(10, extra_fields=["cmdline"]):
+            print(info["pid"], info["cpu_percent"], info["cmdline"])
+    """
+
+    def __init__(self):
+        self._entries: Dict[int, _CacheEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self._entries
+
+    def _new_entry(self, pid: int) -> Optional[_CacheEntry]:
+        try:
+            process = psutil.Process(pid)
+            return _CacheEntry(process, process.create_time(), process.name())
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+
+    def _sample(self, entry: _CacheEntry) -> bool:
+        """저렴한 필드 갱신. PID 가 재사용되었거나 종료되었으면 False"""
+        process = entry.process
+        info: Dict[str, Any] = {"pid": process.pid, "name": entry.name}
+        try:
+            with process.oneshot():
+                if abs(_read_create_time(process) - entry.create_time) > _CREATE_TIME_TOLERANCE:
+                    return False
+                for name in CHEAP_FIELDS:
+                    try:
+                        info[name] = getattr(process, name)()
+                    except psutil.AccessDenied:
+                        info[name] = None
+        except psutil.ZombieProcess:
+            info.setdefault("status", psutil.STATUS_ZOMBIE)
+        except psutil.NoSuchProcess:
+            return False
+        entry.info = info
+        return True
+
+    def refresh(self) -> List[Dict[str, Any]]:
+        """
+        현재 프로세스 목록으로 캐시 갱신
+
+        Returns:
+            프로세스별 저렴한 필드 딕셔너리 목록 (``pid``, ``name`` 과 CHEAP_FIELDS)
+        """
+        entries = self._entries
+        alive = set(psutil.pids())
+
+        for pid in [pid for pid in entries if pid not in alive]:
+            del entries[pid]
+
+        samples = []
+        for pid in alive:
+            entry = entries.get(pid)
+            if entry is not None and not self._sample(entry):
+                # PID 재사용: 새 프로세스로 교체 (CPU% 는 다음 틱부터 유효)
+                entry = None
+            if entry is None:
+                entry = self._new_entry(pid)
+                if entry is None:
+                    entries.pop(pid, None)
+                    continue
+                entries[pid] = entry
+                # 첫 cpu_percent() 는 다음 refresh 에서 증분 계산을 위한 기준점 (0.0)
+                if not self._sample(entry):
+                    del entries[pid]
+                    continue
+            samples.append(entry.info)
+        return samples
+
+    def details(self, pid: int, fields: Iterable[str] = EXPENSIVE_FIELDS) -> Dict[str, Any]:
+        """
+        표시할 행의 비싼 필드 조회 (PID 당 한 번만 읽고 캐시)
+
+        Returns:
+            ``info`` 에 요청한 필드를 더한 딕셔너리. 캐시에 없는 PID 면 빈 딕셔너리
+        """
+        entry = self._entries.get(pid)
+        if entry is None:
+            return {}
+        for name in fields:
+            if name in entry.extra:
+                continue
+            try:
+                entry.extra[name] = getattr(entry.process, name)()
+            except (psutil.AccessDenied, psutil.ZombieProcess):
+                entry.extra[name] = None
+            except psutil.NoSuchProcess:
+                return {}
+        return {**entry.info, **entry.extra}
+
+    def top(
+        self,
+        n: int,
+        key: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        extra_fields: Iterable[str] = (),
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        samples: Optional[List[Dict[str, Any]]] = None,
+        reverse: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        상위 N 개 프로세스 선택 (전체 정렬 없이 heapq 로 O(P log N))
+
+        Args:
+            n: 선택할 개수
+            key: 정렬 키 (기본: cpu_percent)
+            extra_fields: 선택된 행에 대해서만 추가로 읽을 필드 (예: cmdline, username)
+            predicate: 필터 (True 인 프로세스만 후보)
+            samples: ``refresh()`` 결과 (없으면 새로 갱신)
+            reverse: True 면 큰 값부터, False 면 작은 값부터
+        """
+        if samples is None:
+            samples = self.refresh()
+        if key is None:
+            key = lambda info: info.get("cpu_percent") or 0
+        candidates = samples if predicate is None else (info for info in samples if predicate(info))
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        rows = select(n, candidates, key=key)
+
+        extra_fields = tuple(extra_fields)
+        if not extra_fields:
+            return rows
+        detailed = []
+        for info in rows:
+            details = self.details(info["pid"], extra_fields)
+            detailed.append(details or {**info, **{name: None for name in extra_fields}})
+        return detailed
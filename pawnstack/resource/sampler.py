@@ -0,0 +1,338 @@
+"""
+/proc 기반 비차단 시스템 샘플러
+
+``psutil.cpu_percent(interval=0.1)`` 처럼 측정 구간 동안 잠드는 대신, 직전 샘플과의
+카운터 차이로 CPU 사용률을 계산합니다. Linux 에서는 /proc/stat, /proc/meminfo,
+/proc/net/dev, /proc/diskstats, /proc/loadavg 파일 디스크립터를 열어 둔 채 매 틱
+``pread`` 로 다시 읽으므로, 틱당 비용은 open/close 없이 read 시스템 콜 다섯 번입니다.
+/proc 가 없는 플랫폼에서는 같은 값을 psutil 로 수집합니다.
+
+``top`` 과 ``SystemMonitor`` 는 ``get_system_sampler()`` 로 같은 인스턴스를 공유합니다.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import psutil
+
+# /proc/diskstats 의 섹터 단위 (커널 고정값)
+_SECTOR_SIZE = 512
+# /proc/stat 의 cpu 행에서 합산할 필드 (user nice system idle iowait irq softirq steal)
+_CPU_FIELDS = 8
+# pread 초기 버퍼 크기 (부족하면 두 배씩 증가)
+_READ_SIZE = 8192
+
+
+@dataclass
+class SystemSample:
+    """시스템 샘플 (카운터는 부팅 이후 누적값, 비율은 직전 샘플 대비)"""
+    timestamp: float
+    cpu_percent: float
+    cpu_user: float
+    cpu_system: float
+    cpu_iowait: float
+    cpu_count: int
+    cpu_freq: float
+    memory_total: int
+    memory_used: int
+    memory_available: int
+    memory_percent: float
+    disk_total: int
+    disk_used: int
+    disk_percent: float
+    net_bytes_sent: int
+    net_bytes_recv: int
+    net_packets_sent: int
+    net_packets_recv: int
+    disk_read_bytes: int
+    disk_write_bytes: int
+    load_average: Optional[Tuple[float, float, float]]  # 지원하지 않는 플랫폼에서는 None
+    process_count: int
+    uptime: float
+
+
+class SystemSampler:
+    """
+    비차단 시스템 샘플러
+
+    Args:
+        proc_path: procfs 마운트 경로. None 이거나 /proc/stat 이 없으면 psutil 사용
+        disk_path: 디스크 사용량을 조회할 경로
+        min_interval: 이 간격 (초) 안에 다시 호출하면 직전 샘플을 그대로 반환
+        slow_interval: 프로세스 수와 CPU 클럭처럼 천천히 변하는 값의 갱신 간격 (초)
+
+    Example:
+        sampler = SystemSampler()
+        sample = sampler.sample()
+        print(sample.cpu_percent, sample.memory_percent)
+    """
+
+    def __init__(
+        self,
+        proc_path: Optional[str] = "/proc",
+        disk_path: str = "/",
+        min_interval: float = 0.05,
+        slow_interval: float = 1.0
+    ):
+        self.proc_path = proc_path
+        self.disk_path = disk_path
+        self.min_interval = min_interval
+        self.slow_interval = slow_interval
+        self._lock = threading.Lock()
+        self._fds: Dict[str, int] = {}
+        self._buffer_size: Dict[str, int] = {}
+        self._block_devices: Dict[str, bool] = {}
+        self._last: Optional[SystemSample] = None
+        self._last_monotonic = 0.0
+        self._slow_checked_at = -float("inf")
+        self._process_count = 0
+        self._cpu_freq = 0.0
+        self._cpu_count = os.cpu_count() or 1
+        self._boot_time: Optional[float] = None
+        self._prev_cpu: Optional[Tuple[int, ...]] = None
+        self._cpu_percent = 0.0
+        self._cpu_user = self._cpu_system = self._cpu_iowait = 0.0
+
+        self.procfs = bool(proc_path) and os.path.exists(os.path.join(proc_path, "stat"))
+        if self.procfs:
+            for name in ("stat", "meminfo", "net/dev", "diskstats", "loadavg"):
+                self._fds[name] = os.open(os.path.join(proc_path, name), os.O_RDONLY)
+                self._buffer_size[name] = _READ_SIZE
+
+        # 첫 sample() 이 생성 이후 구간의 CPU 사용률을 반환하도록 기준점 설정
+        self._read_cpu()
+
+    def close(self):
+        """열어 둔 /proc 파일 디스크립터 닫기"""
+        with self._lock:
+            for fd in self._fds.values():
+                os.close(fd)
+            self._fds.clear()
+
+    def __enter__(self) -> "SystemSampler":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _read(self, name: str) -> str:
+        """열어 둔 파일을 처음부터 다시 읽기 (내용이 버퍼보다 크면 버퍼를 늘려 재시도)"""
+        fd = self._fds[name]
+        while True:
+            size = self._buffer_size[name]
+            data = os.pread(fd, size, 0)
+            if len(data) < size:
+                return data.decode("ascii", "replace")
+            self._buffer_size[name] = size * 2
+
+    def _read_cpu(self):
+        """CPU 사용률 갱신 (직전 호출 이후의 jiffies 증분 비율)"""
+        if not self.procfs:
+            times = psutil.cpu_times_percent(None)
+            self._cpu_percent = round(max(0.0, 100.0 - times.idle - getattr(times, "iowait", 0.0)), 1)
+            self._cpu_user = times.user
+            self._cpu_system = times.system
+            self._cpu_iowait = getattr(times, "iowait", 0.0)
+            return
+
+        stat = self._read("stat")
+        values = tuple(int(value) for value in stat[:stat.index("\n")].split()[1:_CPU_FIELDS + 1])
+
+        if self._prev_cpu is not None:
+            deltas = [current - previous for current, previous in zip(values, self._prev_cpu)]
+            delta_total = sum(deltas)
+            if delta_total > 0:
+                idle = deltas[3] + (deltas[4] if len(deltas) > 4 else 0)
+                self._cpu_percent = round(max(0.0, min(100.0, 100.0 * (1 - idle / delta_total))), 1)
+                self._cpu_user = round(100.0 * deltas[0] / delta_total, 1)
+                self._cpu_system = round(100.0 * deltas[2] / delta_total, 1)
+                self._cpu_iowait = round(100.0 * deltas[4] / delta_total, 1) if len(deltas) > 4 else 0.0
+        self._prev_cpu = values
+
+        if self._boot_time is None:
+            for line in stat.splitlines():
+                if line.startswith("btime "):
+                    self._boot_time = float(line.split()[1])
+                    break
+
+    def _read_memory(self) -> Tuple[int, int, int, float]:
+        """
+        (total, used, available, percent)
+
+        available 과 percent 는 psutil.virtual_memory() 와 같은 계산식입니다. used 는 ``total - available``
+        로, psutil 6.0 이상과 같고 psutil 5.x 의 ``total - free - buffers - cached`` 보다 큽니다.
+        """
+        if not self.procfs:
+            memory = psutil.virtual_memory()
+            return memory.total, memory.used, memory.available, memory.percent
+
+        values: Dict[str, int] = {}
+        for line in self._read("meminfo").splitlines():
+            key, _, rest = line.partition(":")
+            parts = rest.split()
+            if parts:
+                values[key] = int(parts[0]) * 1024
+
+        total = values.get("MemTotal", 0)
+        free = values.get("MemFree", 0)
+        available = values.get("MemAvailable")
+        if not available:
+            # MemAvailable 이 없거나 0 (커널 버그) 이면 추정치 사용
+            available = free + values.get("Buffers", 0) + values.get("Cached", 0) + values.get("SReclaimable", 0)
+        if available > total:
+            # 컨테이너 (LXC) 에서 호스트 값이 섞인 경우 psutil 과 같이 free 사용
+            available = free
+        used = total - available
+        percent = round(used / total * 100, 1) if total else 0.0
+        return total, used, available, percent
+
+    def _read_network(self) -> Tuple[int, int, int, int]:
+        """모든 인터페이스 합계 (bytes_sent, bytes_recv, packets_sent, packets_recv)"""
+        if not self.procfs:
+            net_io = psutil.net_io_counters()
+            if net_io is None:
+                return 0, 0, 0, 0
+            return net_io.bytes_sent, net_io.bytes_recv, net_io.packets_sent, net_io.packets_recv
+
+        bytes_sent = bytes_recv = packets_sent = packets_recv = 0
+        for line in self._read("net/dev").splitlines()[2:]:
+            _, _, counters = line.partition(":")
+            fields = counters.split()
+            if len(fields) < 10:
+                continue
+            bytes_recv += int(fields[0])
+            packets_recv += int(fields[1])
+            bytes_sent += int(fields[8])
+            packets_sent += int(fields[9])
+        return bytes_sent, bytes_recv, packets_sent, packets_recv
+
+    def _is_block_device(self, name: str) -> bool:
+        """파티션이 아닌 전체 디스크인지 (psutil 과 동일하게 /sys/block 기준, 결과 캐시)"""
+        known = self._block_devices.get(name)
+        if known is None:
+            known = os.path.exists(f"/sys/block/{name.replace('/', '!')}")
+            self._block_devices[name] = known
+        return known
+
+    def _read_disk_io(self) -> Tuple[int, int]:
+        """전체 디스크 합계 (read_bytes, write_bytes)"""
+        if not self.procfs:
+            disk_io = psutil.disk_io_counters()
+            if disk_io is None:
+                return 0, 0
+            return disk_io.read_bytes, disk_io.write_bytes
+
+        read_bytes = write_bytes = 0
+        for line in self._read("diskstats").splitlines():
+            fields = line.split()
+            if len(fields) < 10 or not self._is_block_device(fields[2]):
+                continue
+            read_bytes += int(fields[5]) * _SECTOR_SIZE
+            write_bytes += int(fields[9]) * _SECTOR_SIZE
+        return read_bytes, write_bytes
+
+    def _read_load_average(self) -> Optional[Tuple[float, float, float]]:
+        """1/5/15분 로드 평균 (지원하지 않는 플랫폼에서는 None)"""
+        if not self.procfs:
+            try:
+                return tuple(psutil.getloadavg())
+            except (AttributeError, OSError):
+                return None
+        fields = self._read("loadavg").split()
+        return float(fields[0]), float(fields[1]), float(fields[2])
+
+    def _refresh_slow(self, now: float):
+        """프로세스 수, CPU 클럭 (slow_interval 마다)"""
+        if now - self._slow_checked_at < self.slow_interval:
+            return
+        self._slow_checked_at = now
+
+        if self.procfs:
+            self._process_count = sum(1 for entry in os.scandir(self.proc_path) if entry.name.isdigit())
+        else:
+            self._process_count = len(psutil.pids())
+
+        try:
+            cpu_freq = psutil.cpu_freq()
+        except (AttributeError, NotImplementedError, OSError):
+            cpu_freq = None
+        self._cpu_freq = cpu_freq.current if cpu_freq else 0.0
+
+        if self._boot_time is None:
+            self._boot_time = psutil.boot_time()
+
+    def sample(self) -> SystemSample:
+        """
+        현재 시스템 샘플 (차단 없음)
+
+        CPU 사용률은 직전 ``sample()`` (또는 생성 시점) 이후 구간의 평균입니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._last is not None and now - self._last_monotonic < self.min_interval:
+                return self._last
+
+            self._read_cpu()
+            memory_total, memory_used, memory_available, memory_percent = self._read_memory()
+            bytes_sent, bytes_recv, packets_sent, packets_recv = self._read_network()
+            disk_read_bytes, disk_write_bytes = self._read_disk_io()
+            load_average = self._read_load_average()
+            self._refresh_slow(now)
+
+            try:
+                disk = psutil.disk_usage(self.disk_path)
+                disk_total, disk_used, disk_percent = disk.total, disk.used, disk.percent
+            except OSError:
+                disk_total = disk_used = 0
+                disk_percent = 0.0
+
+            timestamp = time.time()
+            self._last = SystemSample(
+                timestamp=timestamp,
+                cpu_percent=self._cpu_percent,
+                cpu_user=self._cpu_user,
+                cpu_system=self._cpu_system,
+                cpu_iowait=self._cpu_iowait,
+                cpu_count=self._cpu_count,
+                cpu_freq=self._cpu_freq,
+                memory_total=memory_total,
+                memory_used=memory_used,
+                memory_available=memory_available,
+                memory_percent=memory_percent,
+                disk_total=disk_total,
+                disk_used=disk_used,
+                disk_percent=disk_percent,
+                net_bytes_sent=bytes_sent,
+                net_bytes_recv=bytes_recv,
+                net_packets_sent=packets_sent,
+                net_packets_recv=packets_recv,
+                disk_read_bytes=disk_read_bytes,
+                disk_write_bytes=disk_write_bytes,
+                load_average=load_average,
+                process_count=self._process_count,
+                uptime=timestamp - self._boot_time if self._boot_time else 0.0,
+            )
+            self._last_monotonic = now
+            return self._last
+
+
+_shared_sampler: Optional[SystemSampler] = None
+_shared_lock = threading.Lock()
+
+
+def get_system_sampler() -> SystemSampler:
+    """프로세스 전역 공유 샘플러 (top, SystemMonitor 가 함께 사용)"""
+    global _shared_sampler
+    with _shared_lock:
+        if _shared_sampler is None:
+            _shared_sampler = SystemSampler()
+        return _shared_sampler
@@ -0,0 +1,354 @@
+"""
+netlink sock_diag 기반 프로세스별 네트워크 처리량
+
+eBPF/kprobe 없이 커널의 INET_DIAG 덤프로 모든 TCP 소켓의 ``tcp_info`` 바이트 카운터
+(bytes_acked, bytes_received) 를 한 번의 netlink 요청으로 읽고, 소켓 inode → PID 인덱스로
+프로세스에 귀속시킵니다. 인덱스는 새로 등장한 inode 가 있을 때만, 이전에 소켓을 가졌던
+프로세스부터 /proc/<pid>/fd 를 스캔하고 모두 찾으면 멈춥니다.
+
+UDP 소켓은 커널이 바이트 카운터를 제공하지 않으므로 연결 수만 집계합니다.
+Linux 전용이며, 다른 플랫폼에서는 ``SockDiag`` 생성 시 OSError 가 발생합니다.
+"""
+
+import os
+import socket
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# netlink / sock_diag 상수 (linux/netlink.h, linux/sock_diag.h, linux/inet_diag.h)
+NETLINK_SOCK_DIAG = 4
+SOCK_DIAG_BY_FAMILY = 20
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+NLMSG_ERROR = 0x2
+NLMSG_DONE = 0x3
+INET_DIAG_INFO = 2
+
+_NLMSGHDR = struct.Struct("=IHHII")
+# inet_diag_req_v2: family, protocol, ext, pad, states + inet_diag_sockid (48 bytes)
+_INET_DIAG_REQ_V2 = struct.Struct("=BBBxI48s")
+# inet_diag_msg: family, state, timer, retrans, sockid(sport, dport, src, dst / if / cookie), expires, rqueue, wqueue, uid, inode
+_INET_DIAG_MSG = struct.Struct("=BBBB36sI8sIIIII")
+_RTATTR = struct.Struct("=HH")
+# tcp_info 의 tcpi_bytes_acked, tcpi_bytes_received 오프셋 (Linux 4.1+)
+_TCP_INFO_BYTES = struct.Struct("=QQ")
+_TCP_INFO_BYTES_OFFSET = 120
+
+_PROTOCOLS = {"tcp": socket.IPPROTO_TCP, "udp": socket.IPPROTO_UDP}
+_ALL_STATES = 0xFFFFFFFF
+_RECV_SIZE = 65536
+
+
+@dataclass
+class SocketStats:
+    """sock_diag 로 읽은 소켓 하나의 정보"""
+    protocol: str
+    family: int
+    state: int
+    inode: int
+    cookie: bytes
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+
+@dataclass
+class ProcessNetUsage:
+    """프로세스 (또는 이름 그룹) 별 네트워크 사용량"""
+    pid: Optional[int]
+    name: str
+    sent_rate: float = 0.0
+    recv_rate: float = 0.0
+    connections: int = 0
+    pids: List[int] = field(default_factory=list)
+
+    @property
+    def total_rate(self) -> float:
+        return self.sent_rate + self.recv_rate
+
+
+def _align(length: int) -> int:
+    return (length + 3) & ~3
+
+
+class SockDiag:
+    """
+    netlink sock_diag 클라이언트
+
+    Raises:
+        OSError: netlink 소켓을 만들 수 없는 경우 (Linux 가 아니거나 커널 미지원)
+    """
+
+    def __init__(self):
+        if not hasattr(socket, "AF_NETLINK"):
+            raise OSError("netlink sock_diag is only available on Linux")
+        self._sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_SOCK_DIAG)
+        self._sock.bind((0, 0))
+        self._seq = 0
+
+    def close(self):
+        self._sock.close()
+
+    def __enter__(self) -> "SockDiag":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _dump(self, family: int, protocol: int, ext: int) -> Iterator[Tuple[bytes, int, int]]:
+        """INET_DIAG 덤프 요청 후 응답 메시지 (버퍼, 본문 시작, 본문 끝) 반환"""
+        self._seq += 1
+        seq = self._seq
+        request = _INET_DIAG_REQ_V2.pack(family, protocol, ext, _ALL_STATES, b"\0" * 48)
+        header = _NLMSGHDR.pack(_NLMSGHDR.size + len(request), SOCK_DIAG_BY_FAMILY, NLM_F_REQUEST | NLM_F_DUMP, seq, 0)
+        self._sock.send(header + request)
+
+        while True:
+            data = self._sock.recv(_RECV_SIZE)
+            offset = 0
+            while offset + _NLMSGHDR.size <= len(data):
+                length, msg_type, _, msg_seq, _ = _NLMSGHDR.unpack_from(data, offset)
+                if length < _NLMSGHDR.size:
+                    return
+                if msg_seq == seq:
+                    if msg_type == NLMSG_DONE:
+                        return
+                    if msg_type == NLMSG_ERROR:
+                        error = -struct.unpack_from("=i", data, offset + _NLMSGHDR.size)[0]
+                        if error:
+                            raise OSError(error, os.strerror(error))
+                        return
+                    yield data, offset + _NLMSGHDR.size, offset + length
+                offset += _align(length)
+
+    def sockets(self, protocols: Iterable[str] = ("tcp",)) -> List[SocketStats]:
+        """
+        IPv4/IPv6 소켓 목록 (TCP 는 tcp_info 바이트 카운터 포함)
+
+        Args:
+            protocols: "tcp", "udp" 중 조회할 프로토콜
+        """
+        results = []
+        for name in protocols:
+            protocol = _PROTOCOLS.get(name.lower())
+            if protocol is None:
+                continue
+            ext = 1 << (INET_DIAG_INFO - 1) if protocol == socket.IPPROTO_TCP else 0
+            for family in (socket.AF_INET, socket.AF_INET6):
+                for data, start, end in self._dump(family, protocol, ext):
+                    results.append(self._parse(name.lower(), data, start, end))
+        return results
+
+    @staticmethod
+    def _parse(protocol: str, data: bytes, start: int, end: int) -> SocketStats:
+        family, state, _, _, _, _, cookie, _, _, _, _, inode = _INET_DIAG_MSG.unpack_from(data, start)
+        stats = SocketStats(protocol, family, state, inode, cookie)
+
+        offset = start + _INET_DIAG_MSG.size
+        while offset + _RTATTR.size <= end:
+            attr_length, attr_type = _RTATTR.unpack_from(data, offset)
+            if attr_length < _RTATTR.size:
+                break
+            payload = offset + _RTATTR.size
+            if attr_type == INET_DIAG_INFO and attr_length - _RTATTR.size >= _TCP_INFO_BYTES_OFFSET + _TCP_INFO_BYTES.size:
+                stats.bytes_sent, stats.bytes_received = _TCP_INFO_BYTES.unpack_from(data, payload + _TCP_INFO_BYTES_OFFSET)
+            offset += _align(attr_length)
+        return stats
+
+
+class SocketInodeIndex:
+    """
+    소켓 inode → PID 인덱스 (점진적 갱신)
+
+    ``resolve()`` 에 넘긴 inode 중 모르는 것이 있을 때만 /proc/<pid>/fd 를 스캔합니다.
+    이전에 소켓을 가졌던 프로세스, 새로 생긴 프로세스, 나머지 순으로 스캔하며 모두 찾으면
+    중단합니다. 권한 부족 등으로 찾지 못한 inode 는 ``full_scan_interval`` 동안 다시 찾지 않습니다.
+
+    Args:
+        proc_path: procfs 마운트 경로
+        full_scan_interval: 찾지 못한 inode 를 다시 찾기까지의 간격 (초)
+    """
+
+    def __init__(self, proc_path: str = "/proc", full_scan_interval: float = 10.0):
+        self.proc_path = proc_path
+        self.full_scan_interval = full_scan_interval
+        self._owners: Dict[int, int] = {}
+        self._pid_inodes: Dict[int, Set[int]] = {}
+        self._known_pids: Set[int] = set()
+        self._unresolved: Dict[int, float] = {}
+        self.scanned_pids = 0
+
+    def _list_pids(self) -> Set[int]:
+        return {int(entry.name) for entry in os.scandir(self.proc_path) if entry.name.isdigit()}
+
+    def _scan_pid(self, pid: int) -> Set[int]:
+        """프로세스가 연 소켓 inode 집합"""
+        self.scanned_pids += 1
+        inodes = set()
+        fd_path = os.path.join(self.proc_path, str(pid), "fd")
+        try:
+            with os.scandir(fd_path) as entries:
+                for entry in entries:
+                    try:
+                        target = os.readlink(entry.path)
+                    except OSError:
+                        continue
+                    if target.startswith("socket:["):
+                        inodes.add(int(target[8:-1]))
+        except OSError:
+            pass
+        return inodes
+
+    def _assign(self, pid: int, inodes: Set[int]):
+        for inode in self._pid_inodes.get(pid, ()):
+            if self._owners.get(inode) == pid:
+                del self._owners[inode]
+        self._pid_inodes[pid] = inodes
+        for inode in inodes:
+            self._owners[inode] = pid
+
+    def _forget(self, pid: int):
+        for inode in self._pid_inodes.pop(pid, ()):
+            if self._owners.get(inode) == pid:
+                del self._owners[inode]
+
+    def resolve(self, inodes: Iterable[int]) -> Dict[int, int]:
+        """
+        inode → PID 매핑 (찾지 못한 inode 는 결과에서 제외)
+
+        Args:
+            inodes: 현재 존재하는 소켓 inode (0 은 무시)
+        """
+        now = time.monotonic()
+        wanted = {inode for inode in inodes if inode}
+
+        # 사라진 소켓/프로세스 정리
+        for inode in [inode for inode in self._owners if inode not in wanted]:
+            del self._owners[inode]
+        for inode in [inode for inode in self._unresolved if inode not in wanted]:
+            del self._unresolved[inode]
+
+        missing = {
+            inode for inode in wanted
+            if inode not in self._owners and now - self._unresolved.get(inode, -float("inf")) >= self.full_scan_interval
+        }
+        if missing:
+            pids = self._list_pids()
+            for pid in self._known_pids - pids:
+                self._forget(pid)
+            new_pids = pids - self._known_pids
+            self._known_pids = pids
+
+            owners = [pid for pid in self._pid_inodes if pid in pids]
+            owner_set = set(owners)
+            order = owners + sorted(new_pids - owner_set) + sorted(pids - owner_set - new_pids)
+            for pid in order:
+                inodes_of_pid = self._scan_pid(pid)
+                if inodes_of_pid or pid in self._pid_inodes:
+                    self._assign(pid, inodes_of_pid)
+                missing -= inodes_of_pid
+                if not missing:
+                    break
+            for inode in missing:
+                self._unresolved[inode] = now
+
+        return {inode: self._owners[inode] for inode in wanted if inode in self._owners}
+
+
+def _process_name(proc_path: str, pid: int) -> str:
+    try:
+        with open(os.path.join(proc_path, str(pid), "comm")) as f:
+            return f.read().strip()
+    except OSError:
+        return "?"
+
+
+class ProcessNetMonitor:
+    """
+    프로세스별 네트워크 처리량 모니터 (eBPF 불필요)
+
+    ``sample()`` 을 주기적으로 호출하면 직전 호출 이후 소켓별 바이트 카운터 증분을 PID 별로
+    합산해 초당 전송량을 반환합니다. 첫 호출은 기준점만 기록합니다.
+
+    Args:
+        protocols: 집계할 프로토콜 ("tcp", "udp")
+        proc_path: procfs 마운트 경로
+
+    Raises:
+        OSError: sock_diag 를 사용할 수 없는 경우
+
+    Example:
+        monitor = ProcessNetMonitor()
+        monitor.sample()
+        time.sleep(1)
+        for usage in monitor.sample():
+            print(usage.pid, usage.name, usage.sent_rate, usage.recv_rate)
+    """
+
+    def __init__(self, protocols: Iterable[str] = ("tcp", "udp"), proc_path: str = "/proc"):
+        self.protocols = [protocol.lower() for protocol in protocols]
+        self.proc_path = proc_path
+        self.diag = SockDiag()
+        self.index = SocketInodeIndex(proc_path)
+        self._prev_counters: Dict[bytes, Tuple[int, int]] = {}
+        self._prev_time: Optional[float] = None
+        self._names: Dict[int, str] = {}
+
+    def close(self):
+        self.diag.close()
+
+    def sample(self, group_by: str = "pid") -> List[ProcessNetUsage]:
+        """
+        직전 호출 이후 프로세스별 송수신 속도 (bytes/sec)
+
+        Args:
+            group_by: "pid" 또는 "name" (같은 이름의 프로세스 합산)
+        """
+        now = time.monotonic()
+        sockets = self.diag.sockets(self.protocols)
+        owners = self.index.resolve(sock.inode for sock in sockets)
+        elapsed = now - self._prev_time if self._prev_time is not None else None
+
+        usages: Dict[int, ProcessNetUsage] = {}
+        counters: Dict[bytes, Tuple[int, int]] = {}
+        for sock in sockets:
+            pid = owners.get(sock.inode)
+            if sock.protocol == "tcp":
+                counters[sock.cookie] = (sock.bytes_sent, sock.bytes_received)
+            if pid is None:
+                continue
+
+            usage = usages.get(pid)
+            if usage is None:
+                usage = usages[pid] = ProcessNetUsage(pid, "", pids=[pid])
+            usage.connections += 1
+
+            if elapsed and sock.protocol == "tcp":
+                # 처음 보는 소켓은 구간 중에 열렸으므로 누적값 전체가 이번 구간 전송량
+                prev_sent, prev_received = self._prev_counters.get(sock.cookie, (0, 0))
+                usage.sent_rate += max(0, sock.bytes_sent - prev_sent) / elapsed
+                usage.recv_rate += max(0, sock.bytes_received - prev_received) / elapsed
+
+        self._prev_counters = counters
+        self._prev_time = now
+
+        self._names = {pid: self._names.get(pid) or _process_name(self.proc_path, pid) for pid in usages}
+        for pid, usage in usages.items():
+            usage.name = self._names[pid]
+
+        if group_by != "name":
+            return list(usages.values())
+
+        groups: Dict[str, ProcessNetUsage] = {}
+        for usage in usages.values():
+            group = groups.get(usage.name)
+            if group is None:
+                groups[usage.name] = ProcessNetUsage(None, usage.name, usage.sent_rate, usage.recv_rate,
+                                                     usage.connections, [usage.pid])
+            else:
+                group.sent_rate += usage.sent_rate
+                group.recv_rate += usage.recv_rate
+                group.connections += usage.connections
+                group.pids.append(usage.pid)
+        return list(groups.values())
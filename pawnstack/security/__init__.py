@@ -0,0 +1,15 @@
+"""
+PawnStack 보안 모듈
+
+비밀 정보 (키/토큰) 탐지 엔진, 병렬/증분 저장소 스캔, Git 변경분 스캔
+"""
+
+from .git_diff import GitDiffScanner, parse_patch, pre_receive_revisions
+from .repository import FileEntry, FileResult, RepositoryScanner, RepositoryScanStats, ScanCache, iter_files
+from .scanner import DEFAULT_PATTERNS, LineIndex, Rule, SecretScanner, mask_secret
+
+__all__ = [
+    'DEFAULT_PATTERNS', 'LineIndex', 'Rule', 'SecretScanner', 'mask_secret',
+    'FileEntry', 'FileResult', 'RepositoryScanner', 'RepositoryScanStats', 'ScanCache', 'iter_files',
+    'GitDiffScanner', 'parse_patch', 'pre_receive_revisions',
+]
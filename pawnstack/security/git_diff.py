@@ -0,0 +1,251 @@
+"""
+Git 변경분 스캔
+
+작업 트리 전체 대신 ``git log -p`` / ``git diff --cached`` 출력을 스트리밍으로 읽어
+**추가된 줄만** 검사합니다.
+
+    - 커밋 범위 (``main..feature``), 스테이징된 변경, 전체 히스토리 (``--all``), pre-receive 훅 입력
+    - ``-U0`` 패치를 파일 단위로 모아 한 버퍼로 검사하고 줄 번호를 새 파일 기준으로 복원
+    - ``--reverse`` 순서로 읽어 각 비밀 정보를 처음 도입한 커밋을 보고
+    - 같은 비밀 정보 (규칙 + 지문 + 경로) 가 여러 커밋에 다시 나타나면 한 항목으로 합치고 ``occurrences`` 증가
+
+푸시 하나의 추가 줄만 검사하므로 pre-receive 훅에서도 저장소 크기와 무관하게 빠릅니다.
+"""
+
+import re
+import subprocess
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .scanner import SecretScanner
+
+__all__ = [
+    "AddedLines",
+    "Commit",
+    "GitDiffScanner",
+    "GitScanStats",
+    "parse_patch",
+    "pre_receive_revisions",
+]
+
+# 커밋 헤더 줄: NUL 로 시작해 다른 패치 줄과 구분
+_COMMIT_FORMAT = "--format=%x00%H%x00%an%x00%aI"
+_HUNK_RE = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@")
+_ZERO_SHA = re.compile(r"^0+$")
+_PATCH_OPTIONS = ["-U0", "--no-color", "--no-ext-diff", "--no-textconv"]
+
+
+@dataclass(frozen=True)
+class Commit:
+    """커밋 메타데이터"""
+    sha: str
+    author: str
+    date: str
+
+
+@dataclass
+class AddedLines:
+    """커밋 하나에서 파일 하나에 추가된 줄들 (새 파일 기준 줄 번호 포함)"""
+    commit: Optional[Commit]
+    path: str
+    line_numbers: List[int] = field(default_factory=list)
+    lines: List[str] = field(default_factory=list)
+
+
+@dataclass
+class GitScanStats:
+    """Git 스캔 통계"""
+    commits: int = 0
+    files: int = 0
+    added_lines: int = 0
+
+
+def _unquote_path(path: str) -> str:
+    """git 이 따옴표로 감싼 경로 (제어 문자/비 ASCII 포함) 복원"""
+    if len(path) < 2 or not (path.startswith('"') and path.endswith('"')):
+        return path
+    raw = path[1:-1].encode("latin-1", "backslashreplace").decode("unicode_escape")
+    return raw.encode("latin-1", "ignore").decode("utf-8", "replace")
+
+
+def parse_patch(lines: Iterable[str]) -> Iterator[AddedLines]:
+    """
+    ``git log -p -U0`` / ``git diff -U0`` 출력에서 (커밋, 파일) 별 추가 줄 추출
+
+    커밋 헤더는 ``%x00%H%x00%an%x00%aI`` 형식이어야 합니다. 삭제된 파일, 바이너리 파일,
+    이름만 바뀐 파일은 추가 줄이 없으므로 나오지 않습니다.
+    """
+    commit: Optional[Commit] = None
+    current: Optional[AddedLines] = None
+    in_hunk = False
+    new_line = 0
+
+    for line in lines:
+        line = line.rstrip("\n")
+        if line.startswith("\x00"):
+            if current is not None and current.lines:
+                yield current
+            current = None
+            in_hunk = False
+            _, sha, author, date = (line.split("\x00") + ["", "", ""])[:4]
+            commit = Commit(sha, author, date)
+            continue
+        if line.startswith("diff --git "):
+            if current is not None and current.lines:
+                yield current
+            current = None
+            in_hunk = False
+            continue
+
+        if in_hunk:
+            prefix = line[:1]
+            if prefix == "+":
+                if current is not None:
+                    current.line_numbers.append(new_line)
+                    current.lines.append(line[1:])
+                new_line += 1
+                continue
+            if prefix == " ":
+                new_line += 1
+                continue
+            if prefix in ("-", "\\"):
+                continue
+            # 헝크가 아닌 줄이면 헤더 처리로 넘어감
+
+        if line.startswith("+++ "):
+            # 공백이 있는 경로에는 git 이 끝에 탭을 붙임
+            target = line[4:].rstrip("\t")
+            if target == "/dev/null":
+                current = None
+            else:
+                target = _unquote_path(target)
+                current = AddedLines(commit, target[2:] if target.startswith("b/") else target)
+            in_hunk = False
+            continue
+        match = _HUNK_RE.match(line)
+        if match:
+            in_hunk = True
+            new_line = int(match.group(1))
+
+    if current is not None and current.lines:
+        yield current
+
+
+def pre_receive_revisions(stdin_lines: Iterable[str]) -> List[List[str]]:
+    """
+    pre-receive 훅 입력 (``<old> <new> <ref>``) 을 ``git log`` 리비전 인수로 변환
+
+    새 브랜치는 기존 참조에서 도달할 수 없는 커밋만 (``<new> --not --all``), 삭제는 건너뜁니다.
+    """
+    revisions = []
+    for line in stdin_lines:
+        parts = line.split()
+        if len(parts) < 3:
+            continue
+        old, new, _ref = parts[:3]
+        if _ZERO_SHA.match(new):
+            continue
+        if _ZERO_SHA.match(old):
+            revisions.append([new, "--not", "--all"])
+        else:
+            revisions.append([f"{old}..{new}"])
+    return revisions
+
+
+class GitDiffScanner:
+    """
+    Git 패치 스트림의 추가 줄을 검사
+
+    Args:
+        scanner: 탐지 엔진
+        repo: 저장소 경로
+        dedupe: 같은 비밀 정보를 한 항목으로 합칠지 여부
+        git: git 실행 파일
+    """
+
+    def __init__(self, scanner: SecretScanner, repo: str = ".", dedupe: bool = True, git: str = "git"):
+        self.scanner = scanner
+        self.repo = repo
+        self.dedupe = dedupe
+        self.git = git
+        self.stats = GitScanStats()
+        self._seen: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+
+    def _git_lines(self, args: Sequence[str]) -> Iterator[str]:
+        """git 출력 한 줄씩 (stdout 을 끝까지 읽은 뒤 종료 코드 확인)"""
+        command = [self.git, "-C", self.repo, "-c", "core.quotePath=false", *args]
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            for raw in process.stdout:
+                yield raw.decode("utf-8", "replace")
+            stderr = process.stderr.read().decode("utf-8", "replace").strip()
+            if process.wait() != 0:
+                raise ValueError(f"git {args[0]} 실패: {stderr}")
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+            process.stderr.close()
+
+    def scan_added(self, added: AddedLines) -> List[Dict[str, Any]]:
+        """추가 줄 묶음 하나 검사 (줄 번호는 새 파일 기준, 중복은 합침)"""
+        self.stats.files += 1
+        self.stats.added_lines += len(added.lines)
+        findings = []
+        for finding, fingerprint in self.scanner.scan_text_with_fingerprints("\n".join(added.lines), added.path):
+            finding["line_number"] = added.line_numbers[finding["line_number"] - 1]
+            if added.commit is not None:
+                finding["commit"] = added.commit.sha
+                finding["author"] = added.commit.author
+                finding["commit_date"] = added.commit.date
+
+            if self.dedupe:
+                key = (finding["type"], finding.get("pattern_name"), fingerprint, added.path)
+                first = self._seen.get(key)
+                if first is not None:
+                    first["occurrences"] += 1
+                    continue
+                finding["occurrences"] = 1
+                self._seen[key] = finding
+            findings.append(finding)
+        return findings
+
+    def scan_patch(self, lines: Iterable[str]) -> List[Dict[str, Any]]:
+        """패치 텍스트 스트림 검사"""
+        findings = []
+        last_commit = None
+        for added in parse_patch(lines):
+            if added.commit is not None and added.commit is not last_commit:
+                last_commit = added.commit
+                self.stats.commits += 1
+            findings.extend(self.scan_added(added))
+        return findings
+
+    def scan_revisions(self, revisions: Union[str, Sequence[str]]) -> List[Dict[str, Any]]:
+        """
+        커밋 범위 검사 (오래된 커밋부터 읽어 비밀 정보를 처음 추가한 커밋을 보고)
+
+        Args:
+            revisions: ``git log`` 리비전 인수 (예: ``"main..HEAD"``, ``["abc123", "--not", "--all"]``)
+        """
+        if isinstance(revisions, str):
+            revisions = [revisions]
+        return self.scan_patch(self._git_lines(
+            ["log", "-p", "--reverse", _COMMIT_FORMAT, *_PATCH_OPTIONS, *revisions, "--"]
+        ))
+
+    def scan_history(self) -> List[Dict[str, Any]]:
+        """모든 참조의 전체 히스토리 검사"""
+        return self.scan_revisions(["--all"])
+
+    def scan_staged(self) -> List[Dict[str, Any]]:
+        """스테이징된 변경 검사 (pre-commit 훅 용)"""
+        return self.scan_patch(self._git_lines(["diff", "--cached", *_PATCH_OPTIONS]))
+
+    def scan_pre_receive(self, stdin_lines: Iterable[str]) -> List[Dict[str, Any]]:
+        """pre-receive 훅 입력으로 받은 푸시의 추가 줄 검사"""
+        findings = []
+        for revisions in pre_receive_revisions(stdin_lines):
+            findings.extend(self.scan_revisions(revisions))
+        return findings
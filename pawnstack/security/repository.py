@@ -0,0 +1,300 @@
+"""
+병렬 + 증분 저장소 스캔
+
+    - ``os.scandir`` 기반 워커: DirEntry 의 캐시된 타입 정보로 재귀하고 stat 은 파일당 한 번
+    - 프로세스 풀: 워커마다 ``SecretScanner`` 를 한 번만 받아 (컴파일된 규칙 포함) 청크 단위로 검사
+    - 큰 파일은 ``mmap`` 으로 읽고, 바이너리 판별 (NUL 바이트) 은 같은 버퍼의 앞부분으로 수행
+    - 영구 캐시 (SQLite): ``(경로, 크기, mtime, 내용 해시, 규칙 버전)`` 이 같으면 파일을 열지 않고
+      이전 결과를 재사용하고, mtime 만 바뀐 파일 (git checkout 등) 은 해시가 같으면 정규식을 건너뜀
+
+변경 없는 트리를 다시 스캔하면 stat 만 수행하므로 CI 에서 매 push 마다 실행해도 수 초면 끝납니다.
+"""
+
+import hashlib
+import json
+import mmap
+import multiprocessing
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from pawnstack.utils.walk import FileEntry, iter_files
+
+from .scanner import SecretScanner
+
+__all__ = [
+    "FileEntry",
+    "FileResult",
+    "ScanCache",
+    "RepositoryScanner",
+    "RepositoryScanStats",
+    "iter_files",
+    "read_text",
+]
+
+# 이 크기 이상이면 read() 대신 mmap 으로 읽음
+MMAP_THRESHOLD = 1024 * 1024
+_SNIFF_SIZE = 1024
+
+
+@dataclass
+class FileResult:
+    """파일 하나의 스캔 결과"""
+    path: str
+    findings: List[Dict[str, Any]] = field(default_factory=list)
+    digest: Optional[str] = None
+    binary: bool = False
+    cached: bool = False
+    error: Optional[str] = None
+
+
+def read_text(path: str, size: Optional[int] = None, mmap_threshold: int = MMAP_THRESHOLD) -> Tuple[Optional[str], str]:
+    """
+    파일을 한 번 열어 (텍스트, 내용 해시) 반환 (바이너리면 텍스트는 None)
+
+    ``mmap_threshold`` 이상인 파일은 mmap 으로 매핑해 커널 페이지에서 바로 해시/디코딩합니다.
+    """
+    with open(path, "rb") as f:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size >= mmap_threshold and size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest = hashlib.blake2b(mapped, digest_size=16).hexdigest()
+                if b"\x00" in mapped[:_SNIFF_SIZE]:
+                    return None, digest
+                return str(memoryview(mapped), "utf-8", "ignore"), digest
+        data = f.read()
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if b"\x00" in data[:_SNIFF_SIZE]:
+        return None, digest
+    return data.decode("utf-8", "ignore"), digest
+
+
+# 워커 프로세스 전역 (initializer 에서 한 번 설정)
+_worker_scanner: Optional[SecretScanner] = None
+_worker_mmap_threshold = MMAP_THRESHOLD
+
+
+def _init_worker(scanner: SecretScanner, mmap_threshold: int):
+    global _worker_scanner, _worker_mmap_threshold
+    _worker_scanner = scanner
+    _worker_mmap_threshold = mmap_threshold
+
+
+def _scan_one(scanner: SecretScanner, entry: FileEntry, known_digest: Optional[str], mmap_threshold: int) -> FileResult:
+    try:
+        text, digest = read_text(entry.path, entry.size, mmap_threshold)
+    except OSError as e:
+        return FileResult(entry.path, error=str(e))
+    if text is None:
+        return FileResult(entry.path, digest=digest, binary=True)
+    if known_digest is not None and digest == known_digest:
+        # mtime 만 바뀌고 내용은 같음 - 호출자가 캐시된 결과를 사용
+        return FileResult(entry.path, digest=digest, cached=True)
+    return FileResult(entry.path, scanner.scan_text(text, entry.path), digest)
+
+
+def _scan_chunk(chunk: List[Tuple[FileEntry, Optional[str]]]) -> List[FileResult]:
+    """워커 프로세스 작업 단위"""
+    return [_scan_one(_worker_scanner, entry, digest, _worker_mmap_threshold) for entry, digest in chunk]
+
+
+@dataclass
+class _CacheRow:
+    size: int
+    mtime_ns: int
+    digest: Optional[str]
+    version: str
+    binary: bool
+    findings: List[Dict[str, Any]]
+
+
+class ScanCache:
+    """
+    파일별 스캔 결과 영구 캐시 (SQLite)
+
+    열 때 전체 항목을 메모리로 읽고, 변경분은 ``flush()``/``close()`` 에서 한 트랜잭션으로 기록합니다.
+
+    Args:
+        path: 캐시 파일 경로
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest TEXT,"
+            " version TEXT, binary INTEGER, findings TEXT)"
+        )
+        self._rows: Dict[str, _CacheRow] = {
+            path: _CacheRow(size, mtime_ns, digest, version, bool(binary), json.loads(findings))
+            for path, size, mtime_ns, digest, version, binary, findings in self._db.execute("SELECT * FROM files")
+        }
+        self._dirty: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def lookup(self, entry: FileEntry, version: str) -> Tuple[Optional[FileResult], Optional[str]]:
+        """
+        캐시 조회
+
+        Returns:
+            (크기/mtime/규칙 버전이 모두 같으면 캐시된 결과, 내용 해시 비교용 이전 해시)
+        """
+        row = self._rows.get(entry.path)
+        if row is None or row.version != version:
+            return None, None
+        if row.size == entry.size and row.mtime_ns == entry.mtime_ns:
+            return FileResult(entry.path, row.findings, row.digest, row.binary, cached=True), row.digest
+        return None, row.digest
+
+    def cached_findings(self, path: str) -> List[Dict[str, Any]]:
+        row = self._rows.get(path)
+        return row.findings if row else []
+
+    def store(self, entry: FileEntry, version: str, result: FileResult):
+        self._rows[entry.path] = _CacheRow(
+            entry.size, entry.mtime_ns, result.digest, version, result.binary, result.findings
+        )
+        self._dirty.add(entry.path)
+
+    def prune(self, keep: Iterable[str], under: Optional[str] = None):
+        """``under`` 경로 아래에서 ``keep`` 에 없는 (삭제된) 파일 항목 제거"""
+        keep = set(keep)
+        prefix = os.path.join(under, "") if under else ""
+        for path in [p for p in self._rows if p.startswith(prefix) and p not in keep]:
+            del self._rows[path]
+            self._dirty.add(path)
+
+    def flush(self):
+        if not self._dirty:
+            return
+        with self._db:
+            for path in self._dirty:
+                row = self._rows.get(path)
+                if row is None:
+                    self._db.execute("DELETE FROM files WHERE path = ?", (path,))
+                else:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (path, row.size, row.mtime_ns, row.digest, row.version, int(row.binary),
+                         json.dumps(row.findings, ensure_ascii=False))
+                    )
+        self._dirty.clear()
+
+    def close(self):
+        self.flush()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@dataclass
+class RepositoryScanStats:
+    """저장소 스캔 통계"""
+    files: int = 0          # 텍스트 파일 수 (바이너리 제외)
+    scanned: int = 0        # 실제로 정규식을 실행한 파일
+    cached: int = 0         # 캐시 재사용 (stat 또는 내용 해시 일치)
+    binary: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+
+
+class RepositoryScanner:
+    """
+    파일 목록을 프로세스 풀로 검사하고 결과를 캐시에 반영
+
+    Args:
+        scanner: 탐지 엔진 (워커마다 한 번 전달)
+        workers: 워커 프로세스 수 (기본: CPU 수, 1 이면 현재 프로세스에서 실행)
+        cache: 영구 캐시 (없으면 매번 전부 검사)
+        chunk_size: 워커에 한 번에 보내는 파일 수
+        mmap_threshold: 이 크기 이상인 파일은 mmap 으로 읽음
+    """
+
+    def __init__(
+        self,
+        scanner: SecretScanner,
+        workers: Optional[int] = None,
+        cache: Optional[ScanCache] = None,
+        chunk_size: int = 64,
+        mmap_threshold: int = MMAP_THRESHOLD
+    ):
+        self.scanner = scanner
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = cache
+        self.chunk_size = chunk_size
+        self.mmap_threshold = mmap_threshold
+        self.stats = RepositoryScanStats()
+
+    def _finish(self, entry: FileEntry, result: FileResult, store: bool = True) -> FileResult:
+        stats = self.stats
+        if result.error:
+            stats.errors += 1
+            return result
+        if self.cache is not None and store:
+            if result.cached and not result.binary:
+                # 내용 해시 일치: 이전 결과 재사용 (mtime 만 갱신)
+                result.findings = self.cache.cached_findings(entry.path)
+            self.cache.store(entry, self.scanner.version, result)
+        if result.binary:
+            stats.binary += 1
+            return result
+        stats.files += 1
+        if result.cached:
+            stats.cached += 1
+        else:
+            stats.scanned += 1
+        return result
+
+    def scan(self, entries: Iterable[FileEntry]) -> Iterator[FileResult]:
+        """
+        파일별 결과 (캐시 적중은 즉시, 나머지는 워커가 끝나는 순서대로 청크 단위로)
+        """
+        started = time.perf_counter()
+        version = self.scanner.version
+        pending: List[Tuple[FileEntry, Optional[str]]] = []
+        chunks: List[List[Tuple[FileEntry, Optional[str]]]] = []
+
+        for entry in entries:
+            cached, known_digest = self.cache.lookup(entry, version) if self.cache else (None, None)
+            if cached is not None:
+                yield self._finish(entry, cached, store=False)
+                continue
+            pending.append((entry, known_digest))
+            if len(pending) >= self.chunk_size:
+                chunks.append(pending)
+                pending = []
+        if pending:
+            chunks.append(pending)
+
+        if self.workers <= 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                for entry, digest in chunk:
+                    yield self._finish(entry, _scan_one(self.scanner, entry, digest, self.mmap_threshold))
+        else:
+            # fork 는 스레드 (이벤트 루프, 로거 등) 를 가진 부모에서 교착될 수 있으므로 spawn 사용
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(chunks)),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.scanner, self.mmap_threshold)
+            ) as pool:
+                for chunk, results in zip(chunks, pool.map(_scan_chunk, chunks)):
+                    for (entry, _), result in zip(chunk, results):
+                        yield self._finish(entry, result)
+
+        if self.cache is not None:
+            self.cache.flush()
+        self.stats.elapsed += time.perf_counter() - started
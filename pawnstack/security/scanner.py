@@ -0,0 +1,455 @@
+"""
+한 번 컴파일하고 버퍼 전체를 한 번에 훑는 비밀 정보 (키/토큰) 탐지 엔진
+
+기존 ``pawns scan-key`` 는 파일마다 줄 단위로 나눈 뒤 패턴마다 모든 줄에 대해
+컴파일되지 않은 ``re.finditer`` 를 호출했습니다. 이 엔진은
+
+    - 규칙을 생성 시 한 번만 컴파일하고 (``re.MULTILINE`` 으로 줄 단위 ``^``/``$`` 의미 유지)
+    - 고정 문자열 (``AKIA``, ``ghp_``, ``xox``, ``-----BEGIN`` ...) 이 있는 규칙은 ``keywords`` 로
+      버퍼를 먼저 거르고 (C 수준 ``in`` 검사), 키워드가 없으면 정규식을 아예 실행하지 않으며
+    - 키워드가 없는 규칙들은 단일 alternation 사전 필터로 일치가 없는 버퍼를 한 번에 건너뛰고
+    - 줄 번호/줄 내용은 일치 항목이 있을 때만 줄 오프셋 인덱스를 만들어 계산합니다.
+
+규칙은 버퍼 전체에 적용되므로 부정 문자 클래스가 줄을 넘지 않게 하려면 ``[^"\\n]`` 처럼 씁니다.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import math
+import os
+import re
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+__all__ = [
+    "DEFAULT_PATTERNS",
+    "Rule",
+    "LineIndex",
+    "SecretScanner",
+    "calculate_entropy",
+    "is_base64_encoded",
+    "mask_secret",
+]
+
+# 기본 탐지 규칙 (keywords: 버퍼에 하나도 없으면 규칙을 건너뛰는 소문자 고정 문자열)
+DEFAULT_PATTERNS: Dict[str, Dict[str, Any]] = {
+    'aws_access_key': {
+        'pattern': r'AKIA[0-9A-Z]{16}',
+        'description': 'AWS Access Key ID',
+        'severity': 'high',
+        'keywords': ['akia'],
+    },
+    'aws_secret_key': {
+        'pattern': r'[A-Za-z0-9/+=]{40}',
+        'description': 'AWS Secret Access Key (추정)',
+        'severity': 'high',
+        'context_required': True,
+        # 같은 줄에 컨텍스트 키워드가 있어야 하므로 버퍼에도 반드시 있음
+        'keywords': ['secret', 'key', 'password', 'token'],
+    },
+    'github_token': {
+        'pattern': r'ghp_[A-Za-z0-9]{36}',
+        'description': 'GitHub Personal Access Token',
+        'severity': 'high',
+        'keywords': ['ghp_'],
+    },
+    'github_oauth': {
+        'pattern': r'gho_[A-Za-z0-9]{36}',
+        'description': 'GitHub OAuth Token',
+        'severity': 'high',
+        'keywords': ['gho_'],
+    },
+    'slack_token': {
+        'pattern': r'xox[baprs]-[A-Za-z0-9-]+',
+        'description': 'Slack Token',
+        'severity': 'medium',
+        'keywords': ['xox'],
+    },
+    'discord_token': {
+        'pattern': r'[MN][A-Za-z\d]{23}\.[\w-]{6}\.[\w-]{27}',
+        'description': 'Discord Bot Token',
+        'severity': 'medium'
+    },
+    'jwt_token': {
+        'pattern': r'eyJ[A-Za-z0-9_-]*\.eyJ[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*',
+        'description': 'JWT Token',
+        'severity': 'medium',
+        'keywords': ['eyj'],
+    },
+    'api_key_generic': {
+        'pattern': r'[Aa][Pp][Ii]_?[Kk][Ee][Yy].*[\'"][A-Za-z0-9]{20,}[\'"]',
+        'description': '일반 API Key',
+        'severity': 'medium',
+        'keywords': ['api'],
+    },
+    'private_key': {
+        'pattern': r'-----BEGIN [A-Z ]+PRIVATE KEY-----',
+        'description': 'Private Key',
+        'severity': 'high',
+        'keywords': ['-----begin'],
+    },
+    'password_field': {
+        'pattern': r'[Pp][Aa][Ss][Ss][Ww][Oo][Rr][Dd].*[\'"][^\'"\s]{8,}[\'"]',
+        'description': '비밀번호 필드',
+        'severity': 'low',
+        'keywords': ['password'],
+    },
+    'database_url': {
+        'pattern': r'[a-zA-Z][a-zA-Z0-9+.-]*://[^\s]+:[^\s]+@[^\s]+',
+        'description': '데이터베이스 연결 URL',
+        'severity': 'high',
+        'keywords': ['://'],
+    },
+    'email_credentials': {
+        'pattern': r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}:[^\s]{6,}',
+        'description': '이메일 인증 정보',
+        'severity': 'medium',
+        'keywords': ['@'],
+    }
+}
+
+_CONTEXT_KEYWORDS = ('secret', 'key', 'password', 'token')
+_FLAGS = re.IGNORECASE | re.MULTILINE
+# 발견 항목 형식 버전 (필드나 탐지 결과가 바뀌면 올려서 결과 캐시 무효화)
+_FINDING_FORMAT = 4
+# 번호/이름 역참조 (alternation 으로 묶으면 그룹 번호가 바뀌어 의미가 달라짐)
+_BACKREFERENCE = re.compile(r'\\[1-9]|\(\?P=')
+
+
+def calculate_entropy(text: str) -> float:
+    """문자열의 섀넌 엔트로피 (문자당 비트)"""
+    if not text:
+        return 0.0
+    length = len(text)
+    return -sum(count / length * math.log2(count / length) for count in Counter(text).values())
+
+
+def is_base64_encoded(text: str) -> bool:
+    """Base64 인코딩 여부 확인"""
+    if len(text) < 4 or len(text) % 4 != 0:
+        return False
+
+    try:
+        decoded = base64.b64decode(text, validate=True)
+        # 디코딩된 결과가 의미있는 데이터인지 간단히 확인
+        return len(decoded) > 0 and not all(b == 0 for b in decoded)
+    except Exception:
+        return False
+
+
+def mask_secret(secret: str, hash_secrets: bool = False) -> str:
+    """비밀 정보 마스킹 (앞뒤 4자만 노출하거나 SHA-256 해시 접두어)"""
+    if hash_secrets:
+        return f"[HASH:{hashlib.sha256(secret.encode('utf-8')).hexdigest()[:16]}]"
+    if len(secret) <= 8:
+        return '*' * len(secret)
+    return secret[:4] + '*' * (len(secret) - 8) + secret[-4:]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """컴파일된 탐지 규칙"""
+    name: str
+    pattern: str
+    description: str
+    severity: str = 'medium'
+    context_required: bool = False
+    keywords: Tuple[str, ...] = ()
+    regex: Any = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_dict(cls, name: str, info: Mapping[str, Any]) -> "Rule":
+        """
+        패턴 정의 딕셔너리에서 규칙 생성
+
+        Raises:
+            ValueError: 패턴이 없거나 컴파일할 수 없음
+        """
+        pattern = info.get('pattern') if isinstance(info, Mapping) else None
+        if not pattern:
+            raise ValueError(f"Pattern '{name}' has no 'pattern'")
+        try:
+            regex = re.compile(pattern, _FLAGS)
+        except re.error as e:
+            raise ValueError(f"Invalid pattern '{name}': {e}") from e
+        return cls(
+            name=name,
+            pattern=pattern,
+            description=info.get('description', name),
+            severity=info.get('severity', 'medium'),
+            context_required=bool(info.get('context_required', False)),
+            keywords=tuple(keyword.lower() for keyword in info.get('keywords') or ()),
+            regex=regex,
+        )
+
+
+class LineIndex:
+    """
+    오프셋 → (줄 번호, 열) 변환기
+
+    줄바꿈 위치 목록은 첫 조회 때 한 번만 만듭니다 (일치 항목이 없는 파일은 비용 없음).
+    """
+
+    __slots__ = ("text", "_newlines")
+
+    def __init__(self, text: str):
+        self.text = text
+        self._newlines: Optional[List[int]] = None
+
+    def _index(self) -> List[int]:
+        if self._newlines is None:
+            newlines = []
+            find = self.text.find
+            pos = find('\n')
+            while pos != -1:
+                newlines.append(pos)
+                pos = find('\n', pos + 1)
+            self._newlines = newlines
+        return self._newlines
+
+    def locate(self, offset: int) -> Tuple[int, int]:
+        """1 부터 시작하는 (줄 번호, 열)"""
+        newlines = self._index()
+        line = bisect_right(newlines, offset - 1)
+        line_start = newlines[line - 1] + 1 if line else 0
+        return line + 1, offset - line_start + 1
+
+    def line_at(self, offset: int) -> str:
+        """오프셋이 속한 줄 (줄바꿈 제외)"""
+        start = self.text.rfind('\n', 0, offset) + 1
+        end = self.text.find('\n', offset)
+        return self.text[start:] if end == -1 else self.text[start:end]
+
+
+class SecretScanner:
+    """
+    비밀 정보 탐지 엔진
+
+    Args:
+        patterns: ``{이름: {pattern, description, severity, context_required, keywords}}``
+            (기본: ``DEFAULT_PATTERNS``)
+        check_patterns: 규칙 기반 검사 수행
+        check_entropy: 따옴표 문자열의 엔트로피 검사 수행
+        check_base64: Base64 문자열 검사 수행
+        entropy_threshold: 엔트로피 임계값 (문자당 비트)
+        min_length: 엔트로피/Base64 검사 최소 길이
+        hash_secrets: 일치 문자열을 해시로 마스킹
+        include_content: False 면 일치 문자열/줄 내용을 ``[MASKED]`` 로 대체
+
+    Raises:
+        ValueError: 컴파일할 수 없는 패턴
+    """
+
+    def __init__(
+        self,
+        patterns: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        check_patterns: bool = True,
+        check_entropy: bool = False,
+        check_base64: bool = False,
+        entropy_threshold: float = 4.5,
+        min_length: int = 20,
+        hash_secrets: bool = False,
+        include_content: bool = True
+    ):
+        self.patterns = dict(DEFAULT_PATTERNS if patterns is None else patterns)
+        self.check_patterns = check_patterns
+        self.check_entropy = check_entropy
+        self.check_base64 = check_base64
+        self.entropy_threshold = entropy_threshold
+        self.min_length = min_length
+        self.hash_secrets = hash_secrets
+        self.include_content = include_content
+        # 중복 제거용 지문의 HMAC 키 (인스턴스마다 새로 만들고 저장하지 않음)
+        self._fingerprint_key = os.urandom(16)
+
+        self.rules: List[Rule] = [Rule.from_dict(name, info) for name, info in self.patterns.items()]
+        self._keyword_rules = [rule for rule in self.rules if rule.keywords]
+        self._generic_rules = [rule for rule in self.rules if not rule.keywords]
+        self._generic_prefilter = self._combine(self._generic_rules)
+
+        # 큰따옴표/작은따옴표 문자열을 따로 찾아야 중첩된 따옴표 안의 문자열도 놓치지 않음
+        self._string_regexes = (
+            re.compile(r'"([^"\n]{%d,})"' % min_length),
+            re.compile(r"'([^'\n]{%d,})'" % min_length),
+        )
+        self._base64_regex = re.compile(r'[A-Za-z0-9+/]{%d,}={0,2}' % min_length)
+        self.version = self._ruleset_version()
+
+    @staticmethod
+    def _combine(rules: Sequence[Rule]):
+        """
+        키워드가 없는 규칙들의 단일 alternation (사전 필터)
+
+        alternation 은 겹치는 일치 중 하나만 반환하므로 탐지에는 쓰지 않고, 어느 규칙이든 처음
+        일치할 수 있는 위치를 찾는 데만 씁니다. 커스텀 패턴의 이름 있는 그룹/번호 역참조/인라인
+        플래그 때문에 묶을 수 없으면 None (사전 필터 없이 규칙마다 실행)
+        """
+        if not rules or any(_BACKREFERENCE.search(rule.pattern) for rule in rules):
+            return None
+        try:
+            return re.compile("|".join(f"(?:{rule.pattern})" for rule in rules), _FLAGS)
+        except re.error:
+            return None
+
+    def _ruleset_version(self) -> str:
+        """규칙과 옵션의 해시 (결과 캐시 무효화 키)"""
+        payload = json.dumps(
+            {
+                "format": _FINDING_FORMAT,
+                "patterns": self.patterns,
+                "options": [
+                    self.check_patterns, self.check_entropy, self.check_base64,
+                    self.entropy_threshold, self.min_length, self.hash_secrets, self.include_content,
+                ],
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def _active_rules(self, lowered: str) -> List[Rule]:
+        return [rule for rule in self._keyword_rules if any(keyword in lowered for keyword in rule.keywords)]
+
+    @staticmethod
+    def _keyword_spans(lowered: str, keywords: Sequence[str]) -> List[Tuple[int, int]]:
+        """키워드가 있는 줄들의 (시작, 끝) 오프셋 (인접한 줄은 하나로 합침)"""
+        lines = set()
+        for keyword in keywords:
+            pos = lowered.find(keyword)
+            while pos != -1:
+                start = lowered.rfind('\n', 0, pos) + 1
+                end = lowered.find('\n', pos)
+                end = len(lowered) if end == -1 else end
+                lines.add((start, end))
+                pos = lowered.find(keyword, end)
+
+        spans: List[List[int]] = []
+        for start, end in sorted(lines):
+            if spans and start <= spans[-1][1] + 1:
+                spans[-1][1] = max(spans[-1][1], end)
+            else:
+                spans.append([start, end])
+        return [(start, end) for start, end in spans]
+
+    def iter_pattern_matches(self, content: str) -> Iterator[Tuple[Rule, "re.Match"]]:
+        """
+        (규칙, 일치) 쌍 (키워드가 있는 규칙 먼저)
+
+        키워드 규칙은 키워드가 나오는 줄에서만 정규식을 실행합니다. 규칙은 줄을 넘지 않으므로
+        (일치 항목이나 컨텍스트가 키워드와 같은 줄에 있음) 버퍼 전체를 훑는 것과 결과가 같습니다.
+        """
+        lowered = content.lower()
+        # 소문자 변환으로 길이가 바뀌는 문자가 있으면 오프셋을 공유할 수 없으므로 전체 검사
+        windowed = len(lowered) == len(content)
+        for rule in self._active_rules(lowered):
+            spans = self._keyword_spans(lowered, rule.keywords) if windowed else [(0, len(content))]
+            for start, end in spans:
+                for match in rule.regex.finditer(content, start, end):
+                    yield rule, match
+        if not self._generic_rules:
+            return
+        start = 0
+        if self._generic_prefilter is not None:
+            # 가장 왼쪽 일치 이전에는 어떤 규칙도 일치하지 않으므로 그 위치부터 규칙별로 실행
+            first = self._generic_prefilter.search(content)
+            if first is None:
+                return
+            start = first.start()
+        for rule in self._generic_rules:
+            for match in rule.regex.finditer(content, start):
+                yield rule, match
+
+    def _masked(self, text: str) -> str:
+        return mask_secret(text, self.hash_secrets) if self.include_content else '[MASKED]'
+
+    def _finding(self, index: LineIndex, start: int, text: str, file_path: str, **fields) -> Dict[str, Any]:
+        line_number, column = index.locate(start)
+        finding = {
+            **fields,
+            'file_path': file_path,
+            'line_number': line_number,
+            'column': column,
+            'matched_text': self._masked(text),
+            'line_content': index.line_at(start).strip() if self.include_content else '[MASKED]',
+        }
+        return finding
+
+    def fingerprint(self, text: str) -> str:
+        """
+        일치 문자열의 지문 (중복 제거용)
+
+        이 스캐너 인스턴스의 임의 키로 만든 HMAC 이므로 같은 실행 안에서만 비교할 수 있고,
+        지문만으로 짧은 비밀 값을 대입해 확인할 수 없습니다. 발견 항목/캐시에는 넣지 않습니다.
+        """
+        return hmac.new(self._fingerprint_key, text.encode('utf-8', 'ignore'), hashlib.sha256).hexdigest()[:16]
+
+    def scan_text(self, content: str, file_path: str = "") -> List[Dict[str, Any]]:
+        """텍스트 버퍼 하나를 검사해 발견 항목 목록 반환"""
+        return [finding for finding, _ in self._scan(content, file_path)]
+
+    def scan_text_with_fingerprints(self, content: str, file_path: str = "") -> List[Tuple[Dict[str, Any], str]]:
+        """``scan_text()`` 와 같지만 (발견 항목, ``fingerprint()``) 쌍 목록 반환"""
+        return [(finding, self.fingerprint(text)) for finding, text in self._scan(content, file_path)]
+
+    def _scan(self, content: str, file_path: str) -> List[Tuple[Dict[str, Any], str]]:
+        """(발견 항목, 일치 문자열) 쌍 목록"""
+        findings = []
+        index = LineIndex(content)
+
+        if self.check_patterns:
+            pattern_findings = []
+            for rule, match in self.iter_pattern_matches(content):
+                start = match.start()
+                if rule.context_required:
+                    line = index.line_at(start).lower()
+                    if not any(keyword in line for keyword in _CONTEXT_KEYWORDS):
+                        continue
+                text = match.group(0)
+                pattern_findings.append((start, (self._finding(
+                    index, start, text, file_path,
+                    type='pattern',
+                    pattern_name=rule.name,
+                    description=rule.description,
+                    severity=rule.severity,
+                ), text)))
+            pattern_findings.sort(key=lambda item: item[0])
+            findings.extend(item for _, item in pattern_findings)
+
+        if self.check_entropy:
+            entropy_findings = []
+            for order, regex in enumerate(self._string_regexes):
+                for match in regex.finditer(content):
+                    text = match.group(1)
+                    entropy = calculate_entropy(text)
+                    if entropy >= self.entropy_threshold:
+                        finding = self._finding(
+                            index, match.start(), text, file_path,
+                            type='entropy',
+                            description=f'높은 엔트로피 문자열 (엔트로피: {entropy:.2f})',
+                            severity='medium',
+                        )
+                        finding['entropy'] = entropy
+                        entropy_findings.append(((finding['line_number'], order, match.start()), (finding, text)))
+            # 줄 단위로, 같은 줄에서는 큰따옴표 문자열 먼저 (기존 줄별 검사와 같은 순서)
+            entropy_findings.sort(key=lambda item: item[0])
+            findings.extend(item for _, item in entropy_findings)
+
+        if self.check_base64:
+            for match in self._base64_regex.finditer(content):
+                text = match.group(0)
+                if is_base64_encoded(text):
+                    findings.append((self._finding(
+                        index, match.start(), text, file_path,
+                        type='base64',
+                        description='Base64 인코딩된 데이터',
+                        severity='low',
+                    ), text))
+
+        return findings
+
+    def __repr__(self) -> str:
+        return f"SecretScanner(rules={len(self.rules)}, version={self.version})"
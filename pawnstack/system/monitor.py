@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import math
 import time
 from typing import Dict, List, Optional
 
@@ -11,6 +12,8 @@ from pydantic import BaseModel
 
 from pawnstack.config.settings import SystemConfig
 from pawnstack.core.mixins import LoggerMixin
+from pawnstack.monitoring.timeseries import TimeSeriesBuffer
+from pawnstack.resource.sampler import get_system_sampler
 
 
 class SystemInfo(BaseModel):
@@ -30,6 +33,15 @@ class SystemInfo(BaseModel):
     load_average: Optional[List[float]] = None
 
 
+# 히스토리 버퍼 컬럼 (SystemInfo 숫자 필드 + 로드 평균 3개)
+_HISTORY_FIELDS = (
+    "cpu_percent", "memory_total", "memory_used", "memory_percent",
+    "disk_total", "disk_used", "disk_percent", "network_sent", "network_recv", "process_count",
+)
+_LOAD_FIELDS = ("load_1", "load_5", "load_15")
+_HISTORY_SIZE = 1000
+
+
 class SystemMonitor(LoggerMixin):
     """시스템 리소스 모니터"""
     
@@ -43,52 +55,26 @@ class SystemMonitor(LoggerMixin):
         super().__init__()
         self.config = config
         self._monitoring = False
-        self._history: List[SystemInfo] = []
+        self._history = TimeSeriesBuffer(_HISTORY_FIELDS + _LOAD_FIELDS, capacity=_HISTORY_SIZE)
     
     def get_current_info(self) -> SystemInfo:
-        """현재 시스템 정보 수집"""
-        
-        # CPU 정보
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        
-        # 메모리 정보
-        memory = psutil.virtual_memory()
+        """현재 시스템 정보 수집 (공유 샘플러 사용, CPU 사용률은 직전 수집 이후 구간 기준)"""
         
-        # 디스크 정보
-        disk = psutil.disk_usage('/')
-        
-        # 네트워크 정보
-        try:
-            network = psutil.net_io_counters()
-            network_sent = network.bytes_sent
-            network_recv = network.bytes_recv
-        except Exception:
-            network_sent = network_recv = 0
-        
-        # 프로세스 수
-        process_count = len(psutil.pids())
-        
-        # 로드 평균 (Unix 계열에서만 사용 가능)
-        load_average = None
-        try:
-            load_average = list(psutil.getloadavg())
-        except AttributeError:
-            # Windows에서는 지원하지 않음
-            pass
+        sample = get_system_sampler().sample()
         
         return SystemInfo(
-            timestamp=time.time(),
-            cpu_percent=cpu_percent,
-            memory_total=memory.total,
-            memory_used=memory.used,
-            memory_percent=memory.percent,
-            disk_total=disk.total,
-            disk_used=disk.used,
-            disk_percent=(disk.used / disk.total) * 100,
-            network_sent=network_sent,
-            network_recv=network_recv,
-            process_count=process_count,
-            load_average=load_average,
+            timestamp=sample.timestamp,
+            cpu_percent=sample.cpu_percent,
+            memory_total=sample.memory_total,
+            memory_used=sample.memory_used,
+            memory_percent=sample.memory_percent,
+            disk_total=sample.disk_total,
+            disk_used=sample.disk_used,
+            disk_percent=(sample.disk_used / sample.disk_total) * 100 if sample.disk_total else 0.0,
+            network_sent=sample.net_bytes_sent,
+            network_recv=sample.net_bytes_recv,
+            process_count=sample.process_count,
+            load_average=list(sample.load_average) if sample.load_average is not None else None,
         )
     
     def check_thresholds(self, info: SystemInfo) -> Dict[str, bool]:
@@ -136,12 +122,8 @@ class SystemMonitor(LoggerMixin):
                 # 시스템 정보 수집
                 info = self.get_current_info()
                 
-                # 히스토리에 추가
-                self._history.append(info)
-                
-                # 히스토리 크기 제한 (최근 1000개만 유지)
-                if len(self._history) > 1000:
-                    self._history = self._history[-1000:]
+                # 히스토리에 추가 (최근 1000개만 유지하는 링 버퍼)
+                self._record(info)
                 
                 # 임계값 체크
                 self.check_thresholds(info)
@@ -174,38 +156,51 @@ class SystemMonitor(LoggerMixin):
         self._monitoring = False
         self.logger.info("모니터링 중지 요청됨")
     
+    def _record(self, info: SystemInfo) -> None:
+        """히스토리 버퍼에 한 행 추가"""
+        load = info.load_average or [None, None, None]
+        self._history.append(
+            info.timestamp,
+            **{name: getattr(info, name) for name in _HISTORY_FIELDS},
+            **dict(zip(_LOAD_FIELDS, load)),
+        )
+    
     def get_history(self, limit: Optional[int] = None) -> List[SystemInfo]:
         """모니터링 히스토리 조회"""
-        if limit:
-            return self._history[-limit:]
-        return self._history.copy()
+        history = []
+        for row in self._history.rows(limit or None):
+            load_average = [row[name] for name in _LOAD_FIELDS]
+            history.append(SystemInfo(
+                timestamp=row["timestamp"],
+                cpu_percent=row["cpu_percent"],
+                memory_total=int(row["memory_total"]),
+                memory_used=int(row["memory_used"]),
+                memory_percent=row["memory_percent"],
+                disk_total=int(row["disk_total"]),
+                disk_used=int(row["disk_used"]),
+                disk_percent=row["disk_percent"],
+                network_sent=int(row["network_sent"]),
+                network_recv=int(row["network_recv"]),
+                process_count=int(row["process_count"]),
+                load_average=None if math.isnan(load_average[0]) else load_average,
+            ))
+        return history
     
     def get_average_stats(self, minutes: int = 5) -> Optional[Dict[str, float]]:
         """지정된 시간 동안의 평균 통계"""
         
-        if not self._history:
-            return None
-        
-        # 지정된 시간 이후의 데이터만 필터링
+        # 지정된 시간 이후의 샘플 수 (timestamp 는 단조 증가)
         cutoff_time = time.time() - (minutes * 60)
-        recent_data = [
-            info for info in self._history 
-            if info.timestamp >= cutoff_time
-        ]
+        count = self._history.since(cutoff_time)
         
-        if not recent_data:
+        if not count:
             return None
         
-        # 평균 계산
-        avg_cpu = sum(info.cpu_percent for info in recent_data) / len(recent_data)
-        avg_memory = sum(info.memory_percent for info in recent_data) / len(recent_data)
-        avg_disk = sum(info.disk_percent for info in recent_data) / len(recent_data)
-        
         return {
-            'cpu_percent': avg_cpu,
-            'memory_percent': avg_memory,
-            'disk_percent': avg_disk,
-            'sample_count': len(recent_data),
+            'cpu_percent': self._history.mean('cpu_percent', last=count),
+            'memory_percent': self._history.mean('memory_percent', last=count),
+            'disk_percent': self._history.mean('disk_percent', last=count),
+            'sample_count': count,
         }
     
     def get_top_processes(self, limit: int = 10, sort_by: str = 'cpu') -> List[Dict]:
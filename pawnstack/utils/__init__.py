@@ -1,5 +1,7 @@
 """유틸리티 함수 모듈"""
 
+from pawnstack.utils.aio import windowed
+from pawnstack.utils.walk import FileEntry, iter_files
 from pawnstack.utils.file import (
     FileHandler,
     write_file,
@@ -13,6 +15,7 @@ from pawnstack.utils.file import (
 )
 
 __all__ = [
+    "FileEntry",
     "FileHandler",
     "write_file",
     "write_json", 
@@ -22,4 +25,6 @@ __all__ = [
     "read_yaml",
     "is_file",
     "is_directory",
+    "iter_files",
+    "windowed",
 ]
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""비동기 실행 유틸리티"""
+
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Iterable, TypeVar, Union
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+__all__ = ["windowed"]
+
+
+async def windowed(
+    items: Union[Iterable[T], AsyncIterator[T]],
+    func: Callable[[T], Awaitable[R]],
+    limit: int
+) -> AsyncIterator[R]:
+    """
+    ``items`` 를 최대 ``limit`` 개씩 동시에 실행하며 끝나는 순서대로 결과 반환
+
+    ``items`` 는 필요한 만큼만 읽으므로 큰 (또는 끝없는) 입력도 메모리에 쌓이지 않습니다.
+    ``func`` 에서 예외가 나면 그대로 전파되고, 호출자가 중간에 반복을 멈추면 남은 작업은 취소됩니다.
+
+    Example:
+        async for result in windowed(urls, fetch, limit=20):
+            print(result)
+    """
+    if hasattr(items, "__anext__"):
+        source = items
+    else:
+        iterator = iter(items)
+
+        async def from_iterable():
+            for item in iterator:
+                yield item
+
+        source = from_iterable()
+
+    pending = set()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < limit:
+                try:
+                    item = await source.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(func(item)))
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
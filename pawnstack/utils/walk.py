@@ -0,0 +1,77 @@
+"""
+디렉터리 트리 순회 유틸리티
+
+비밀 정보 스캔 (``pawns scan-key``) 과 S3 동기화 (``pawns s3 sync``) 가 같은 walker 를 씁니다.
+"""
+
+import fnmatch
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence, Union
+
+__all__ = [
+    "FileEntry",
+    "iter_files",
+]
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """``iter_files()`` 가 stat 한 파일"""
+    path: str
+    size: int
+    mtime_ns: int
+
+
+
+def iter_files(
+    root: Union[str, Path],
+    recursive: bool = True,
+    max_depth: Optional[int] = None,
+    exclude_dirs: Iterable[str] = (),
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    max_size: Optional[int] = None
+) -> Iterator[FileEntry]:
+    """
+    ``os.scandir`` 로 파일 나열 (DirEntry 의 캐시된 타입 정보로 재귀하고 stat 은 파일당 한 번)
+
+    ``max_depth`` 는 root 를 깊이 0 으로 셉니다 (``max_depth=1`` 이면 root 바로 아래 파일만).
+    디렉터리 심볼릭 링크는 따라가지 않고, 하위 디렉터리는 이름 순으로 방문합니다.
+    """
+    exclude_dirs = set(exclude_dirs)
+    stack = [(os.fspath(root), 0)]
+    while stack:
+        directory, depth = stack.pop()
+        if max_depth and depth >= max_depth:
+            continue
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and entry.name not in exclude_dirs:
+                        subdirs.append(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+                name = entry.name
+                if include and not any(fnmatch.fnmatch(name, pattern) for pattern in include):
+                    continue
+                if exclude and any(fnmatch.fnmatch(name, pattern) for pattern in exclude):
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            if max_size is not None and stat.st_size > max_size:
+                continue
+            yield FileEntry(entry.path, stat.st_size, stat.st_mtime_ns)
+
+        # 이름 순으로 처리되도록 역순으로 push
+        stack.extend((path, depth + 1) for path in sorted(subdirs, reverse=True))
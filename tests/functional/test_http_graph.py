@@ -104,8 +104,9 @@ async def test_live_monitoring():
     monitor.add_endpoint(config)
     
     # 테스트 데이터로 히스토리 채우기
-    monitor.response_time_history[config.name] = generate_test_data(50)
-    monitor.status_history[config.name] = [1 if random.random() > 0.05 else 0 for _ in range(50)]
+    history = monitor.history[config.name]
+    for response_time in generate_test_data(50):
+        history.append(response_time=response_time, success=1 if random.random() > 0.05 else 0)
     
     # 통계 데이터 설정
     monitor.statistics[config.name] = {
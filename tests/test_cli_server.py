@@ -222,6 +222,28 @@ class TestServerCLI:
             assert result == 0
             mock_live.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_live_collector_survives_errors(self):
+        """패널 수집이 실패해도 수집 루프가 오류를 기록하고 계속 도는지 테스트"""
+        args = Namespace(interval=0.05, duration=0.5)
+        cli = ServerCLI(args)
+        calls = []
+
+        def flaky_content():
+            calls.append(1)
+            if len(calls) == 2:
+                raise RuntimeError("boom")
+            return "content"
+
+        with patch.object(cli, 'create_content', side_effect=flaky_content), \
+                patch.object(cli, 'create_header', return_value="header"), \
+                patch.object(cli, 'log_error') as mock_log_error:
+            await cli.start_live_monitoring()
+
+        mock_log_error.assert_called_once()
+        assert "boom" in mock_log_error.call_args[0][0]
+        assert len(calls) > 3
+
     def test_error_handling_cpu_info(self):
         """CPU 정보 오류 처리 테스트"""
         cli = ServerCLI()
@@ -2,12 +2,14 @@
 PawnStack Top CLI 테스트
 """
 
+import asyncio
+import io
 import pytest
 import time
 from unittest.mock import patch, MagicMock
 from argparse import Namespace
 
-from pawnstack.cli.top import TopCLI, TopConfig, get_arguments, main
+from pawnstack.cli.top import SystemStats, TopCLI, TopConfig, get_arguments, main
 
 
 class TestTopConfig:
@@ -62,6 +64,76 @@ class TestTopCLI:
         assert cli.command_name == "top"
         assert hasattr(cli, 'start_time')
     
+    def test_history_properties(self):
+        """기존 *_history 속성이 시계열 버퍼를 읽기 전용으로 노출하는지 테스트"""
+        cli = TopCLI()
+        cli.history.append(1.0, cpu=10.0, memory=40.0)
+        cli.history.append(2.0, cpu=20.0, memory=41.0, net_in=1.5, net_out=0.5, disk_read=0.0, disk_write=2.0)
+
+        assert cli.cpu_history == [10.0, 20.0]
+        assert cli.mem_history == [40.0, 41.0]
+        assert cli.net_in_history == [1.5]
+        assert cli.disk_write_history == [2.0]
+        with pytest.raises(AttributeError):
+            cli.cpu_history = []
+
+    def test_panels_do_not_consume_rates(self):
+        """패널을 다시 만들어도 (터미널 리사이즈) 같은 속도를 표시하는지 테스트"""
+        from rich.console import Console
+
+        def stats(timestamp, sent, read):
+            return SystemStats(
+                timestamp=timestamp, cpu_percent=0.0, cpu_freq=0.0, memory_percent=0.0, memory_used=0,
+                memory_total=1, disk_percent=0.0, disk_used=0, disk_total=1, net_bytes_sent=sent,
+                net_bytes_recv=0, net_packets_sent=0, net_packets_recv=0, disk_read_bytes=read,
+                disk_write_bytes=0, load_average=(0.0, 0.0, 0.0), process_count=1, uptime=0.0,
+            )
+
+        cli = TopCLI()
+        samples = [stats(0.0, 0, 0), stats(2.0, 4 * 1024 * 1024, 8 * 1024 * 1024)]
+        with patch.object(cli, 'collect_system_stats', side_effect=samples):
+            asyncio.run(cli.collect_stats())
+            asyncio.run(cli.collect_stats())
+
+        assert cli.rates["net_sent"] == 2 * 1024 * 1024
+        assert cli.rates["disk_read"] == 4 * 1024 * 1024
+
+        def render(panel):
+            console = Console(file=io.StringIO(), width=120)
+            console.print(panel)
+            return console.file.getvalue()
+
+        network = [render(cli.create_network_panel(cli.current_stats)) for _ in range(2)]
+        disk = [render(cli.create_disk_panel(cli.current_stats)) for _ in range(2)]
+        assert network[0] == network[1] and "16.00 Mbps" in network[0]
+        assert disk[0] == disk[1] and "R: 4.00 MB/s" in disk[0]
+
+    def test_print_line_mode(self):
+        """라인 모드가 샘플러의 CPU 사용률로 한 줄을 출력하는지 테스트"""
+        from rich.console import Console
+        from pawnstack.resource.sampler import SystemSample
+
+        def sample(timestamp, recv):
+            return SystemSample(
+                timestamp=timestamp, cpu_percent=37.5, cpu_user=25.0, cpu_system=12.5, cpu_iowait=0.25,
+                cpu_count=4, cpu_freq=0.0, memory_total=8 * 1024 ** 3, memory_used=2 * 1024 ** 3,
+                memory_available=6 * 1024 ** 3, memory_percent=25.0, disk_total=1, disk_used=0, disk_percent=0.0,
+                net_bytes_sent=0, net_bytes_recv=recv, net_packets_sent=0, net_packets_recv=0,
+                disk_read_bytes=0, disk_write_bytes=0, load_average=None, process_count=1, uptime=0.0,
+            )
+
+        cli = TopCLI()
+        cli.console = Console(file=io.StringIO(), width=200)
+        sampler = MagicMock()
+        sampler.sample.side_effect = [sample(0.0, 0), sample(1.0, 1024 * 1024)]
+        with patch("pawnstack.cli.top.get_system_sampler", return_value=sampler):
+            cli.print_line_mode(asyncio.run(cli.collect_stats()))
+            cli.print_line_mode(asyncio.run(cli.collect_stats()))
+
+        output = cli.console.file.getvalue()
+        assert "usr" in output and "mem_%" in output
+        assert "25.0%" in output and "12.5%" in output and "0.00" in output
+
     def test_get_arguments(self):
         """인수 정의 테스트"""
         from argparse import ArgumentParser
@@ -0,0 +1,209 @@
+"""EC2 인스턴스 메타데이터 수집기 테스트 (로컬 IMDS 흉내 서버)"""
+
+import asyncio
+import json
+import os
+import stat
+from argparse import Namespace
+
+import pytest
+
+import pawnstack.cli.aws as aws_cli
+from pawnstack.cli.aws import AWSCLI
+from pawnstack.cloud.metadata import SUMMARY_PATHS, InstanceMetadata
+
+CREDENTIALS = {
+    "Code": "Success", "Type": "AWS-HMAC", "AccessKeyId": "ASIAEXAMPLE",
+    "SecretAccessKey": "secret-value", "Token": "session-token", "Expiration": "2030-01-01T00:00:00Z",
+}
+
+TREE = {
+    "": "ami-id\ninstance-id\ninstance-type\nlocal-ipv4\nplacement/\npublic-keys/\niam/\nsecurity-groups",
+    "ami-id": "ami-0123",
+    "instance-id": "i-0abc",
+    "instance-type": "m6i.large",
+    "local-ipv4": "10.0.0.5",
+    "security-groups": "web",
+    "placement/": "availability-zone\nregion",
+    "placement/availability-zone": "ap-northeast-2a",
+    "placement/region": "ap-northeast-2",
+    "public-keys/": "0=deploy-key",
+    "public-keys/0/": "openssh-key",
+    "public-keys/0/openssh-key": "ssh-ed25519 AAAA deploy-key",
+    "iam/": "info\nsecurity-credentials/",
+    "iam/info": json.dumps({"Code": "Success", "InstanceProfileArn": "arn:aws:iam::1:instance-profile/web"}),
+    "iam/security-credentials/": "web-role",
+    "iam/security-credentials/web-role": json.dumps(CREDENTIALS),
+}
+
+
+async def _start_imds_server(imdsv2=True, stall_put=False):
+    """
+    IMDS 흉내 서버 (토큰 발급/검증, 요청마다 10ms 지연, 동시 요청 수 기록)
+
+    ``stall_put`` 이면 hop limit 을 넘은 컨테이너처럼 토큰 요청에 응답하지 않습니다.
+    """
+    state = {"tokens": [], "gets": 0, "in_flight": 0, "max_in_flight": 0, "imdsv2": imdsv2}
+
+    def respond(method, path, headers):
+        if method == "PUT" and path == "/latest/api/token":
+            if not state["imdsv2"]:
+                return 403, ""
+            token = f"token-{len(state['tokens'])}"
+            state["tokens"].append(token)
+            return 200, token
+        if method != "GET" or not path.startswith("/latest/meta-data/"):
+            return 400, ""
+        state["gets"] += 1
+        if state["imdsv2"] and headers.get("x-aws-ec2-metadata-token") != (state["tokens"] or [None])[-1]:
+            return 401, ""
+        value = TREE.get(path[len("/latest/meta-data/"):])
+        return (200, value) if value is not None else (404, "")
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                head = (await reader.readuntil(b"\r\n\r\n")).decode()
+                request_line, *lines = head.split("\r\n")
+                method, path, _ = request_line.split(" ")
+                headers = dict(line.lower().split(": ", 1) for line in lines if ": " in line)
+                if int(headers.get("content-length", 0)):
+                    await reader.readexactly(int(headers["content-length"]))
+                if stall_put and method == "PUT":
+                    # 클라이언트가 포기하고 연결을 닫을 때까지 대기
+                    await reader.read()
+                    break
+                state["in_flight"] += 1
+                state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+                await asyncio.sleep(0.01)
+                state["in_flight"] -= 1
+                status, body = respond(method, path, headers)
+                data = body.encode()
+                writer.write(f"HTTP/1.1 {status} X\r\nContent-Length: {len(data)}\r\n\r\n".encode() + data)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, f"127.0.0.1:{server.sockets[0].getsockname()[1]}", state
+
+
+@pytest.mark.asyncio
+async def test_collect_is_concurrent_with_one_token():
+    """요약 경로를 토큰 하나로 동시에 조회하고 자격 증명 비밀 값은 남기지 않는지 테스트"""
+    server, host, state = await _start_imds_server()
+    try:
+        async with InstanceMetadata(host=host) as imds:
+            metadata = await imds.collect(SUMMARY_PATHS)
+    finally:
+        server.close()
+
+    assert metadata["instance-id"] == "i-0abc"
+    assert metadata["placement"] == {"availability-zone": "ap-northeast-2a", "region": "ap-northeast-2"}
+    assert "public-hostname" not in metadata
+    assert metadata["iam"] == {
+        "role_name": "web-role",
+        "credentials": {"access_key_id": "ASIAEXAMPLE", "expiration": "2030-01-01T00:00:00Z", "type": "AWS-HMAC"},
+    }
+    assert len(state["tokens"]) == 1
+    assert state["max_in_flight"] > 4
+
+
+@pytest.mark.asyncio
+async def test_crawl_full_tree_and_refresh_expired_token():
+    """전체 트리를 수집하고, 토큰이 무효가 되면 새로 받아 재시도하는지 테스트"""
+    server, host, state = await _start_imds_server()
+    try:
+        async with InstanceMetadata(host=host) as imds:
+            first = await imds.crawl()
+            # 서버 측 토큰 무효화 (재시작 등)
+            state["tokens"].append("rotated")
+            second = await imds.crawl("placement")
+    finally:
+        server.close()
+
+    assert first["public-keys"] == {"0": {"openssh-key": "ssh-ed25519 AAAA deploy-key"}}
+    assert first["iam"]["info"]["InstanceProfileArn"].endswith("instance-profile/web")
+    assert first["iam"]["security-credentials"]["web-role"]["AccessKeyId"] == "ASIAEXAMPLE"
+    assert "secret-value" not in json.dumps(first) and "session-token" not in json.dumps(first)
+    assert second == {"availability-zone": "ap-northeast-2a", "region": "ap-northeast-2"}
+    assert len(state["tokens"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_imdsv1():
+    """토큰 발급이 거부되면 토큰 없이 조회하는지 테스트"""
+    server, host, state = await _start_imds_server(imdsv2=False)
+    try:
+        async with InstanceMetadata(host=host) as imds:
+            metadata = await imds.collect(["instance-id", "instance-type"], iam=False)
+    finally:
+        server.close()
+    assert metadata == {"instance-id": "i-0abc", "instance-type": "m6i.large"}
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_imdsv1_when_token_request_times_out():
+    """토큰 요청 응답이 오지 않으면 (hop limit) 도달 불가로 보지 않고 IMDSv1 으로 조회하는지 테스트"""
+    server, host, state = await _start_imds_server(imdsv2=False, stall_put=True)
+    try:
+        async with InstanceMetadata(host=host, timeout=0.2) as imds:
+            metadata = await imds.collect(["instance-id", "instance-type"], iam=False)
+    finally:
+        server.close()
+    assert metadata == {"instance-id": "i-0abc", "instance-type": "m6i.large"}
+    assert state["tokens"] == [] and state["gets"] == 2
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_with_ttl(tmp_path):
+    """캐시가 유효한 동안 요청을 보내지 않고, 만료되거나 refresh 이면 다시 조회하는지 테스트"""
+    server, host, state = await _start_imds_server()
+    cache_path = tmp_path / "imds.json"
+
+    async def crawl(**kwargs):
+        async with InstanceMetadata(host=host, cache_path=cache_path, **kwargs) as imds:
+            return await imds.crawl(), imds.stats
+
+    try:
+        tree, stats = await crawl()
+        assert stats["cache_hits"] == 0 and stats["requests"] > 0
+        cached, stats = await crawl()
+        assert cached == tree and stats == {"requests": 0, "tokens": 0, "cache_hits": 1}
+
+        assert stat.S_IMODE(os.stat(cache_path).st_mode) == 0o600
+        assert "secret-value" not in cache_path.read_text()
+
+        _, stats = await crawl(refresh=True)
+        assert stats["requests"] > 0
+
+        # 만료된 항목은 다시 조회
+        entries = json.loads(cache_path.read_text())
+        for entry in entries.values():
+            entry["time"] -= 301
+        cache_path.write_text(json.dumps(entries))
+        _, stats = await crawl(cache_ttl=300)
+        assert stats["cache_hits"] == 0
+    finally:
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_cli_metadata_uses_cache(tmp_path, monkeypatch, capsys):
+    """pawns aws metadata 의 두 번째 호출이 캐시에서 바로 응답하는지 테스트"""
+    monkeypatch.setattr(aws_cli, "DEFAULT_CACHE_PATH", str(tmp_path / "imds.json"))
+    server, host, state = await _start_imds_server()
+    args = Namespace(subcommand="metadata", metadata_ip=host, metadata_timeout=2, cache_ttl=300,
+                     refresh=False, crawl=False, output_format="json", output_file=None)
+    try:
+        assert await AWSCLI(args)._handle_metadata() == 0
+        requests = state["gets"]
+        assert await AWSCLI(args)._handle_metadata() == 0
+    finally:
+        server.close()
+
+    assert state["gets"] == requests
+    outputs = [line for line in capsys.readouterr().out.splitlines() if line.strip()]
+    assert json.loads("\n".join(outputs[:len(outputs) // 2]))["instance-id"] == "i-0abc"
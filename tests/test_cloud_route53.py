@@ -0,0 +1,294 @@
+"""Route53 병렬 백업 / 차분 복원 테스트 (메모리 기반 가짜 Route53 클라이언트)"""
+
+import asyncio
+import json
+from argparse import Namespace
+
+from pawnstack.cli.aws import AWSCLI
+from pawnstack.cloud.route53 import (
+    Backoff, apply_changes, backup_zones, batch_changes, diff_record_sets, list_hosted_zones, list_record_sets,
+    rebase_records,
+)
+
+
+class FakeClientError(Exception):
+    """botocore ClientError 처럼 ``response`` 에 오류 코드를 담은 예외"""
+
+    def __init__(self, code):
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+def _record(name, rtype="A", *values, ttl=300):
+    return {"Name": name, "Type": rtype, "TTL": ttl, "ResourceRecords": [{"Value": v} for v in values or ["10.0.0.1"]]}
+
+
+def _sort_key(record):
+    return record["Name"], record["Type"], record.get("SetIdentifier", "")
+
+
+class FakeRoute53:
+    """페이지 나누기, 스로틀링, 원자적 배치 적용을 흉내 내는 가짜 클라이언트"""
+
+    def __init__(self, zones, throttle_every=0, zone_page_size=2):
+        self.zones = zones  # id -> (zone, {key: record})
+        self.throttle_every = throttle_every
+        self.zone_page_size = zone_page_size
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.batches = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def _request(self):
+        self.requests += 1
+        if self.throttle_every and self.requests % self.throttle_every == 0:
+            raise FakeClientError("Throttling")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.002)
+        self.in_flight -= 1
+
+    async def list_hosted_zones(self, Marker=None):
+        await self._request()
+        ids = sorted(self.zones)
+        start = ids.index(Marker) if Marker else 0
+        page = ids[start:start + self.zone_page_size]
+        response = {"HostedZones": [self.zones[i][0] for i in page], "IsTruncated": start + len(page) < len(ids)}
+        if response["IsTruncated"]:
+            response["NextMarker"] = ids[start + len(page)]
+        return response
+
+    async def list_hosted_zones_by_name(self, DNSName, HostedZoneId=None):
+        zones = sorted((zone for zone, _ in self.zones.values()), key=lambda z: (z["Name"], z["Id"]))
+        return {"HostedZones": [z for z in zones if z["Name"] >= DNSName], "IsTruncated": False}
+
+    async def get_hosted_zone(self, Id):
+        return {"HostedZone": self.zones[Id][0]}
+
+    async def list_resource_record_sets(self, HostedZoneId, MaxItems="300", StartRecordName=None,
+                                        StartRecordType=None, StartRecordIdentifier=None):
+        await self._request()
+        records = sorted(self.zones[HostedZoneId][1].values(), key=_sort_key)
+        start = 0
+        if StartRecordName:
+            begin = (StartRecordName, StartRecordType or "", StartRecordIdentifier or "")
+            start = next((i for i, r in enumerate(records) if _sort_key(r) >= begin), len(records))
+        # 실제 API 처럼 한 페이지를 최대 100 개로 제한
+        size = min(int(MaxItems), 100)
+        page = records[start:start + size]
+        response = {"ResourceRecordSets": page, "IsTruncated": start + size < len(records)}
+        if response["IsTruncated"]:
+            following = records[start + size]
+            response["NextRecordName"] = following["Name"]
+            response["NextRecordType"] = following["Type"]
+            if following.get("SetIdentifier"):
+                response["NextRecordIdentifier"] = following["SetIdentifier"]
+        return response
+
+    async def create_hosted_zone(self, Name, CallerReference, HostedZoneConfig):
+        zone_id = f"/hostedzone/Z{len(self.zones) + 1}"
+        zone = {"Id": zone_id, "Name": Name if Name.endswith(".") else Name + ".", "Config": HostedZoneConfig}
+        self.zones[zone_id] = (zone, {
+            ("SOA", zone["Name"]): _record(zone["Name"], "SOA", "ns-1. admin. 1 7200 900 1209600 86400"),
+            ("NS", zone["Name"]): _record(zone["Name"], "NS", "ns-1.", "ns-2."),
+        })
+        return {"HostedZone": zone}
+
+    async def change_resource_record_sets(self, HostedZoneId, ChangeBatch):
+        await self._request()
+        records = dict(self.zones[HostedZoneId][1])
+        for change in ChangeBatch["Changes"]:
+            record = change["ResourceRecordSet"]
+            key = (record["Type"], record["Name"])
+            if record["Name"].startswith("bad."):
+                raise FakeClientError("InvalidChangeBatch")
+            if change["Action"] == "CREATE" and key in records:
+                raise FakeClientError("InvalidChangeBatch")
+            if change["Action"] == "DELETE":
+                if records.get(key) != record:
+                    raise FakeClientError("InvalidChangeBatch")
+                del records[key]
+            else:
+                records[key] = record
+        self.zones[HostedZoneId][1].clear()
+        self.zones[HostedZoneId][1].update(records)
+        self.batches.append([change["Action"] for change in ChangeBatch["Changes"]])
+        return {"ChangeInfo": {"Status": "PENDING"}}
+
+
+def _zone(index, records=0):
+    name = f"zone{index}.example."
+    zone = {"Id": f"/hostedzone/Z{index:03d}", "Name": name, "Config": {"PrivateZone": False}}
+    rows = [_record(name, "SOA", "ns-1. admin. 1 7200 900 1209600 86400"), _record(name, "NS", "ns-1.", "ns-2.")]
+    rows += [_record(f"host{i:04d}.{name}") for i in range(records)]
+    return zone["Id"], (zone, {(r["Type"], r["Name"]): r for r in rows})
+
+
+def test_listing_paginates_and_retries_throttling():
+    """영역/레코드 목록을 끝까지 나열하고 스로틀링은 재시도하는지 테스트"""
+    client = FakeRoute53(dict(_zone(i, records=250) for i in range(5)), throttle_every=4)
+    backoff = Backoff(base_delay=0)
+
+    async def run():
+        zones = await list_hosted_zones(client, backoff)
+        return zones, await list_record_sets(client, zones[0]["Id"], backoff)
+
+    zones, records = asyncio.run(run())
+    assert len(zones) == 5
+    assert len(records) == 252 and len({r["Name"] for r in records}) == 251
+    assert backoff.throttled > 0
+
+
+def test_backup_zones_is_concurrent_and_bounded():
+    """영역별 레코드 조회를 동시에 하되 concurrency 를 넘지 않는지 테스트"""
+    client = FakeRoute53(dict(_zone(i, records=120) for i in range(12)))
+    missing = {"Id": "/hostedzone/MISSING", "Name": "missing.example."}
+
+    async def run():
+        zones = await list_hosted_zones(client)
+        return [result async for result in backup_zones(client, zones + [missing], concurrency=4)]
+
+    results = asyncio.run(run())
+    assert sorted(len(r.records) for r in results if r.ok) == [122] * 12
+    assert [r.zone["Name"] for r in results if not r.ok] == ["missing.example."]
+    assert 1 < client.max_in_flight <= 4
+
+
+def test_diff_and_batch_changes():
+    """apex SOA/NS 를 건너뛰고 변경분만 계산하며 한도에 맞춰 배치로 묶는지 테스트"""
+    zone = "example.com."
+    live = [
+        _record(zone, "SOA", "ns-9. admin. 1 7200 900 1209600 86400"),
+        _record(zone, "NS", "ns-9."),
+        _record("same.example.com.", "A", "10.0.0.1", "10.0.0.2"),
+        _record("changed.example.com.", "A", "10.0.0.1"),
+        _record("extra.example.com.", "A", "10.0.0.1"),
+    ]
+    desired = [
+        _record(zone, "SOA", "ns-1. admin. 1 7200 900 1209600 86400"),
+        _record(zone, "NS", "ns-1."),
+        _record("sub.example.com.", "NS", "ns-sub."),
+        _record("SAME.example.com", "A", "10.0.0.2", "10.0.0.1"),
+        _record("changed.example.com.", "A", "10.0.0.9"),
+        {"Name": "alias.example.com.", "Type": "A",
+         "AliasTarget": {"HostedZoneId": "Z1", "DNSName": "changed.example.com.", "EvaluateTargetHealth": False}},
+    ]
+
+    changes = diff_record_sets(live, desired, zone)
+    assert [(c["Action"], c["ResourceRecordSet"]["Name"]) for c in changes] == [
+        ("CREATE", "sub.example.com."), ("UPSERT", "changed.example.com."), ("CREATE", "alias.example.com."),
+    ]
+    changes = diff_record_sets(live, desired, zone, delete=True)
+    assert changes[0] == {"Action": "DELETE", "ResourceRecordSet": live[4]}
+
+    # UPSERT 는 ResourceRecord 와 Value 글자 수를 두 배로 계산
+    creates = [{"Action": "CREATE", "ResourceRecordSet": _record(f"h{i}.example.com.")} for i in range(2500)]
+    assert [len(b) for b in batch_changes(creates)] == [1000, 1000, 500]
+    upserts = [dict(c, Action="UPSERT") for c in creates[:1200]]
+    assert [len(b) for b in batch_changes(upserts)] == [500, 500, 200]
+    long_values = [{"Action": "CREATE", "ResourceRecordSet": _record(f"t{i}.example.com.", "TXT", "x" * 250)} for i in range(300)]
+    assert [len(b) for b in batch_changes(long_values)] == [128, 128, 44]
+
+
+def test_apply_changes_isolates_invalid_records():
+    """거부된 배치를 반으로 나눠 잘못된 변경만 실패로 남기는지 테스트"""
+    zone_id, zone = _zone(1)
+    client = FakeRoute53({zone_id: zone})
+    changes = [{"Action": "CREATE", "ResourceRecordSet": _record(f"h{i}.zone1.example.")} for i in range(8)]
+    changes[5] = {"Action": "CREATE", "ResourceRecordSet": _record("bad.zone1.example.")}
+
+    async def run():
+        return [result async for result in apply_changes(client, zone_id, changes, backoff=Backoff(base_delay=0))]
+
+    results = asyncio.run(run())
+    failed = [change for batch, error in results if error for change in batch]
+    assert [c["ResourceRecordSet"]["Name"] for c in failed] == ["bad.zone1.example."]
+    assert sum(len(batch) for batch, error in results if not error) == 7
+    assert len(client.zones[zone_id][1]) == 2 + 7
+
+
+def _cli(client, **kwargs):
+    options = dict(subcommand="route53", concurrency=4, dry_run=False, delete=False, zone_id=None)
+    options.update(kwargs)
+    cli = AWSCLI(Namespace(**options))
+    cli._aws_clients["route53"] = client
+    return cli
+
+
+def test_cli_backup_all_and_restore_deltas(tmp_path):
+    """pawns aws route53 backup all 이 모든 레코드를 저장하고, restore 가 새 영역 생성 후 변경분만 배치로 보내는지 테스트"""
+    client = FakeRoute53(dict(_zone(i, records=150) for i in range(3)))
+    backup_dir = tmp_path / "backup"
+    cli = _cli(client, route53_command="backup", zone_id="all", backup_file=str(backup_dir))
+    assert asyncio.run(cli._route53_backup()) == 0
+    backup = json.loads((backup_dir / "zone1.example.json").read_text())
+    assert len(backup["resource_record_sets"]) == 152
+
+    # 새 이름의 영역으로 복원: 영역 생성 후 150 개 레코드를 한 배치로
+    backup_file = str(backup_dir / "zone1.example.json")
+    cli = _cli(client, backup_file=backup_file, new_zone_name="restored.example")
+    assert asyncio.run(cli._route53_restore()) == 0
+    restored_id, (restored, records) = next((k, v) for k, v in client.zones.items() if v[0]["Name"] == "restored.example.")
+    assert client.batches == [["CREATE"] * 150]
+    assert ("A", "host0007.restored.example.") in records and len(records) == 152
+
+    # 다시 복원하면 같은 영역을 찾아 변경 없음, 레코드 하나를 바꾸고 추가하면 그 변경만 전송
+    client.batches.clear()
+    assert asyncio.run(cli._route53_restore()) == 0
+    assert client.batches == []
+    records[("A", "host0003.restored.example.")] = _record("host0003.restored.example.", "A", "10.9.9.9")
+    records[("A", "stray.restored.example.")] = _record("stray.restored.example.")
+    cli = _cli(client, backup_file=backup_file, new_zone_name="restored.example", delete=True)
+    assert asyncio.run(cli._route53_restore()) == 0
+    assert client.batches == [["DELETE", "UPSERT"]]
+    assert records[("A", "host0003.restored.example.")]["ResourceRecords"] == [{"Value": "10.0.0.1"}]
+    assert ("A", "stray.restored.example.") not in records
+
+
+def test_rebase_records_rewrites_in_zone_alias_zone_id():
+    """영역 내부 alias 의 HostedZoneId 를 새 영역 ID 로 바꾸고, 외부 alias 는 그대로 두는지 테스트"""
+    records = [
+        {"Name": "www.zone1.example.", "Type": "A",
+         "AliasTarget": {"HostedZoneId": "Z001", "DNSName": "host0001.zone1.example.", "EvaluateTargetHealth": False}},
+        {"Name": "lb.zone1.example.", "Type": "A",
+         "AliasTarget": {"HostedZoneId": "ZELB", "DNSName": "lb-1.elb.amazonaws.com.", "EvaluateTargetHealth": False}},
+    ]
+    # 이름이 같아도 다른 영역으로 복원하면 영역 ID 를 바꿈
+    rebased = rebase_records(records, "zone1.example.", "zone1.example.", "/hostedzone/Z001", "/hostedzone/Z009")
+    assert [r["AliasTarget"]["HostedZoneId"] for r in rebased] == ["Z009", "ZELB"]
+
+    rebased = rebase_records(records, "zone1.example.", "other.example.", "/hostedzone/Z001", "/hostedzone/Z009")
+    assert rebased[0]["Name"] == "www.other.example."
+    assert rebased[0]["AliasTarget"] == {
+        "HostedZoneId": "Z009", "DNSName": "host0001.other.example.", "EvaluateTargetHealth": False,
+    }
+    assert rebased[1]["AliasTarget"] == records[1]["AliasTarget"]
+
+    # 새 영역 ID 를 모르면 이름만 옮김
+    assert rebase_records(records, "zone1.example.", "other.example.", "/hostedzone/Z001")[0]["AliasTarget"]["HostedZoneId"] == "Z001"
+
+
+def test_cli_restore_points_in_zone_alias_at_new_zone(tmp_path):
+    """새 영역으로 복원한 영역 내부 alias 가 새 영역 ID 를 가리키고, 다시 복원하면 변경이 없는지 테스트"""
+    zone_id, (zone, records) = _zone(1, records=2)
+    alias = {"Name": "www.zone1.example.", "Type": "A",
+             "AliasTarget": {"HostedZoneId": "Z001", "DNSName": "host0001.zone1.example.", "EvaluateTargetHealth": False}}
+    records[("A", alias["Name"])] = alias
+    client = FakeRoute53({zone_id: (zone, records)})
+    backup_file = tmp_path / "zone1.json"
+    assert asyncio.run(_cli(client, route53_command="backup", zone_id=zone_id, backup_file=str(backup_file))._route53_backup()) == 0
+
+    cli = _cli(client, backup_file=str(backup_file), new_zone_name="restored.example")
+    assert asyncio.run(cli._route53_restore()) == 0
+    restored_id, (_, restored) = next((k, v) for k, v in client.zones.items() if v[0]["Name"] == "restored.example.")
+    assert restored[("A", "www.restored.example.")]["AliasTarget"]["HostedZoneId"] == restored_id.rsplit("/", 1)[-1]
+
+    client.batches.clear()
+    assert asyncio.run(cli._route53_restore()) == 0
+    assert client.batches == []
@@ -0,0 +1,199 @@
+"""S3 스트리밍 목록 / 배치 삭제 테스트"""
+
+import asyncio
+import fnmatch
+import json
+import re
+from argparse import Namespace
+from datetime import datetime, timezone
+
+from pawnstack.cli.s3 import S3CLI
+from pawnstack.cloud.s3_listing import ListingStats, PathMatcher, delete_keys, iter_object_pages
+
+PAGE_SIZE = 3
+
+
+class FakePaginator:
+    def __init__(self, client):
+        self.client = client
+
+    async def paginate(self, Bucket, Prefix="", Delimiter=None):
+        """list_objects_v2 흉내 (PAGE_SIZE 개 단위, CommonPrefixes 포함)"""
+        entries = []
+        seen = set()
+        for key in sorted(self.client.keys):
+            if not key.startswith(Prefix):
+                continue
+            rest = key[len(Prefix):]
+            if Delimiter and Delimiter in rest:
+                common = Prefix + rest.split(Delimiter, 1)[0] + Delimiter
+                if common not in seen:
+                    seen.add(common)
+                    entries.append(("prefix", common))
+            else:
+                entries.append(("key", key))
+        for i in range(0, max(len(entries), 1), PAGE_SIZE):
+            self.client.requests += 1
+            self.client.in_flight += 1
+            self.client.max_in_flight = max(self.client.max_in_flight, self.client.in_flight)
+            await asyncio.sleep(0.005)
+            self.client.in_flight -= 1
+            chunk = entries[i:i + PAGE_SIZE]
+            yield {
+                "Contents": [
+                    {"Key": key, "Size": len(key), "LastModified": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+                    for kind, key in chunk if kind == "key"
+                ],
+                "CommonPrefixes": [{"Prefix": key} for kind, key in chunk if kind == "prefix"],
+            }
+
+
+class FakeS3:
+    def __init__(self, keys, fail_key=None):
+        self.keys = set(keys)
+        self.fail_key = fail_key
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delete_batches = []
+
+    def get_paginator(self, name):
+        return FakePaginator(self)
+
+    async def head_object(self, Bucket, Key):
+        if Key not in self.keys:
+            raise KeyError(Key)
+        return {"ContentLength": len(Key)}
+
+    async def delete_objects(self, Bucket, Delete):
+        keys = [item["Key"] for item in Delete["Objects"]]
+        self.delete_batches.append(len(keys))
+        await asyncio.sleep(0.005)
+        deleted = [key for key in keys if key != self.fail_key]
+        self.keys.difference_update(deleted)
+        return {
+            "Deleted": [{"Key": key} for key in deleted],
+            "Errors": [{"Key": key, "Message": "AccessDenied"} for key in keys if key == self.fail_key],
+        }
+
+
+def _tree():
+    keys = [f"data/top{i}.txt" for i in range(4)]
+    for d in range(5):
+        keys += [f"data/d{d}/f{i}.log" for i in range(7)]
+        keys += [f"data/d{d}/sub/f{i}.tmp" for i in range(2)]
+    return keys
+
+
+def _list(client, **kwargs):
+    async def run():
+        return [obj["Key"] async for page in iter_object_pages(client, "bucket", "data/", **kwargs) for obj in page]
+    return asyncio.run(run())
+
+
+def test_path_matcher_matches_fnmatch():
+    """컴파일된 매처가 fnmatch 규칙과 같은지 테스트"""
+    matcher = PathMatcher(include=["*.log", "top*"], exclude=["d1/*", "*/sub/*"])
+    for key in ["d0/f1.log", "d1/f1.log", "d0/sub/f0.log", "top0.txt", "d2/f.tmp"]:
+        expected = (
+            any(fnmatch.fnmatchcase(key, p) for p in ["*.log", "top*"])
+            and not any(fnmatch.fnmatchcase(key, p) for p in ["d1/*", "*/sub/*"])
+        )
+        assert matcher(key) == expected
+    assert not PathMatcher().active and PathMatcher()("anything")
+
+
+def test_sharded_listing_is_complete_and_parallel():
+    """하위 prefix 병렬 나열이 순차 나열과 같은 키를 중복 없이 내는지 테스트"""
+    keys = sorted(_tree())
+    flat = FakeS3(keys)
+    assert sorted(_list(flat, shard_depth=0)) == keys
+    assert flat.max_in_flight == 1
+
+    sharded = FakeS3(keys)
+    stats = ListingStats()
+    assert sorted(_list(sharded, shard_depth=2, concurrency=4, stats=stats)) == keys
+    assert sharded.max_in_flight > 1
+    assert stats.objects == len(keys) and stats.prefixes == 10
+
+    # 하위 prefix 가 너무 많으면 나누지 않고 한 번에 나열 (바로 아래 객체 중복 없음)
+    capped = FakeS3(keys)
+    assert sorted(_list(capped, shard_depth=1, max_shards=2)) == keys
+
+
+def test_delete_keys_batches_concurrently():
+    """키를 배치로 나눠 동시에 삭제하고 실패 키를 보고하는지 테스트"""
+    keys = [f"k{i:04d}" for i in range(2500)]
+    client = FakeS3(keys, fail_key="k0042")
+
+    async def run():
+        async def source():
+            for key in keys:
+                yield key
+        return [result async for result in delete_keys(client, "bucket", source(), concurrency=3)]
+
+    results = asyncio.run(run())
+    assert sorted(client.delete_batches) == [500, 1000, 1000]
+    assert sum(len(deleted) for deleted, _ in results) == 2499
+    assert [e["Key"] for _, errors in results for e in errors] == ["k0042"]
+    assert client.keys == {"k0042"}
+
+
+def _cli(client, **kwargs):
+    options = dict(
+        recursive=True, dry_run=False, include=None, exclude=None, output_format="json", summarize=False,
+        human_readable=False, list_concurrency=4, list_shard_depth=1, max_workers=4,
+    )
+    options.update(kwargs)
+    cli = S3CLI(Namespace(**options))
+    cli._s3_client = client
+    return cli
+
+
+def test_cli_remove_streams_filtered_deletes():
+    """pawns s3 rm -r 이 exclude 를 적용해 목록을 받는 대로 삭제하는지 테스트"""
+    client = FakeS3(_tree())
+    cli = _cli(client, path="s3://bucket/data/", exclude=["*.tmp"], dry_run=True)
+    assert asyncio.run(cli._handle_remove()) == 0
+    assert len(client.keys) == len(_tree())
+
+    cli = _cli(client, path="s3://bucket/data/", exclude=["*.tmp"])
+    assert asyncio.run(cli._handle_remove()) == 0
+    assert sorted(client.keys) == sorted(k for k in _tree() if k.endswith(".tmp"))
+
+
+def test_cli_recursive_ls_streams_valid_json(capsys):
+    """페이지별로 나눠 출력한 JSON 목록이 하나의 올바른 배열인지 테스트"""
+    client = FakeS3(_tree())
+    assert asyncio.run(_cli(client)._list_objects("bucket", "data/")) == 0
+    rows = json.loads(capsys.readouterr().out)
+    assert sorted(row["key"] for row in rows) == sorted(_tree())
+
+
+def test_cli_ls_keeps_column_order(capsys):
+    """페이지별 table/csv 출력이 기존 열 순서 (key, size, last_modified, type) 를 유지하는지 테스트"""
+    client = FakeS3(_tree())
+    assert asyncio.run(_cli(client, output_format="csv", list_shard_depth=0)._list_objects("bucket", "data/")) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "key,size,last_modified,type"
+    assert [line.split(",")[0] for line in lines[1:]] == sorted(_tree())
+
+    assert asyncio.run(_cli(client, output_format="table")._list_objects("bucket", "data/")) == 0
+    header = re.sub(r"\x1b\[[0-9;]*m", "", capsys.readouterr().out).split()[:4]
+    assert header == ["key", "size", "last_modified", "type"]
+
+
+def test_cli_ls_closes_json_array_on_error(capsys):
+    """목록 도중 실패해도 이미 출력한 JSON 배열을 닫는지 테스트"""
+    class FailingPaginator(FakePaginator):
+        async def paginate(self, **kwargs):
+            async for page in super().paginate(**kwargs):
+                yield page
+                raise RuntimeError("throttled")
+
+    client = FakeS3(_tree())
+    client.get_paginator = lambda name: FailingPaginator(client)
+    assert asyncio.run(_cli(client, list_shard_depth=0)._list_objects("bucket", "data/")) == 1
+    out = capsys.readouterr().out
+    rows = json.loads(out[:out.index("\n]") + 2])
+    assert [row["key"] for row in rows] == sorted(_tree())[:PAGE_SIZE]
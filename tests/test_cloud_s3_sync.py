@@ -0,0 +1,239 @@
+"""체크섬 매니페스트 기반 S3 동기화 테스트"""
+
+import asyncio
+import hashlib
+import os
+import time
+from argparse import Namespace
+from datetime import datetime, timezone
+
+import pawnstack.cli.s3 as s3_cli
+import pawnstack.cloud.s3_sync as s3_sync
+from pawnstack.cli.s3 import S3CLI
+from pawnstack.cloud.s3_sync import RemoteObject, SyncManifest, SyncStats, compute_etags, diff_objects, s3_etag
+from pawnstack.cloud.s3_transfer import MB, TransferConfig
+from pawnstack.utils.walk import iter_files
+
+
+class FakePaginator:
+    def __init__(self, client):
+        self.client = client
+
+    async def paginate(self, Bucket, Prefix=""):
+        self.client.calls.append("list_objects_v2")
+        keys = sorted(k for b, k in self.client.objects if b == Bucket and k.startswith(Prefix))
+        for i in range(0, len(keys), 2):
+            yield {"Contents": [
+                {"Key": key, "Size": len(self.client.objects[(Bucket, key)]),
+                 "ETag": '"%s"' % self.client.etags[(Bucket, key)],
+                 "LastModified": self.client.modified[(Bucket, key)]}
+                for key in keys[i:i + 2]
+            ]}
+
+
+class FakeS3:
+    """
+    put_object / list_objects_v2 / delete_objects 만 구현한 가짜 클라이언트
+
+    ``encrypted`` 이면 SSE-KMS 처럼 MD5 가 아닌 ETag 를 돌려줍니다.
+    """
+
+    def __init__(self, encrypted=False):
+        self.encrypted = encrypted
+        self.objects = {}
+        self.etags = {}
+        self.modified = {}
+        self.calls = []
+
+    def get_paginator(self, name):
+        return FakePaginator(self)
+
+    async def put_object(self, Bucket, Key, Body, **extra):
+        self.calls.append("put_object")
+        self.objects[(Bucket, Key)] = bytes(Body)
+        self.etags[(Bucket, Key)] = os.urandom(16).hex() if self.encrypted else hashlib.md5(Body).hexdigest()
+        self.modified[(Bucket, Key)] = datetime.now(timezone.utc)
+        return {"ETag": '"%s"' % self.etags[(Bucket, Key)]}
+
+    async def delete_objects(self, Bucket, Delete):
+        self.calls.append("delete_objects")
+        for item in Delete["Objects"]:
+            del self.objects[(Bucket, item["Key"])]
+        return {"Deleted": Delete["Objects"]}
+
+
+def test_s3_etag_matches_multipart_layout(tmp_path):
+    """임계값 미만은 MD5, 이상은 파트 MD5 의 MD5 + 파트 수인지 테스트"""
+    data = os.urandom(12 * MB + 7)
+    path = tmp_path / "blob"
+    path.write_bytes(data)
+
+    parts = [data[i:i + 5 * MB] for i in range(0, len(data), 5 * MB)]
+    expected = hashlib.md5(b"".join(hashlib.md5(p).digest() for p in parts)).hexdigest() + "-3"
+    assert s3_etag(path, TransferConfig(part_size=5 * MB, multipart_threshold=8 * MB)) == expected
+    assert s3_etag(path, TransferConfig(multipart_threshold=64 * MB)) == hashlib.md5(data).hexdigest()
+
+
+def test_compute_etags_reuses_manifest(tmp_path):
+    """stat 이 같은 파일은 매니페스트 ETag 를 재사용하고 바뀐 파일만 다시 계산하는지 테스트"""
+    root = tmp_path / "data"
+    root.mkdir()
+    for i in range(5):
+        (root / f"f{i}.txt").write_text(f"content {i}\n")
+    config = TransferConfig()
+
+    def run(manifest):
+        stats = SyncStats()
+        etags = asyncio.run(compute_etags(iter_files(root), manifest, config, workers=2, stats=stats))
+        return etags, stats
+
+    with SyncManifest(tmp_path / "manifest.db") as manifest:
+        first, stats = run(manifest)
+    assert (stats.hashed, stats.cached) == (5, 0)
+
+    # 같은 크기로 내용만 바뀐 파일
+    (root / "f3.txt").write_text("CONTENT 3\n")
+    with SyncManifest(tmp_path / "manifest.db") as manifest:
+        second, stats = run(manifest)
+    assert (stats.hashed, stats.cached) == (1, 4)
+    changed = str(root / "f3.txt")
+    assert second[changed] != first[changed]
+    assert {k: v for k, v in second.items() if k != changed} == {k: v for k, v in first.items() if k != changed}
+
+
+def test_diff_objects_falls_back_to_mtime():
+    """ETag 로 판단할 수 없으면 크기 + mtime 으로 비교하는지 테스트"""
+    remote = {
+        "same": RemoteObject(3, "aaa"),
+        "uploaded": RemoteObject(3, "kms-etag", 100.0, source_etag="aaa"),
+        "changed": RemoteObject(3, "kms-etag", 100.0, source_etag="bbb"),
+        "foreign-old": RemoteObject(3, "other", 100.0),
+        "foreign-new": RemoteObject(3, "other", 100.0),
+        "unhashed": RemoteObject(3, "aaa", 100.0),
+        "resized": RemoteObject(4, "aaa", 100.0),
+    }
+    local = {
+        "same": (3, "aaa", 200.0),
+        "uploaded": (3, "aaa", 50.0),
+        "changed": (3, "aaa", 50.0),
+        "foreign-old": (3, "aaa", 50.0),
+        "foreign-new": (3, "aaa", 150.0),
+        "unhashed": (3, None, 50.0),
+        "resized": (3, "aaa", 50.0),
+        "missing": (3, "aaa", 50.0),
+    }
+    uploads, deletes = diff_objects(local, remote)
+    assert sorted(uploads) == ["changed", "foreign-new", "missing", "resized"]
+    assert deletes == []
+
+
+def _sync_runner(tmp_path, root, client, **defaults):
+    def sync(**kwargs):
+        options = dict(
+            subcommand="sync", dry_run=False, delete=True, include=None, exclude=["*.tmp"],
+            manifest=str(tmp_path / "manifest.db"), no_manifest=False, trust_manifest=False, hash_workers=2,
+            storage_class="STANDARD", max_workers=4, part_concurrency=2, chunk_size=8 * MB,
+            multipart_threshold=8 * MB, max_bandwidth=0, list_concurrency=4, list_shard_depth=0,
+        )
+        options.update(defaults, **kwargs)
+        cli = S3CLI(Namespace(**options))
+        cli._s3_client = client
+        client.calls.clear()
+        assert asyncio.run(cli._sync_to_s3(str(root), "s3://bucket/backup/")) == 0
+        return list(client.calls)
+    return sync
+
+
+def test_cli_sync_uploads_only_changed_files(tmp_path):
+    """pawns s3 sync 가 ETag 로 같은 크기 수정을 찾고, 신뢰하는 매니페스트로 목록 조회를 생략하는지 테스트"""
+    root = tmp_path / "data"
+    (root / "sub").mkdir(parents=True)
+    for i in range(4):
+        (root / "sub" / f"f{i}.txt").write_text(f"file {i}\n")
+    (root / "skip.tmp").write_text("temp\n")
+    client = FakeS3()
+    sync = _sync_runner(tmp_path, root, client)
+
+    assert sync().count("put_object") == 4
+    assert sorted(k for _, k in client.objects) == [f"backup/sub/f{i}.txt" for i in range(4)]
+
+    # 변경 없음: 목록 한 번, 업로드 없음
+    assert sync() == ["list_objects_v2"]
+
+    # 같은 크기 수정 + 삭제, 원격 목록 조회 없이
+    (root / "sub" / "f1.txt").write_text("FILE 1\n")
+    (root / "sub" / "f2.txt").unlink()
+    assert sync(trust_manifest=True) == ["put_object", "delete_objects"]
+    assert client.objects[("bucket", "backup/sub/f1.txt")] == b"FILE 1\n"
+    assert ("bucket", "backup/sub/f2.txt") not in client.objects
+
+    assert sync(trust_manifest=True) == []
+
+
+def test_cli_sync_skips_objects_with_non_md5_etag(tmp_path):
+    """SSE-KMS 처럼 MD5 가 아닌 ETag 도 업로드 때 기록한 값과 비교해 다시 올리지 않는지 테스트"""
+    root = tmp_path / "data"
+    root.mkdir()
+    for i in range(3):
+        (root / f"f{i}.txt").write_text(f"file {i}\n")
+    client = FakeS3(encrypted=True)
+    sync = _sync_runner(tmp_path, root, client)
+
+    assert sync().count("put_object") == 3
+    assert sync() == ["list_objects_v2"]
+
+    # 같은 크기 내용 변경은 여전히 찾음
+    (root / "f0.txt").write_text("FILE 0\n")
+    os.utime(root / "f0.txt", (1, 1))
+    assert sync() == ["list_objects_v2", "put_object"]
+    assert sync() == ["list_objects_v2"]
+
+
+def test_cli_sync_default_manifest_and_no_manifest(tmp_path, monkeypatch):
+    """기본 매니페스트 경로를 쓰고, --no-manifest 이면 해시 없이 크기 + mtime 으로 비교하는지 테스트"""
+    default_path = tmp_path / "cache" / "s3-sync.db"
+    monkeypatch.setattr(s3_cli, "DEFAULT_MANIFEST_PATH", str(default_path))
+    root = tmp_path / "data"
+    root.mkdir()
+    for i in range(2):
+        (root / f"f{i}.txt").write_text(f"file {i}\n")
+    client = FakeS3()
+
+    sync = _sync_runner(tmp_path, root, client, manifest=None, no_manifest=True)
+    assert sync().count("put_object") == 2
+    assert not default_path.exists()
+    assert sync() == ["list_objects_v2"]
+
+    # 원격보다 최근에 수정된 파일만 업로드
+    later = time.time() + 60
+    os.utime(root / "f1.txt", (later, later))
+    assert sync() == ["list_objects_v2", "put_object"]
+
+    sync = _sync_runner(tmp_path, root, client, manifest=None)
+    assert sync() == ["list_objects_v2"]
+    assert default_path.exists()
+
+
+def test_cli_sync_keeps_remote_copy_of_unhashable_file(tmp_path, monkeypatch):
+    """해시에 실패한 파일을 원격에만 있는 키로 보고 --delete 로 지우지 않는지 테스트"""
+    root = tmp_path / "data"
+    root.mkdir()
+    for i in range(2):
+        (root / f"f{i}.txt").write_text(f"file {i}\n")
+    client = FakeS3()
+    sync = _sync_runner(tmp_path, root, client)
+    assert sync().count("put_object") == 2
+
+    # stat 이 바뀌어 다시 해시해야 하는데 읽기에 실패 -> 크기 + mtime 으로 비교 (원격이 더 최근)
+    os.utime(root / "f1.txt", (1, 1))
+    failing = str(root / "f1.txt")
+    real_etag = s3_sync.s3_etag
+
+    def s3_etag(path, *args):
+        if str(path) == failing:
+            raise PermissionError(13, "Permission denied", path)
+        return real_etag(path, *args)
+
+    monkeypatch.setattr(s3_sync, "s3_etag", s3_etag)
+    assert sync() == ["list_objects_v2"]
+    assert ("bucket", "backup/f1.txt") in client.objects
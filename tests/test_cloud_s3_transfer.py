@@ -0,0 +1,168 @@
+"""S3 전송 관리자 테스트 (메모리 기반 가짜 S3 클라이언트)"""
+
+import asyncio
+import time
+from argparse import Namespace
+
+import pytest
+
+from pawnstack.cli.s3 import S3CLI
+from pawnstack.cloud.s3_transfer import MB, RateLimiter, S3TransferManager, TransferConfig, TransferJob, parse_size
+
+
+class FakeBody:
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    async def read(self, size=-1):
+        end = len(self.data) if size < 0 else self.pos + size
+        chunk = self.data[self.pos:end]
+        self.pos += len(chunk)
+        return chunk
+
+    def close(self):
+        pass
+
+
+class FakeS3:
+    """put/multipart/get(Range)/head 만 구현한 가짜 클라이언트 (동시 요청 수 기록)"""
+
+    def __init__(self, fail_part=None):
+        self.objects = {}
+        self.uploads = {}
+        self.aborted = []
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_part = fail_part
+
+    async def _request(self, name):
+        self.calls.append(name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def put_object(self, Bucket, Key, Body, **extra):
+        await self._request("put_object")
+        self.objects[(Bucket, Key)] = (bytes(Body), extra)
+
+    async def create_multipart_upload(self, Bucket, Key, **extra):
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = ({}, extra)
+        return {"UploadId": upload_id}
+
+    async def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        await self._request("upload_part")
+        if PartNumber == self.fail_part:
+            raise RuntimeError("part failed")
+        self.uploads[UploadId][0][PartNumber] = bytes(Body)
+        return {"ETag": f'"etag-{PartNumber}"'}
+
+    async def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        parts, extra = self.uploads.pop(UploadId)
+        numbers = [p["PartNumber"] for p in MultipartUpload["Parts"]]
+        assert numbers == sorted(parts)
+        self.objects[(Bucket, Key)] = (b"".join(parts[n] for n in numbers), extra)
+
+    async def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId)
+        self.aborted.append(UploadId)
+
+    async def head_object(self, Bucket, Key):
+        return {"ContentLength": len(self.objects[(Bucket, Key)][0])}
+
+    async def get_object(self, Bucket, Key, Range=None):
+        await self._request("get_object")
+        data = self.objects[(Bucket, Key)][0]
+        if Range:
+            start, end = Range[len("bytes="):].split("-")
+            data = data[int(start):int(end) + 1]
+        return {"Body": FakeBody(data)}
+
+
+def _payload(size):
+    return (bytes(range(256)) * (size // 256 + 1))[:size]
+
+
+def test_parse_size():
+    """크기 문자열 변환 테스트"""
+    assert parse_size("8MB") == 8 * MB
+    assert parse_size("512k") == 512 * 1024
+    assert parse_size("1.5GiB") == int(1.5 * 1024 * MB)
+    assert parse_size("100") == 100
+    with pytest.raises(ValueError):
+        parse_size("fast")
+    with pytest.raises(ValueError):
+        TransferConfig(part_size=1 * MB)
+
+
+def test_multipart_round_trip(tmp_path):
+    """큰 파일은 병렬 multipart 업로드 / ranged GET 다운로드로 같은 내용을 주고받는지 테스트"""
+    data = _payload(23 * MB + 123)
+    source = tmp_path / "big.bin"
+    source.write_bytes(data)
+    client = FakeS3()
+    manager = S3TransferManager(client, TransferConfig(part_size=5 * MB, part_concurrency=3))
+
+    async def run():
+        up = await manager.upload_file(source, "bucket", "big.bin", {"StorageClass": "STANDARD_IA"})
+        down = await manager.download_file("bucket", "big.bin", tmp_path / "out" / "big.bin")
+        return up, down
+
+    up, down = asyncio.run(run())
+    assert up.parts == 5 and down.parts == 5
+    assert client.objects[("bucket", "big.bin")] == (data, {"StorageClass": "STANDARD_IA"})
+    assert (tmp_path / "out" / "big.bin").read_bytes() == data
+    assert not (tmp_path / "out" / "big.bin.pawns-part").exists()
+    assert client.max_in_flight == 3
+
+
+def test_failed_multipart_is_aborted(tmp_path):
+    """파트 업로드가 실패하면 multipart 업로드를 취소하고 결과에 오류를 남기는지 테스트"""
+    source = tmp_path / "big.bin"
+    source.write_bytes(_payload(12 * MB))
+    client = FakeS3(fail_part=2)
+    manager = S3TransferManager(client, TransferConfig(part_size=5 * MB))
+
+    async def run():
+        return [r async for r in manager.upload_many([TransferJob("bucket", "big.bin", str(source))])]
+
+    [result] = asyncio.run(run())
+    assert not result.ok and "part failed" in result.error
+    assert client.aborted == ["upload-0"] and not client.uploads
+    assert manager.stats["failed"] == 1
+
+
+def test_rate_limiter_shared_across_transfers():
+    """여러 코루틴이 공유하는 토큰 버킷이 전체 속도를 제한하는지 테스트"""
+    limiter = RateLimiter(rate=1 * MB, burst=256 * 1024)
+
+    async def run():
+        started = time.monotonic()
+        await asyncio.gather(*(limiter.acquire(256 * 1024) for _ in range(4)))
+        return time.monotonic() - started
+
+    # 버킷 256KB 를 뺀 768KB 는 1MB/s 로 0.75 초
+    assert 0.6 < asyncio.run(run()) < 1.5
+    assert asyncio.run(RateLimiter(0).acquire(10 * MB)) is None
+
+
+def test_cli_directory_copy_is_parallel(tmp_path):
+    """pawns s3 cp -r 이 공유 클라이언트로 파일을 동시에 업로드하는지 테스트"""
+    for i in range(12):
+        (tmp_path / "dir" / str(i % 3)).mkdir(parents=True, exist_ok=True)
+        (tmp_path / "dir" / str(i % 3) / f"f{i}.txt").write_bytes(b"x" * (i + 1))
+
+    cli = S3CLI(Namespace(
+        subcommand="cp", recursive=True, dry_run=False, metadata=["team=infra"], storage_class="STANDARD",
+        max_workers=4, part_concurrency=2, chunk_size=8 * MB, multipart_threshold=8 * MB, max_bandwidth=0,
+    ))
+    client = FakeS3()
+    cli._s3_client = client
+
+    assert asyncio.run(cli._copy_local_to_s3(str(tmp_path / "dir"), "s3://bucket/prefix/")) == 0
+    assert len(client.objects) == 12
+    assert client.objects[("bucket", "prefix/1/f4.txt")] == (b"x" * 5, {"StorageClass": "STANDARD", "Metadata": {"team": "infra"}})
+    assert client.max_in_flight == 4
@@ -52,4 +52,130 @@ async def test_http_client_close(http_client):
     
     # 종료 테스트
     await http_client.close()
-    assert http_client._client is None
\ No newline at end of file
+    assert http_client._client is None
+
+async def _start_counting_server():
+    """연결 수를 세는 로컬 keep-alive HTTP 서버"""
+    stats = {"connections": 0}
+
+    async def handle(reader, writer):
+        stats["connections"] += 1
+        try:
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                if not request:
+                    break
+                body = b'{"ok": true}'
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}/", stats
+
+
+@pytest.mark.asyncio
+async def test_http_client_reuses_connections():
+    """연속 요청이 하나의 keep-alive 커넥션을 재사용하는지 테스트"""
+    server, url, stats = await _start_counting_server()
+    try:
+        async with HttpClient() as client:
+            for _ in range(5):
+                response = await client.get(url)
+                assert response.status_code == 200
+            assert client.pool_stats()["pools"] == 1
+        assert stats["connections"] == 1
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_http_client_pool_per_key():
+    """verify_ssl 별로 별도 풀이 생성되는지 테스트"""
+    server, url, _ = await _start_counting_server()
+    try:
+        client = HttpClient()
+        await client.get(url)
+        await client.get(url, verify_ssl=False)
+        assert client.pool_stats()["pools"] == 2
+
+        await client.aclose()
+        assert client.pool_stats()["pools"] == 0
+        assert client._client is None
+
+        # 종료 후에도 다시 요청 가능
+        response = await client.get(url)
+        assert response.is_success()
+        await client.aclose()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def test_http_response_lazy_decoding():
+    """본문 지연 디코딩 및 JSON 캐시 테스트"""
+    response = HttpResponse(status_code=200, headers={}, content=b'{"a": {"b": 1}}', url="https://example.com")
+
+    assert response._text is None
+    data = response.json()
+    assert data == {"a": {"b": 1}}
+    assert response.json() is data
+    assert response._text is None
+    assert response.text == '{"a": {"b": 1}}'
+    assert response.size == len(response.content)
+
+
+@pytest.mark.asyncio
+async def test_http_client_max_body_size():
+    """본문 크기 제한 및 스트리밍 테스트"""
+    server, url, stats = await _start_counting_server()
+    try:
+        async with HttpClient() as client:
+            capped = await client.get(url, max_body_size=4)
+            assert capped.content == b'{"ok'
+            assert capped.truncated is True
+            assert capped.size == len(b'{"ok": true}')
+
+            discarded = await client.get(url, max_body_size=0)
+            assert discarded.content == b""
+            assert discarded.size == len(b'{"ok": true}')
+
+            chunks = []
+            async with client.stream("GET", url) as response:
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+            assert b"".join(chunks) == b'{"ok": true}'
+
+        # 잘린 응답도 끝까지 읽으므로 커넥션이 재사용됨
+        assert stats["connections"] == 1
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def test_http_client_releases_pool_of_previous_loop():
+    """이벤트 루프가 바뀌면 이전 루프의 클라이언트를 해제하는지 테스트"""
+    client = HttpClient()
+
+    async def fetch():
+        server, url, _ = await _start_counting_server()
+        try:
+            assert (await client.get(url)).is_success()
+            return client._client
+        finally:
+            server.close()
+
+    first = asyncio.run(fetch())
+    second = asyncio.run(fetch())
+    assert first is not second and first.is_closed
+    assert client.pool_stats()["retired"] == 0
+    asyncio.run(client.aclose())
+    assert second.is_closed
@@ -0,0 +1,121 @@
+"""HTTP 성공 기준 엔진 테스트"""
+
+import pytest
+
+from pawnstack.http.client import HttpResponse
+from pawnstack.http.criteria import SuccessCriteria, compile_criteria, resolve_json_path
+from pawnstack.monitoring.http_monitor import HTTPMonitorConfig, HTTPMonitor
+from pawnstack.cli.http import HTTPCLI, HTTPTask
+
+
+BODY = b'{"result": {"height": "120", "ok": true, "items": [{"id": 7}, {"id": 9}]}, "msg": "up and running"}'
+
+
+@pytest.fixture
+def response():
+    """JSON 응답 픽스처"""
+    return HttpResponse(
+        status_code=200,
+        headers={"Content-Type": "application/json"},
+        content=BODY,
+        url="http://localhost/",
+    )
+
+
+@pytest.mark.parametrize("criterion, expected", [
+    ("status_code==200", True),
+    ("status_code!=200", False),
+    ("status_code>=200", True),
+    ("status_code<=199", False),
+    ("status_code<201", True),
+    ("status_code>199", True),
+    ("response_time<0.5", True),
+    ("response_time>=0.5", False),
+    ("status_code in [200, 201]", True),
+    ("status_code not in [200, 201]", False),
+    ("result.height==120", True),
+    ("result.height>100", True),
+    ("result.ok==true", True),
+    ("result.items[1].id==9", True),
+    ("result.items.0.id==7", True),
+    ("result.items[5].id==7", False),
+    ("result.missing==null", True),
+    ('msg=="up and running"', True),
+    ("msg=~^up", True),
+    ("msg!~down", True),
+    ("headers.content-type=~json", True),
+    ("content_length>10", True),
+])
+def test_single_criterion(response, criterion, expected):
+    """단일 기준 평가 테스트"""
+    assert compile_criteria([criterion]).evaluate(response, 0.1) is expected
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("status_code==200 and response_time<0.5", True),
+    ("status_code==500 or result.ok==true", True),
+    ("status_code==500 || result.ok==false", False),
+    ("(status_code==500 or status_code==200) && result.height>=120", True),
+    ("status_code==200 and (result.ok==false or response_time>1)", False),
+    ("msg=~^(up|down)", True),
+    ("(status_code in [200, 204] or status_code==304) and response_time<0.5", True),
+])
+def test_grouping(response, expression, expected):
+    """and/or 그룹 및 괄호 테스트"""
+    assert compile_criteria(expression).evaluate(response, 0.1) is expected
+
+
+def test_list_operator(response):
+    """목록 결합 연산자 테스트"""
+    assert compile_criteria(["status_code==500", "response_time<1"], "or").evaluate(response, 0.1)
+    assert not compile_criteria(["status_code==500", "response_time<1"], "and").evaluate(response, 0.1)
+
+
+def test_empty_criteria_uses_2xx(response):
+    """기준이 없으면 2xx 를 성공으로 판정"""
+    assert compile_criteria(None).evaluate(response) is True
+    assert compile_criteria([None]).evaluate(HttpResponse(status_code=500, headers={})) is False
+
+
+def test_needs_body():
+    """본문 필요 여부 판단 테스트"""
+    assert compile_criteria(["status_code==200", "response_time<1"]).needs_body is False
+    assert compile_criteria(["result.ok==true"]).needs_body is True
+
+
+@pytest.mark.parametrize("criterion", ["status_code", "response_time<abc", "(status_code==200", "status_code==200 and"])
+def test_invalid_criteria(criterion):
+    """잘못된 기준은 컴파일 시점에 ValueError"""
+    with pytest.raises(ValueError):
+        compile_criteria([criterion])
+
+
+def test_resolve_json_path():
+    """JSON 경로 탐색 테스트"""
+    data = {"a": {"b": [{"c": 1}]}, "x.y": 2}
+    assert resolve_json_path(data, "a.b[0].c") == 1
+    assert resolve_json_path(data, 'a["b"].0.c') == 1
+    assert resolve_json_path(data, '["x.y"]') == 2
+    assert resolve_json_path(data, "a.z") is None
+
+
+def test_monitor_and_cli_share_semantics(response):
+    """HTTPMonitor 와 HTTPCLI 가 같은 판정을 내리는지 테스트"""
+    criteria = ["result.items[0].id==7", "status_code<=299"]
+    config = HTTPMonitorConfig(url="http://localhost/", success_criteria=criteria)
+    task = HTTPTask(url="http://localhost/", success_criteria=criteria)
+
+    assert isinstance(config.criteria, SuccessCriteria)
+    assert config.criteria.evaluate(response, 0.1) is True
+    assert HTTPMonitor()._check_success_criteria(response, 0.1, criteria) is True
+    assert HTTPCLI().check_success_criteria(response, 0.1, task.criteria) is True
+
+
+def test_empty_criteria_defaults():
+    """기준이 없으면 HTTPCLI 는 200 만, HTTPMonitor 는 2xx 를 성공으로 보는지 테스트"""
+    created = HttpResponse(status_code=201, headers={}, url="http://localhost/")
+
+    assert HTTPTask(url="http://localhost/", success_criteria=[]).criteria.evaluate(created, 0.1) is False
+    assert HTTPCLI().check_success_criteria(created, 0.1, []) is False
+    assert HTTPMonitorConfig(url="http://localhost/", success_criteria=[]).criteria.evaluate(created, 0.1) is True
+
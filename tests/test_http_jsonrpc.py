@@ -0,0 +1,132 @@
+"""JSON-RPC 배치 전송 테스트"""
+
+import asyncio
+import json
+from argparse import Namespace
+
+import pytest
+
+from pawnstack.cli.rpc import RPCCLI
+from pawnstack.http.client import HttpClient
+from pawnstack.http.jsonrpc import JsonRpcBatcher, iter_batch_file
+
+
+async def _start_rpc_server(batch=True, drop_ids=()):
+    """JSON-RPC 로컬 서버 (배치 응답은 역순, drop_ids 는 응답 생략)"""
+    stats = {"connections": 0, "posts": 0}
+
+    def answer(request):
+        if request.get("method") == "fail":
+            return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32601, "message": "Method not found"}}
+        return {"jsonrpc": "2.0", "id": request["id"], "result": request.get("params")}
+
+    async def handle(reader, writer):
+        stats["connections"] += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = int([line for line in head.split(b"\r\n") if line.lower().startswith(b"content-length")][0].split(b":")[1])
+                payload = json.loads(await reader.readexactly(length))
+                stats["posts"] += 1
+                if isinstance(payload, list):
+                    if batch:
+                        body = [answer(r) for r in reversed(payload) if r["id"] not in drop_ids]
+                    else:
+                        body = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch not supported"}}
+                else:
+                    body = answer(payload)
+                data = json.dumps(body).encode()
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: " + str(len(data)).encode() + b"\r\n\r\n" + data)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/api/v3", stats
+
+
+def test_iter_batch_file_streams_array_and_jsonl(tmp_path, monkeypatch):
+    """JSON 배열과 JSON Lines 를 작은 청크로 나눠 읽어도 같은 요청이 나오는지 테스트"""
+    import pawnstack.http.jsonrpc as jsonrpc
+    monkeypatch.setattr(jsonrpc, "_READ_SIZE", 7)
+
+    requests = [{"method": "icx_getBlockByHeight", "params": {"height": hex(i), "note": "a, ]\"b"}} for i in range(20)]
+    array_file = tmp_path / "calls.json"
+    array_file.write_text("  [\n" + ",\n".join(json.dumps(r) for r in requests) + "\n]\n")
+    lines_file = tmp_path / "calls.jsonl"
+    lines_file.write_text("\n".join(json.dumps(r) for r in requests) + "\n\n")
+
+    assert list(iter_batch_file(array_file)) == requests
+    assert list(iter_batch_file(lines_file)) == requests
+    assert list(iter_batch_file(tmp_path / "calls.json")) == requests
+
+    broken = tmp_path / "broken.json"
+    broken.write_text('[{"method": "a"}, {"method": ')
+    with pytest.raises(ValueError):
+        list(iter_batch_file(broken))
+
+
+@pytest.mark.asyncio
+async def test_batches_reassociate_by_id_and_report_partial_failures():
+    """응답 순서와 무관하게 id 로 연결하고, 빠진 응답만 실패로 보고하는지 테스트"""
+    server, url, stats = await _start_rpc_server(drop_ids={7})
+    requests = [{"method": "echo", "params": {"n": i}} for i in range(25)] + ["bad", {"method": "fail"}]
+    try:
+        async with HttpClient() as client:
+            batcher = JsonRpcBatcher(client, url, batch_size=10, concurrency=3)
+            results = sorted([r async for r in batcher.run(requests)], key=lambda r: r["request_id"])
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert len(results) == 27
+    assert stats["posts"] == 3 and stats["connections"] <= 3
+    assert results[0]["response"]["result"] == {"n": 0}
+    assert results[24]["response"]["result"] == {"n": 24}
+    assert results[6]["success"] is False and "No response" in results[6]["error"]
+    assert results[25]["success"] is False and results[25]["id"] is None
+    assert results[26]["response"]["error"]["code"] == -32601
+    assert batcher.stats["failed"] == 2 and batcher.stats["requests"] == 27
+
+
+@pytest.mark.asyncio
+async def test_duplicate_ids_split_batches_and_fallback():
+    """같은 id 는 다른 배치로, 배치 미지원 서버는 개별 요청으로 보내는지 테스트"""
+    server, url, stats = await _start_rpc_server(batch=False)
+    requests = [{"id": 1, "method": "a", "params": 1}, {"id": 2, "method": "b", "params": 2}, {"id": 1, "method": "c", "params": 3}]
+    try:
+        async with HttpClient() as client:
+            batcher = JsonRpcBatcher(client, url, batch_size=10)
+            results = sorted([r async for r in batcher.run(requests)], key=lambda r: r["request_id"])
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert [r["response"]["result"] for r in results] == [1, 2, 3]
+    assert batcher.stats["fallbacks"] == 1
+    # 배치 1개 (거부) + 개별 2개 + 중복 id 로 분리된 단일 요청 1개
+    assert stats["posts"] == 4
+
+
+@pytest.mark.asyncio
+async def test_cli_streams_results_to_jsonl(tmp_path):
+    """pawns rpc 배치 결과가 JSON Lines 로 기록되는지 테스트"""
+    server, url, _ = await _start_rpc_server()
+    batch_file = tmp_path / "calls.jsonl"
+    batch_file.write_text("\n".join(json.dumps({"method": "echo", "params": i}) for i in range(50)))
+    output = tmp_path / "results.jsonl"
+    cli = RPCCLI(Namespace(url=url, batch_file=str(batch_file), batch_size=20, concurrency=2, output=str(output), timeout=5.0))
+    try:
+        stats = await cli.stream_batch_requests(cli.create_config())
+        in_order = await cli.send_batch_requests(cli.create_config())
+    finally:
+        await cli.http_client.aclose()
+        server.close()
+        await server.wait_closed()
+
+    assert (stats["requests"], stats["succeeded"], stats["batches"]) == (50, 50, 3)
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert sorted(r["response"]["result"] for r in records) == list(range(50))
+    assert [r["request_id"] for r in in_order] == list(range(1, 51))
@@ -0,0 +1,89 @@
+"""벤치마크 기준선 및 분포 기반 회귀 감지 테스트"""
+
+import io
+import json
+import random
+from datetime import datetime
+
+from rich.console import Console
+
+from pawnstack.monitoring.benchmark import BenchmarkBaseline, BenchmarkManager
+from pawnstack.monitoring.histogram import LatencyHistogram
+from pawnstack.monitoring.performance import BenchmarkRecorder, PerformanceMetrics, PerformanceMonitor, _plan_load
+
+
+def _histogram(values):
+    histogram = LatencyHistogram()
+    histogram.extend(values)
+    return histogram
+
+
+def _manager(tmp_path):
+    return BenchmarkManager(baseline_dir=str(tmp_path), console=Console(file=io.StringIO()))
+
+
+def test_baseline_histogram_roundtrip(tmp_path):
+    """기준선 파일에 히스토그램이 압축 저장되고 다시 로드되는지 테스트"""
+    rng = random.Random(5)
+    histogram = _histogram(rng.expovariate(20) for _ in range(100000))
+    manager = _manager(tmp_path)
+    manager._save_baseline(BenchmarkBaseline(
+        name="api", version="1.0", timestamp=datetime.now(),
+        metrics={"avg_response_time": histogram.mean}, histogram=histogram
+    ))
+
+    path = tmp_path / "api_1.0.json"
+    assert path.stat().st_size < 16 * 1024
+    assert isinstance(json.loads(path.read_text())["histogram"], str)
+
+    loaded = _manager(tmp_path).get_baseline("api")
+    assert loaded.histogram.count == histogram.count
+    assert loaded.histogram.percentile(99.9) == histogram.percentile(99.9)
+
+
+def test_distribution_regression_detected_in_tail(tmp_path):
+    """평균/p95 는 같아도 꼬리 분포가 나빠지면 회귀로 감지하는지 테스트"""
+    rng = random.Random(9)
+    base_values = [rng.uniform(0.010, 0.020) for _ in range(10000)]
+    # 상위 0.5% 만 10배 느려짐 (p95 는 변화 없음)
+    slow_values = [v * 10 if i % 200 == 0 else v for i, v in enumerate(base_values)]
+
+    manager = _manager(tmp_path)
+    changes = manager._compare_distributions(_histogram(base_values), _histogram(slow_values))
+
+    assert abs(changes["latency_p95"]["change_percent"]) < 5
+    assert changes["latency_p99.9"]["change_percent"] > 100
+    detected, severity = manager._detect_regression(changes, 10.0, 25.0)
+    assert detected and severity == "critical"
+
+
+def test_distribution_skips_undersampled_tail(tmp_path):
+    """샘플이 부족한 꼬리 백분위수는 비교하지 않는지 테스트"""
+    manager = _manager(tmp_path)
+    changes = manager._compare_distributions(_histogram([0.01] * 100), _histogram([0.01] * 100))
+    assert "latency_p95" in changes
+    assert "latency_p99" not in changes
+    assert "latency_p99.9" not in changes
+
+
+def test_result_backed_by_histogram():
+    """요청별 메트릭 없이 누적기로부터 결과가 생성되는지 테스트"""
+    recorder = BenchmarkRecorder()
+    for i in range(1, 1001):
+        recorder.record(PerformanceMetrics(
+            timestamp=datetime.now(), response_time=i / 1000, status_code=200 if i % 10 else 500,
+            content_length=10, success=bool(i % 10)
+        ))
+
+    merged = BenchmarkRecorder.from_dict(recorder.to_dict()).merge(recorder)
+    monitor = PerformanceMonitor(Console(file=io.StringIO()))
+    result = monitor._analyze_benchmark_results("x", [], 1.0, {})
+    assert result.total_requests == 0
+
+    result = PerformanceMonitor._result_from_recorder("x", merged, 2.0, {}, _plan_load(None, None, None, None, 1, 1))
+    assert result.total_requests == 2000
+    assert result.failed_requests == 200
+    assert result.error_rate == 10.0
+    assert abs(result.percentile(99.9) - 0.999) < 0.02
+    assert abs(result.percentiles[50] - 0.5) < 0.01
+    assert json.loads(json.dumps(result.to_dict()))["histogram"]["count"] == 2000
@@ -0,0 +1,65 @@
+"""지연시간 히스토그램 테스트"""
+
+import random
+
+import pytest
+
+from pawnstack.monitoring.histogram import LatencyHistogram
+
+
+@pytest.mark.parametrize("p", [50, 90, 99, 99.9])
+def test_histogram_percentile_accuracy(p):
+    """백분위수 상대 오차가 해상도 이내인지 테스트"""
+    rng = random.Random(11)
+    samples = sorted(rng.lognormvariate(-3, 1) for _ in range(50000))
+    histogram = LatencyHistogram()
+    histogram.extend(samples)
+
+    exact = samples[int(p / 100 * len(samples)) - 1]
+    assert histogram.percentile(p) == pytest.approx(exact, rel=0.02)
+    assert histogram.count == len(samples)
+    assert histogram.min == samples[0]
+    assert histogram.max == samples[-1]
+
+
+def test_histogram_merge():
+    """병합 결과가 전체를 한 번에 기록한 것과 같은지 테스트"""
+    rng = random.Random(3)
+    samples = [rng.uniform(0.001, 1.0) for _ in range(2000)]
+    whole = LatencyHistogram()
+    whole.extend(samples)
+
+    left, right = LatencyHistogram(), LatencyHistogram()
+    left.extend(samples[:700])
+    right.extend(samples[700:])
+    left.merge(right)
+
+    assert left.count == whole.count
+    assert left.mean == pytest.approx(whole.mean)
+    assert left.percentiles() == whole.percentiles()
+    assert list(left.buckets()) == list(whole.buckets())
+
+    with pytest.raises(ValueError):
+        left.merge(LatencyHistogram(sub_bucket_bits=5))
+
+
+def test_histogram_empty():
+    """빈 히스토그램 테스트"""
+    histogram = LatencyHistogram()
+    assert histogram.percentile(99) == 0.0
+    assert histogram.mean == 0.0
+    with pytest.raises(ValueError):
+        histogram.percentile(101)
+
+
+def test_histogram_serialization():
+    """딕셔너리 직렬화 왕복 테스트"""
+    histogram = LatencyHistogram()
+    histogram.extend([0.001, 0.002, 0.5, 1.25])
+    restored = LatencyHistogram.from_dict(histogram.to_dict())
+
+    assert restored.count == histogram.count
+    assert restored.min == histogram.min
+    assert restored.max == histogram.max
+    assert list(restored.buckets()) == list(histogram.buckets())
+    assert LatencyHistogram.from_dict(LatencyHistogram().to_dict()).count == 0
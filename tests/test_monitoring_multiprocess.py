@@ -0,0 +1,30 @@
+"""워커 프로세스 분산 벤치마크 테스트"""
+
+import io
+
+import pytest
+from rich.console import Console
+
+from pawnstack.monitoring.performance import PerformanceMonitor
+from tests.test_monitoring_performance import _start_serial_server
+
+
+@pytest.mark.asyncio
+async def test_benchmark_multiple_processes():
+    """워커 프로세스 결과가 하나의 결과로 병합되는지 테스트"""
+    server, url = await _start_serial_server(0)
+    monitor = PerformanceMonitor(Console(file=io.StringIO()))
+    try:
+        result = await monitor.run_benchmark(
+            "processes", url, concurrent_requests=4, total_requests=40, warmup_requests=2, processes=2
+        )
+    finally:
+        await monitor.close()
+        server.close()
+        await server.wait_closed()
+
+    assert result.total_requests == 40
+    assert result.successful_requests == 40
+    assert result.histogram.count == 40
+    assert result.percentiles[99] >= result.percentiles[50] > 0
+    assert result.client_overhead["processes"] == 2
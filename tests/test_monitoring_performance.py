@@ -0,0 +1,154 @@
+"""벤치마크 부하 모드 (closed-loop / open-loop) 및 부하 생성기 오버헤드 테스트"""
+
+import asyncio
+import io
+
+import pytest
+from rich.console import Console
+
+from pawnstack.monitoring import performance
+from pawnstack.monitoring.performance import (
+    LoadStage,
+    PerformanceMonitor,
+    _stage_target,
+    parse_load_stages,
+)
+
+
+def test_load_stages():
+    """부하 단계 파싱 및 선형 ramp 테스트"""
+    stages = parse_load_stages("10:100, 10:100,5:0")
+    assert stages == [LoadStage(10, 100), LoadStage(10, 100), LoadStage(5, 0)]
+    assert _stage_target(stages, 5) == pytest.approx(50)
+    assert _stage_target(stages, 15) == pytest.approx(100)
+    assert _stage_target(stages, 22.5) == pytest.approx(50)
+    assert _stage_target(stages, 25) is None
+
+    for spec in ("10", "a:b", "0:10", ""):
+        with pytest.raises(ValueError):
+            parse_load_stages(spec)
+
+
+async def _start_serial_server(delay: float):
+    """요청을 한 번에 하나씩 ``delay`` 초 동안 처리하는 로컬 HTTP 서버"""
+    lock = asyncio.Lock()
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                async with lock:
+                    await asyncio.sleep(delay)
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}/"
+
+
+@pytest.mark.asyncio
+async def test_benchmark_closed_loop_request_count():
+    """concurrency 모드가 정확한 요청 수를 보내는지 테스트"""
+    server, url = await _start_serial_server(0)
+    monitor = PerformanceMonitor(Console(file=io.StringIO()))
+    try:
+        result = await monitor.run_benchmark(
+            "closed", url, concurrent_requests=4, total_requests=30, warmup_requests=0
+        )
+    finally:
+        await monitor.close()
+        server.close()
+        await server.wait_closed()
+
+    assert result.mode == "concurrency"
+    assert result.total_requests == 30
+    assert result.successful_requests == 30
+    assert result.histogram.count == 30
+    assert result.corrected_histogram is None
+
+
+@pytest.mark.asyncio
+async def test_benchmark_open_loop_corrects_coordinated_omission():
+    """rate 모드에서 밀린 요청의 지연이 예정 시각 기준으로 보정되는지 테스트"""
+    # 서버는 초당 최대 50건만 처리하지만 100 RPS 로 요청
+    server, url = await _start_serial_server(0.02)
+    monitor = PerformanceMonitor(Console(file=io.StringIO()))
+    try:
+        result = await monitor.run_benchmark(
+            "open", url, rate=100, duration=0.5, warmup_requests=0, max_in_flight=1
+        )
+    finally:
+        await monitor.close()
+        server.close()
+        await server.wait_closed()
+
+    assert result.mode == "rate"
+    assert result.target_rps == 100
+    assert 45 <= result.total_requests <= 55
+    # 서비스 시간은 ~20ms 로 일정하지만, 예정 시각 기준 지연은 대기열만큼 증가
+    assert result.histogram.percentile(99) < 0.1
+    assert result.corrected_percentiles[99] > 0.2
+
+
+@pytest.mark.asyncio
+async def test_benchmark_resource_sampling_off_hot_path(monkeypatch):
+    """요청 경로에서 psutil 을 호출하지 않고 부하 생성기 CPU 사용량을 보고하는지 테스트"""
+    server, url = await _start_serial_server(0)
+    monitor = PerformanceMonitor(Console(file=io.StringIO()), resource_sample_interval=0.01)
+
+    # 생성 이후 요청 경로에서 새 Process 객체를 만들면 실패
+    def forbidden_process(*args, **kwargs):
+        raise AssertionError("psutil.Process() called on the request path")
+
+    monkeypatch.setattr(performance.psutil, "Process", forbidden_process)
+    try:
+        result = await monitor.run_benchmark(
+            "overhead", url, concurrent_requests=2, total_requests=200, warmup_requests=0
+        )
+    finally:
+        await monitor.close()
+        server.close()
+        await server.wait_closed()
+
+    assert result.successful_requests == 200
+    assert result.memory_usage["peak"] > 0
+    assert result.client_overhead["cpu_seconds"] >= 0
+    assert set(result.client_overhead) >= {"cpu_percent", "cpu_per_request_ms"}
+
+
+@pytest.mark.asyncio
+async def test_open_loop_pending_tasks_bounded_by_max_in_flight():
+    """in-flight 상한에 걸려도 대기 태스크가 상한 이상 쌓이지 않는지 테스트"""
+    server, url = await _start_serial_server(0.005)
+    monitor = PerformanceMonitor(Console(file=io.StringIO()))
+    peak = 0
+    stop = asyncio.Event()
+
+    async def watch():
+        nonlocal peak
+        baseline = len(asyncio.all_tasks())
+        while not stop.is_set():
+            peak = max(peak, len(asyncio.all_tasks()) - baseline)
+            await asyncio.sleep(0.005)
+
+    watcher = asyncio.create_task(watch())
+    try:
+        result = await monitor.run_benchmark(
+            "bounded", url, rate=1000, duration=0.1, warmup_requests=0, max_in_flight=2
+        )
+    finally:
+        stop.set()
+        await watcher
+        await monitor.close()
+        server.close()
+        await server.wait_closed()
+
+    # 서버가 1000 RPS 를 따라가지 못해도 fire 태스크는 max_in_flight 개까지만 존재
+    assert peak <= 2 + 2
+    assert 95 <= result.total_requests <= 105
+    assert result.corrected_percentiles[99] > result.percentiles[99]
@@ -0,0 +1,79 @@
+"""고정 주기 스케줄러 테스트"""
+
+import asyncio
+
+import pytest
+
+from pawnstack.monitoring.scheduler import FixedRateScheduler
+
+
+@pytest.mark.asyncio
+async def test_slow_job_does_not_delay_others():
+    """느린 작업이 다른 작업의 주기에 영향을 주지 않는지 테스트"""
+    calls = {"fast": 0, "slow": 0}
+
+    async def fast():
+        calls["fast"] += 1
+
+    async def slow():
+        calls["slow"] += 1
+        await asyncio.sleep(0.25)
+
+    scheduler = FixedRateScheduler(interval=0.05, max_concurrency=4, jitter=0)
+    scheduler.add("fast", fast)
+    scheduler.add("slow", slow)
+    await scheduler.run(duration=0.52)
+
+    # 0, 0.05, ..., 0.50 → 약 11 회
+    assert calls["fast"] >= 9
+    # 느린 작업은 진행 중인 틱을 건너뛰고 누락으로 집계
+    assert calls["slow"] <= 3
+    assert scheduler.stats["slow"].missed >= 6
+    assert scheduler.stats["fast"].missed == 0
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_is_bounded():
+    """동시 실행 수 제한 테스트"""
+    state = {"running": 0, "peak": 0}
+
+    async def job():
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await asyncio.sleep(0.03)
+        state["running"] -= 1
+
+    scheduler = FixedRateScheduler(interval=0.1, max_concurrency=3, jitter=0)
+    for i in range(10):
+        scheduler.add(i, job)
+    await scheduler.run(duration=0.25)
+
+    assert state["peak"] == 3
+    assert scheduler.total_stats().completed >= 10
+
+
+@pytest.mark.asyncio
+async def test_no_drift_and_errors_counted():
+    """실행 시간이 주기에 누적되지 않고 예외가 집계되는지 테스트"""
+    errors = []
+
+    async def failing():
+        await asyncio.sleep(0.02)
+        raise RuntimeError("boom")
+
+    scheduler = FixedRateScheduler(interval=0.05, max_concurrency=1, jitter=0, on_error=lambda k, e: errors.append(k))
+    scheduler.add("job", failing)
+    await scheduler.run(duration=0.5)
+
+    stats = scheduler.stats["job"]
+    # 실행 시간(0.02s)을 더해 sleep 하던 방식이면 약 7 회, 고정 주기면 약 10 회
+    assert stats.started >= 9
+    assert stats.errors >= 9
+    assert stats.completed == 0
+    assert len(errors) == stats.errors
+
+
+def test_invalid_interval():
+    """잘못된 주기 테스트"""
+    with pytest.raises(ValueError):
+        FixedRateScheduler(interval=0)
@@ -0,0 +1,70 @@
+"""스트리밍 통계 테스트"""
+
+import random
+import statistics
+
+import pytest
+
+from pawnstack.monitoring.stats import P2Quantile, RollingStats
+
+
+def test_welford_mean_variance():
+    """평균/분산이 전체 샘플 계산과 일치하는지 테스트"""
+    rng = random.Random(7)
+    samples = [rng.uniform(0.01, 2.0) for _ in range(5000)]
+    stats = RollingStats()
+    stats.extend(samples)
+
+    assert stats.count == len(samples)
+    assert stats.mean == pytest.approx(statistics.mean(samples))
+    assert stats.variance == pytest.approx(statistics.variance(samples))
+    assert stats.min == min(samples)
+    assert stats.max == max(samples)
+
+
+def test_ewma():
+    """EWMA 테스트"""
+    stats = RollingStats(ewma_alpha=0.5)
+    stats.extend([1.0, 3.0])
+    assert stats.ewma == pytest.approx(2.0)
+    assert stats.last == 3.0
+
+
+@pytest.mark.parametrize("p", [0.5, 0.95, 0.99])
+def test_p2_quantile_accuracy(p):
+    """P² 분위수 근사 정확도 테스트"""
+    rng = random.Random(42)
+    samples = [rng.expovariate(10) for _ in range(20000)]
+    estimator = P2Quantile(p)
+    for value in samples:
+        estimator.add(value)
+
+    exact = sorted(samples)[int(p * len(samples)) - 1]
+    assert estimator.value == pytest.approx(exact, rel=0.05)
+
+
+def test_small_sample_quantiles():
+    """샘플이 적을 때 분위수 테스트"""
+    stats = RollingStats()
+    assert stats.quantile(0.5) == 0.0
+    stats.extend([3.0, 1.0, 2.0])
+    assert stats.quantile(0.5) == 2.0
+    assert stats.percentiles()[99] == 3.0
+
+
+def test_fixed_memory_and_reset():
+    """샘플 수와 무관하게 상태 크기가 일정한지 테스트"""
+    stats = RollingStats()
+    stats.extend(range(1, 100001))
+    assert stats.to_dict()["count"] == 100000
+    assert stats.quantile(0.5) == pytest.approx(50000, rel=0.01)
+
+    stats.reset()
+    assert stats.count == 0
+    assert stats.to_dict()["min"] == 0.0
+
+
+def test_invalid_quantile():
+    """잘못된 분위수 테스트"""
+    with pytest.raises(ValueError):
+        P2Quantile(1.5)
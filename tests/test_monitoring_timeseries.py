@@ -0,0 +1,89 @@
+"""컬럼형 시계열 버퍼 테스트"""
+
+import math
+
+import pytest
+
+from pawnstack.monitoring.http_monitor import HTTPMonitor, HTTPMonitorConfig
+from pawnstack.monitoring.timeseries import TimeSeriesBuffer, resample
+
+
+def test_buffer_wraps_and_returns_contiguous_views():
+    """용량을 넘으면 오래된 값을 덮어쓰고, 최근 구간을 순서대로 반환하는지 테스트"""
+    history = TimeSeriesBuffer(["cpu"], capacity=5)
+    for i in range(12):
+        history.append(float(i), cpu=i * 10.0)
+
+    assert len(history) == 5
+    view = history.view("cpu")
+    assert isinstance(view, memoryview)
+    assert view.tolist() == [70.0, 80.0, 90.0, 100.0, 110.0]
+    assert history.values("cpu", last=2) == [100.0, 110.0]
+    assert history.latest("cpu") == 110.0
+    assert history.view("timestamp").tolist() == [7.0, 8.0, 9.0, 10.0, 11.0]
+    assert history.since(9.5) == 2
+
+
+def test_buffer_statistics_skip_missing_values():
+    """빠진 값 (NaN) 을 제외하고 min/max/mean 을 계산하는지 테스트"""
+    history = TimeSeriesBuffer(["cpu", "net"], capacity=10)
+    history.append(1.0, cpu=10.0)
+    history.append(2.0, cpu=30.0, net=4.0)
+    history.append(3.0, cpu=20.0, net=2.0)
+
+    assert math.isnan(history.view("net")[0])
+    assert history.mean("cpu") == pytest.approx(20.0)
+    assert history.summary("net") == {"min": 2.0, "max": 4.0, "mean": 3.0, "latest": 2.0, "count": 2}
+    assert math.isnan(TimeSeriesBuffer(["cpu"]).mean("cpu"))
+
+    with pytest.raises(KeyError):
+        history.append(4.0, unknown=1.0)
+
+
+@pytest.mark.parametrize("method, expected", [
+    ("mean", [1.5, 5.5, 9.5]),
+    ("max", [3.0, 7.0, 11.0]),
+    ("min", [0.0, 4.0, 8.0]),
+    ("last", [3.0, 7.0, 11.0]),
+])
+def test_buffer_downsample(method, expected):
+    """그래프 너비에 맞춰 구간 집계하는지 테스트"""
+    history = TimeSeriesBuffer(["value"], capacity=12)
+    for i in range(12):
+        history.append(float(i), value=float(i))
+
+    assert history.downsample("value", 3, method=method) == expected
+    assert history.downsample("value", 20) == [float(i) for i in range(12)]
+
+
+def test_buffer_rows():
+    """행 단위 조회 테스트"""
+    history = TimeSeriesBuffer(["a", "b"], capacity=3)
+    history.append_row({"timestamp": 1.0, "a": 1.0, "b": 2.0})
+    history.append_row({"a": 3.0, "b": 4.0}, timestamp=2.0)
+
+    assert list(history.rows()) == [
+        {"timestamp": 1.0, "a": 1.0, "b": 2.0},
+        {"timestamp": 2.0, "a": 3.0, "b": 4.0},
+    ]
+
+
+def test_resample():
+    """임의 시퀀스 리샘플링 (구간 평균 / 선형 보간) 테스트"""
+    assert resample([0, 2, 4, 6], 2) == [1.0, 5.0]
+    assert resample([0, 10], 3) == [0.0, 5.0, 10.0]
+    assert resample([7], 3) == [7.0, 7.0, 7.0]
+    assert resample([], 3) == []
+
+
+def test_http_monitor_legacy_history_properties():
+    """HTTPMonitor 의 response_time_history / status_history 가 버퍼 내용을 읽기 전용으로 노출하는지 테스트"""
+    monitor = HTTPMonitor()
+    monitor.add_endpoint(HTTPMonitorConfig(url="http://localhost/", name="api"))
+    monitor.history["api"].append(response_time=0.25, success=1)
+    monitor.history["api"].append(response_time=0.5, success=0)
+
+    assert monitor.response_time_history == {"api": [0.25, 0.5]}
+    assert monitor.status_history == {"api": [1, 0]}
+    with pytest.raises(AttributeError):
+        monitor.status_history = {}
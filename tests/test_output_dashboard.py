@@ -0,0 +1,148 @@
+"""변경분 렌더링 대시보드 테스트"""
+
+import asyncio
+import io
+
+import pytest
+from rich.console import Console
+from rich.layout import Layout
+from rich.text import Text
+
+from pawnstack.monitoring.http_monitor import HTTPMonitor, HTTPMonitorConfig
+from pawnstack.output.dashboard import CachedRenderable, DashboardRenderer
+
+
+def _console():
+    return Console(file=io.StringIO(), width=60, height=20, force_terminal=False)
+
+
+class CountingText:
+    """렌더링 횟수를 세는 renderable"""
+
+    def __init__(self, text):
+        self.text = Text(text)
+        self.renders = 0
+
+    def __rich_console__(self, console, options):
+        self.renders += 1
+        yield self.text
+
+
+def _layout():
+    layout = Layout()
+    layout.split_column(Layout(name="a", size=3), Layout(name="b"))
+    return layout
+
+
+def test_cached_renderable_renders_once_per_size():
+    """같은 크기로 다시 그릴 때 캐시된 라인을 재사용하는지 테스트"""
+    console = _console()
+    inner = CountingText("hello")
+    cached = CachedRenderable(inner)
+
+    console.print(cached)
+    console.print(cached)
+    assert inner.renders == 1
+    assert "hello" in console.file.getvalue()
+
+    console.print(cached, width=30)
+    assert inner.renders == 2
+
+
+def test_renderer_rebuilds_only_changed_regions():
+    """키가 바뀐 영역만 다시 만들고, 변화가 없으면 화면을 갱신하지 않는지 테스트"""
+    builds = {"a": 0, "b": 0}
+    state = {"a": 0}
+
+    def build(name):
+        def _build():
+            builds[name] += 1
+            return Text(name)
+        return _build
+
+    renderer = DashboardRenderer(_layout(), console=_console())
+    renderer.region("a", build("a"), key=lambda: state["a"])
+    renderer.region("b", build("b"))
+
+    assert renderer.render() is True
+    assert builds == {"a": 1, "b": 1}
+
+    # 변화 없음 - 유휴 프레임
+    assert renderer.render() is False
+    assert renderer.stats.idle_frames == 1
+
+    state["a"] += 1
+    assert renderer.render() is True
+    assert builds == {"a": 2, "b": 1}
+
+    renderer.invalidate("b")
+    renderer.render()
+    assert builds == {"a": 2, "b": 2}
+    assert renderer.stats.regions_rendered == 4
+
+    with pytest.raises(KeyError):
+        renderer.region("missing", build("a"))
+
+
+def test_renderer_drops_frames_when_over_budget():
+    """렌더링이 프레임 예산을 넘으면 다음 프레임을 미루는지 테스트"""
+    renderer = DashboardRenderer(_layout(), console=_console(), max_fps=10, max_render_share=0.5)
+
+    assert renderer.next_delay(0.01, rendered=True) == pytest.approx(0.09)
+    assert renderer.stats.dropped_frames == 0
+
+    # 0.3초 렌더링 -> 0.3초 휴식, 그 사이 0.1초 프레임 5개 드롭
+    assert renderer.next_delay(0.3, rendered=True) == pytest.approx(0.3)
+    assert renderer.stats.dropped_frames == 5
+
+    # 그리지 않은 프레임은 예산과 무관
+    assert renderer.next_delay(0.3, rendered=False) == 0.0
+
+    with pytest.raises(ValueError):
+        DashboardRenderer(_layout(), max_fps=0)
+
+
+def test_renderer_run_is_decoupled_from_collection():
+    """수집 태스크 주기와 관계없이 바뀐 프레임만 그리는지 테스트"""
+    state = {"tick": 0}
+
+    async def collect():
+        for _ in range(3):
+            await asyncio.sleep(0.05)
+            state["tick"] += 1
+
+    async def main():
+        renderer = DashboardRenderer(_layout(), console=_console(), max_fps=50, screen=False)
+        renderer.region("a", lambda: Text(str(state["tick"])), key=lambda: state["tick"])
+        renderer.region("b", lambda: Text("static"))
+        collector = asyncio.create_task(collect())
+        await renderer.run(lambda: not collector.done())
+        return renderer
+
+    renderer = asyncio.run(main())
+    # 초기 1회 + 수집 3회 이하로만 영역을 다시 만듦
+    assert renderer.stats.regions_rendered <= 2 + 3
+    assert renderer.stats.idle_frames > 0
+
+
+def test_http_sparkline_panel_caches_unchanged_endpoints(monkeypatch):
+    """결과가 바뀐 엔드포인트만 그래프 마크업을 다시 만드는지 테스트"""
+    monitor = HTTPMonitor(console=_console())
+    for name in ("a", "b"):
+        monitor.add_endpoint(HTTPMonitorConfig(url=f"http://{name}.example", name=name))
+
+    calls = []
+    original = monitor._create_endpoint_graph
+    monkeypatch.setattr(monitor, "_create_endpoint_graph", lambda name, *args: calls.append(name) or original(name, *args))
+
+    monitor.history["a"].append(1.0, response_time=0.1, success=1.0)
+    first = monitor._create_sparkline_panel()
+    assert sorted(calls) == ["a", "b"]
+
+    calls.clear()
+    assert monitor._create_sparkline_panel() == first
+    assert calls == []
+
+    monitor.history["b"].append(2.0, response_time=0.2, success=0.0)
+    monitor._create_sparkline_panel()
+    assert calls == ["b"]
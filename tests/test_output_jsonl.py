@@ -0,0 +1,137 @@
+"""추가 전용 JSON Lines 싱크 테스트"""
+
+import asyncio
+import json
+import threading
+import time
+from argparse import Namespace
+
+import pytest
+
+from pawnstack.cli.mon import MonCLI
+from pawnstack.cli.noti import NotiCLI
+from pawnstack.output.jsonl import JsonlReader, JsonlSink, rotated_files
+
+
+@pytest.mark.parametrize("name", ["metrics.jsonl", "metrics.jsonl.gz", "metrics.jsonl.zst"])
+def test_sink_appends_and_survives_unclosed_stream(tmp_path, name):
+    """flush 된 레코드는 파일을 닫지 않아도 읽히고, 다시 열면 이어 쓰는지 테스트"""
+    if name.endswith(".zst"):
+        pytest.importorskip("zstandard")
+    path = tmp_path / name
+
+    sink = JsonlSink(path, batch_size=4)
+    for i in range(10):
+        sink.write({"timestamp": float(i), "value": i})
+    # batch_size 단위로만 기록됨
+    assert len(list(JsonlReader(path).read())) == 8
+    sink.flush()
+    # 닫지 않은 (압축 트레일러가 없는) 상태에서도 읽을 수 있음
+    assert [r["value"] for r in JsonlReader(path).read()] == list(range(10))
+    sink.close()
+
+    with JsonlSink(path) as sink:
+        sink.write({"timestamp": 10.0, "value": 10})
+
+    reader = JsonlReader(path)
+    assert [r["value"] for r in reader.read(start=3, end=5)] == [3, 4, 5]
+    assert [r["value"] for r in reader.tail(2)] == [9, 10]
+
+
+def test_sink_rotates_by_size_and_prunes_backups(tmp_path):
+    """크기 기준 로테이션, 보관 개수 제한, 로테이션 파일을 포함한 조회 테스트"""
+    path = tmp_path / "metrics.jsonl"
+    sink = JsonlSink(path, batch_size=1, max_bytes=200, backup_count=2, fsync=False)
+    for i in range(30):
+        sink.write({"timestamp": float(i), "value": "x" * 20})
+    sink.close()
+
+    backups = rotated_files(path)
+    assert len(backups) == 2
+    assert all(p.name.startswith("metrics-") and p.name.endswith(".jsonl") for p in backups)
+
+    reader = JsonlReader(path)
+    values = [r["timestamp"] for r in reader.read()]
+    # 오래된 로테이션 파일은 삭제되었지만 남은 파일은 시간순
+    assert values == sorted(values)
+    assert values[-1] == 29.0
+    assert [r["timestamp"] for r in reader.tail(12)] == values[-12:]
+
+    # 로테이션 시각이 start 보다 이전인 파일은 열지 않음
+    opened = []
+    original = reader._chunks
+    reader._chunks = lambda p: opened.append(p) or original(p)
+    list(reader.read(start=time.time() + 60))
+    assert not set(opened) & set(backups)
+
+
+def test_reader_range_query_accepts_iso_timestamps(tmp_path):
+    """ISO 문자열 timestamp 레코드의 범위 조회 테스트"""
+    path = tmp_path / "history.jsonl"
+    with JsonlSink(path) as sink:
+        for hour in range(5):
+            sink.write({"timestamp": f"2025-01-01T0{hour}:00:00", "hour": hour})
+
+    reader = JsonlReader(path)
+    records = reader.read(start="2025-01-01T01:30:00", end="2025-01-01T03:00:00")
+    assert [r["hour"] for r in records] == [2, 3]
+
+
+def test_reader_follow_handles_rotation(tmp_path):
+    """실시간 추적이 로테이션 이후 새 파일을 따라가는지 테스트"""
+    path = tmp_path / "live.jsonl"
+    sink = JsonlSink(path, batch_size=1, fsync=False)
+    sink.write({"n": 0})
+
+    received = []
+    done = threading.Event()
+
+    def follow():
+        for record in JsonlReader(path).follow(poll_interval=0.01, until=lambda: not done.is_set()):
+            received.append(record["n"])
+            if len(received) == 2:
+                done.set()
+
+    thread = threading.Thread(target=follow, daemon=True)
+    thread.start()
+    time.sleep(0.05)
+    sink.write({"n": 1})
+    sink.rotate()
+    sink.write({"n": 2})
+    thread.join(timeout=5)
+    sink.close()
+
+    # 추적 시작 이전 레코드 (n=0) 는 건너뛰고, 로테이션 전후 레코드를 모두 받음
+    assert received == [1, 2]
+
+    with pytest.raises(ValueError):
+        next(JsonlReader(tmp_path / "x.jsonl.gz").follow())
+
+
+def test_mon_save_metrics_appends_lines(tmp_path):
+    """pawns mon 메트릭이 JSON Lines 로 이어 써지는지 테스트"""
+    path = tmp_path / "mon.jsonl"
+    cli = MonCLI(Namespace(output_file=str(path), output_max_mb=100, output_backups=None))
+
+    async def run():
+        for i in range(3):
+            await cli.save_metrics({"timestamp": f"2025-01-01T00:00:0{i}", "cpu": i})
+        cli.close_metrics_sink()
+
+    asyncio.run(run())
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["cpu"] for line in lines] == [0, 1, 2]
+
+
+def test_noti_history_migrates_legacy_array(tmp_path):
+    """기존 JSON 배열 히스토리를 변환한 뒤 한 줄씩 추가하는지 테스트"""
+    path = tmp_path / "noti_history.json"
+    path.write_text(json.dumps([{"message": "old"}], indent=2))
+
+    cli = NotiCLI(Namespace(save_history=str(path), priority="normal"))
+    cli.save_notification_history("new", "subject", {"slack": True})
+    cli.save_notification_history("newer", None, {"slack": False})
+
+    records = list(JsonlReader(path).read())
+    assert [r["message"] for r in records] == ["old", "new", "newer"]
+    assert records[1]["success"] is True
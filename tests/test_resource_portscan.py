@@ -0,0 +1,120 @@
+"""asyncio 포트 스캐너 테스트"""
+
+import asyncio
+import socket
+import tracemalloc
+
+import pytest
+
+from pawnstack.resource.portscan import AdaptiveTimeout, PortScanner, count_hosts, iter_hosts, parse_ports
+
+
+@pytest.fixture
+def listening_port():
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(64)
+    yield server.getsockname()[1]
+    server.close()
+
+
+def _closed_port():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def _collect(scanner, hosts, ports):
+    async def run():
+        return [result async for result in scanner.scan(hosts, ports)]
+    return asyncio.run(run())
+
+
+def test_host_and_port_parsing():
+    """CIDR/범위/목록 파싱과 개수 계산 테스트"""
+    assert list(iter_hosts("10.0.0.0/30")) == ["10.0.0.1", "10.0.0.2"]
+    assert list(iter_hosts("10.0.0.8/31,192.168.1.10-12")) == ["10.0.0.8", "10.0.0.9", "192.168.1.10", "192.168.1.11", "192.168.1.12"]
+    assert list(iter_hosts("::1")) == ["::1"]
+    assert count_hosts("10.0.0.0/16") == 65534
+    assert count_hosts("10.0.0.0/8,1.1.1.1") == 2 ** 24 - 2 + 1
+
+    with pytest.raises(ValueError):
+        iter_hosts("10.0.0.5-10.0.0.1")
+    with pytest.raises(ValueError):
+        iter_hosts("10.0.0.1-::1")
+
+    assert parse_ports("443,20-22,22") == [443, 20, 21, 22]
+    with pytest.raises(ValueError):
+        parse_ports("70000")
+
+
+def test_host_generation_is_lazy():
+    """/8 범위도 목록을 만들지 않고 앞에서부터 생성하는지 테스트"""
+    tracemalloc.start()
+    hosts = iter_hosts("10.0.0.0/8")
+    first = [next(hosts) for _ in range(3)]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert first == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+    assert peak < 1024 * 1024
+
+
+def test_adaptive_timeout():
+    """관측 RTT 로 타임아웃이 줄고 상/하한이 지켜지는지 테스트"""
+    timeout = AdaptiveTimeout(maximum=2.0, minimum=0.05, min_samples=4)
+    for _ in range(3):
+        timeout.observe(0.01)
+    assert timeout.current == 2.0
+    timeout.observe(0.01)
+    assert timeout.current == 0.05
+
+    for _ in range(50):
+        timeout.observe(0.2)
+    assert 0.2 < timeout.current < 2.0
+
+
+def test_scan_states_and_window(listening_port):
+    """열림/닫힘 판정과 진행 중 연결 수 상한 테스트"""
+    closed = _closed_port()
+    scanner = PortScanner(concurrency=4, timeout=1.0)
+
+    in_flight = peak = 0
+    original = scanner.probe
+
+    async def tracked(host, port, timeout=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            return await original(host, port, timeout)
+        finally:
+            in_flight -= 1
+
+    scanner.probe = tracked
+    results = _collect(scanner, iter_hosts("127.0.0.1-127.0.0.3"), [listening_port, closed] * 5)
+
+    states = {(r.host, r.port): r.state for r in results}
+    assert states[("127.0.0.1", listening_port)] == "open"
+    assert states[("127.0.0.1", closed)] == "closed"
+    assert len(results) == 30 and peak <= 4
+    assert (scanner.stats.probed, scanner.stats.open + scanner.stats.closed) == (30, 30)
+
+
+def test_ping_prefilter_skips_dead_hosts(listening_port):
+    """ping 선별로 응답 없는 호스트의 포트는 검사하지 않는지 테스트"""
+    scanner = PortScanner(concurrency=8, timeout=0.5, ping=True, ping_ports=[listening_port])
+
+    async def fake_alive(host):
+        return host == "127.0.0.1"
+
+    scanner.is_alive = fake_alive
+    results = _collect(scanner, ["127.0.0.1", "127.0.0.2", "127.0.0.3"], [listening_port, _closed_port()])
+
+    assert {r.host for r in results} == {"127.0.0.1"}
+    assert (scanner.stats.hosts_checked, scanner.stats.hosts_alive, scanner.stats.probed) == (3, 1, 2)
+
+    # 실제 생존 확인: 열린 포트 또는 RST 응답이면 살아 있음
+    assert asyncio.run(PortScanner(ping_ports=[listening_port]).is_alive("127.0.0.1"))
+    assert asyncio.run(PortScanner(ping_ports=[_closed_port()]).is_alive("127.0.0.1"))
@@ -0,0 +1,85 @@
+"""프로세스 캐시 테스트"""
+
+import os
+import subprocess
+import sys
+import time
+
+import psutil
+import pytest
+
+from pawnstack.resource import process as process_module
+from pawnstack.resource.process import ProcessCache, _read_create_time
+
+
+def _busy_child():
+    return subprocess.Popen([sys.executable, "-c", "while True: pass"])
+
+
+def test_process_cache_reuses_process_objects_for_cpu_delta():
+    """틱 사이에 Process 객체를 재사용해 CPU% 가 실제 증분으로 계산되는지 테스트"""
+    child = _busy_child()
+    cache = ProcessCache()
+    try:
+        cache.refresh()
+        first = cache._entries[child.pid].process
+        time.sleep(0.3)
+        samples = {info["pid"]: info for info in cache.refresh()}
+
+        assert cache._entries[child.pid].process is first
+        assert samples[child.pid]["cpu_percent"] > 10
+        assert samples[os.getpid()]["name"]
+
+        top = cache.top(1, samples=list(samples.values()))
+        assert top[0]["cpu_percent"] >= samples[child.pid]["cpu_percent"]
+    finally:
+        child.kill()
+        child.wait()
+
+    cache.refresh()
+    assert child.pid not in cache
+
+
+def test_process_cache_detects_pid_reuse(monkeypatch):
+    """생성 시각이 달라진 PID 를 새 Process 로 교체하는지 테스트"""
+    cache = ProcessCache()
+    cache.refresh()
+    pid = os.getpid()
+    stale = cache._entries[pid]
+    stale.create_time -= 100
+
+    cache.refresh()
+    assert cache._entries[pid] is not stale
+    assert cache._entries[pid].create_time == psutil.Process(pid).create_time()
+
+
+def test_read_create_time_matches_psutil():
+    """캐시된 Process 내부 구현 없이 읽은 생성 시각이 psutil 값과 같은지 테스트"""
+    process = psutil.Process(os.getpid())
+    assert _read_create_time(process) == pytest.approx(process.create_time(), abs=0.01)
+
+
+def test_process_cache_fetches_expensive_fields_only_for_selected_rows(monkeypatch):
+    """cmdline/username 을 선택된 행에 대해서만 한 번 읽는지 테스트"""
+    calls = []
+    original_cmdline = psutil.Process.cmdline
+
+    def counting_cmdline(self):
+        calls.append(self.pid)
+        return original_cmdline(self)
+
+    monkeypatch.setattr(process_module.psutil.Process, "cmdline", counting_cmdline)
+
+    cache = ProcessCache()
+    cache.refresh()
+    calls.clear()
+    pid = os.getpid()
+    only_self = lambda info: info["pid"] == pid
+
+    rows = cache.top(3, extra_fields=["cmdline", "username"], predicate=only_self)
+    assert [row["pid"] for row in rows] == [pid]
+    assert rows[0]["cmdline"] == original_cmdline(psutil.Process(pid))
+    assert rows[0]["username"]
+
+    cache.top(3, extra_fields=["cmdline"], predicate=only_self)
+    assert calls == [pid]
@@ -0,0 +1,132 @@
+"""비차단 시스템 샘플러 테스트"""
+
+import os
+import time
+
+import psutil
+import pytest
+
+from pawnstack.resource.sampler import SystemSampler, get_system_sampler
+
+MEMINFO = """MemTotal:        1000000 kB
+MemFree:          200000 kB
+MemAvailable:     400000 kB
+Buffers:           10000 kB
+Cached:           150000 kB
+"""
+
+NET_DEV = """Inter-|   Receive                                                |  Transmit
+ face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed
+    lo:    1000      10    0    0    0     0          0         0     1000      10    0    0    0     0       0          0
+  eth0:    5000      50    0    0    0     0          0         0     3000      30    0    0    0     0       0          0
+"""
+
+
+def _write_proc(root, cpu, diskstats=""):
+    (root / "net").mkdir(exist_ok=True)
+    (root / "stat").write_text(f"cpu  {cpu}\ncpu0 {cpu}\nbtime 1000\n")
+    (root / "meminfo").write_text(MEMINFO)
+    (root / "net" / "dev").write_text(NET_DEV)
+    (root / "diskstats").write_text(diskstats)
+    (root / "loadavg").write_text("0.50 0.25 0.10 1/100 1234\n")
+
+
+def _rewrite(path, text):
+    """열어 둔 fd 가 같은 inode 를 다시 읽도록 제자리 덮어쓰기"""
+    with open(path, "r+") as f:
+        f.write(text)
+        f.truncate()
+
+
+def test_sampler_computes_cpu_from_counter_deltas(tmp_path):
+    """직전 샘플 대비 jiffies 증분으로 CPU 사용률을 계산하는지 테스트"""
+    _write_proc(tmp_path, "100 0 100 800 0 0 0 0")
+    for pid in ("1", "42"):
+        (tmp_path / pid).mkdir()
+
+    with SystemSampler(proc_path=str(tmp_path), min_interval=0) as sampler:
+        assert sampler.procfs
+        # 이후 100 jiffies 중 user 60, system 20, idle 10, iowait 10
+        _rewrite(tmp_path / "stat", "cpu  160 0 120 810 10 0 0 0\nbtime 1000\n")
+        sample = sampler.sample()
+
+        assert sample.cpu_percent == pytest.approx(80.0)
+        assert sample.cpu_user == pytest.approx(60.0)
+        assert sample.cpu_system == pytest.approx(20.0)
+        assert sample.cpu_iowait == pytest.approx(10.0)
+        assert sample.memory_total == 1000000 * 1024
+        assert sample.memory_used == 600000 * 1024
+        assert sample.memory_percent == pytest.approx(60.0)
+        assert (sample.net_bytes_recv, sample.net_bytes_sent) == (6000, 4000)
+        assert (sample.net_packets_recv, sample.net_packets_sent) == (60, 40)
+        assert sample.load_average == (0.5, 0.25, 0.1)
+        assert sample.process_count == 2
+        assert sample.uptime == pytest.approx(time.time() - 1000, abs=5)
+
+        # 카운터 변화가 없으면 직전 값 유지
+        assert sampler.sample().cpu_percent == pytest.approx(80.0)
+
+
+def test_sampler_grows_read_buffer(tmp_path, monkeypatch):
+    """버퍼보다 큰 /proc 파일도 끝까지 읽는지 테스트"""
+    monkeypatch.setattr("pawnstack.resource.sampler._READ_SIZE", 16)
+    _write_proc(tmp_path, "1 0 1 8 0 0 0 0")
+
+    with SystemSampler(proc_path=str(tmp_path), min_interval=0) as sampler:
+        assert sampler.sample().net_bytes_recv == 6000
+
+
+def test_sampler_is_non_blocking_and_matches_psutil():
+    """실제 /proc 샘플이 차단 없이 psutil 과 같은 값을 반환하는지 테스트"""
+    if not os.path.exists("/proc/stat"):
+        pytest.skip("procfs not available")
+
+    sampler = SystemSampler(min_interval=0)
+    try:
+        started = time.perf_counter()
+        sample = sampler.sample()
+        assert time.perf_counter() - started < 0.05
+
+        memory = psutil.virtual_memory()
+        assert sample.memory_total == memory.total
+        assert sample.memory_percent == pytest.approx(memory.percent, abs=5)
+        assert sample.net_bytes_recv <= psutil.net_io_counters().bytes_recv
+        assert 0 <= sample.cpu_percent <= 100
+    finally:
+        sampler.close()
+
+
+def test_sampler_psutil_fallback():
+    """procfs 가 없으면 psutil 로 수집하는지 테스트"""
+    sampler = SystemSampler(proc_path=None, min_interval=0)
+    sample = sampler.sample()
+    assert not sampler.procfs
+    assert sample.memory_total == psutil.virtual_memory().total
+    assert sample.process_count > 0
+
+
+def test_sampler_load_average_unsupported(monkeypatch):
+    """로드 평균을 지원하지 않으면 0 이 아니라 None 을 반환하는지 테스트"""
+    def unsupported():
+        raise OSError("getloadavg unavailable")
+
+    monkeypatch.setattr(psutil, "getloadavg", unsupported)
+    sample = SystemSampler(proc_path=None, min_interval=0).sample()
+    assert sample.load_average is None
+
+
+def test_sampler_memory_available_edge_cases(tmp_path):
+    """MemAvailable 이 0 이거나 total 보다 크면 psutil 과 같은 보정값을 쓰는지 테스트"""
+    _write_proc(tmp_path, "1 0 1 8 0 0 0 0")
+    with SystemSampler(proc_path=str(tmp_path), min_interval=0) as sampler:
+        _rewrite(tmp_path / "meminfo", MEMINFO.replace("400000", "0"))
+        assert sampler.sample().memory_available == (200000 + 10000 + 150000) * 1024
+        _rewrite(tmp_path / "meminfo", MEMINFO.replace("400000", "2000000"))
+        assert sampler.sample().memory_available == 200000 * 1024
+
+
+def test_shared_sampler_returns_cached_sample_within_min_interval():
+    """공유 샘플러가 min_interval 안의 재호출에 같은 샘플을 반환하는지 테스트"""
+    sampler = get_system_sampler()
+    assert sampler is get_system_sampler()
+    assert sampler.sample() is sampler.sample()
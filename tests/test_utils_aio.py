@@ -0,0 +1,55 @@
+"""비동기 실행 유틸리티 테스트"""
+
+import asyncio
+
+import pytest
+
+from pawnstack.utils import windowed
+
+
+@pytest.mark.asyncio
+async def test_windowed_limits_concurrency_and_yields_in_completion_order():
+    """동시 실행 수를 limit 이하로 유지하고 끝나는 순서대로 결과를 내는지 테스트"""
+    running = 0
+    peak = 0
+
+    async def work(delay):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(delay)
+        running -= 1
+        return delay
+
+    results = [result async for result in windowed([0.05, 0.01, 0.02, 0.0], work, 2)]
+    assert peak == 2
+    assert results == [0.01, 0.02, 0.0, 0.05]
+
+
+@pytest.mark.asyncio
+async def test_windowed_reads_async_source_lazily_and_cancels_on_break():
+    """비동기 입력을 필요한 만큼만 읽고, 반복을 멈추면 남은 작업을 취소하는지 테스트"""
+    pulled = []
+    cancelled = []
+
+    async def source():
+        for i in range(1000):
+            pulled.append(i)
+            yield i
+
+    async def work(item):
+        try:
+            await asyncio.sleep(0 if item == 0 else 10)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+        return item
+
+    results = windowed(source(), work, 3)
+    async for result in results:
+        assert result == 0
+        break
+    await results.aclose()
+
+    assert pulled == [0, 1, 2]
+    assert sorted(cancelled) == [1, 2]